@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: python/sawtooth_block_info/protobuf/consensus.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3python/sawtooth_block_info/protobuf/consensus.proto\"|\n\x1a\x43onsensusPeerMessageHeader\x12\x11\n\tsigner_id\x18\x01 \x01(\x0c\x12\x16\n\x0e\x63ontent_sha512\x18\x02 \x01(\x0c\x12\x14\n\x0cmessage_type\x18\x05 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\"Q\n\x14\x43onsensusPeerMessage\x12\x0e\n\x06header\x18\x01 \x01(\x0c\x12\x18\n\x10header_signature\x18\x03 \x01(\x0c\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\"\x7f\n\x0e\x43onsensusBlock\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x13\n\x0bprevious_id\x18\x02 \x01(\x0c\x12\x11\n\tsigner_id\x18\x03 \x01(\x0c\x12\x11\n\tblock_num\x18\x04 \x01(\x04\x12\x0f\n\x07payload\x18\x05 \x01(\x0c\x12\x0f\n\x07summary\x18\x06 \x01(\x0c\"$\n\x11\x43onsensusPeerInfo\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"4\n\x16\x43onsensusSettingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"4\n\x13\x43onsensusStateEntry\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"9\n\x18\x43onsensusRegisterRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"\x9a\x02\n\x19\x43onsensusRegisterResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusRegisterResponse.Status\x12#\n\nchain_head\x18\x02 \x01(\x0b\x32\x0f.ConsensusBlock\x12!\n\x05peers\x18\x03 \x03(\x0b\x32\x12.ConsensusPeerInfo\x12+\n\x0flocal_peer_info\x18\x04 \x01(\x0b\x32\x12.ConsensusPeerInfo\"U\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\"E\n\x1c\x43onsensusNotifyPeerConnected\x12%\n\tpeer_info\x18\x01 \x01(\x0b\x32\x12.ConsensusPeerInfo\"2\n\x1f\x43onsensusNotifyPeerDisconnected\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"W\n\x1a\x43onsensusNotifyPeerMessage\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\x12\x11\n\tsender_id\x18\x02 \x01(\x0c\"9\n\x17\x43onsensusNotifyBlockNew\x12\x1e\n\x05\x62lock\x18\x01 \x01(\x0b\x32\x0f.ConsensusBlock\"-\n\x19\x43onsensusNotifyBlockValid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"/\n\x1b\x43onsensusNotifyBlockInvalid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\".\n\x1a\x43onsensusNotifyBlockCommit\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\x95\x01\n\x1e\x43onsensusNotifyEngineActivated\x12#\n\nchain_head\x18\x01 \x01(\x0b\x32\x0f.ConsensusBlock\x12!\n\x05peers\x18\x02 \x03(\x0b\x32\x12.ConsensusPeerInfo\x12+\n\x0flocal_peer_info\x18\x03 \x01(\x0b\x32\x12.ConsensusPeerInfo\"\"\n ConsensusNotifyEngineDeactivated\"\x14\n\x12\x43onsensusNotifyAck\"T\n\x16\x43onsensusSendToRequest\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x14\n\x0cmessage_type\x18\x03 \x01(\t\x12\x13\n\x0breceiver_id\x18\x02 \x01(\x0c\"\xca\x01\n\x17\x43onsensusSendToResponse\x12/\n\x06status\x18\x01 \x01(\x0e\x32\x1f.ConsensusSendToResponse.Status\"~\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x10\n\x0cUNKNOWN_PEER\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"B\n\x19\x43onsensusBroadcastRequest\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x14\n\x0cmessage_type\x18\x02 \x01(\t\"\xbe\x01\n\x1a\x43onsensusBroadcastResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBroadcastResponse.Status\"l\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x05\"6\n\x1f\x43onsensusInitializeBlockRequest\x12\x13\n\x0bprevious_id\x18\x01 \x01(\x0c\"\xf1\x01\n ConsensusInitializeBlockResponse\x12\x38\n\x06status\x18\x01 \x01(\x0e\x32(.ConsensusInitializeBlockResponse.Status\"\x92\x01\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x11\n\rUNKNOWN_BLOCK\x10\x06\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x07\" \n\x1e\x43onsensusSummarizeBlockRequest\"\x82\x02\n\x1f\x43onsensusSummarizeBlockResponse\x12\x37\n\x06status\x18\x01 \x01(\x0e\x32\'.ConsensusSummarizeBlockResponse.Status\x12\x0f\n\x07summary\x18\x02 \x01(\x0c\"\x94\x01\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x13\n\x0f\x42LOCK_NOT_READY\x10\x06\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x07\"-\n\x1d\x43onsensusFinalizeBlockRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\x81\x02\n\x1e\x43onsensusFinalizeBlockResponse\x12\x36\n\x06status\x18\x01 \x01(\x0e\x32&.ConsensusFinalizeBlockResponse.Status\x12\x10\n\x08\x62lock_id\x18\x02 \x01(\x0c\"\x94\x01\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x13\n\x0f\x42LOCK_NOT_READY\x10\x06\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x07\"\x1d\n\x1b\x43onsensusCancelBlockRequest\"\xd5\x01\n\x1c\x43onsensusCancelBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCancelBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"0\n\x1b\x43onsensusCheckBlocksRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xd5\x01\n\x1c\x43onsensusCheckBlocksResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCheckBlocksResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"/\n\x1b\x43onsensusCommitBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xd5\x01\n\x1c\x43onsensusCommitBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCommitBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"/\n\x1b\x43onsensusIgnoreBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xd5\x01\n\x1c\x43onsensusIgnoreBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusIgnoreBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"-\n\x19\x43onsensusFailBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xd1\x01\n\x1a\x43onsensusFailBlockResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusFailBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\".\n\x19\x43onsensusBlocksGetRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xf2\x01\n\x1a\x43onsensusBlocksGetResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBlocksGetResponse.Status\x12\x1f\n\x06\x62locks\x18\x02 \x03(\x0b\x32\x0f.ConsensusBlock\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"\x1e\n\x1c\x43onsensusChainHeadGetRequest\"\xf7\x01\n\x1d\x43onsensusChainHeadGetResponse\x12\x35\n\x06status\x18\x01 \x01(\x0e\x32%.ConsensusChainHeadGetResponse.Status\x12\x1e\n\x05\x62lock\x18\x02 \x01(\x0b\x32\x0f.ConsensusBlock\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rNO_CHAIN_HEAD\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"=\n\x1b\x43onsensusSettingsGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x0c\n\x04keys\x18\x02 \x03(\t\"\xff\x01\n\x1c\x43onsensusSettingsGetResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusSettingsGetResponse.Status\x12(\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x17.ConsensusSettingsEntry\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"?\n\x18\x43onsensusStateGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x11\n\taddresses\x18\x02 \x03(\t\"\xf6\x01\n\x19\x43onsensusStateGetResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusStateGetResponse.Status\x12%\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x14.ConsensusStateEntry\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'python.sawtooth_block_info.protobuf.consensus_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _CONSENSUSPEERMESSAGEHEADER._serialized_start=55
+  _CONSENSUSPEERMESSAGEHEADER._serialized_end=179
+  _CONSENSUSPEERMESSAGE._serialized_start=181
+  _CONSENSUSPEERMESSAGE._serialized_end=262
+  _CONSENSUSBLOCK._serialized_start=264
+  _CONSENSUSBLOCK._serialized_end=391
+  _CONSENSUSPEERINFO._serialized_start=393
+  _CONSENSUSPEERINFO._serialized_end=429
+  _CONSENSUSSETTINGSENTRY._serialized_start=431
+  _CONSENSUSSETTINGSENTRY._serialized_end=483
+  _CONSENSUSSTATEENTRY._serialized_start=485
+  _CONSENSUSSTATEENTRY._serialized_end=537
+  _CONSENSUSREGISTERREQUEST._serialized_start=539
+  _CONSENSUSREGISTERREQUEST._serialized_end=596
+  _CONSENSUSREGISTERRESPONSE._serialized_start=599
+  _CONSENSUSREGISTERRESPONSE._serialized_end=881
+  _CONSENSUSREGISTERRESPONSE_STATUS._serialized_start=796
+  _CONSENSUSREGISTERRESPONSE_STATUS._serialized_end=881
+  _CONSENSUSNOTIFYPEERCONNECTED._serialized_start=883
+  _CONSENSUSNOTIFYPEERCONNECTED._serialized_end=952
+  _CONSENSUSNOTIFYPEERDISCONNECTED._serialized_start=954
+  _CONSENSUSNOTIFYPEERDISCONNECTED._serialized_end=1004
+  _CONSENSUSNOTIFYPEERMESSAGE._serialized_start=1006
+  _CONSENSUSNOTIFYPEERMESSAGE._serialized_end=1093
+  _CONSENSUSNOTIFYBLOCKNEW._serialized_start=1095
+  _CONSENSUSNOTIFYBLOCKNEW._serialized_end=1152
+  _CONSENSUSNOTIFYBLOCKVALID._serialized_start=1154
+  _CONSENSUSNOTIFYBLOCKVALID._serialized_end=1199
+  _CONSENSUSNOTIFYBLOCKINVALID._serialized_start=1201
+  _CONSENSUSNOTIFYBLOCKINVALID._serialized_end=1248
+  _CONSENSUSNOTIFYBLOCKCOMMIT._serialized_start=1250
+  _CONSENSUSNOTIFYBLOCKCOMMIT._serialized_end=1296
+  _CONSENSUSNOTIFYENGINEACTIVATED._serialized_start=1299
+  _CONSENSUSNOTIFYENGINEACTIVATED._serialized_end=1448
+  _CONSENSUSNOTIFYENGINEDEACTIVATED._serialized_start=1450
+  _CONSENSUSNOTIFYENGINEDEACTIVATED._serialized_end=1484
+  _CONSENSUSNOTIFYACK._serialized_start=1486
+  _CONSENSUSNOTIFYACK._serialized_end=1506
+  _CONSENSUSSENDTOREQUEST._serialized_start=1508
+  _CONSENSUSSENDTOREQUEST._serialized_end=1592
+  _CONSENSUSSENDTORESPONSE._serialized_start=1595
+  _CONSENSUSSENDTORESPONSE._serialized_end=1797
+  _CONSENSUSSENDTORESPONSE_STATUS._serialized_start=1671
+  _CONSENSUSSENDTORESPONSE_STATUS._serialized_end=1797
+  _CONSENSUSBROADCASTREQUEST._serialized_start=1799
+  _CONSENSUSBROADCASTREQUEST._serialized_end=1865
+  _CONSENSUSBROADCASTRESPONSE._serialized_start=1868
+  _CONSENSUSBROADCASTRESPONSE._serialized_end=2058
+  _CONSENSUSBROADCASTRESPONSE_STATUS._serialized_start=1950
+  _CONSENSUSBROADCASTRESPONSE_STATUS._serialized_end=2058
+  _CONSENSUSINITIALIZEBLOCKREQUEST._serialized_start=2060
+  _CONSENSUSINITIALIZEBLOCKREQUEST._serialized_end=2114
+  _CONSENSUSINITIALIZEBLOCKRESPONSE._serialized_start=2117
+  _CONSENSUSINITIALIZEBLOCKRESPONSE._serialized_end=2358
+  _CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS._serialized_start=2212
+  _CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS._serialized_end=2358
+  _CONSENSUSSUMMARIZEBLOCKREQUEST._serialized_start=2360
+  _CONSENSUSSUMMARIZEBLOCKREQUEST._serialized_end=2392
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE._serialized_start=2395
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE._serialized_end=2653
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE_STATUS._serialized_start=2505
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE_STATUS._serialized_end=2653
+  _CONSENSUSFINALIZEBLOCKREQUEST._serialized_start=2655
+  _CONSENSUSFINALIZEBLOCKREQUEST._serialized_end=2700
+  _CONSENSUSFINALIZEBLOCKRESPONSE._serialized_start=2703
+  _CONSENSUSFINALIZEBLOCKRESPONSE._serialized_end=2960
+  _CONSENSUSFINALIZEBLOCKRESPONSE_STATUS._serialized_start=2505
+  _CONSENSUSFINALIZEBLOCKRESPONSE_STATUS._serialized_end=2653
+  _CONSENSUSCANCELBLOCKREQUEST._serialized_start=2962
+  _CONSENSUSCANCELBLOCKREQUEST._serialized_end=2991
+  _CONSENSUSCANCELBLOCKRESPONSE._serialized_start=2994
+  _CONSENSUSCANCELBLOCKRESPONSE._serialized_end=3207
+  _CONSENSUSCANCELBLOCKRESPONSE_STATUS._serialized_start=3080
+  _CONSENSUSCANCELBLOCKRESPONSE_STATUS._serialized_end=3207
+  _CONSENSUSCHECKBLOCKSREQUEST._serialized_start=3209
+  _CONSENSUSCHECKBLOCKSREQUEST._serialized_end=3257
+  _CONSENSUSCHECKBLOCKSRESPONSE._serialized_start=3260
+  _CONSENSUSCHECKBLOCKSRESPONSE._serialized_end=3473
+  _CONSENSUSCHECKBLOCKSRESPONSE_STATUS._serialized_start=3346
+  _CONSENSUSCHECKBLOCKSRESPONSE_STATUS._serialized_end=3473
+  _CONSENSUSCOMMITBLOCKREQUEST._serialized_start=3475
+  _CONSENSUSCOMMITBLOCKREQUEST._serialized_end=3522
+  _CONSENSUSCOMMITBLOCKRESPONSE._serialized_start=3525
+  _CONSENSUSCOMMITBLOCKRESPONSE._serialized_end=3738
+  _CONSENSUSCOMMITBLOCKRESPONSE_STATUS._serialized_start=3346
+  _CONSENSUSCOMMITBLOCKRESPONSE_STATUS._serialized_end=3473
+  _CONSENSUSIGNOREBLOCKREQUEST._serialized_start=3740
+  _CONSENSUSIGNOREBLOCKREQUEST._serialized_end=3787
+  _CONSENSUSIGNOREBLOCKRESPONSE._serialized_start=3790
+  _CONSENSUSIGNOREBLOCKRESPONSE._serialized_end=4003
+  _CONSENSUSIGNOREBLOCKRESPONSE_STATUS._serialized_start=3346
+  _CONSENSUSIGNOREBLOCKRESPONSE_STATUS._serialized_end=3473
+  _CONSENSUSFAILBLOCKREQUEST._serialized_start=4005
+  _CONSENSUSFAILBLOCKREQUEST._serialized_end=4050
+  _CONSENSUSFAILBLOCKRESPONSE._serialized_start=4053
+  _CONSENSUSFAILBLOCKRESPONSE._serialized_end=4262
+  _CONSENSUSFAILBLOCKRESPONSE_STATUS._serialized_start=3346
+  _CONSENSUSFAILBLOCKRESPONSE_STATUS._serialized_end=3473
+  _CONSENSUSBLOCKSGETREQUEST._serialized_start=4264
+  _CONSENSUSBLOCKSGETREQUEST._serialized_end=4310
+  _CONSENSUSBLOCKSGETRESPONSE._serialized_start=4313
+  _CONSENSUSBLOCKSGETRESPONSE._serialized_end=4555
+  _CONSENSUSBLOCKSGETRESPONSE_STATUS._serialized_start=3346
+  _CONSENSUSBLOCKSGETRESPONSE_STATUS._serialized_end=3473
+  _CONSENSUSCHAINHEADGETREQUEST._serialized_start=4557
+  _CONSENSUSCHAINHEADGETREQUEST._serialized_end=4587
+  _CONSENSUSCHAINHEADGETRESPONSE._serialized_start=4590
+  _CONSENSUSCHAINHEADGETRESPONSE._serialized_end=4837
+  _CONSENSUSCHAINHEADGETRESPONSE_STATUS._serialized_start=4710
+  _CONSENSUSCHAINHEADGETRESPONSE_STATUS._serialized_end=4837
+  _CONSENSUSSETTINGSGETREQUEST._serialized_start=4839
+  _CONSENSUSSETTINGSGETREQUEST._serialized_end=4900
+  _CONSENSUSSETTINGSGETRESPONSE._serialized_start=4903
+  _CONSENSUSSETTINGSGETRESPONSE._serialized_end=5158
+  _CONSENSUSSETTINGSGETRESPONSE_STATUS._serialized_start=3346
+  _CONSENSUSSETTINGSGETRESPONSE_STATUS._serialized_end=3473
+  _CONSENSUSSTATEGETREQUEST._serialized_start=5160
+  _CONSENSUSSTATEGETREQUEST._serialized_end=5223
+  _CONSENSUSSTATEGETRESPONSE._serialized_start=5226
+  _CONSENSUSSTATEGETRESPONSE._serialized_end=5472
+  _CONSENSUSSTATEGETRESPONSE_STATUS._serialized_start=3346
+  _CONSENSUSSTATEGETRESPONSE_STATUS._serialized_end=3473
+# @@protoc_insertion_point(module_scope)
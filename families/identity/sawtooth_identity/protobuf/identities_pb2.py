@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sawtooth_identity/protobuf/identities.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n+sawtooth_identity/protobuf/identities.proto\"\x8b\x01\n\x0fIdentityPayload\x12+\n\x04type\x18\x01 \x01(\x0e\x32\x1d.IdentityPayload.IdentityType\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"=\n\x0cIdentityType\x12\x17\n\x13IDENTITY_TYPE_UNSET\x10\x00\x12\n\n\x06POLICY\x10\x01\x12\x08\n\x04ROLE\x10\x02\x42\x1e\n\x1asawtooth.identity.protobufP\x01\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_identity.protobuf.identities_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n\032sawtooth.identity.protobufP\001'
+  _IDENTITYPAYLOAD._serialized_start=48
+  _IDENTITYPAYLOAD._serialized_end=187
+  _IDENTITYPAYLOAD_IDENTITYTYPE._serialized_start=126
+  _IDENTITYPAYLOAD_IDENTITYTYPE._serialized_end=187
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sawtooth_settings_test/protobuf/consensus.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/sawtooth_settings_test/protobuf/consensus.proto\"|\n\x1a\x43onsensusPeerMessageHeader\x12\x11\n\tsigner_id\x18\x01 \x01(\x0c\x12\x16\n\x0e\x63ontent_sha512\x18\x02 \x01(\x0c\x12\x14\n\x0cmessage_type\x18\x05 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\"Q\n\x14\x43onsensusPeerMessage\x12\x0e\n\x06header\x18\x01 \x01(\x0c\x12\x18\n\x10header_signature\x18\x03 \x01(\x0c\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\"\x7f\n\x0e\x43onsensusBlock\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x13\n\x0bprevious_id\x18\x02 \x01(\x0c\x12\x11\n\tsigner_id\x18\x03 \x01(\x0c\x12\x11\n\tblock_num\x18\x04 \x01(\x04\x12\x0f\n\x07payload\x18\x05 \x01(\x0c\x12\x0f\n\x07summary\x18\x06 \x01(\x0c\"$\n\x11\x43onsensusPeerInfo\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"4\n\x16\x43onsensusSettingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"4\n\x13\x43onsensusStateEntry\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"9\n\x18\x43onsensusRegisterRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"\x9a\x02\n\x19\x43onsensusRegisterResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusRegisterResponse.Status\x12#\n\nchain_head\x18\x02 \x01(\x0b\x32\x0f.ConsensusBlock\x12!\n\x05peers\x18\x03 \x03(\x0b\x32\x12.ConsensusPeerInfo\x12+\n\x0flocal_peer_info\x18\x04 \x01(\x0b\x32\x12.ConsensusPeerInfo\"U\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\"E\n\x1c\x43onsensusNotifyPeerConnected\x12%\n\tpeer_info\x18\x01 \x01(\x0b\x32\x12.ConsensusPeerInfo\"2\n\x1f\x43onsensusNotifyPeerDisconnected\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"W\n\x1a\x43onsensusNotifyPeerMessage\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\x12\x11\n\tsender_id\x18\x02 \x01(\x0c\"9\n\x17\x43onsensusNotifyBlockNew\x12\x1e\n\x05\x62lock\x18\x01 \x01(\x0b\x32\x0f.ConsensusBlock\"-\n\x19\x43onsensusNotifyBlockValid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"/\n\x1b\x43onsensusNotifyBlockInvalid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\".\n\x1a\x43onsensusNotifyBlockCommit\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\x95\x01\n\x1e\x43onsensusNotifyEngineActivated\x12#\n\nchain_head\x18\x01 \x01(\x0b\x32\x0f.ConsensusBlock\x12!\n\x05peers\x18\x02 \x03(\x0b\x32\x12.ConsensusPeerInfo\x12+\n\x0flocal_peer_info\x18\x03 \x01(\x0b\x32\x12.ConsensusPeerInfo\"\"\n ConsensusNotifyEngineDeactivated\"\x14\n\x12\x43onsensusNotifyAck\"T\n\x16\x43onsensusSendToRequest\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x14\n\x0cmessage_type\x18\x03 \x01(\t\x12\x13\n\x0breceiver_id\x18\x02 \x01(\x0c\"\xca\x01\n\x17\x43onsensusSendToResponse\x12/\n\x06status\x18\x01 \x01(\x0e\x32\x1f.ConsensusSendToResponse.Status\"~\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x10\n\x0cUNKNOWN_PEER\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"B\n\x19\x43onsensusBroadcastRequest\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x14\n\x0cmessage_type\x18\x02 \x01(\t\"\xbe\x01\n\x1a\x43onsensusBroadcastResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBroadcastResponse.Status\"l\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x05\"6\n\x1f\x43onsensusInitializeBlockRequest\x12\x13\n\x0bprevious_id\x18\x01 \x01(\x0c\"\xf1\x01\n ConsensusInitializeBlockResponse\x12\x38\n\x06status\x18\x01 \x01(\x0e\x32(.ConsensusInitializeBlockResponse.Status\"\x92\x01\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x11\n\rUNKNOWN_BLOCK\x10\x06\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x07\" \n\x1e\x43onsensusSummarizeBlockRequest\"\x82\x02\n\x1f\x43onsensusSummarizeBlockResponse\x12\x37\n\x06status\x18\x01 \x01(\x0e\x32\'.ConsensusSummarizeBlockResponse.Status\x12\x0f\n\x07summary\x18\x02 \x01(\x0c\"\x94\x01\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x13\n\x0f\x42LOCK_NOT_READY\x10\x06\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x07\"-\n\x1d\x43onsensusFinalizeBlockRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\x81\x02\n\x1e\x43onsensusFinalizeBlockResponse\x12\x36\n\x06status\x18\x01 \x01(\x0e\x32&.ConsensusFinalizeBlockResponse.Status\x12\x10\n\x08\x62lock_id\x18\x02 \x01(\x0c\"\x94\x01\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x13\n\x0f\x42LOCK_NOT_READY\x10\x06\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x07\"\x1d\n\x1b\x43onsensusCancelBlockRequest\"\xd5\x01\n\x1c\x43onsensusCancelBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCancelBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"0\n\x1b\x43onsensusCheckBlocksRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xd5\x01\n\x1c\x43onsensusCheckBlocksResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCheckBlocksResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"/\n\x1b\x43onsensusCommitBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xd5\x01\n\x1c\x43onsensusCommitBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCommitBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"/\n\x1b\x43onsensusIgnoreBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xd5\x01\n\x1c\x43onsensusIgnoreBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusIgnoreBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"-\n\x19\x43onsensusFailBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xd1\x01\n\x1a\x43onsensusFailBlockResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusFailBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\".\n\x19\x43onsensusBlocksGetRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xf2\x01\n\x1a\x43onsensusBlocksGetResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBlocksGetResponse.Status\x12\x1f\n\x06\x62locks\x18\x02 \x03(\x0b\x32\x0f.ConsensusBlock\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"\x1e\n\x1c\x43onsensusChainHeadGetRequest\"\xf7\x01\n\x1d\x43onsensusChainHeadGetResponse\x12\x35\n\x06status\x18\x01 \x01(\x0e\x32%.ConsensusChainHeadGetResponse.Status\x12\x1e\n\x05\x62lock\x18\x02 \x01(\x0b\x32\x0f.ConsensusBlock\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rNO_CHAIN_HEAD\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"=\n\x1b\x43onsensusSettingsGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x0c\n\x04keys\x18\x02 \x03(\t\"\xff\x01\n\x1c\x43onsensusSettingsGetResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusSettingsGetResponse.Status\x12(\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x17.ConsensusSettingsEntry\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"?\n\x18\x43onsensusStateGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x11\n\taddresses\x18\x02 \x03(\t\"\xf6\x01\n\x19\x43onsensusStateGetResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusStateGetResponse.Status\x12%\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x14.ConsensusStateEntry\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_settings_test.protobuf.consensus_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _CONSENSUSPEERMESSAGEHEADER._serialized_start=51
+  _CONSENSUSPEERMESSAGEHEADER._serialized_end=175
+  _CONSENSUSPEERMESSAGE._serialized_start=177
+  _CONSENSUSPEERMESSAGE._serialized_end=258
+  _CONSENSUSBLOCK._serialized_start=260
+  _CONSENSUSBLOCK._serialized_end=387
+  _CONSENSUSPEERINFO._serialized_start=389
+  _CONSENSUSPEERINFO._serialized_end=425
+  _CONSENSUSSETTINGSENTRY._serialized_start=427
+  _CONSENSUSSETTINGSENTRY._serialized_end=479
+  _CONSENSUSSTATEENTRY._serialized_start=481
+  _CONSENSUSSTATEENTRY._serialized_end=533
+  _CONSENSUSREGISTERREQUEST._serialized_start=535
+  _CONSENSUSREGISTERREQUEST._serialized_end=592
+  _CONSENSUSREGISTERRESPONSE._serialized_start=595
+  _CONSENSUSREGISTERRESPONSE._serialized_end=877
+  _CONSENSUSREGISTERRESPONSE_STATUS._serialized_start=792
+  _CONSENSUSREGISTERRESPONSE_STATUS._serialized_end=877
+  _CONSENSUSNOTIFYPEERCONNECTED._serialized_start=879
+  _CONSENSUSNOTIFYPEERCONNECTED._serialized_end=948
+  _CONSENSUSNOTIFYPEERDISCONNECTED._serialized_start=950
+  _CONSENSUSNOTIFYPEERDISCONNECTED._serialized_end=1000
+  _CONSENSUSNOTIFYPEERMESSAGE._serialized_start=1002
+  _CONSENSUSNOTIFYPEERMESSAGE._serialized_end=1089
+  _CONSENSUSNOTIFYBLOCKNEW._serialized_start=1091
+  _CONSENSUSNOTIFYBLOCKNEW._serialized_end=1148
+  _CONSENSUSNOTIFYBLOCKVALID._serialized_start=1150
+  _CONSENSUSNOTIFYBLOCKVALID._serialized_end=1195
+  _CONSENSUSNOTIFYBLOCKINVALID._serialized_start=1197
+  _CONSENSUSNOTIFYBLOCKINVALID._serialized_end=1244
+  _CONSENSUSNOTIFYBLOCKCOMMIT._serialized_start=1246
+  _CONSENSUSNOTIFYBLOCKCOMMIT._serialized_end=1292
+  _CONSENSUSNOTIFYENGINEACTIVATED._serialized_start=1295
+  _CONSENSUSNOTIFYENGINEACTIVATED._serialized_end=1444
+  _CONSENSUSNOTIFYENGINEDEACTIVATED._serialized_start=1446
+  _CONSENSUSNOTIFYENGINEDEACTIVATED._serialized_end=1480
+  _CONSENSUSNOTIFYACK._serialized_start=1482
+  _CONSENSUSNOTIFYACK._serialized_end=1502
+  _CONSENSUSSENDTOREQUEST._serialized_start=1504
+  _CONSENSUSSENDTOREQUEST._serialized_end=1588
+  _CONSENSUSSENDTORESPONSE._serialized_start=1591
+  _CONSENSUSSENDTORESPONSE._serialized_end=1793
+  _CONSENSUSSENDTORESPONSE_STATUS._serialized_start=1667
+  _CONSENSUSSENDTORESPONSE_STATUS._serialized_end=1793
+  _CONSENSUSBROADCASTREQUEST._serialized_start=1795
+  _CONSENSUSBROADCASTREQUEST._serialized_end=1861
+  _CONSENSUSBROADCASTRESPONSE._serialized_start=1864
+  _CONSENSUSBROADCASTRESPONSE._serialized_end=2054
+  _CONSENSUSBROADCASTRESPONSE_STATUS._serialized_start=1946
+  _CONSENSUSBROADCASTRESPONSE_STATUS._serialized_end=2054
+  _CONSENSUSINITIALIZEBLOCKREQUEST._serialized_start=2056
+  _CONSENSUSINITIALIZEBLOCKREQUEST._serialized_end=2110
+  _CONSENSUSINITIALIZEBLOCKRESPONSE._serialized_start=2113
+  _CONSENSUSINITIALIZEBLOCKRESPONSE._serialized_end=2354
+  _CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS._serialized_start=2208
+  _CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS._serialized_end=2354
+  _CONSENSUSSUMMARIZEBLOCKREQUEST._serialized_start=2356
+  _CONSENSUSSUMMARIZEBLOCKREQUEST._serialized_end=2388
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE._serialized_start=2391
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE._serialized_end=2649
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE_STATUS._serialized_start=2501
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE_STATUS._serialized_end=2649
+  _CONSENSUSFINALIZEBLOCKREQUEST._serialized_start=2651
+  _CONSENSUSFINALIZEBLOCKREQUEST._serialized_end=2696
+  _CONSENSUSFINALIZEBLOCKRESPONSE._serialized_start=2699
+  _CONSENSUSFINALIZEBLOCKRESPONSE._serialized_end=2956
+  _CONSENSUSFINALIZEBLOCKRESPONSE_STATUS._serialized_start=2501
+  _CONSENSUSFINALIZEBLOCKRESPONSE_STATUS._serialized_end=2649
+  _CONSENSUSCANCELBLOCKREQUEST._serialized_start=2958
+  _CONSENSUSCANCELBLOCKREQUEST._serialized_end=2987
+  _CONSENSUSCANCELBLOCKRESPONSE._serialized_start=2990
+  _CONSENSUSCANCELBLOCKRESPONSE._serialized_end=3203
+  _CONSENSUSCANCELBLOCKRESPONSE_STATUS._serialized_start=3076
+  _CONSENSUSCANCELBLOCKRESPONSE_STATUS._serialized_end=3203
+  _CONSENSUSCHECKBLOCKSREQUEST._serialized_start=3205
+  _CONSENSUSCHECKBLOCKSREQUEST._serialized_end=3253
+  _CONSENSUSCHECKBLOCKSRESPONSE._serialized_start=3256
+  _CONSENSUSCHECKBLOCKSRESPONSE._serialized_end=3469
+  _CONSENSUSCHECKBLOCKSRESPONSE_STATUS._serialized_start=3342
+  _CONSENSUSCHECKBLOCKSRESPONSE_STATUS._serialized_end=3469
+  _CONSENSUSCOMMITBLOCKREQUEST._serialized_start=3471
+  _CONSENSUSCOMMITBLOCKREQUEST._serialized_end=3518
+  _CONSENSUSCOMMITBLOCKRESPONSE._serialized_start=3521
+  _CONSENSUSCOMMITBLOCKRESPONSE._serialized_end=3734
+  _CONSENSUSCOMMITBLOCKRESPONSE_STATUS._serialized_start=3342
+  _CONSENSUSCOMMITBLOCKRESPONSE_STATUS._serialized_end=3469
+  _CONSENSUSIGNOREBLOCKREQUEST._serialized_start=3736
+  _CONSENSUSIGNOREBLOCKREQUEST._serialized_end=3783
+  _CONSENSUSIGNOREBLOCKRESPONSE._serialized_start=3786
+  _CONSENSUSIGNOREBLOCKRESPONSE._serialized_end=3999
+  _CONSENSUSIGNOREBLOCKRESPONSE_STATUS._serialized_start=3342
+  _CONSENSUSIGNOREBLOCKRESPONSE_STATUS._serialized_end=3469
+  _CONSENSUSFAILBLOCKREQUEST._serialized_start=4001
+  _CONSENSUSFAILBLOCKREQUEST._serialized_end=4046
+  _CONSENSUSFAILBLOCKRESPONSE._serialized_start=4049
+  _CONSENSUSFAILBLOCKRESPONSE._serialized_end=4258
+  _CONSENSUSFAILBLOCKRESPONSE_STATUS._serialized_start=3342
+  _CONSENSUSFAILBLOCKRESPONSE_STATUS._serialized_end=3469
+  _CONSENSUSBLOCKSGETREQUEST._serialized_start=4260
+  _CONSENSUSBLOCKSGETREQUEST._serialized_end=4306
+  _CONSENSUSBLOCKSGETRESPONSE._serialized_start=4309
+  _CONSENSUSBLOCKSGETRESPONSE._serialized_end=4551
+  _CONSENSUSBLOCKSGETRESPONSE_STATUS._serialized_start=3342
+  _CONSENSUSBLOCKSGETRESPONSE_STATUS._serialized_end=3469
+  _CONSENSUSCHAINHEADGETREQUEST._serialized_start=4553
+  _CONSENSUSCHAINHEADGETREQUEST._serialized_end=4583
+  _CONSENSUSCHAINHEADGETRESPONSE._serialized_start=4586
+  _CONSENSUSCHAINHEADGETRESPONSE._serialized_end=4833
+  _CONSENSUSCHAINHEADGETRESPONSE_STATUS._serialized_start=4706
+  _CONSENSUSCHAINHEADGETRESPONSE_STATUS._serialized_end=4833
+  _CONSENSUSSETTINGSGETREQUEST._serialized_start=4835
+  _CONSENSUSSETTINGSGETREQUEST._serialized_end=4896
+  _CONSENSUSSETTINGSGETRESPONSE._serialized_start=4899
+  _CONSENSUSSETTINGSGETRESPONSE._serialized_end=5154
+  _CONSENSUSSETTINGSGETRESPONSE_STATUS._serialized_start=3342
+  _CONSENSUSSETTINGSGETRESPONSE_STATUS._serialized_end=3469
+  _CONSENSUSSTATEGETREQUEST._serialized_start=5156
+  _CONSENSUSSTATEGETREQUEST._serialized_end=5219
+  _CONSENSUSSTATEGETRESPONSE._serialized_start=5222
+  _CONSENSUSSTATEGETRESPONSE._serialized_end=5468
+  _CONSENSUSSTATEGETRESPONSE_STATUS._serialized_start=3342
+  _CONSENSUSSTATEGETRESPONSE_STATUS._serialized_end=3469
+# @@protoc_insertion_point(module_scope)
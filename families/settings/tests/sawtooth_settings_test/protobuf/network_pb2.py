@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sawtooth_settings_test/protobuf/network.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n-sawtooth_settings_test/protobuf/network.proto\"\x13\n\x11\x44isconnectMessage\"A\n\x13PeerRegisterRequest\x12\x10\n\x08\x65ndpoint\x18\x01 \x01(\t\x12\x18\n\x10protocol_version\x18\x02 \x01(\r\"\x17\n\x15PeerUnregisterRequest\"\x11\n\x0fGetPeersRequest\"*\n\x10GetPeersResponse\x12\x16\n\x0epeer_endpoints\x18\x01 \x03(\t\"\r\n\x0bPingRequest\"\x0e\n\x0cPingResponse\"\xb4\x01\n\rGossipMessage\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x30\n\x0c\x63ontent_type\x18\x02 \x01(\x0e\x32\x1a.GossipMessage.ContentType\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\r\"J\n\x0b\x43ontentType\x12\x16\n\x12\x43ONTENT_TYPE_UNSET\x10\x00\x12\t\n\x05\x42LOCK\x10\x01\x12\t\n\x05\x42\x41TCH\x10\x02\x12\r\n\tCONSENSUS\x10\x03\"w\n\x16NetworkAcknowledgement\x12.\n\x06status\x18\x01 \x01(\x0e\x32\x1e.NetworkAcknowledgement.Status\"-\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\t\n\x05\x45RROR\x10\x02\"K\n\x12GossipBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\t\x12\r\n\x05nonce\x18\x02 \x01(\t\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\r\"&\n\x13GossipBlockResponse\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\"&\n\x13GossipBatchResponse\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\"N\n\x1bGossipBatchByBatchIdRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05nonce\x18\x02 \x01(\t\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\r\"U\n!GossipBatchByTransactionIdRequest\x12\x0b\n\x03ids\x18\x01 \x03(\t\x12\r\n\x05nonce\x18\x02 \x01(\t\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\rB&\n\x15sawtooth.sdk.protobufP\x01Z\x0bnetwork_pb2b\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_settings_test.protobuf.network_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n\025sawtooth.sdk.protobufP\001Z\013network_pb2'
+  _DISCONNECTMESSAGE._serialized_start=49
+  _DISCONNECTMESSAGE._serialized_end=68
+  _PEERREGISTERREQUEST._serialized_start=70
+  _PEERREGISTERREQUEST._serialized_end=135
+  _PEERUNREGISTERREQUEST._serialized_start=137
+  _PEERUNREGISTERREQUEST._serialized_end=160
+  _GETPEERSREQUEST._serialized_start=162
+  _GETPEERSREQUEST._serialized_end=179
+  _GETPEERSRESPONSE._serialized_start=181
+  _GETPEERSRESPONSE._serialized_end=223
+  _PINGREQUEST._serialized_start=225
+  _PINGREQUEST._serialized_end=238
+  _PINGRESPONSE._serialized_start=240
+  _PINGRESPONSE._serialized_end=254
+  _GOSSIPMESSAGE._serialized_start=257
+  _GOSSIPMESSAGE._serialized_end=437
+  _GOSSIPMESSAGE_CONTENTTYPE._serialized_start=363
+  _GOSSIPMESSAGE_CONTENTTYPE._serialized_end=437
+  _NETWORKACKNOWLEDGEMENT._serialized_start=439
+  _NETWORKACKNOWLEDGEMENT._serialized_end=558
+  _NETWORKACKNOWLEDGEMENT_STATUS._serialized_start=513
+  _NETWORKACKNOWLEDGEMENT_STATUS._serialized_end=558
+  _GOSSIPBLOCKREQUEST._serialized_start=560
+  _GOSSIPBLOCKREQUEST._serialized_end=635
+  _GOSSIPBLOCKRESPONSE._serialized_start=637
+  _GOSSIPBLOCKRESPONSE._serialized_end=675
+  _GOSSIPBATCHRESPONSE._serialized_start=677
+  _GOSSIPBATCHRESPONSE._serialized_end=715
+  _GOSSIPBATCHBYBATCHIDREQUEST._serialized_start=717
+  _GOSSIPBATCHBYBATCHIDREQUEST._serialized_end=795
+  _GOSSIPBATCHBYTRANSACTIONIDREQUEST._serialized_start=797
+  _GOSSIPBATCHBYTRANSACTIONIDREQUEST._serialized_end=882
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sawtooth_rest_api/protobuf/consensus.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n*sawtooth_rest_api/protobuf/consensus.proto\"|\n\x1a\x43onsensusPeerMessageHeader\x12\x11\n\tsigner_id\x18\x01 \x01(\x0c\x12\x16\n\x0e\x63ontent_sha512\x18\x02 \x01(\x0c\x12\x14\n\x0cmessage_type\x18\x05 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\"Q\n\x14\x43onsensusPeerMessage\x12\x0e\n\x06header\x18\x01 \x01(\x0c\x12\x18\n\x10header_signature\x18\x03 \x01(\x0c\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\"\x7f\n\x0e\x43onsensusBlock\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x13\n\x0bprevious_id\x18\x02 \x01(\x0c\x12\x11\n\tsigner_id\x18\x03 \x01(\x0c\x12\x11\n\tblock_num\x18\x04 \x01(\x04\x12\x0f\n\x07payload\x18\x05 \x01(\x0c\x12\x0f\n\x07summary\x18\x06 \x01(\x0c\"$\n\x11\x43onsensusPeerInfo\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"4\n\x16\x43onsensusSettingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"4\n\x13\x43onsensusStateEntry\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"9\n\x18\x43onsensusRegisterRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"\x9a\x02\n\x19\x43onsensusRegisterResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusRegisterResponse.Status\x12#\n\nchain_head\x18\x02 \x01(\x0b\x32\x0f.ConsensusBlock\x12!\n\x05peers\x18\x03 \x03(\x0b\x32\x12.ConsensusPeerInfo\x12+\n\x0flocal_peer_info\x18\x04 \x01(\x0b\x32\x12.ConsensusPeerInfo\"U\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\"E\n\x1c\x43onsensusNotifyPeerConnected\x12%\n\tpeer_info\x18\x01 \x01(\x0b\x32\x12.ConsensusPeerInfo\"2\n\x1f\x43onsensusNotifyPeerDisconnected\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"W\n\x1a\x43onsensusNotifyPeerMessage\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\x12\x11\n\tsender_id\x18\x02 \x01(\x0c\"9\n\x17\x43onsensusNotifyBlockNew\x12\x1e\n\x05\x62lock\x18\x01 \x01(\x0b\x32\x0f.ConsensusBlock\"-\n\x19\x43onsensusNotifyBlockValid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"/\n\x1b\x43onsensusNotifyBlockInvalid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\".\n\x1a\x43onsensusNotifyBlockCommit\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\x95\x01\n\x1e\x43onsensusNotifyEngineActivated\x12#\n\nchain_head\x18\x01 \x01(\x0b\x32\x0f.ConsensusBlock\x12!\n\x05peers\x18\x02 \x03(\x0b\x32\x12.ConsensusPeerInfo\x12+\n\x0flocal_peer_info\x18\x03 \x01(\x0b\x32\x12.ConsensusPeerInfo\"\"\n ConsensusNotifyEngineDeactivated\"\x14\n\x12\x43onsensusNotifyAck\"T\n\x16\x43onsensusSendToRequest\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x14\n\x0cmessage_type\x18\x03 \x01(\t\x12\x13\n\x0breceiver_id\x18\x02 \x01(\x0c\"\xca\x01\n\x17\x43onsensusSendToResponse\x12/\n\x06status\x18\x01 \x01(\x0e\x32\x1f.ConsensusSendToResponse.Status\"~\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x10\n\x0cUNKNOWN_PEER\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"B\n\x19\x43onsensusBroadcastRequest\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x14\n\x0cmessage_type\x18\x02 \x01(\t\"\xbe\x01\n\x1a\x43onsensusBroadcastResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBroadcastResponse.Status\"l\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x05\"6\n\x1f\x43onsensusInitializeBlockRequest\x12\x13\n\x0bprevious_id\x18\x01 \x01(\x0c\"\xf1\x01\n ConsensusInitializeBlockResponse\x12\x38\n\x06status\x18\x01 \x01(\x0e\x32(.ConsensusInitializeBlockResponse.Status\"\x92\x01\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x11\n\rUNKNOWN_BLOCK\x10\x06\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x07\" \n\x1e\x43onsensusSummarizeBlockRequest\"\x82\x02\n\x1f\x43onsensusSummarizeBlockResponse\x12\x37\n\x06status\x18\x01 \x01(\x0e\x32\'.ConsensusSummarizeBlockResponse.Status\x12\x0f\n\x07summary\x18\x02 \x01(\x0c\"\x94\x01\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x13\n\x0f\x42LOCK_NOT_READY\x10\x06\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x07\"-\n\x1d\x43onsensusFinalizeBlockRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\x81\x02\n\x1e\x43onsensusFinalizeBlockResponse\x12\x36\n\x06status\x18\x01 \x01(\x0e\x32&.ConsensusFinalizeBlockResponse.Status\x12\x10\n\x08\x62lock_id\x18\x02 \x01(\x0c\"\x94\x01\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x13\n\x0f\x42LOCK_NOT_READY\x10\x06\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x07\"\x1d\n\x1b\x43onsensusCancelBlockRequest\"\xd5\x01\n\x1c\x43onsensusCancelBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCancelBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"0\n\x1b\x43onsensusCheckBlocksRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xd5\x01\n\x1c\x43onsensusCheckBlocksResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCheckBlocksResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"/\n\x1b\x43onsensusCommitBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xd5\x01\n\x1c\x43onsensusCommitBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCommitBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"/\n\x1b\x43onsensusIgnoreBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xd5\x01\n\x1c\x43onsensusIgnoreBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusIgnoreBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"-\n\x19\x43onsensusFailBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xd1\x01\n\x1a\x43onsensusFailBlockResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusFailBlockResponse.Status\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\".\n\x19\x43onsensusBlocksGetRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xf2\x01\n\x1a\x43onsensusBlocksGetResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBlocksGetResponse.Status\x12\x1f\n\x06\x62locks\x18\x02 \x03(\x0b\x32\x0f.ConsensusBlock\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"\x1e\n\x1c\x43onsensusChainHeadGetRequest\"\xf7\x01\n\x1d\x43onsensusChainHeadGetResponse\x12\x35\n\x06status\x18\x01 \x01(\x0e\x32%.ConsensusChainHeadGetResponse.Status\x12\x1e\n\x05\x62lock\x18\x02 \x01(\x0b\x32\x0f.ConsensusBlock\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rNO_CHAIN_HEAD\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"=\n\x1b\x43onsensusSettingsGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x0c\n\x04keys\x18\x02 \x03(\t\"\xff\x01\n\x1c\x43onsensusSettingsGetResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusSettingsGetResponse.Status\x12(\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x17.ConsensusSettingsEntry\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\"?\n\x18\x43onsensusStateGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x11\n\taddresses\x18\x02 \x03(\t\"\xf6\x01\n\x19\x43onsensusStateGetResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusStateGetResponse.Status\x12%\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x14.ConsensusStateEntry\"\x7f\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x12\x15\n\x11NOT_ACTIVE_ENGINE\x10\x06\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_rest_api.protobuf.consensus_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _CONSENSUSPEERMESSAGEHEADER._serialized_start=46
+  _CONSENSUSPEERMESSAGEHEADER._serialized_end=170
+  _CONSENSUSPEERMESSAGE._serialized_start=172
+  _CONSENSUSPEERMESSAGE._serialized_end=253
+  _CONSENSUSBLOCK._serialized_start=255
+  _CONSENSUSBLOCK._serialized_end=382
+  _CONSENSUSPEERINFO._serialized_start=384
+  _CONSENSUSPEERINFO._serialized_end=420
+  _CONSENSUSSETTINGSENTRY._serialized_start=422
+  _CONSENSUSSETTINGSENTRY._serialized_end=474
+  _CONSENSUSSTATEENTRY._serialized_start=476
+  _CONSENSUSSTATEENTRY._serialized_end=528
+  _CONSENSUSREGISTERREQUEST._serialized_start=530
+  _CONSENSUSREGISTERREQUEST._serialized_end=587
+  _CONSENSUSREGISTERRESPONSE._serialized_start=590
+  _CONSENSUSREGISTERRESPONSE._serialized_end=872
+  _CONSENSUSREGISTERRESPONSE_STATUS._serialized_start=787
+  _CONSENSUSREGISTERRESPONSE_STATUS._serialized_end=872
+  _CONSENSUSNOTIFYPEERCONNECTED._serialized_start=874
+  _CONSENSUSNOTIFYPEERCONNECTED._serialized_end=943
+  _CONSENSUSNOTIFYPEERDISCONNECTED._serialized_start=945
+  _CONSENSUSNOTIFYPEERDISCONNECTED._serialized_end=995
+  _CONSENSUSNOTIFYPEERMESSAGE._serialized_start=997
+  _CONSENSUSNOTIFYPEERMESSAGE._serialized_end=1084
+  _CONSENSUSNOTIFYBLOCKNEW._serialized_start=1086
+  _CONSENSUSNOTIFYBLOCKNEW._serialized_end=1143
+  _CONSENSUSNOTIFYBLOCKVALID._serialized_start=1145
+  _CONSENSUSNOTIFYBLOCKVALID._serialized_end=1190
+  _CONSENSUSNOTIFYBLOCKINVALID._serialized_start=1192
+  _CONSENSUSNOTIFYBLOCKINVALID._serialized_end=1239
+  _CONSENSUSNOTIFYBLOCKCOMMIT._serialized_start=1241
+  _CONSENSUSNOTIFYBLOCKCOMMIT._serialized_end=1287
+  _CONSENSUSNOTIFYENGINEACTIVATED._serialized_start=1290
+  _CONSENSUSNOTIFYENGINEACTIVATED._serialized_end=1439
+  _CONSENSUSNOTIFYENGINEDEACTIVATED._serialized_start=1441
+  _CONSENSUSNOTIFYENGINEDEACTIVATED._serialized_end=1475
+  _CONSENSUSNOTIFYACK._serialized_start=1477
+  _CONSENSUSNOTIFYACK._serialized_end=1497
+  _CONSENSUSSENDTOREQUEST._serialized_start=1499
+  _CONSENSUSSENDTOREQUEST._serialized_end=1583
+  _CONSENSUSSENDTORESPONSE._serialized_start=1586
+  _CONSENSUSSENDTORESPONSE._serialized_end=1788
+  _CONSENSUSSENDTORESPONSE_STATUS._serialized_start=1662
+  _CONSENSUSSENDTORESPONSE_STATUS._serialized_end=1788
+  _CONSENSUSBROADCASTREQUEST._serialized_start=1790
+  _CONSENSUSBROADCASTREQUEST._serialized_end=1856
+  _CONSENSUSBROADCASTRESPONSE._serialized_start=1859
+  _CONSENSUSBROADCASTRESPONSE._serialized_end=2049
+  _CONSENSUSBROADCASTRESPONSE_STATUS._serialized_start=1941
+  _CONSENSUSBROADCASTRESPONSE_STATUS._serialized_end=2049
+  _CONSENSUSINITIALIZEBLOCKREQUEST._serialized_start=2051
+  _CONSENSUSINITIALIZEBLOCKREQUEST._serialized_end=2105
+  _CONSENSUSINITIALIZEBLOCKRESPONSE._serialized_start=2108
+  _CONSENSUSINITIALIZEBLOCKRESPONSE._serialized_end=2349
+  _CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS._serialized_start=2203
+  _CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS._serialized_end=2349
+  _CONSENSUSSUMMARIZEBLOCKREQUEST._serialized_start=2351
+  _CONSENSUSSUMMARIZEBLOCKREQUEST._serialized_end=2383
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE._serialized_start=2386
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE._serialized_end=2644
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE_STATUS._serialized_start=2496
+  _CONSENSUSSUMMARIZEBLOCKRESPONSE_STATUS._serialized_end=2644
+  _CONSENSUSFINALIZEBLOCKREQUEST._serialized_start=2646
+  _CONSENSUSFINALIZEBLOCKREQUEST._serialized_end=2691
+  _CONSENSUSFINALIZEBLOCKRESPONSE._serialized_start=2694
+  _CONSENSUSFINALIZEBLOCKRESPONSE._serialized_end=2951
+  _CONSENSUSFINALIZEBLOCKRESPONSE_STATUS._serialized_start=2496
+  _CONSENSUSFINALIZEBLOCKRESPONSE_STATUS._serialized_end=2644
+  _CONSENSUSCANCELBLOCKREQUEST._serialized_start=2953
+  _CONSENSUSCANCELBLOCKREQUEST._serialized_end=2982
+  _CONSENSUSCANCELBLOCKRESPONSE._serialized_start=2985
+  _CONSENSUSCANCELBLOCKRESPONSE._serialized_end=3198
+  _CONSENSUSCANCELBLOCKRESPONSE_STATUS._serialized_start=3071
+  _CONSENSUSCANCELBLOCKRESPONSE_STATUS._serialized_end=3198
+  _CONSENSUSCHECKBLOCKSREQUEST._serialized_start=3200
+  _CONSENSUSCHECKBLOCKSREQUEST._serialized_end=3248
+  _CONSENSUSCHECKBLOCKSRESPONSE._serialized_start=3251
+  _CONSENSUSCHECKBLOCKSRESPONSE._serialized_end=3464
+  _CONSENSUSCHECKBLOCKSRESPONSE_STATUS._serialized_start=3337
+  _CONSENSUSCHECKBLOCKSRESPONSE_STATUS._serialized_end=3464
+  _CONSENSUSCOMMITBLOCKREQUEST._serialized_start=3466
+  _CONSENSUSCOMMITBLOCKREQUEST._serialized_end=3513
+  _CONSENSUSCOMMITBLOCKRESPONSE._serialized_start=3516
+  _CONSENSUSCOMMITBLOCKRESPONSE._serialized_end=3729
+  _CONSENSUSCOMMITBLOCKRESPONSE_STATUS._serialized_start=3337
+  _CONSENSUSCOMMITBLOCKRESPONSE_STATUS._serialized_end=3464
+  _CONSENSUSIGNOREBLOCKREQUEST._serialized_start=3731
+  _CONSENSUSIGNOREBLOCKREQUEST._serialized_end=3778
+  _CONSENSUSIGNOREBLOCKRESPONSE._serialized_start=3781
+  _CONSENSUSIGNOREBLOCKRESPONSE._serialized_end=3994
+  _CONSENSUSIGNOREBLOCKRESPONSE_STATUS._serialized_start=3337
+  _CONSENSUSIGNOREBLOCKRESPONSE_STATUS._serialized_end=3464
+  _CONSENSUSFAILBLOCKREQUEST._serialized_start=3996
+  _CONSENSUSFAILBLOCKREQUEST._serialized_end=4041
+  _CONSENSUSFAILBLOCKRESPONSE._serialized_start=4044
+  _CONSENSUSFAILBLOCKRESPONSE._serialized_end=4253
+  _CONSENSUSFAILBLOCKRESPONSE_STATUS._serialized_start=3337
+  _CONSENSUSFAILBLOCKRESPONSE_STATUS._serialized_end=3464
+  _CONSENSUSBLOCKSGETREQUEST._serialized_start=4255
+  _CONSENSUSBLOCKSGETREQUEST._serialized_end=4301
+  _CONSENSUSBLOCKSGETRESPONSE._serialized_start=4304
+  _CONSENSUSBLOCKSGETRESPONSE._serialized_end=4546
+  _CONSENSUSBLOCKSGETRESPONSE_STATUS._serialized_start=3337
+  _CONSENSUSBLOCKSGETRESPONSE_STATUS._serialized_end=3464
+  _CONSENSUSCHAINHEADGETREQUEST._serialized_start=4548
+  _CONSENSUSCHAINHEADGETREQUEST._serialized_end=4578
+  _CONSENSUSCHAINHEADGETRESPONSE._serialized_start=4581
+  _CONSENSUSCHAINHEADGETRESPONSE._serialized_end=4828
+  _CONSENSUSCHAINHEADGETRESPONSE_STATUS._serialized_start=4701
+  _CONSENSUSCHAINHEADGETRESPONSE_STATUS._serialized_end=4828
+  _CONSENSUSSETTINGSGETREQUEST._serialized_start=4830
+  _CONSENSUSSETTINGSGETREQUEST._serialized_end=4891
+  _CONSENSUSSETTINGSGETRESPONSE._serialized_start=4894
+  _CONSENSUSSETTINGSGETRESPONSE._serialized_end=5149
+  _CONSENSUSSETTINGSGETRESPONSE_STATUS._serialized_start=3337
+  _CONSENSUSSETTINGSGETRESPONSE_STATUS._serialized_end=3464
+  _CONSENSUSSTATEGETREQUEST._serialized_start=5151
+  _CONSENSUSSTATEGETREQUEST._serialized_end=5214
+  _CONSENSUSSTATEGETRESPONSE._serialized_start=5217
+  _CONSENSUSSTATEGETRESPONSE._serialized_end=5463
+  _CONSENSUSSTATEGETRESPONSE_STATUS._serialized_start=3337
+  _CONSENSUSSTATEGETRESPONSE_STATUS._serialized_end=3464
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sawtooth_rest_api/protobuf/network.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n(sawtooth_rest_api/protobuf/network.proto\"\x13\n\x11\x44isconnectMessage\"A\n\x13PeerRegisterRequest\x12\x10\n\x08\x65ndpoint\x18\x01 \x01(\t\x12\x18\n\x10protocol_version\x18\x02 \x01(\r\"\x17\n\x15PeerUnregisterRequest\"\x11\n\x0fGetPeersRequest\"*\n\x10GetPeersResponse\x12\x16\n\x0epeer_endpoints\x18\x01 \x03(\t\"\r\n\x0bPingRequest\"\x0e\n\x0cPingResponse\"\xb4\x01\n\rGossipMessage\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x30\n\x0c\x63ontent_type\x18\x02 \x01(\x0e\x32\x1a.GossipMessage.ContentType\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\r\"J\n\x0b\x43ontentType\x12\x16\n\x12\x43ONTENT_TYPE_UNSET\x10\x00\x12\t\n\x05\x42LOCK\x10\x01\x12\t\n\x05\x42\x41TCH\x10\x02\x12\r\n\tCONSENSUS\x10\x03\"w\n\x16NetworkAcknowledgement\x12.\n\x06status\x18\x01 \x01(\x0e\x32\x1e.NetworkAcknowledgement.Status\"-\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\t\n\x05\x45RROR\x10\x02\"K\n\x12GossipBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\t\x12\r\n\x05nonce\x18\x02 \x01(\t\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\r\"&\n\x13GossipBlockResponse\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\"&\n\x13GossipBatchResponse\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\"N\n\x1bGossipBatchByBatchIdRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05nonce\x18\x02 \x01(\t\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\r\"U\n!GossipBatchByTransactionIdRequest\x12\x0b\n\x03ids\x18\x01 \x03(\t\x12\r\n\x05nonce\x18\x02 \x01(\t\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\rB&\n\x15sawtooth.sdk.protobufP\x01Z\x0bnetwork_pb2b\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_rest_api.protobuf.network_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n\025sawtooth.sdk.protobufP\001Z\013network_pb2'
+  _DISCONNECTMESSAGE._serialized_start=44
+  _DISCONNECTMESSAGE._serialized_end=63
+  _PEERREGISTERREQUEST._serialized_start=65
+  _PEERREGISTERREQUEST._serialized_end=130
+  _PEERUNREGISTERREQUEST._serialized_start=132
+  _PEERUNREGISTERREQUEST._serialized_end=155
+  _GETPEERSREQUEST._serialized_start=157
+  _GETPEERSREQUEST._serialized_end=174
+  _GETPEERSRESPONSE._serialized_start=176
+  _GETPEERSRESPONSE._serialized_end=218
+  _PINGREQUEST._serialized_start=220
+  _PINGREQUEST._serialized_end=233
+  _PINGRESPONSE._serialized_start=235
+  _PINGRESPONSE._serialized_end=249
+  _GOSSIPMESSAGE._serialized_start=252
+  _GOSSIPMESSAGE._serialized_end=432
+  _GOSSIPMESSAGE_CONTENTTYPE._serialized_start=358
+  _GOSSIPMESSAGE_CONTENTTYPE._serialized_end=432
+  _NETWORKACKNOWLEDGEMENT._serialized_start=434
+  _NETWORKACKNOWLEDGEMENT._serialized_end=553
+  _NETWORKACKNOWLEDGEMENT_STATUS._serialized_start=508
+  _NETWORKACKNOWLEDGEMENT_STATUS._serialized_end=553
+  _GOSSIPBLOCKREQUEST._serialized_start=555
+  _GOSSIPBLOCKREQUEST._serialized_end=630
+  _GOSSIPBLOCKRESPONSE._serialized_start=632
+  _GOSSIPBLOCKRESPONSE._serialized_end=670
+  _GOSSIPBATCHRESPONSE._serialized_start=672
+  _GOSSIPBATCHRESPONSE._serialized_end=710
+  _GOSSIPBATCHBYBATCHIDREQUEST._serialized_start=712
+  _GOSSIPBATCHBYBATCHIDREQUEST._serialized_end=790
+  _GOSSIPBATCHBYTRANSACTIONIDREQUEST._serialized_start=792
+  _GOSSIPBATCHBYTRANSACTIONIDREQUEST._serialized_end=877
+# @@protoc_insertion_point(module_scope)
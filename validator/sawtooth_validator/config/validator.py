@@ -21,11 +21,30 @@ import toml
 
 from sawtooth_validator.exceptions import LocalConfigurationError
 from sawtooth_validator.config.path import load_path_config
+from sawtooth_validator.journal.receipt_codec import \
+    RECEIPT_COMPRESSION_TYPES
 from sawtooth_validator.protobuf.identity_pb2 import Policy
 
 
 LOGGER = logging.getLogger(__name__)
 
+# The most event lists queued for sending to one event subscriber
+DEFAULT_SEND_QUEUE_SIZE = 64
+
+# What to do with a subscriber whose send queue is full: drop the event list
+# which does not fit, or remove the subscriber and disconnect it.
+SLOW_CONSUMER_DROP = 'drop'
+SLOW_CONSUMER_DISCONNECT = 'disconnect'
+SLOW_CONSUMER_POLICIES = (SLOW_CONSUMER_DROP, SLOW_CONSUMER_DISCONNECT)
+
+# The kinds of connection the dispatcher takes messages from, as told by the
+# message types they send
+ROLE_PEER = 'peer'
+ROLE_CLIENT = 'client'
+ROLE_PROCESSOR = 'processor'
+ROLE_CONSENSUS = 'consensus'
+CONNECTION_ROLES = (ROLE_CONSENSUS, ROLE_PROCESSOR, ROLE_PEER, ROLE_CLIENT)
+
 
 def load_default_validator_config():
     return ValidatorConfig(
@@ -39,6 +58,10 @@ def load_default_validator_config():
         maximum_peer_connectivity=10,
         state_pruning_block_depth=100,
         fork_cache_keep_time=300,
+        receipt_compression='none',
+        event_log=False,
+        event_send_queue_size=DEFAULT_SEND_QUEUE_SIZE,
+        event_slow_consumer_policy=SLOW_CONSUMER_DROP,
     )
 
 
@@ -68,7 +91,10 @@ def load_toml_validator_config(filename):
          'opentsdb_url', 'opentsdb_db', 'opentsdb_username',
          'opentsdb_password', 'minimum_peer_connectivity',
          'maximum_peer_connectivity', 'state_pruning_block_depth',
-         'fork_cache_keep_time'])
+         'fork_cache_keep_time', 'receipt_compression', 'event_log',
+         'event_log_attributes', 'component_shard_endpoints',
+         'receipt_commit_window', 'event_send_queue_size',
+         'event_slow_consumer_policy', 'dispatcher_role_weights'])
     if invalid_keys:
         raise LocalConfigurationError(
             "Invalid keys in validator config: "
@@ -87,6 +113,61 @@ def load_toml_validator_config(filename):
     network_public_key = None
     network_private_key = None
 
+    receipt_compression = toml_config.get("receipt_compression", None)
+    if receipt_compression is not None and \
+            receipt_compression not in RECEIPT_COMPRESSION_TYPES:
+        raise LocalConfigurationError(
+            "Invalid receipt_compression in validator config: {}; must be "
+            "one of {}".format(
+                receipt_compression, ", ".join(RECEIPT_COMPRESSION_TYPES)))
+
+    receipt_commit_window = toml_config.get("receipt_commit_window", None)
+    if receipt_commit_window is not None and (
+            not isinstance(receipt_commit_window, (int, float))
+            or receipt_commit_window < 0):
+        raise LocalConfigurationError(
+            "Invalid receipt_commit_window in validator config: {}; must be "
+            "a number of seconds, zero or more".format(
+                receipt_commit_window))
+
+    event_send_queue_size = toml_config.get("event_send_queue_size", None)
+    if event_send_queue_size is not None and (
+            not isinstance(event_send_queue_size, int)
+            or event_send_queue_size < 1):
+        raise LocalConfigurationError(
+            "Invalid event_send_queue_size in validator config: {}; must be "
+            "a positive integer".format(event_send_queue_size))
+
+    event_slow_consumer_policy = toml_config.get(
+        "event_slow_consumer_policy", None)
+    if event_slow_consumer_policy is not None and \
+            event_slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+        raise LocalConfigurationError(
+            "Invalid event_slow_consumer_policy in validator config: {}; "
+            "must be one of {}".format(
+                event_slow_consumer_policy,
+                ", ".join(SLOW_CONSUMER_POLICIES)))
+
+    dispatcher_role_weights = toml_config.get(
+        "dispatcher_role_weights", None)
+    if dispatcher_role_weights is not None:
+        if not isinstance(dispatcher_role_weights, dict):
+            raise LocalConfigurationError(
+                "Invalid dispatcher_role_weights in validator config: {}; "
+                "must be a table of role weights".format(
+                    dispatcher_role_weights))
+        for role, weight in dispatcher_role_weights.items():
+            if role not in CONNECTION_ROLES:
+                raise LocalConfigurationError(
+                    "Invalid role in dispatcher_role_weights in validator "
+                    "config: {}; must be one of {}".format(
+                        role, ", ".join(CONNECTION_ROLES)))
+            if not isinstance(weight, int) or weight < 1:
+                raise LocalConfigurationError(
+                    "Invalid weight for {} in dispatcher_role_weights in "
+                    "validator config: {}; must be a positive "
+                    "integer".format(role, weight))
+
     if toml_config.get("network_public_key") is not None:
         network_public_key = toml_config.get("network_public_key").encode()
 
@@ -118,6 +199,15 @@ def load_toml_validator_config(filename):
             "state_pruning_block_depth", None),
         fork_cache_keep_time=toml_config.get(
             "fork_cache_keep_time", None),
+        receipt_compression=receipt_compression,
+        event_log=toml_config.get("event_log", None),
+        event_log_attributes=toml_config.get("event_log_attributes", None),
+        component_shard_endpoints=toml_config.get(
+            "component_shard_endpoints", None),
+        receipt_commit_window=receipt_commit_window,
+        event_send_queue_size=event_send_queue_size,
+        event_slow_consumer_policy=event_slow_consumer_policy,
+        dispatcher_role_weights=dispatcher_role_weights,
     )
 
     return config
@@ -149,6 +239,14 @@ def merge_validator_config(configs):
     maximum_peer_connectivity = None
     state_pruning_block_depth = None
     fork_cache_keep_time = None
+    receipt_compression = None
+    event_log = None
+    event_log_attributes = None
+    component_shard_endpoints = None
+    receipt_commit_window = None
+    event_send_queue_size = None
+    event_slow_consumer_policy = None
+    dispatcher_role_weights = None
 
     for config in reversed(configs):
         if config.bind_network is not None:
@@ -191,6 +289,22 @@ def merge_validator_config(configs):
             state_pruning_block_depth = config.state_pruning_block_depth
         if config.fork_cache_keep_time is not None:
             fork_cache_keep_time = config.fork_cache_keep_time
+        if config.receipt_compression is not None:
+            receipt_compression = config.receipt_compression
+        if config.event_log is not None:
+            event_log = config.event_log
+        if config.event_log_attributes is not None:
+            event_log_attributes = config.event_log_attributes
+        if config.component_shard_endpoints is not None:
+            component_shard_endpoints = config.component_shard_endpoints
+        if config.receipt_commit_window is not None:
+            receipt_commit_window = config.receipt_commit_window
+        if config.event_send_queue_size is not None:
+            event_send_queue_size = config.event_send_queue_size
+        if config.event_slow_consumer_policy is not None:
+            event_slow_consumer_policy = config.event_slow_consumer_policy
+        if config.dispatcher_role_weights is not None:
+            dispatcher_role_weights = config.dispatcher_role_weights
 
     return ValidatorConfig(
         bind_network=bind_network,
@@ -213,6 +327,14 @@ def merge_validator_config(configs):
         maximum_peer_connectivity=maximum_peer_connectivity,
         state_pruning_block_depth=state_pruning_block_depth,
         fork_cache_keep_time=fork_cache_keep_time,
+        receipt_compression=receipt_compression,
+        event_log=event_log,
+        event_log_attributes=event_log_attributes,
+        component_shard_endpoints=component_shard_endpoints,
+        receipt_commit_window=receipt_commit_window,
+        event_send_queue_size=event_send_queue_size,
+        event_slow_consumer_policy=event_slow_consumer_policy,
+        dispatcher_role_weights=dispatcher_role_weights,
     )
 
 
@@ -264,7 +386,15 @@ class ValidatorConfig:
                  minimum_peer_connectivity=None,
                  maximum_peer_connectivity=None,
                  state_pruning_block_depth=None,
-                 fork_cache_keep_time=None):
+                 fork_cache_keep_time=None,
+                 receipt_compression=None,
+                 event_log=None,
+                 event_log_attributes=None,
+                 component_shard_endpoints=None,
+                 receipt_commit_window=None,
+                 event_send_queue_size=None,
+                 event_slow_consumer_policy=None,
+                 dispatcher_role_weights=None):
 
         self._bind_network = bind_network
         self._bind_component = bind_component
@@ -286,6 +416,14 @@ class ValidatorConfig:
         self._maximum_peer_connectivity = maximum_peer_connectivity
         self._state_pruning_block_depth = state_pruning_block_depth
         self._fork_cache_keep_time = fork_cache_keep_time
+        self._receipt_compression = receipt_compression
+        self._event_log = event_log
+        self._event_log_attributes = event_log_attributes
+        self._component_shard_endpoints = component_shard_endpoints
+        self._receipt_commit_window = receipt_commit_window
+        self._event_send_queue_size = event_send_queue_size
+        self._event_slow_consumer_policy = event_slow_consumer_policy
+        self._dispatcher_role_weights = dispatcher_role_weights
 
     @property
     def bind_network(self):
@@ -367,6 +505,38 @@ class ValidatorConfig:
     def fork_cache_keep_time(self):
         return self._fork_cache_keep_time
 
+    @property
+    def receipt_compression(self):
+        return self._receipt_compression
+
+    @property
+    def event_log(self):
+        return self._event_log
+
+    @property
+    def event_log_attributes(self):
+        return self._event_log_attributes
+
+    @property
+    def component_shard_endpoints(self):
+        return self._component_shard_endpoints
+
+    @property
+    def receipt_commit_window(self):
+        return self._receipt_commit_window
+
+    @property
+    def event_send_queue_size(self):
+        return self._event_send_queue_size
+
+    @property
+    def event_slow_consumer_policy(self):
+        return self._event_slow_consumer_policy
+
+    @property
+    def dispatcher_role_weights(self):
+        return self._dispatcher_role_weights
+
     def __repr__(self):
         # not including  password for opentsdb
         return (
@@ -377,7 +547,13 @@ class ValidatorConfig:
             "opentsdb_url={}, opentsdb_db={}, opentsdb_username={}, "
             "minimum_peer_connectivity={}, maximum_peer_connectivity={}, "
             "state_pruning_block_depth={}, "
-            "fork_cache_keep_time={})"
+            "fork_cache_keep_time={}, receipt_compression={}, "
+            "event_log={}, event_log_attributes={}, "
+            "component_shard_endpoints={}, "
+            "receipt_commit_window={}, "
+            "event_send_queue_size={}, "
+            "event_slow_consumer_policy={}, "
+            "dispatcher_role_weights={})"
         ).format(
             self.__class__.__name__,
             repr(self._bind_network),
@@ -399,6 +575,14 @@ class ValidatorConfig:
             repr(self._maximum_peer_connectivity),
             repr(self._state_pruning_block_depth),
             repr(self._fork_cache_keep_time),
+            repr(self._receipt_compression),
+            repr(self._event_log),
+            repr(self._event_log_attributes),
+            repr(self._component_shard_endpoints),
+            repr(self._receipt_commit_window),
+            repr(self._event_send_queue_size),
+            repr(self._event_slow_consumer_policy),
+            repr(self._dispatcher_role_weights),
         )
 
     def to_dict(self):
@@ -422,7 +606,15 @@ class ValidatorConfig:
             ('minimum_peer_connectivity', self._minimum_peer_connectivity),
             ('maximum_peer_connectivity', self._maximum_peer_connectivity),
             ('state_pruning_block_depth', self._state_pruning_block_depth),
-            ('fork_cache_keep_time', self._fork_cache_keep_time)
+            ('fork_cache_keep_time', self._fork_cache_keep_time),
+            ('receipt_compression', self._receipt_compression),
+            ('event_log', self._event_log),
+            ('event_log_attributes', self._event_log_attributes),
+            ('component_shard_endpoints', self._component_shard_endpoints),
+            ('receipt_commit_window', self._receipt_commit_window),
+            ('event_send_queue_size', self._event_send_queue_size),
+            ('event_slow_consumer_policy', self._event_slow_consumer_policy),
+            ('dispatcher_role_weights', self._dispatcher_role_weights)
         ])
 
     def to_toml_string(self):
@@ -0,0 +1,187 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+from threading import Condition
+from threading import Lock
+from threading import Timer
+
+from sawtooth_validator import metrics
+
+
+COLLECTOR = metrics.get_collector(__name__)
+
+
+class _PendingUpdate:
+    def __init__(self, puts, deletes):
+        self.puts = puts
+        self.deletes = deletes
+        self.done = False
+        self.error = None
+
+
+class GroupCommit:
+    """Gathers the updates of concurrent writers to an LMDB environment into
+    shared write transactions, and bounds how long a committed write may go
+    unsynced.
+
+    A writer which finds no commit in progress commits every update queued
+    at that moment, its own included, in one transaction. Writers arriving
+    meanwhile queue up behind it and are committed together by the next one,
+    so every update is visible to readers by the time it returns. The
+    environment is synced once per commit window rather than once per write:
+    a write is durable at most `commit_window` seconds after it returns.
+
+    Args:
+        lmdb_env (:obj:`lmdb.Environment`): the environment to write to
+        apply_update (function): applies an update within a write transaction
+            Expected args:
+                txn (:obj:`lmdb.Transaction`): the write transaction
+                updates (list of (puts, deletes)): the updates to apply, in
+                    order
+        commit_window (float): the longest time, in seconds, a committed
+            write may wait to be synced; zero syncs after every transaction
+    """
+
+    def __init__(self, lmdb_env, apply_update, commit_window):
+        self._lmdb_env = lmdb_env
+        self._apply_update = apply_update
+        self._commit_window = commit_window
+
+        self._condition = Condition()
+        self._pending = []
+        self._committing = False
+        self._sync_timer = None
+        self._closed = False
+
+        # Held while syncing, so that the environment is not closed under a
+        # sync
+        self._sync_lock = Lock()
+
+        self._commit_size = COLLECTOR.counter(
+            'group_commit_updates_count', instance=self)
+        self._commit_count = COLLECTOR.counter(
+            'group_commit_count', instance=self)
+        self._retry_count = COLLECTOR.counter(
+            'group_commit_retry_count', instance=self)
+
+    def update(self, puts, deletes):
+        """Applies the given puts and deletes atomically, with the updates of
+        any concurrent writers.
+
+        If applying the updates together fails, each is retried in a
+        transaction of its own, so that an error is only raised to the
+        writers whose updates caused it.
+
+        Args:
+            puts (:iterable:`tuple`): an iterable of key/value pairs to insert
+            deletes (:iterable:str:) an iterable of keys to delete
+        """
+        update = _PendingUpdate(puts, deletes)
+        with self._condition:
+            self._pending.append(update)
+            while self._committing and not update.done:
+                self._condition.wait()
+
+            if not update.done:
+                # This writer commits everything queued so far, its own
+                # update included
+                self._committing = True
+                batch = self._pending
+                self._pending = []
+
+        if not update.done:
+            try:
+                self._commit(batch)
+            finally:
+                with self._condition:
+                    for committed in batch:
+                        committed.done = True
+                    self._committing = False
+                    self._condition.notify_all()
+
+        if update.error is not None:
+            raise update.error
+
+    def close(self):
+        """Syncs any writes which are waiting on the commit window, and stops
+        syncing; the environment may be closed once this returns.
+        """
+        with self._sync_lock:
+            with self._condition:
+                self._closed = True
+                timer = self._sync_timer
+                self._sync_timer = None
+
+            if timer is not None:
+                timer.cancel()
+            self._lmdb_env.sync()
+
+        # A timer which had already fired finds the environment closed, and
+        # returns without syncing
+        if timer is not None:
+            timer.join()
+
+    def _commit(self, batch):
+        try:
+            self._write(batch)
+        # pylint: disable=broad-except
+        except Exception as err:
+            if len(batch) == 1:
+                batch[0].error = err
+            else:
+                self._retry_count.inc()
+                for update in batch:
+                    try:
+                        self._write([update])
+                    # pylint: disable=broad-except
+                    except Exception as update_err:
+                        update.error = update_err
+
+        self._commit_size.inc(len(batch))
+        self._commit_count.inc()
+
+        try:
+            self._schedule_sync()
+        # pylint: disable=broad-except
+        except Exception as err:
+            for update in batch:
+                if update.error is None:
+                    update.error = err
+
+    def _write(self, batch):
+        with self._lmdb_env.begin(write=True, buffers=True) as txn:
+            self._apply_update(txn, [(u.puts, u.deletes) for u in batch])
+
+    def _schedule_sync(self):
+        if not self._commit_window:
+            self._sync()
+            return
+
+        with self._condition:
+            if self._sync_timer is not None or self._closed:
+                return
+            self._sync_timer = Timer(self._commit_window, self._on_timer)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+
+    def _on_timer(self):
+        with self._condition:
+            self._sync_timer = None
+        self._sync()
+
+    def _sync(self):
+        with self._sync_lock:
+            if not self._closed:
+                self._lmdb_env.sync()
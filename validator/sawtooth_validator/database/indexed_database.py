@@ -18,6 +18,7 @@ import os
 import lmdb
 
 from sawtooth_validator.database import database
+from sawtooth_validator.database.group_commit import GroupCommit
 
 
 LOGGER = logging.getLogger(__name__)
@@ -40,6 +41,7 @@ class IndexedDatabase(database.Database):
     def __init__(self, filename, serializer, deserializer,
                  indexes=None,
                  flag=None,
+                 commit_window=None,
                  _size=DEFAULT_SIZE):
         """Constructor for the IndexedDatabase class.
 
@@ -54,6 +56,10 @@ class IndexedDatabase(database.Database):
             flag (str:optional): a flag indicating the mode for opening the
                 database.  Refer to the documentation for anydbm.open().
                 Defaults to None.
+            commit_window (float:optional): if set, concurrent updates are
+                committed together, and synced at most this many seconds
+                after they are written; see GroupCommit. Defaults to None,
+                which commits and syncs each update on its own.
         """
         super(IndexedDatabase, self).__init__()
 
@@ -87,6 +93,11 @@ class IndexedDatabase(database.Database):
             {name: self._make_index_tuple(name, index_info)
              for name, index_info in indexes.items()}
 
+        self._group_commit = None
+        if commit_window is not None:
+            self._group_commit = GroupCommit(
+                self._lmdb, self._apply_updates, commit_window)
+
     def _make_index_tuple(self, name, index_info):
         if callable(index_info):
             key_fn = index_info
@@ -186,8 +197,23 @@ class IndexedDatabase(database.Database):
             puts (:iterable:`tuple`): an iterable of key/value pairs to insert
             deletes (:iterable:str:) an iterable of keys to delete
         """
+        if self._group_commit is not None:
+            self._group_commit.update(puts, deletes)
+            return
+
         with self._lmdb.begin(write=True, buffers=True) as txn:
-            cursor = txn.cursor(self._main_db)
+            self._apply_updates(txn, [(puts, deletes)])
+
+        self.sync()
+
+    def _apply_updates(self, txn, updates):
+        cursor = txn.cursor(self._main_db)
+        index_cursors = [
+            (txn.cursor(index_db), index_key_fn)
+            for (index_db, index_key_fn) in self._indexes.values()
+        ]
+
+        for puts, deletes in updates:
             # Process deletes first, to handle the case of new items replacing
             # old index locations
             for key in deletes:
@@ -198,10 +224,8 @@ class IndexedDatabase(database.Database):
                 value = self._deserializer(bytes(cursor.value()))
                 cursor.delete()
 
-                for (index_db, index_key_fn) in self._indexes.values():
-                    index_keys = index_key_fn(value)
-                    index_cursor = txn.cursor(index_db)
-                    for idx_key in index_keys:
+                for (index_cursor, index_key_fn) in index_cursors:
+                    for idx_key in index_key_fn(value):
                         if index_cursor.set_key(idx_key):
                             index_cursor.delete()
 
@@ -211,14 +235,10 @@ class IndexedDatabase(database.Database):
 
                 cursor.put(key.encode(), packed, overwrite=True)
 
-                for (index_db, index_key_fn) in self._indexes.values():
-                    index_keys = index_key_fn(value)
-                    index_cursor = txn.cursor(index_db)
-                    for idx_key in index_keys:
+                for (index_cursor, index_key_fn) in index_cursors:
+                    for idx_key in index_key_fn(value):
                         index_cursor.put(idx_key, key.encode())
 
-        self.sync()
-
     def sync(self):
         """Ensures that pending writes are flushed to disk
         """
@@ -227,6 +247,8 @@ class IndexedDatabase(database.Database):
     def close(self):
         """Closes the connection to the database
         """
+        if self._group_commit is not None:
+            self._group_commit.close()
         self._lmdb.close()
 
     def keys(self, index=None):
@@ -18,6 +18,7 @@ import lmdb
 import cbor
 
 from sawtooth_validator.database import database
+from sawtooth_validator.database.group_commit import GroupCommit
 
 
 class LMDBNoLockDatabase(database.Database):
@@ -29,13 +30,17 @@ class LMDBNoLockDatabase(database.Database):
        _lmdb (lmdb.Environment): The underlying lmdb database.
     """
 
-    def __init__(self, filename, flag):
+    def __init__(self, filename, flag, commit_window=None):
         """Constructor for the LMDBNoLockDatabase class.
 
         Args:
             filename (str): The filename of the database file.
             flag (str): a flag indicating the mode for opening the database.
                 Refer to the documentation for anydbm.open().
+            commit_window (float): if set, concurrent updates are committed
+                together, and synced at most this many seconds after they are
+                written; see GroupCommit. Defaults to None, which commits and
+                syncs each update on its own.
         """
         super(LMDBNoLockDatabase, self).__init__()
 
@@ -56,6 +61,11 @@ class LMDBNoLockDatabase(database.Database):
             create=create,
             lock=True)
 
+        self._group_commit = None
+        if commit_window is not None:
+            self._group_commit = GroupCommit(
+                self._lmdb, self._apply_updates, commit_window)
+
     # pylint: disable=no-value-for-parameter
     def __len__(self):
         with self._lmdb.begin() as txn:
@@ -96,13 +106,24 @@ class LMDBNoLockDatabase(database.Database):
         raise NotImplementedError()
 
     def update(self, puts, deletes):
+        if self._group_commit is not None:
+            self._group_commit.update(puts, deletes)
+            return
+
         with self._lmdb.begin(write=True, buffers=True) as txn:
+            self._apply_updates(txn, [(puts, deletes)])
+        self.sync()
+
+    @staticmethod
+    def _apply_updates(txn, updates):
+        cursor = txn.cursor()
+        for puts, deletes in updates:
             for k in deletes:
-                txn.delete(k.encode())
+                if cursor.set_key(k.encode()):
+                    cursor.delete()
             for k, v in puts:
                 packed = cbor.dumps(v)
-                txn.put(k.encode(), packed, overwrite=True)
-        self.sync()
+                cursor.put(k.encode(), packed, overwrite=True)
 
     def delete(self, key):
         """Removes a key:value from the database
@@ -121,6 +142,8 @@ class LMDBNoLockDatabase(database.Database):
     def close(self):
         """Closes the connection to the database
         """
+        if self._group_commit is not None:
+            self._group_commit.close()
         self._lmdb.close()
 
     def keys(self, index=None):
@@ -16,12 +16,15 @@
 import logging
 import re
 
+from collections import defaultdict
 from collections import deque
 from threading import Lock
+from queue import Empty
 from queue import Queue
 
 from sawtooth_validator.concurrent.thread import InstrumentedThread
 from sawtooth_validator.state.merkle import MerkleDatabase
+from sawtooth_validator import metrics
 
 from sawtooth_validator.execution.execution_context \
     import AuthorizationException
@@ -29,6 +32,7 @@ from sawtooth_validator.execution.execution_context import ExecutionContext
 
 
 LOGGER = logging.getLogger(__name__)
+COLLECTOR = metrics.get_collector(__name__)
 
 
 class CreateContextException(Exception):
@@ -41,17 +45,27 @@ class SquashException(Exception):
 
 _SHUTDOWN_SENTINEL = -1
 
+# The maximum number of queued prefetch requests a reader will combine into a
+# single round of merkle reads.
+_MAX_PREFETCH_BATCH = 64
+
 
 class ContextManager:
 
-    def __init__(self, database):
+    def __init__(self, database, reader_count=3, state_read_cache=None):
         """
 
         Args:
             database (database.Database subclass): the subclass/implementation
                 of the Database
+            reader_count (int): the number of threads prefetching context
+                inputs from the merkle tree. Requests are sharded across the
+                readers by address.
+            state_read_cache (StateReadCache, optional): a cache of state
+                values consulted before reading from the merkle tree
         """
         self._database = database
+        self._state_read_cache = state_read_cache
         self._first_merkle_root = None
         self._contexts = _ThreadsafeContexts()
 
@@ -59,13 +73,21 @@ class ContextManager:
 
         self._namespace_regex = re.compile('^([0-9a-f]{2}){0,35}$')
 
-        self._address_queue = Queue()
+        self._address_queues = [Queue() for _ in range(reader_count)]
 
         self._inflated_addresses = Queue()
 
-        self._context_reader = _ContextReader(database, self._address_queue,
-                                              self._inflated_addresses)
-        self._context_reader.start()
+        self._prefetch_latency_timer = COLLECTOR.timer(
+            'prefetch_latency', instance=self)
+
+        self._context_readers = [
+            _ContextReader(database, address_queue, self._inflated_addresses,
+                           state_read_cache=state_read_cache,
+                           name='_ContextReader-{}'.format(i))
+            for i, address_queue in enumerate(self._address_queues)
+        ]
+        for context_reader in self._context_readers:
+            context_reader.start()
 
         self._context_writer = _ContextWriter(self._inflated_addresses,
                                               self._contexts)
@@ -136,10 +158,29 @@ class ContextManager:
 
         if reads:
             context.create_prefetch(reads)
-            self._address_queue.put_nowait(
-                (context.session_id, state_hash, reads))
+            for address_queue, addresses in self._shard_reads(reads):
+                address_queue.put_nowait(
+                    (context.session_id, state_hash, addresses,
+                     self._prefetch_latency_timer.time()))
         return context.session_id
 
+    def _shard_reads(self, addresses):
+        """Splits addresses across the prefetch queues. An address always
+        goes to the same reader, so that reads of it against the same root
+        may be combined, while the reads of a root are spread over all of
+        the readers.
+
+        Returns:
+            list: (queue.Queue, list of str) tuples
+        """
+        shards = defaultdict(list)
+        for address in addresses:
+            shards[hash(address) % len(self._address_queues)].append(address)
+        return [
+            (self._address_queues[index], shard)
+            for index, shard in shards.items()
+        ]
+
     def _find_address_values_in_chain(self, base_contexts, addresses_to_find):
         """Breadth first search through the chain of contexts searching for
         the bytes values at the addresses in addresses_to_find.
@@ -312,17 +353,9 @@ class ContextManager:
             values_list.extend(address_values)
 
             if reads:
-                tree = MerkleDatabase(self._database, context.merkle_root)
-                add_values = []
-                for add in reads:
-                    value = None
-                    try:
-                        value = tree.get(add)
-                    except KeyError:
-                        # The address is not in the radix tree/merkle tree
-                        pass
-                    add_values.append((add, value))
-                values_list.extend(add_values)
+                values_list.extend(_read_state(
+                    self._database, self._state_read_cache,
+                    context.merkle_root, reads))
 
             values_list.sort(key=lambda x: address_list.index(x[0]))
 
@@ -417,7 +450,8 @@ class ContextManager:
         return _squash
 
     def stop(self):
-        self._address_queue.put_nowait(_SHUTDOWN_SENTINEL)
+        for address_queue in self._address_queues:
+            address_queue.put_nowait(_SHUTDOWN_SENTINEL)
         self._inflated_addresses.put_nowait(_SHUTDOWN_SENTINEL)
 
     def add_execution_data(self, context_id, data):
@@ -468,38 +502,94 @@ class ContextManager:
                 context.get_execution_data().copy())
 
 
-class _ContextReader(InstrumentedThread):
+def _read_state(database, state_read_cache, state_hash, addresses):
+    """Reads the values at the given addresses under a state root, through
+    the state read cache, if there is one.
+
+    Returns:
+        list: (address, value) tuples, where value is None for addresses
+            which are not in state
     """
+    def read_tree(addresses_to_read):
+        return MerkleDatabase(database, state_hash).get_many(
+            addresses_to_read)
+
+    if state_read_cache is None:
+        return read_tree(addresses)
+
+    return state_read_cache.get_many(state_hash, addresses, read_tree)
+
+
+class _ContextReader(InstrumentedThread):
+    """Reads the inputs of contexts from the merkle tree, and hands the values
+    to the _ContextWriter.
+
+    Any requests which are queued while a read is in progress are combined
+    into the next read: requests are grouped by state root, and each distinct
+    address under a root is read once, with a single bulk merkle read. Each
+    reader is given a share of the addresses, so the reads of a root run on
+    all of the readers at once.
+
     Attributes:
-        _in_condition (threading.Condition): threading object for notification
         _addresses (queue.Queue): each item is a tuple
-                                  (context_id, state_hash, address_list)
+                                  (context_id, state_hash, address_list,
+                                   latency timer context)
         _inflated_addresses (queue.Queue): each item is a tuple
                                           (context_id, [(address, value), ...
     """
 
-    def __init__(self, database, address_queue, inflated_addresses):
-        super(_ContextReader, self).__init__(name='_ContextReader')
+    def __init__(self, database, address_queue, inflated_addresses,
+                 state_read_cache=None, name='_ContextReader'):
+        super(_ContextReader, self).__init__(name=name)
         self._database = database
+        self._state_read_cache = state_read_cache
         self._addresses = address_queue
         self._inflated_addresses = inflated_addresses
 
+        self._queue_depth_gauge = COLLECTOR.gauge(
+            'prefetch_queue_depth', instance=self, tags={'name': name})
+
     def run(self):
         while True:
-            context_state_addresslist_tuple = self._addresses.get(block=True)
-            if context_state_addresslist_tuple is _SHUTDOWN_SENTINEL:
-                break
-            c_id, state_hash, address_list = context_state_addresslist_tuple
-            tree = MerkleDatabase(self._database, state_hash)
-            return_values = []
-            for address in address_list:
-                value = None
+            requests = [self._addresses.get(block=True)]
+            while len(requests) < _MAX_PREFETCH_BATCH:
                 try:
-                    value = tree.get(address)
-                except KeyError:
-                    pass
-                return_values.append((address, value))
-            self._inflated_addresses.put((c_id, return_values))
+                    requests.append(self._addresses.get_nowait())
+                except Empty:
+                    break
+
+            self._queue_depth_gauge.set_value(self._addresses.qsize())
+
+            shutdown = any(
+                request is _SHUTDOWN_SENTINEL for request in requests)
+            self._read([
+                request for request in requests
+                if request is not _SHUTDOWN_SENTINEL
+            ])
+            if shutdown:
+                break
+
+    def _read(self, requests):
+        requests_by_root = defaultdict(list)
+        for request in requests:
+            _, state_hash, _, _ = request
+            requests_by_root[state_hash].append(request)
+
+        for state_hash, root_requests in requests_by_root.items():
+            addresses = list({
+                address
+                for _, _, address_list, _ in root_requests
+                for address in address_list
+            })
+            values = dict(_read_state(
+                self._database, self._state_read_cache, state_hash,
+                addresses))
+
+            for c_id, _, address_list, latency_ctx in root_requests:
+                self._inflated_addresses.put(
+                    (c_id, [(address, values[address])
+                            for address in address_list]))
+                latency_ctx.stop()
 
 
 class _ContextWriter(InstrumentedThread):
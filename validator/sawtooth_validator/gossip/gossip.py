@@ -68,6 +68,10 @@ MAXIMUM_STATIC_RETRIES = 24
 
 TIME_TO_LIVE = 3
 
+# The number of seconds to wait for a candidate peer to answer a peering or
+# topology request before giving up on it
+PEER_REQUEST_TIMEOUT = 60
+
 # This is the protocol version number.  It should only be incremented when
 # there are changes to the network protocols, as well as only once per
 # release.
@@ -386,6 +390,9 @@ class Gossip:
             exclude: A list of connection_ids that should be excluded from this
                 broadcast.
         """
+        # Sending the same serialized message to every peer lets the network
+        # compress it once for all of them
+        serialized = gossip_message.SerializeToString()
         with self._lock:
             if exclude is None:
                 exclude = []
@@ -395,7 +402,7 @@ class Gossip:
                             connection_id):
                     self.send(
                         message_type,
-                        gossip_message.SerializeToString(),
+                        serialized,
                         connection_id,
                         one_way=True)
 
@@ -848,7 +855,8 @@ class ConnectionManager(InstrumentedThread):
                 callback=partial(
                     self._peer_callback,
                     endpoint=endpoint,
-                    connection_id=connection_id))
+                    connection_id=connection_id),
+                timeout=PEER_REQUEST_TIMEOUT)
         except KeyError:
             # if the connection uri wasn't found in the network's
             # connections, it raises a KeyError and we need to add
@@ -866,6 +874,12 @@ class ConnectionManager(InstrumentedThread):
 
     def _peer_callback(self, request, result, connection_id, endpoint=None):
         with self._lock:
+            if result.timed_out:
+                LOGGER.debug("Peering request to %s timed out",
+                             connection_id)
+                self._remove_temporary_connection(connection_id)
+                return
+
             ack = NetworkAcknowledgement()
             ack.ParseFromString(result.content)
 
@@ -958,7 +972,8 @@ class ConnectionManager(InstrumentedThread):
                 callback=partial(
                     self._peer_callback,
                     connection_id=connection_id,
-                    endpoint=endpoint))
+                    endpoint=endpoint),
+                timeout=PEER_REQUEST_TIMEOUT)
         except ValueError:
             LOGGER.debug("Connection disconnected: %s", connection_id)
 
@@ -977,6 +992,7 @@ class ConnectionManager(InstrumentedThread):
                 validator_pb2.Message.GOSSIP_GET_PEERS_REQUEST,
                 get_peers_request.SerializeToString(),
                 connection_id,
-                callback=callback)
+                callback=callback,
+                timeout=PEER_REQUEST_TIMEOUT)
         except ValueError:
             LOGGER.debug("Connection disconnected: %s", connection_id)
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ------------------------------------------------------------------------------
+from collections import OrderedDict
 import logging
+from threading import Lock
 
 from sawtooth_validator.protobuf import client_batch_submit_pb2
 from sawtooth_validator.protobuf.batch_pb2 import BatchHeader
@@ -29,18 +31,94 @@ from sawtooth_validator.networking.dispatch import HandlerResult
 from sawtooth_validator.networking.dispatch import HandlerStatus
 from sawtooth_validator.networking.dispatch import Handler
 from sawtooth_validator.state.merkle import INIT_ROOT_KEY
+from sawtooth_validator.state.state_root_cache import DEFAULT_MAX_ROOTS
+from sawtooth_validator.state.state_root_cache import StateRootCache
 
 
 LOGGER = logging.getLogger(__name__)
 
+# The roles checked for batch and transaction signers, first to last
+_BATCH_SIGNER_ROLES = ("transactor.batch_signer", "transactor")
+_TRANSACTION_SIGNER_ROLES = ("transactor.transaction_signer", "transactor")
+
+# The most compiled policies kept for roles and state roots
+_MAX_COMPILED_POLICIES = 1024
+
+_MISSING = object()
+
+
+class CompiledPolicy:
+    """A Policy compiled into the sets of keys it permits and denies, and
+    the decision for any other key, so that checking a key is a set lookup
+    rather than a scan of the policy's entries.
+
+    The entries of a policy are applied in order, and the first to match a
+    key decides it. A key listed more than once is therefore decided by its
+    first entry, and the first "*" entry decides every key not listed
+    before it. A key which matches no entry is denied.
+    """
+
+    __slots__ = ['permitted', 'denied', 'fallback']
+
+    def __init__(self, policy):
+        permitted = set()
+        denied = set()
+        fallback = False
+        for entry in policy.entries:
+            if entry.type == Policy.PERMIT_KEY:
+                allowed = True
+            elif entry.type == Policy.DENY_KEY:
+                allowed = False
+            else:
+                continue
+
+            if entry.key == "*":
+                fallback = allowed
+                break
+
+            if entry.key not in permitted and entry.key not in denied:
+                if allowed:
+                    permitted.add(entry.key)
+                else:
+                    denied.add(entry.key)
+
+        self.permitted = frozenset(permitted)
+        self.denied = frozenset(denied)
+        self.fallback = fallback
+
+    def allows(self, public_key):
+        if public_key in self.permitted:
+            return True
+        if public_key in self.denied:
+            return False
+        return self.fallback
+
 
 class PermissionVerifier:
     def __init__(self, permissions, current_root_func, identity_cache):
         # Off-chain permissions to be enforced
         self._permissions = permissions
+        # role name -> (Policy, CompiledPolicy) of the off-chain permissions
+        self._off_chain_policies = {}
         self._current_root_func = current_root_func
         self._cache = identity_cache
 
+        # (roles, whether a default applies, identity cache version or state
+        # root) -> the CompiledPolicy enforced, or None if no policy is
+        # enforced. Cached identity values stand until the identity cache's
+        # version changes, and those read from state stand for the state
+        # root they were read at.
+        self._compiled_policies = OrderedDict()
+        self._compiled_policies_lock = Lock()
+
+        # (role name, public key) -> whether the key is permitted by the
+        # role's policy, as of the identity cache version below. Nodes send
+        # many messages, so the policy is only evaluated again for a node
+        # once the identity cache has seen a role or policy change.
+        self._network_decisions = {}
+        self._network_decisions_version = None
+        self._network_decisions_lock = Lock()
+
     def is_batch_signer_authorized(self, batch, state_root=None,
                                    from_state=False):
         """ Check the batch signing key against the allowed transactor
@@ -70,31 +148,12 @@ class PermissionVerifier:
                 LOGGER.debug("Chain head is not set yet. Permit all.")
                 return True
 
-        self._cache.update_view(state_root)
-
         header = BatchHeader()
         header.ParseFromString(batch.header)
 
-        role = self._cache.get_role(
-            "transactor.batch_signer",
-            state_root,
-            from_state)
-
-        if role is None:
-            role = self._cache.get_role("transactor", state_root, from_state)
-
-        if role is None:
-            policy_name = "default"
-        else:
-            policy_name = role.policy_name
-
-        policy = self._cache.get_policy(policy_name, state_root, from_state)
-        if policy is None:
-            allowed = True
-        else:
-            allowed = self._allowed(header.signer_public_key, policy)
-
-        if allowed:
+        policy = self._get_compiled_policy(
+            _BATCH_SIGNER_ROLES, state_root, from_state)
+        if policy is None or policy.allows(header.signer_public_key):
             return self.is_transaction_signer_authorized(
                 batch.transactions,
                 state_root,
@@ -127,52 +186,30 @@ class PermissionVerifier:
                     This should be used when the state_root passed is not from
                     the current chain head.
         """
-        role = None
-        if role is None:
-            role = self._cache.get_role("transactor.transaction_signer",
-                                        state_root, from_state)
-
-        if role is None:
-            role = self._cache.get_role("transactor", state_root, from_state)
-
-        if role is None:
-            policy_name = "default"
-        else:
-            policy_name = role.policy_name
+        policy = self._get_compiled_policy(
+            _TRANSACTION_SIGNER_ROLES, state_root, from_state)
 
-        policy = self._cache.get_policy(policy_name, state_root, from_state)
-
-        family_roles = {}
+        # family name -> the policy enforced for the family's transactions
+        family_policies = {}
         for transaction in transactions:
             header = TransactionHeader()
             header.ParseFromString(transaction.header)
-            family_policy = None
-            if header.family_name not in family_roles:
-                role = self._cache.get_role(
-                    "transactor.transaction_signer." + header.family_name,
+            family_policy = family_policies.get(header.family_name, _MISSING)
+            if family_policy is _MISSING:
+                family_policy = self._get_compiled_policy(
+                    ("transactor.transaction_signer." + header.family_name,),
                     state_root,
-                    from_state)
-
-                if role is not None:
-                    family_policy = self._cache.get_policy(role.policy_name,
-                                                           state_root,
-                                                           from_state)
-                family_roles[header.family_name] = family_policy
-            else:
-                family_policy = family_roles[header.family_name]
-
-            if family_policy is not None:
-                if not self._allowed(header.signer_public_key, family_policy):
-                    LOGGER.debug("Transaction Signer: %s is not permitted.",
-                                 header.signer_public_key)
-                    return False
-            else:
-                if policy is not None:
-                    if not self._allowed(header.signer_public_key, policy):
-                        LOGGER.debug(
-                            "Transaction Signer: %s is not permitted.",
-                            header.signer_public_key)
-                        return False
+                    from_state,
+                    default=False)
+                if family_policy is None:
+                    family_policy = policy
+                family_policies[header.family_name] = family_policy
+
+            if family_policy is not None and \
+                    not family_policy.allows(header.signer_public_key):
+                LOGGER.debug("Transaction Signer: %s is not permitted.",
+                             header.signer_public_key)
+                return False
         return True
 
     def check_off_chain_batch_roles(self, batch):
@@ -196,16 +233,11 @@ class PermissionVerifier:
             return True
         header = BatchHeader()
         header.ParseFromString(batch.header)
-        policy = None
-        if "transactor.batch_signer" in self._permissions:
-            policy = self._permissions["transactor.batch_signer"]
-
-        elif "transactor" in self._permissions:
-            policy = self._permissions["transactor"]
+        policy = self._get_off_chain_policy(_BATCH_SIGNER_ROLES)
 
         allowed = True
         if policy is not None:
-            allowed = self._allowed(header.signer_public_key, policy)
+            allowed = policy.allows(header.signer_public_key)
 
         if allowed:
             return self.check_off_chain_transaction_roles(batch.transactions)
@@ -229,31 +261,23 @@ class PermissionVerifier:
                 transactions (List of Transactions): The transactions that are
                     being verified.
         """
-        policy = None
-        if "transactor.transaction_signer" in self._permissions:
-            policy = self._permissions["transactor.transaction_signer"]
-
-        elif "transactor" in self._permissions:
-            policy = self._permissions["transactor"]
+        policy = self._get_off_chain_policy(_TRANSACTION_SIGNER_ROLES)
 
         for transaction in transactions:
             header = TransactionHeader()
             header.ParseFromString(transaction.header)
-            family_role = "transactor.transaction_signer." + \
-                header.family_name
-            family_policy = None
-            if family_role in self._permissions:
-                family_policy = self._permissions[family_role]
+            family_policy = self._get_off_chain_policy(
+                ("transactor.transaction_signer." + header.family_name,))
 
             if family_policy is not None:
-                if not self._allowed(header.signer_public_key, family_policy):
+                if not family_policy.allows(header.signer_public_key):
                     LOGGER.debug("Transaction Signer: %s is not permitted"
                                  "by local configuration.",
                                  header.signer_public_key)
                     return False
 
             elif policy is not None:
-                if not self._allowed(header.signer_public_key, policy):
+                if not policy.allows(header.signer_public_key):
                     LOGGER.debug("Transaction Signer: %s is not permitted"
                                  "by local configuration.",
                                  header.signer_public_key)
@@ -280,18 +304,9 @@ class PermissionVerifier:
             LOGGER.debug("Chain head is not set yet. Permit all.")
             return True
 
-        self._cache.update_view(state_root)
-        role = self._cache.get_role("network", state_root)
-
-        if role is None:
-            policy_name = "default"
-        else:
-            policy_name = role.policy_name
-        policy = self._cache.get_policy(policy_name, state_root)
-        if policy is not None:
-            if not self._allowed(public_key, policy):
-                LOGGER.debug("Node is not permitted: %s.", public_key)
-                return False
+        if not self._check_network_policy("network", public_key, state_root):
+            LOGGER.debug("Node is not permitted: %s.", public_key)
+            return False
         return True
 
     def check_network_consensus_role(self, public_key):
@@ -309,35 +324,101 @@ class PermissionVerifier:
                     network
         """
         state_root = self._current_root_func()
-        self._cache.update_view(state_root)
-        role = self._cache.get_role("network.consensus", state_root)
-
-        if role is None:
-            policy_name = "default"
-        else:
-            policy_name = role.policy_name
-        policy = self._cache.get_policy(policy_name, state_root)
-        if policy is not None:
-            if not self._allowed(public_key, policy):
-                LOGGER.debug(
-                    "Node is not permitted to publish blocks: %s.",
-                    public_key)
-                return False
+        if not self._check_network_policy(
+                "network.consensus", public_key, state_root):
+            LOGGER.debug(
+                "Node is not permitted to publish blocks: %s.",
+                public_key)
+            return False
         return True
 
-    def _allowed(self, public_key, policy):
-        for entry in policy.entries:
-            if entry.type == Policy.PERMIT_KEY:
-                if public_key == entry.key or entry.key == "*":
-                    return True
+    def _check_network_policy(self, role_name, public_key, state_root):
+        """Returns whether a public key is permitted by the policy of the
+        given network role, or of the default role if it is not set, reusing
+        the decision made for the key as long as the identity cache has not
+        changed since.
+        """
+        version = self._cache.version
+        with self._network_decisions_lock:
+            if self._network_decisions_version != version:
+                self._network_decisions = {}
+                self._network_decisions_version = version
+            allowed = self._network_decisions.get((role_name, public_key))
+        if allowed is not None:
+            return allowed
+
+        policy = self._get_compiled_policy((role_name,), state_root)
+        allowed = policy is None or policy.allows(public_key)
+
+        with self._network_decisions_lock:
+            # A decision made from roles or policies which have since
+            # changed is not kept
+            if self._network_decisions_version == version:
+                self._network_decisions[(role_name, public_key)] = allowed
+        return allowed
+
+    def _get_off_chain_policy(self, role_names):
+        """Returns the compiled off-chain policy of the first of the given
+        roles which is set, or None if none is.
+        """
+        for role_name in role_names:
+            policy = self._permissions.get(role_name)
+            if policy is None:
+                continue
+
+            compiled = self._off_chain_policies.get(role_name)
+            if compiled is None or compiled[0] is not policy:
+                compiled = (policy, CompiledPolicy(policy))
+                self._off_chain_policies[role_name] = compiled
+            return compiled[1]
+        return None
+
+    def _get_compiled_policy(self, role_names, state_root, from_state=False,
+                             default=True):
+        """Returns the compiled policy of the first of the given roles which
+        is set, or of the default policy if none is and a default applies.
 
-            elif entry.type == Policy.DENY_KEY:
+        Args:
+            role_names (tuple of str): the roles to check, first to last
+            state_root (str): the state root to read identities at
+            from_state (bool): whether to read identities directly from
+                state, rather than from the identity cache
+            default (bool): whether the default policy applies when none
+                of the roles is set
+
+        Returns:
+            CompiledPolicy: the policy, or None if there is none to enforce
+        """
+        version = state_root if from_state else self._cache.version
+        key = (role_names, default, from_state, version)
+        with self._compiled_policies_lock:
+            policy = self._compiled_policies.get(key, _MISSING)
+            if policy is not _MISSING:
+                self._compiled_policies.move_to_end(key)
+                return policy
+
+        policy_name = "default" if default else None
+        for role_name in role_names:
+            role = self._cache.get_role(role_name, state_root, from_state)
+            if role is not None:
+                policy_name = role.policy_name
+                break
 
-                if public_key == entry.key or entry.key == "*":
-                    return False
+        policy = None
+        if policy_name is not None:
+            policy = self._cache.get_policy(
+                policy_name, state_root, from_state)
+        if policy is not None:
+            policy = CompiledPolicy(policy)
 
-        # Default last entry is always DENY all
-        return False
+        with self._compiled_policies_lock:
+            # A policy compiled from identities which have since changed is
+            # not kept
+            if from_state or self._cache.version == version:
+                self._compiled_policies[key] = policy
+                if len(self._compiled_policies) > _MAX_COMPILED_POLICIES:
+                    self._compiled_policies.popitem(last=False)
+        return policy
 
 
 class BatchListPermissionVerifier(Handler):
@@ -445,10 +526,28 @@ class NetworkConsensusPermissionHandler(Handler):
 
 
 class IdentityCache():
-    def __init__(self, identity_view_factory):
+    """Caches identity roles and policies for the chain head, and, for any
+    state root, the roles and policies read at that state root.
+
+    Roles and policies looked up for the chain head are kept until the
+    IdentityObserver reports they have changed, or that the chain has
+    forked. Those read from state are also kept by state root for the most
+    recently used state roots, so that after a fork, looking them up at a
+    state root which has been seen recently does not read state again.
+
+    Args:
+        identity_view_factory (IdentityViewFactory): creates the views of
+            state that roles and policies are read from
+        max_roots (int): the most state roots to keep roles and policies
+            for
+    """
+
+    def __init__(self, identity_view_factory, max_roots=DEFAULT_MAX_ROOTS):
         self._identity_view_factory = identity_view_factory
-        self._identity_view = None
         self._cache = {}
+        self._version = 0
+        self._state_roots = StateRootCache(
+            identity_view_factory.create_identity_view, max_roots=max_roots)
 
     def __len__(self):
         return len(self._cache)
@@ -474,17 +573,12 @@ class IdentityCache():
                 the current chain head.
         """
         if from_state:
-            # if from state use identity_view and do not add to cache
-            if self._identity_view is None:
-                self.update_view(state_root)
-            value = self._identity_view.get_role(item)
-            return value
+            # if from state, read at the state root and do not add to cache
+            return self._read_role(item, state_root)
 
         value = self._cache.get(item)
         if value is None:
-            if self._identity_view is None:
-                self.update_view(state_root)
-            value = self._identity_view.get_role(item)
+            value = self._read_role(item, state_root)
             self._cache[item] = value
         return value
 
@@ -500,27 +594,38 @@ class IdentityCache():
                 the current chain head.
         """
         if from_state:
-            # if from state use identity_view and do not add to cache
-            if self._identity_view is None:
-                self.update_view(state_root)
-            value = self._identity_view.get_role(item)
-            return value
+            # if from state, read at the state root and do not add to cache
+            return self._read_policy(item, state_root)
 
         value = self._cache.get(item)
         if value is None:
-            if self._identity_view is None:
-                self.update_view(state_root)
-            value = self._identity_view.get_policy(item)
+            value = self._read_policy(item, state_root)
             self._cache[item] = value
         return value
 
+    @property
+    def version(self):
+        """A number which changes whenever a role or policy may have
+        changed, so that decisions made from the cached roles and policies
+        can be kept until it does.
+        """
+        return self._version
+
     def forked(self):
         self._cache = {}
+        self._version += 1
 
     def invalidate(self, item):
         if item in self._cache:
             del self._cache[item]
+        # An item which is not cached may still have been read from state
+        # as unset, so any change counts
+        self._version += 1
+
+    def _read_role(self, item, state_root):
+        return self._state_roots.get(
+            ("role", item), state_root, lambda view: view.get_role(item))
 
-    def update_view(self, state_root):
-        self._identity_view = \
-            self._identity_view_factory.create_identity_view(state_root)
+    def _read_policy(self, item, state_root):
+        return self._state_roots.get(
+            ("policy", item), state_root, lambda view: view.get_policy(item))
@@ -13,7 +13,12 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+from bisect import bisect_left
+
 from sawtooth_validator.server.events.extractor import EventExtractor
+from sawtooth_validator.server.events.subscription import literal_prefix
+from sawtooth_validator.server.events.subscription import RegexAnyFilter
+from sawtooth_validator.server.events.subscription import SimpleAnyFilter
 from sawtooth_validator.journal import block_wrapper
 from sawtooth_validator.protobuf.events_pb2 import Event
 from sawtooth_validator.protobuf.transaction_receipt_pb2 import StateChangeList
@@ -57,46 +62,100 @@ class ReceiptEventExtractor(EventExtractor):
         return events
 
     def _make_receipt_events(self, subscriptions):
-        events = []
-        for receipt in self._receipts:
-            for event in receipt.events:
-                for subscription in subscriptions:
-                    if event in subscription:
-                        events.append(event)
-        return events
+        # Each event is returned once, however many subscriptions it matches
+        return [
+            event
+            for receipt in self._receipts
+            for event in receipt.events
+            if any(event in subscription for subscription in subscriptions)
+        ]
 
     def _make_state_delta_events(self, subscriptions):
-        gen = False
-        for subscription in subscriptions:
-            if subscription.event_type == "sawtooth/state-delta":
-                gen = True
+        subscriptions = [
+            subscription for subscription in subscriptions
+            if subscription.event_type == "sawtooth/state-delta"
+        ]
 
-        if not gen:
+        if not subscriptions:
             return []
 
-        addresses = set()
-        attributes = []
-        squashed_changes = []
-        for receipt in reversed(self._receipts):
-            for state_change in reversed(receipt.state_changes):
-                address = state_change.address
-                if address not in addresses:
-                    addresses.add(address)
-                    attributes.append(
-                        Event.Attribute(key="address", value=address))
-                    squashed_changes.append(state_change)
+        state_delta = _StateDelta(self._receipts)
+        if not any(state_delta.matches(subscription)
+                   for subscription in subscriptions):
+            # Event not in subscriptions
+            return []
+
+        return [state_delta.make_event()]
 
-        state_change_list = StateChangeList()
-        state_change_list.state_changes.extend(squashed_changes)
 
-        event = Event(
-            event_type="sawtooth/state-delta",
-            attributes=attributes,
-            data=state_change_list.SerializeToString())
+class _StateDelta:
+    """The net state changes of a list of receipts, indexed by address.
 
-        for subscription in subscriptions:
-            if event in subscription:
-                return [event]
+    Whether a state-delta event would pass a subscription's address filters
+    is answered from the index, so that the event, with an attribute per
+    address and every change serialized, is only built once it is known to
+    be wanted. Anchored literal patterns, such as "^abc" or the namespace
+    prefixes most subscribers filter on, are looked up in the sorted
+    addresses rather than tested against each one.
+    """
 
-        # Event not in subscriptions
-        return []
+    def __init__(self, receipts):
+        # address -> the last change to it, in reverse order of change
+        self._changes = {}
+        for receipt in reversed(receipts):
+            for state_change in reversed(receipt.state_changes):
+                self._changes.setdefault(state_change.address, state_change)
+
+        self._sorted_addresses = None
+        self._event = None
+
+    def matches(self, subscription):
+        """Returns whether the state-delta event would pass all of a
+        subscription's filters.
+        """
+        for sub_filter in subscription.filters:
+            if sub_filter.key == "address":
+                if isinstance(sub_filter, SimpleAnyFilter):
+                    if sub_filter.match_string not in self._changes:
+                        return False
+                    continue
+
+                if isinstance(sub_filter, RegexAnyFilter):
+                    prefix = literal_prefix(sub_filter.match_string)
+                    if prefix is not None:
+                        if not self._has_address_starting_with(prefix):
+                            return False
+                        continue
+
+            if self._attributes_event() not in sub_filter:
+                return False
+
+        return True
+
+    def make_event(self):
+        state_change_list = StateChangeList()
+        state_change_list.state_changes.extend(self._changes.values())
+
+        event = self._attributes_event()
+        event.data = state_change_list.SerializeToString()
+        return event
+
+    def _has_address_starting_with(self, prefix):
+        if self._sorted_addresses is None:
+            self._sorted_addresses = sorted(self._changes)
+
+        position = bisect_left(self._sorted_addresses, prefix)
+        return (
+            position < len(self._sorted_addresses)
+            and self._sorted_addresses[position].startswith(prefix)
+        )
+
+    def _attributes_event(self):
+        if self._event is None:
+            self._event = Event(
+                event_type="sawtooth/state-delta",
+                attributes=[
+                    Event.Attribute(key="address", value=address)
+                    for address in self._changes
+                ])
+        return self._event
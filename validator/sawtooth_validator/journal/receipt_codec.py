@@ -0,0 +1,213 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+from abc import ABCMeta
+from abc import abstractmethod
+from collections import Counter
+import zlib
+
+from sawtooth_validator.protobuf.transaction_receipt_pb2 import \
+    TransactionReceipt
+
+
+# Encoded receipts start with a zero byte, which can never begin a serialized
+# TransactionReceipt (field number zero is invalid), followed by a byte
+# identifying the codec. Anything else is a plain serialized receipt.
+_ENCODED_MARKER = 0
+_ZLIB_CODEC_ID = 1
+
+DEFAULT_DICTIONARY_SIZE = 32 * 1024
+DEFAULT_COMPRESSION_LEVEL = 6
+
+# Receipt database keys starting with this are kept by the codecs; none of
+# them is a transaction id
+CODEC_KEY_PREFIX = 'codec:'
+
+# The receipt database key under which a trained dictionary is kept
+DICTIONARY_KEY = CODEC_KEY_PREFIX + 'dictionary'
+
+RECEIPT_COMPRESSION_TYPES = ('none', 'zlib')
+
+
+class ReceiptCodec(metaclass=ABCMeta):
+    """Transforms serialized TransactionReceipts on their way to and from the
+    receipt database.
+
+    A codec only decides how receipts are encoded. Every encoded receipt
+    names the codec it was encoded with, so any codec decodes receipts
+    stored by any other, and the compression of a database may be changed
+    without rewriting it.
+
+    Args:
+        dictionary (bytes): the preset dictionary of the database, if it has
+            one; see `train_dictionary`. It is needed to decode receipts
+            compressed with it.
+    """
+
+    def __init__(self, dictionary=None):
+        self._dictionary = dictionary
+
+    @abstractmethod
+    def encode(self, txn_receipt_bytes):
+        """Encodes a serialized receipt for storage.
+
+        Args:
+            txn_receipt_bytes (bytes): the serialized receipt
+
+        Returns:
+            bytes: the encoded receipt
+        """
+        raise NotImplementedError()
+
+    def decode(self, encoded_bytes):
+        """Restores a serialized receipt from its stored form, with the codec
+        named in it.
+
+        Args:
+            encoded_bytes (bytes): the encoded receipt
+
+        Returns:
+            bytes: the serialized receipt
+
+        Raises:
+            ValueError: if the receipt was encoded by an unknown codec, or
+                cannot be decoded.
+        """
+        if not _is_encoded(encoded_bytes):
+            return encoded_bytes
+
+        if encoded_bytes[1] == _ZLIB_CODEC_ID:
+            return _zlib_decompress(encoded_bytes[2:], self._dictionary)
+
+        raise ValueError(
+            'Receipt was encoded with unknown codec {}'.format(
+                encoded_bytes[1]))
+
+
+class RawReceiptCodec(ReceiptCodec):
+    """Stores receipts as plain serialized protobufs."""
+
+    def encode(self, txn_receipt_bytes):
+        return txn_receipt_bytes
+
+
+class ZlibReceiptCodec(ReceiptCodec):
+    """Compresses receipts with zlib, optionally primed with a preset
+    dictionary.
+
+    Receipts are small and repeat the same addresses, event types and
+    attribute keys, which a dictionary trained on existing receipts captures
+    far better than compressing each receipt on its own.
+
+    Args:
+        dictionary (bytes): an optional preset dictionary; see
+            `train_dictionary`.
+        level (int): the zlib compression level
+    """
+
+    def __init__(self, dictionary=None, level=DEFAULT_COMPRESSION_LEVEL):
+        super().__init__(dictionary=dictionary)
+        self._level = level
+        self._header = bytes([_ENCODED_MARKER, _ZLIB_CODEC_ID])
+
+    def encode(self, txn_receipt_bytes):
+        if self._dictionary:
+            compressor = zlib.compressobj(
+                self._level, zdict=self._dictionary)
+        else:
+            compressor = zlib.compressobj(self._level)
+
+        return (
+            self._header
+            + compressor.compress(txn_receipt_bytes)
+            + compressor.flush()
+        )
+
+
+def create_receipt_codec(compression, dictionary=None):
+    """Returns the codec for a receipt compression type.
+
+    Args:
+        compression (str): one of RECEIPT_COMPRESSION_TYPES, or None for no
+            compression
+        dictionary (bytes): the preset dictionary of the database, if it has
+            one; the zlib codec also compresses with it
+
+    Returns:
+        ReceiptCodec: the codec
+
+    Raises:
+        ValueError: if the compression type is unknown.
+    """
+    if compression is None or compression == 'none':
+        return RawReceiptCodec(dictionary=dictionary)
+    if compression == 'zlib':
+        return ZlibReceiptCodec(dictionary=dictionary)
+
+    raise ValueError(
+        'Unknown receipt compression type: {}'.format(compression))
+
+
+def train_dictionary(samples, size=DEFAULT_DICTIONARY_SIZE):
+    """Builds a preset compression dictionary from sample receipts.
+
+    The dictionary holds the state addresses, event types and attribute keys
+    that recur across the samples, with the most frequent last, where zlib
+    finds them at the shortest distance.
+
+    Args:
+        samples (iterable of bytes): serialized TransactionReceipts
+        size (int): the maximum size of the dictionary, in bytes
+
+    Returns:
+        bytes: the dictionary
+    """
+    counts = Counter()
+    for sample in samples:
+        txn_receipt = TransactionReceipt()
+        txn_receipt.ParseFromString(sample)
+
+        for state_change in txn_receipt.state_changes:
+            counts[state_change.address.encode()] += 1
+        for event in txn_receipt.events:
+            counts[event.event_type.encode()] += 1
+            for attribute in event.attributes:
+                counts[attribute.key.encode()] += 1
+
+    # Only strings seen more than once are worth a place in the dictionary
+    common = [
+        string for string, count in reversed(counts.most_common())
+        if count > 1
+    ]
+
+    return b''.join(common)[-size:]
+
+
+def _is_encoded(data):
+    return len(data) > 1 and data[0] == _ENCODED_MARKER
+
+
+def _zlib_decompress(data, dictionary):
+    # A zlib stream records whether it was compressed with a dictionary, and
+    # the dictionary is only used if it was
+    if dictionary:
+        decompressor = zlib.decompressobj(zdict=dictionary)
+    else:
+        decompressor = zlib.decompressobj()
+
+    try:
+        return decompressor.decompress(data) + decompressor.flush()
+    except zlib.error as err:
+        raise ValueError('Unable to decode receipt: {}'.format(err))
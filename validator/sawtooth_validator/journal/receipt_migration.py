@@ -0,0 +1,271 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+"""Rewrites a transaction receipt database with a different receipt codec,
+and compares the stored size and read latency of the available codecs.
+
+The validator must be stopped while a receipt database is migrated.
+"""
+
+import argparse
+from collections import namedtuple
+import itertools
+import os
+import sys
+import time
+
+from sawtooth_validator.database.lmdb_nolock_database import \
+    LMDBNoLockDatabase
+from sawtooth_validator.journal.receipt_codec import create_receipt_codec
+from sawtooth_validator.journal.receipt_codec import CODEC_KEY_PREFIX
+from sawtooth_validator.journal.receipt_codec import DICTIONARY_KEY
+from sawtooth_validator.journal.receipt_codec import \
+    RECEIPT_COMPRESSION_TYPES
+from sawtooth_validator.journal.receipt_codec import train_dictionary
+from sawtooth_validator.protobuf.transaction_receipt_pb2 import \
+    TransactionReceipt
+
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_SAMPLE_SIZE = 10000
+
+CodecReport = namedtuple(
+    'CodecReport',
+    ['name', 'receipt_count', 'encoded_size', 'read_latency'])
+
+
+def migrate_receipts(source_db, target_db, source_codec, target_codec,
+                     batch_size=DEFAULT_BATCH_SIZE):
+    """Copies every entry of a receipt database into another, re-encoding the
+    receipts with a new codec.
+
+    Entries which map a transaction id to the bundle of receipts of its block
+    are copied as they are.
+
+    Args:
+        source_db (:obj:`Database`): the database to read
+        target_db (:obj:`Database`): the database to write
+        source_codec (:obj:`ReceiptCodec`): the codec the source receipts
+            were encoded with
+        target_codec (:obj:`ReceiptCodec`): the codec to encode the target
+            receipts with
+        batch_size (int): the number of entries to write at a time
+
+    Returns:
+        int: the number of receipts re-encoded
+    """
+    def recode(txn_receipt_bytes):
+        return target_codec.encode(source_codec.decode(txn_receipt_bytes))
+
+    receipt_count = 0
+    keys = _receipt_keys(source_db)
+    for batch in _batches(keys, batch_size):
+        entries = []
+        for key, value in source_db.get_multi(batch):
+            if isinstance(value, bytes):
+                entries.append((key, recode(value)))
+                receipt_count += 1
+            elif _is_bundle(value):
+                entries.append((key, [recode(v) for v in value]))
+                receipt_count += len(value)
+            else:
+                entries.append((key, value))
+
+        target_db.put_multi(entries)
+
+    return receipt_count
+
+
+def sample_receipts(receipt_db, codec, sample_size=DEFAULT_SAMPLE_SIZE):
+    """Returns up to `sample_size` serialized receipts from a receipt
+    database, decoded with the given codec.
+    """
+    samples = []
+    keys = _receipt_keys(receipt_db)
+    for batch in _batches(keys, DEFAULT_BATCH_SIZE):
+        for _, value in receipt_db.get_multi(batch):
+            if isinstance(value, bytes):
+                samples.append(codec.decode(value))
+            elif _is_bundle(value):
+                samples.extend(codec.decode(v) for v in value)
+
+        if len(samples) >= sample_size:
+            break
+
+    return samples[:sample_size]
+
+
+def compare_codecs(samples, codecs):
+    """Measures the size of a set of receipts under each of the given codecs,
+    and the mean time to decode and parse a receipt.
+
+    Args:
+        samples (list of bytes): serialized receipts
+        codecs (list of (str, ReceiptCodec)): the codecs to measure, by name
+
+    Returns:
+        list of CodecReport: a report per codec
+    """
+    reports = []
+    for name, codec in codecs:
+        encoded = [codec.encode(sample) for sample in samples]
+
+        start = time.perf_counter()
+        for encoded_bytes in encoded:
+            TransactionReceipt().ParseFromString(codec.decode(encoded_bytes))
+        elapsed = time.perf_counter() - start
+
+        reports.append(CodecReport(
+            name=name,
+            receipt_count=len(encoded),
+            encoded_size=sum(len(encoded_bytes) for encoded_bytes in encoded),
+            read_latency=elapsed / len(encoded) if encoded else 0.0))
+
+    return reports
+
+
+def create_parser(prog_name):
+    parser = argparse.ArgumentParser(
+        prog=prog_name,
+        description='Re-encodes the transaction receipt database of a '
+        'stopped validator with a different receipt compression, or '
+        'compares the available compressions on a sample of its receipts.')
+
+    parser.add_argument(
+        'receipt_db',
+        help='path to the txn_receipts-*.lmdb file to operate on')
+
+    parser.add_argument(
+        '--compression',
+        choices=RECEIPT_COMPRESSION_TYPES,
+        default='zlib',
+        help='the compression to migrate to (default: zlib); the '
+        'validator reads receipts stored with any compression, and its '
+        'receipt_compression setting only chooses how new receipts are '
+        'stored')
+
+    parser.add_argument(
+        '--no-dictionary',
+        action='store_true',
+        help='do not train a compression dictionary from existing receipts')
+
+    parser.add_argument(
+        '--sample-size',
+        type=int,
+        default=DEFAULT_SAMPLE_SIZE,
+        help='the number of receipts used to train the dictionary and for '
+        'benchmarking (default: {})'.format(DEFAULT_SAMPLE_SIZE))
+
+    parser.add_argument(
+        '--benchmark',
+        action='store_true',
+        help='report the size and read latency of each compression on a '
+        'sample of receipts, without modifying the database')
+
+    return parser
+
+
+def main(prog_name=os.path.basename(sys.argv[0]), args=None):
+    if args is None:
+        args = sys.argv[1:]
+    args = create_parser(prog_name).parse_args(args)
+
+    if not os.path.isfile(args.receipt_db):
+        print('Error: no receipt database at {}'.format(args.receipt_db),
+              file=sys.stderr)
+        sys.exit(1)
+
+    source_db = LMDBNoLockDatabase(args.receipt_db, 'r')
+    # Every codec decodes receipts stored with any other
+    source_codec = create_receipt_codec(
+        'none', dictionary=source_db.get(DICTIONARY_KEY))
+
+    if args.benchmark:
+        samples = sample_receipts(source_db, source_codec, args.sample_size)
+        codecs = [
+            ('none', create_receipt_codec('none')),
+            ('zlib', create_receipt_codec('zlib')),
+            ('zlib+dictionary', create_receipt_codec(
+                'zlib', dictionary=train_dictionary(samples))),
+        ]
+        print('{:<16} {:>10} {:>14} {:>16}'.format(
+            'COMPRESSION', 'RECEIPTS', 'BYTES', 'READ (us/rcpt)'))
+        for report in compare_codecs(samples, codecs):
+            print('{:<16} {:>10} {:>14} {:>16.2f}'.format(
+                report.name, report.receipt_count, report.encoded_size,
+                report.read_latency * 1e6))
+        source_db.close()
+        return
+
+    dictionary = None
+    if args.compression == 'zlib' and not args.no_dictionary:
+        dictionary = train_dictionary(
+            sample_receipts(source_db, source_codec, args.sample_size))
+
+    # Write into a fresh file and swap it into place, so that an interrupted
+    # migration leaves the original intact and the new file is compacted.
+    target_filename = args.receipt_db + '.migrating'
+    target_db = LMDBNoLockDatabase(target_filename, 'n')
+    target_codec = create_receipt_codec(args.compression, dictionary)
+
+    receipt_count = migrate_receipts(
+        source_db, target_db, source_codec, target_codec)
+    if dictionary:
+        target_db.put(DICTIONARY_KEY, dictionary)
+
+    source_db.close()
+    target_db.close()
+
+    original_size = _disk_usage(args.receipt_db)
+    os.replace(target_filename, args.receipt_db)
+    _remove_lock_file(target_filename)
+
+    print('Migrated {} receipts to {} compression: {} -> {} bytes'.format(
+        receipt_count, args.compression, original_size,
+        _disk_usage(args.receipt_db)))
+
+
+def _receipt_keys(receipt_db):
+    return [
+        key for key in receipt_db.keys()
+        if not key.startswith(CODEC_KEY_PREFIX)
+    ]
+
+
+def _is_bundle(value):
+    # Bundles are lists of encoded receipts; the entries which map a
+    # transaction id into a bundle are [block id, position] pairs.
+    return isinstance(value, list) and all(
+        isinstance(v, bytes) for v in value)
+
+
+def _batches(keys, batch_size):
+    iterator = iter(keys)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _disk_usage(filename):
+    # LMDB files are sparse, and as large as their map size
+    return os.stat(filename).st_blocks * 512
+
+
+def _remove_lock_file(filename):
+    lock_filename = filename + '-lock'
+    if os.path.exists(lock_filename):
+        os.remove(lock_filename)
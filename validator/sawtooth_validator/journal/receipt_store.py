@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ------------------------------------------------------------------------------
+import logging
+
 from sawtooth_validator.protobuf.transaction_receipt_pb2 import \
     TransactionReceipt
 from sawtooth_validator.protobuf.client_receipt_pb2 import \
@@ -25,22 +27,48 @@ from sawtooth_validator.networking.dispatch import HandlerStatus
 from sawtooth_validator.protobuf import validator_pb2
 
 from sawtooth_validator.journal.chain import ChainObserver
+from sawtooth_validator.journal.receipt_codec import CODEC_KEY_PREFIX
+from sawtooth_validator.journal.receipt_codec import RawReceiptCodec
+from sawtooth_validator import metrics
+
+
+LOGGER = logging.getLogger(__name__)
+COLLECTOR = metrics.get_collector(__name__)
+
+_BUNDLE_KEY_PREFIX = 'block:'
+
+# Keys which share the database with transaction ids, but are not receipts
+_RESERVED_KEY_PREFIXES = (_BUNDLE_KEY_PREFIX, CODEC_KEY_PREFIX)
 
 
 class TransactionReceiptStore(ChainObserver):
     """A TransactionReceiptStore persists TransactionReceipt records to a
     provided database implementation.
+
+    The receipts of a committed block are stored together, as a single bundle
+    keyed by the block id. Each transaction id maps to the block id and the
+    position of its receipt within that bundle, so a block's receipts can be
+    read in one lookup and a single receipt in two.
+
+    Receipts pass through a ReceiptCodec on their way to and from the
+    database, which may compress them.
     """
 
-    def __init__(self, receipt_db):
+    def __init__(self, receipt_db, codec=None):
         """Constructs a TransactionReceiptStore, backed by a given database
         implementation.
 
         Args:
             receipt_db (:obj:sawtooth_validator.database.database.Database): A
                 database implementation that backs this store.
+            codec (:obj:ReceiptCodec): the codec receipts are stored with;
+                defaults to storing plain serialized receipts.
         """
         self._receipt_db = receipt_db
+        self._codec = codec if codec is not None else RawReceiptCodec()
+
+        self._chain_update_timer = COLLECTOR.timer(
+            'chain_update', instance=self)
 
     def put(self, txn_id, txn_receipt):
         """Add the given transaction receipt to the store. Does not guarantee
@@ -50,7 +78,25 @@ class TransactionReceiptStore(ChainObserver):
             txn_id (str): the id of the transaction being stored.
             receipt (TransactionReceipt): the receipt object to store.
         """
-        self._receipt_db[txn_id] = txn_receipt.SerializeToString()
+        self._receipt_db[txn_id] = self._encode(txn_receipt)
+
+    def put_block(self, block_id, txn_receipts):
+        """Add the receipts of a block to the store, as a single bundle keyed
+        by the block id, in a single write to the backing store.
+
+        Args:
+            block_id (str): the id of the block containing the transactions.
+            txn_receipts (list of TransactionReceipt): the receipts of the
+                block's transactions, in block order.
+        """
+        bundle = [self._encode(receipt) for receipt in txn_receipts]
+        entries = [
+            (receipt.transaction_id, [block_id, position])
+            for position, receipt in enumerate(txn_receipts)
+        ]
+        entries.append((_bundle_key(block_id), bundle))
+
+        self._receipt_db.put_multi(entries)
 
     def get(self, txn_id):
         """Returns the TransactionReceipt
@@ -64,18 +110,96 @@ class TransactionReceiptStore(ChainObserver):
 
         Raises:
             KeyError: if the transaction id is unknown.
+            ValueError: if the receipt cannot be decoded.
+        """
+        return self.get_multi([txn_id])[0]
+
+    def get_multi(self, txn_ids):
+        """Returns the TransactionReceipts for the given transaction ids,
+        reading the bundle of each block involved once.
+
+        Args:
+            txn_ids (list of str): the ids of the transactions for which the
+                receipts should be retrieved.
+
+        Returns:
+            list of TransactionReceipt: The receipts, in the order of the
+                given transaction ids.
+
+        Raises:
+            KeyError: if any of the transaction ids is unknown.
+            ValueError: if a receipt cannot be decoded.
+        """
+        for txn_id in txn_ids:
+            if txn_id.startswith(_RESERVED_KEY_PREFIXES):
+                raise KeyError('Unknown transaction id {}'.format(txn_id))
+
+        entries = dict(self._receipt_db.get_multi(txn_ids))
+
+        bundle_keys = {
+            _bundle_key(entry[0])
+            for entry in entries.values() if not isinstance(entry, bytes)
+        }
+        bundles = dict(self._receipt_db.get_multi(list(bundle_keys)))
+
+        txn_receipts = []
+        for txn_id in txn_ids:
+            try:
+                entry = entries[txn_id]
+                if isinstance(entry, bytes):
+                    # Receipts stored individually, by put, are stored whole
+                    txn_receipt_bytes = entry
+                else:
+                    block_id, position = entry
+                    txn_receipt_bytes = \
+                        bundles[_bundle_key(block_id)][position]
+            except (KeyError, IndexError):
+                # An index entry whose position is past the end of its
+                # block's bundle is stale, and its receipt is as missing as
+                # one which was never stored
+                raise KeyError('Unknown transaction id {}'.format(txn_id))
+
+            txn_receipts.append(self._decode(txn_receipt_bytes))
+
+        return txn_receipts
+
+    def get_block_receipts(self, block_id):
+        """Returns the TransactionReceipts of all the transactions in a block.
+
+        Args:
+            block_id (str): the id of the block for which the receipts should
+                be retrieved.
+
+        Returns:
+            list of TransactionReceipt: The receipts, in block order.
+
+        Raises:
+            KeyError: if no receipts are stored for the block id.
+            ValueError: if a receipt cannot be decoded.
         """
-        if txn_id not in self._receipt_db:
-            raise KeyError('Unknown transaction id {}'.format(txn_id))
+        bundle = self._receipt_db.get(_bundle_key(block_id))
+        if bundle is None:
+            raise KeyError('Unknown block id {}'.format(block_id))
+
+        return [
+            self._decode(txn_receipt_bytes) for txn_receipt_bytes in bundle
+        ]
+
+    def chain_update(self, block, receipts):
+        with self._chain_update_timer.time():
+            self.put_block(block.header_signature, receipts)
+
+    def _encode(self, txn_receipt):
+        return self._codec.encode(txn_receipt.SerializeToString())
 
-        txn_receipt_bytes = self._receipt_db[txn_id]
+    def _decode(self, encoded_bytes):
         txn_receipt = TransactionReceipt()
-        txn_receipt.ParseFromString(txn_receipt_bytes)
+        txn_receipt.ParseFromString(self._codec.decode(encoded_bytes))
         return txn_receipt
 
-    def chain_update(self, block, receipts):
-        for receipt in receipts:
-            self.put(receipt.transaction_id, receipt)
+
+def _bundle_key(block_id):
+    return _BUNDLE_KEY_PREFIX + block_id
 
 
 class ClientReceiptGetRequestHandler(Handler):
@@ -91,16 +215,19 @@ class ClientReceiptGetRequestHandler(Handler):
 
         try:
             response = ClientReceiptGetResponse(
-                receipts=[
-                    self._txn_receipt_store.get(txn_id)
-                    for txn_id in request.transaction_ids
-                ],
+                receipts=self._txn_receipt_store.get_multi(
+                    request.transaction_ids),
                 status=ClientReceiptGetResponse.OK)
 
         except KeyError:
             response = ClientReceiptGetResponse(
                 status=ClientReceiptGetResponse.NO_RESOURCE)
 
+        except ValueError as err:
+            LOGGER.error('Unable to decode transaction receipts: %s', err)
+            response = ClientReceiptGetResponse(
+                status=ClientReceiptGetResponse.INTERNAL_ERROR)
+
         return HandlerResult(
             HandlerStatus.RETURN,
             message_out=response,
@@ -0,0 +1,218 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import zlib
+
+from sawtooth_validator.protobuf import validator_pb2
+from sawtooth_validator import metrics
+
+
+COLLECTOR = metrics.get_collector(__name__)
+
+ZLIB = 'zlib'
+
+# The codecs this validator can compress and decompress with, most preferred
+# first
+SUPPORTED_CODECS = [ZLIB]
+
+# The content of other messages is never compressed
+COMPRESSED_MESSAGE_TYPES = frozenset([
+    validator_pb2.Message.GOSSIP_MESSAGE,
+    validator_pb2.Message.GOSSIP_BLOCK_RESPONSE,
+    validator_pb2.Message.GOSSIP_BATCH_RESPONSE,
+])
+
+DEFAULT_THRESHOLD = 1024
+
+# Content which would decompress to more than this is refused, so that a
+# small message cannot be made to take up a large amount of memory. It is
+# comfortably above the largest batch list the REST API accepts by default
+# (10 MiB); larger content is sent uncompressed, so no peer is asked to
+# decompress more than this.
+MAX_DECOMPRESSED_SIZE = 16 * 1024 * 1024
+
+_ZLIB_LEVEL = 6
+
+
+class CompressionError(Exception):
+    pass
+
+
+class PayloadCompressor:
+    """Compresses the content of gossip messages sent to connections which
+    have agreed on a codec, and decompresses the content of those received.
+
+    Which codec a connection uses is negotiated in its ConnectionRequest,
+    which lists the codecs the requester supports, and ConnectionResponse,
+    which names the one chosen. A message whose content is compressed names
+    its codec in the Message's content_encoding; other messages leave it
+    empty.
+
+    Content is compressed only if it is at least the threshold size, no
+    larger than MAX_DECOMPRESSED_SIZE, and compression makes it smaller. As
+    gossip is broadcast by sending the same content to each peer, the last
+    content compressed is remembered, so that it is only compressed once.
+
+    Compressed content is only accepted in the message types which are
+    compressed, from connections which agreed on its codec.
+
+    Args:
+        codecs (list of str): the codecs to offer and accept, most
+            preferred first; an empty list turns compression off
+        threshold (int): the smallest content, in bytes, to compress
+    """
+
+    def __init__(self, codecs=None, threshold=DEFAULT_THRESHOLD):
+        if codecs is None:
+            codecs = SUPPORTED_CODECS
+        unsupported = set(codecs) - set(SUPPORTED_CODECS)
+        if unsupported:
+            raise ValueError(
+                'Unsupported compression codecs: {}'.format(
+                    ', '.join(sorted(unsupported))))
+
+        self._codecs = list(codecs)
+        self._threshold = threshold
+
+        # (codec, content, compressed content) of the last content compressed
+        self._last_compressed = None
+
+        self._compression_ratio_gauges = {}
+        self._compression_timers = {}
+        self._decompression_timers = {}
+
+    @property
+    def codecs(self):
+        return list(self._codecs)
+
+    def choose_codec(self, offered_codecs):
+        """Returns the codec to use with a connection which offered the given
+        codecs: the first of them which is accepted here, or the empty
+        string if there is none.
+        """
+        for codec in offered_codecs:
+            if codec in self._codecs:
+                return codec
+        return ''
+
+    def compress(self, message_type, content, codec):
+        """Compresses the content of a message to be sent, if it is worth
+        compressing.
+
+        Args:
+            message_type (int): the validator_pb2.Message type of the message
+            content (bytes): the content of the message
+            codec (str): the codec agreed with the connection the message is
+                to be sent to, or the empty string
+
+        Returns:
+            (bytes, str): the content to send, and the codec it is
+                compressed with, or the empty string if it is not
+        """
+        if not codec or message_type not in COMPRESSED_MESSAGE_TYPES or \
+                not self._threshold <= len(content) <= MAX_DECOMPRESSED_SIZE:
+            return content, ''
+
+        last_compressed = self._last_compressed
+        if last_compressed is not None and last_compressed[0] == codec and \
+                last_compressed[1] is content:
+            compressed = last_compressed[2]
+        else:
+            tag = _message_type_name(message_type)
+            timer_ctx = self._get_compression_timer(tag).time()
+            compressed = zlib.compress(content, _ZLIB_LEVEL)
+            timer_ctx.stop()
+
+            self._get_compression_ratio_gauge(tag).set_value(
+                len(compressed) / len(content))
+            self._last_compressed = (codec, content, compressed)
+
+        if len(compressed) >= len(content):
+            return content, ''
+
+        return compressed, codec
+
+    def decompress(self, message_type, content, codec, connection_codec):
+        """Decompresses the content of a received message.
+
+        Args:
+            message_type (int): the validator_pb2.Message type of the message
+            content (bytes-like): the compressed content
+            codec (str): the codec the content is compressed with
+            connection_codec (str): the codec agreed with the connection the
+                message was received from, or the empty string
+
+        Returns:
+            bytes: the decompressed content
+
+        Raises:
+            CompressionError: if the message is not of a type which is
+                compressed, the codec is not the one agreed with the
+                connection or is not accepted, or the content cannot be
+                decompressed
+        """
+        if message_type not in COMPRESSED_MESSAGE_TYPES:
+            raise CompressionError(
+                'Content of {} messages is never compressed'.format(
+                    _message_type_name(message_type)))
+        if codec != connection_codec or codec not in self._codecs:
+            raise CompressionError(
+                'Content compressed with {}, but the connection agreed on '
+                '{}'.format(codec, connection_codec or 'none'))
+
+        timer_ctx = self._get_decompression_timer(
+            _message_type_name(message_type)).time()
+        try:
+            decompressor = zlib.decompressobj()
+            decompressed = decompressor.decompress(
+                content, MAX_DECOMPRESSED_SIZE)
+            if decompressor.unconsumed_tail:
+                raise CompressionError(
+                    'Content decompresses to more than {} bytes'.format(
+                        MAX_DECOMPRESSED_SIZE))
+            if not decompressor.eof:
+                raise CompressionError('Compressed content is truncated')
+        except zlib.error as e:
+            raise CompressionError(
+                'Unable to decompress content: {}'.format(e))
+        finally:
+            timer_ctx.stop()
+
+        return decompressed
+
+    def _get_compression_ratio_gauge(self, tag):
+        if tag not in self._compression_ratio_gauges:
+            self._compression_ratio_gauges[tag] = COLLECTOR.gauge(
+                'compression_ratio', instance=self,
+                tags={"message_type": tag})
+        return self._compression_ratio_gauges[tag]
+
+    def _get_compression_timer(self, tag):
+        if tag not in self._compression_timers:
+            self._compression_timers[tag] = COLLECTOR.timer(
+                'compression_time', instance=self,
+                tags={"message_type": tag})
+        return self._compression_timers[tag]
+
+    def _get_decompression_timer(self, tag):
+        if tag not in self._decompression_timers:
+            self._decompression_timers[tag] = COLLECTOR.timer(
+                'decompression_time', instance=self,
+                tags={"message_type": tag})
+        return self._decompression_timers[tag]
+
+
+def _message_type_name(message_type):
+    return validator_pb2.Message.MessageType.Name(message_type)
@@ -16,8 +16,8 @@ import abc
 import enum
 import logging
 from threading import Condition
-import queue
 import uuid
+from collections import deque
 from collections import namedtuple
 
 # pylint: disable=import-error,no-name-in-module
@@ -25,6 +25,10 @@ from collections import namedtuple
 from google.protobuf.message import DecodeError
 
 from sawtooth_validator.concurrent.thread import InstrumentedThread
+from sawtooth_validator.config.validator import ROLE_CLIENT
+from sawtooth_validator.config.validator import ROLE_CONSENSUS
+from sawtooth_validator.config.validator import ROLE_PEER
+from sawtooth_validator.config.validator import ROLE_PROCESSOR
 from sawtooth_validator.networking.interconnect import get_enum_name
 from sawtooth_validator.protobuf import validator_pb2
 from sawtooth_validator import metrics
@@ -39,6 +43,33 @@ class Priority(enum.IntEnum):
     LOW = 2
 
 
+_ROLE_MESSAGE_PREFIXES = (
+    ('CLIENT_', ROLE_CLIENT),
+    ('TP_', ROLE_PROCESSOR),
+    ('CONSENSUS_', ROLE_CONSENSUS),
+    ('GOSSIP_', ROLE_PEER),
+    ('NETWORK_', ROLE_PEER),
+    ('AUTHORIZATION_', ROLE_PEER),
+)
+
+# message type -> the role of the connections which send it
+_MESSAGE_ROLES = {
+    message_type: role
+    for name, message_type in validator_pb2.Message.MessageType.items()
+    for prefix, role in _ROLE_MESSAGE_PREFIXES
+    if name.startswith(prefix)
+}
+
+# The number of messages taken from a connection in its turn, relative to the
+# other connections with messages of the same priority waiting
+DEFAULT_ROLE_WEIGHTS = {
+    ROLE_CONSENSUS: 4,
+    ROLE_PROCESSOR: 4,
+    ROLE_PEER: 2,
+    ROLE_CLIENT: 1,
+}
+
+
 def _gen_message_id():
     return uuid.uuid4().hex.encode()
 
@@ -53,16 +84,46 @@ _MessageInformation = namedtuple('_MessageInformation', (
 
 
 class Dispatcher(InstrumentedThread):
-    def __init__(self, timeout=10):
+    """Runs the handlers registered for each message type on the messages
+    received from connections.
+
+    Messages are taken in order of priority. Messages of the same priority
+    are taken from each connection with messages waiting in turn, so that
+    one connection sending many messages cannot starve the others; each
+    connection's turn is a number of messages given by the weight of its
+    role, and its messages are taken in the order they arrived.
+
+    The number of messages waiting from the connections of each role is
+    reported by a gauge tagged with the role, so there is one gauge per role
+    however many connections come and go.
+
+    Args:
+        timeout (int): accepted for compatibility with existing callers;
+            the dispatcher waits for messages without a timeout until it is
+            stopped
+        role_weights (dict of str: int): the weights of connection roles,
+            set by dispatcher_role_weights in validator.toml; a connection's
+            role is told by the message types it sends. Roles which are
+            missing keep their weight in DEFAULT_ROLE_WEIGHTS, and
+            connections whose role is not known have a weight of 1.
+    """
+
+    def __init__(self, timeout=10, role_weights=None):
         super().__init__(name='Dispatcher')
         self._timeout = timeout
         self._msg_type_handlers = {}
-        self._in_queue = queue.PriorityQueue()
+        weights = dict(DEFAULT_ROLE_WEIGHTS)
+        if role_weights is not None:
+            weights.update(role_weights)
+        self._in_queue = _FairQueue(weights, self._set_role_queue_depth)
+        self._role_queue_gauges = {}
         self._send_message = {}
         self._send_last_message = {}
         self._message_information = {}
         self._condition = Condition()
         self._dispatch_timers = {}
+        self._stage_queue_timers = {}
+        self._stage_timers = {}
         self._priority = {}
         self._preprocessors = {}
 
@@ -73,6 +134,30 @@ class Dispatcher(InstrumentedThread):
                 instance=self)
         return self._dispatch_timers[tag]
 
+    def _get_role_queue_gauge(self, tag):
+        if tag not in self._role_queue_gauges:
+            self._role_queue_gauges[tag] = COLLECTOR.gauge(
+                'role_queue_depth', tags={"role": tag}, instance=self)
+        return self._role_queue_gauges[tag]
+
+    def _set_role_queue_depth(self, role, depth):
+        self._get_role_queue_gauge(
+            'unknown' if role is None else role).set_value(depth)
+
+    def _get_stage_queue_timer(self, tag):
+        if tag not in self._stage_queue_timers:
+            self._stage_queue_timers[tag] = COLLECTOR.timer(
+                'dispatch_stage_queue_time', tags={"stage": tag},
+                instance=self)
+        return self._stage_queue_timers[tag]
+
+    def _get_stage_timer(self, tag):
+        if tag not in self._stage_timers:
+            self._stage_timers[tag] = COLLECTOR.timer(
+                'dispatch_stage_execution_time', tags={"stage": tag},
+                instance=self)
+        return self._stage_timers[tag]
+
     def add_send_message(self, connection, send_message):
         """Adds a send_message function to the Dispatcher's
         dictionary of functions indexed by connection.
@@ -155,7 +240,9 @@ class Dispatcher(InstrumentedThread):
                     collection=_ManagerCollection(
                         self._msg_type_handlers[message.message_type]))
 
-            self._in_queue.put_nowait((priority, message_id))
+            self._in_queue.put(
+                priority, connection_id, message_id,
+                _MESSAGE_ROLES.get(message.message_type))
 
             queue_size = self._in_queue.qsize()
             if queue_size > 10:
@@ -167,14 +254,19 @@ class Dispatcher(InstrumentedThread):
                         connection_id)
 
     def add_handler(self, message_type, handler, executor, priority=None):
+        """Adds a handler to the end of the chain of handlers for a message
+        type, to be run in the given executor.
+
+        Consecutive handlers in a chain which share an executor are run
+        together, as a single task, with no hand-off between them.
+        """
         if not isinstance(handler, Handler):
             raise TypeError("%s is not a Handler subclass" % handler)
-        if message_type not in self._msg_type_handlers:
-            self._msg_type_handlers[message_type] = [
-                _HandlerManager(executor, handler)]
+        stages = self._msg_type_handlers.setdefault(message_type, [])
+        if stages and stages[-1].executor is executor:
+            stages[-1].add_handler(handler)
         else:
-            self._msg_type_handlers[message_type].append(
-                _HandlerManager(executor, handler))
+            stages.append(_HandlerStage(executor, handler))
 
         if priority is not None:
             self._priority[message_type] = priority
@@ -266,40 +358,60 @@ class Dispatcher(InstrumentedThread):
         message_info = self._message_information[message_id]
 
         try:
-            handler_manager = next(message_info.collection)
+            stage = next(message_info.collection)
         except IndexError:
             # IndexError is raised if done with handlers
             del self._message_information[message_id]
+            with self._condition:
+                if not self._message_information:
+                    self._condition.notify()
             return
 
-        timer_tag = type(handler_manager.handler).__name__
-        timer_ctx = self._get_dispatch_timer(timer_tag).time()
+        queue_timer_ctx = self._get_stage_queue_timer(stage.name).time()
+
+        def run_stage(connection_id, message_content):
+            queue_timer_ctx.stop()
+            with self._get_stage_timer(stage.name).time():
+                for handler in stage.handlers:
+                    timer_tag = type(handler).__name__
+                    timer_ctx = self._get_dispatch_timer(timer_tag).time()
+                    result = handler.handle(connection_id, message_content)
+                    timer_ctx.stop()
+
+                    try:
+                        if not self._determine_next(message_id, result):
+                            return
+                    except Exception:  # pylint: disable=broad-except
+                        LOGGER.exception(
+                            "Unhandled exception while determining next")
+                        return
 
-        def do_next(result):
-            timer_ctx.stop()
             try:
-                self._determine_next(message_id, result)
+                self._process_next(message_id)
             except Exception:  # pylint: disable=broad-except
                 LOGGER.exception(
                     "Unhandled exception while determining next")
 
-        handler_manager.execute(
-            message_info.connection_id,
-            message_info.content,
-            do_next)
+        stage.executor.submit(
+            run_stage, message_info.connection_id, message_info.content)
 
     def _determine_next(self, message_id, result):
+        """Acts on the result of a handler.
+
+        Returns:
+            bool: True if the message should be passed to the next handler
+        """
         if result is None:
             LOGGER.debug('Ignoring None handler result, likely due to an '
                          'unhandled error while executing the handler')
-            return
+            return False
 
+        pass_on = False
         if result.status == HandlerStatus.DROP:
             del self._message_information[message_id]
 
         elif result.status == HandlerStatus.PASS:
-            self._process_next(message_id)
-
+            pass_on = True
         elif result.status == HandlerStatus.RETURN_AND_PASS:
             message_info = self._message_information[message_id]
 
@@ -320,7 +432,7 @@ class Dispatcher(InstrumentedThread):
                         message_info.connection_id,
                         message_info.connection)
 
-                self._process_next(message_id)
+                pass_on = True
             else:
                 LOGGER.error("HandlerResult with status of RETURN_AND_PASS "
                              "is missing message_out or message_type")
@@ -382,10 +494,12 @@ class Dispatcher(InstrumentedThread):
             if not self._message_information:
                 self._condition.notify()
 
+        return pass_on
+
     def run(self):
         while True:
             try:
-                _, msg_id = self._in_queue.get()
+                msg_id = self._in_queue.get()
                 if msg_id == -1:
                     break
                 self._process(msg_id)
@@ -393,7 +507,7 @@ class Dispatcher(InstrumentedThread):
                 LOGGER.exception("Unhandled exception while dispatching")
 
     def stop(self):
-        self._in_queue.put_nowait((Priority.HIGH, -1))
+        self._in_queue.put(Priority.HIGH, None, -1)
 
     def block_until_complete(self):
         """Blocks until no more messages are in flight,
@@ -404,6 +518,105 @@ class Dispatcher(InstrumentedThread):
                 self._condition.wait()
 
 
+class _FairQueue:
+    """A queue of message ids, taken in order of priority, and within each
+    priority by weighted round robin over the connections they arrived on.
+
+    Args:
+        role_weights (dict of str: int): the weight of each connection role
+        set_depth (function): called, with the queue held, whenever the
+            number of messages waiting from the connections of a role, over
+            all priorities, changes
+            Expected args:
+                role (str): the role, or None if it is not known
+                depth (int): the number of messages waiting
+    """
+
+    def __init__(self, role_weights, set_depth):
+        self._role_weights = role_weights
+        self._set_depth = set_depth
+        self._condition = Condition()
+        # priority -> _Band
+        self._bands = {}
+        # role -> messages waiting, over all priorities
+        self._role_depths = {}
+        self._size = 0
+
+    def qsize(self):
+        with self._condition:
+            return self._size
+
+    def put(self, priority, connection_id, message_id, role=None):
+        with self._condition:
+            band = self._bands.get(priority)
+            if band is None:
+                band = _Band()
+                self._bands[priority] = band
+
+            messages = band.queues.get(connection_id)
+            if messages is None:
+                messages = deque()
+                band.queues[connection_id] = messages
+                band.active.append(connection_id)
+            if role is not None and band.roles.get(connection_id) is None:
+                band.roles[connection_id] = role
+            messages.append((message_id, role))
+
+            self._size += 1
+            if connection_id is not None:
+                depth = self._role_depths.get(role, 0) + 1
+                self._role_depths[role] = depth
+                self._set_depth(role, depth)
+            self._condition.notify()
+
+    def get(self):
+        with self._condition:
+            while not self._size:
+                self._condition.wait()
+
+            band = self._bands[min(
+                priority for priority, band in self._bands.items()
+                if band.active)]
+
+            connection_id = band.active[0]
+            if band.turns.get(connection_id, 0) <= 0:
+                band.turns[connection_id] = self._role_weights.get(
+                    band.roles.get(connection_id), 1)
+
+            messages = band.queues[connection_id]
+            message_id, role = messages.popleft()
+            band.turns[connection_id] -= 1
+
+            if not messages:
+                del band.queues[connection_id]
+                band.active.popleft()
+                band.turns.pop(connection_id, None)
+                band.roles.pop(connection_id, None)
+            elif band.turns[connection_id] <= 0:
+                band.active.rotate(-1)
+
+            self._size -= 1
+            if connection_id is not None:
+                self._role_depths[role] -= 1
+                self._set_depth(role, self._role_depths[role])
+
+        return message_id
+
+
+class _Band:
+    """The messages of one priority waiting in a _FairQueue."""
+
+    def __init__(self):
+        # connection_id -> deque of message ids
+        self.queues = {}
+        # connection ids with messages waiting, in the order of their turns
+        self.active = deque()
+        # connection_id -> messages left to take in its current turn
+        self.turns = {}
+        # connection_id -> role
+        self.roles = {}
+
+
 class _PreprocessorManager:
     def __init__(self, executor, preprocessor):
         self._executor = executor
@@ -426,33 +639,44 @@ class _PreprocessorManager:
         return self._executor.submit(wrapped, message_content)
 
 
-class _HandlerManager:
+class _HandlerStage:
+    """A run of consecutive handlers in a message type's chain which share
+    an executor, and are run one after another in a single task.
+    """
+
     def __init__(self, executor, handler):
         """
         :param executor: concurrent.futures.Executor
         :param handler: Handler subclass
         """
         self._executor = executor
-        self._handler = handler
+        self._handlers = [handler]
+        self._name = type(handler).__name__
 
     @property
-    def handler(self):
-        return self._handler
+    def executor(self):
+        return self._executor
 
-    def execute(self, connection_id, message, callback):
-        def wrapped(connection_id, message):
-            return callback(self._handler.handle(connection_id, message))
+    @property
+    def handlers(self):
+        return self._handlers
+
+    @property
+    def name(self):
+        return self._name
 
-        return self._executor.submit(wrapped, connection_id, message)
+    def add_handler(self, handler):
+        self._handlers.append(handler)
+        self._name += '+' + type(handler).__name__
 
 
 class _ManagerCollection:
-    """Wraps a list of _HandlerManagers and
-    keeps track of which handler_manager is next
+    """Wraps a list of _HandlerStages and
+    keeps track of which stage is next
     """
 
-    def __init__(self, handler_managers):
-        self._chain = handler_managers
+    def __init__(self, handler_stages):
+        self._chain = handler_stages
         self._index = 0
 
     def __next__(self):
@@ -0,0 +1,133 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+from google.protobuf.message import DecodeError
+
+
+# The field numbers of validator_pb2.Message
+_MESSAGE_TYPE_FIELD = 1
+_CORRELATION_ID_FIELD = 2
+_CONTENT_FIELD = 3
+_CONTENT_ENCODING_FIELD = 4
+
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+_FIXED32 = 5
+
+
+class MessageEnvelope:
+    """A validator_pb2.Message decoded from a received buffer, whose content
+    is a memoryview of that buffer rather than a copy of it.
+
+    The content may be passed to ParseFromString as it is; code which keeps
+    it beyond handling the message, or sends it on, should copy it with
+    bytes().
+    """
+
+    __slots__ = [
+        'message_type', 'correlation_id', 'content', 'content_encoding']
+
+    def __init__(self, message_type, correlation_id, content,
+                 content_encoding=''):
+        self.message_type = message_type
+        self.correlation_id = correlation_id
+        self.content = content
+        self.content_encoding = content_encoding
+
+
+def decode_envelope(buffer):
+    """Decodes the serialized validator_pb2.Message in a buffer, without
+    copying its content.
+
+    Args:
+        buffer (bytes-like): the serialized message, such as the buffer of
+            a received zmq Frame
+
+    Returns:
+        MessageEnvelope: the message
+
+    Raises:
+        DecodeError: if the buffer does not hold a valid message
+    """
+    view = memoryview(buffer)
+    if view.ndim != 1 or view.itemsize != 1:
+        view = view.cast('B')
+
+    message_type = 0
+    correlation_id = ''
+    content = view[0:0]
+    content_encoding = ''
+
+    position = 0
+    end = len(view)
+    while position < end:
+        tag, position = _decode_varint(view, position)
+        field_number = tag >> 3
+        wire_type = tag & 0x7
+
+        if wire_type == _VARINT:
+            value, position = _decode_varint(view, position)
+            if field_number == _MESSAGE_TYPE_FIELD:
+                # Enums are encoded as sign-extended 64 bit integers
+                message_type = value - (1 << 64) if value >> 63 else value
+        elif wire_type == _LENGTH_DELIMITED:
+            length, position = _decode_varint(view, position)
+            value_end = position + length
+            if value_end > end:
+                raise DecodeError('Truncated message')
+            if field_number == _CONTENT_FIELD:
+                content = view[position:value_end]
+            elif field_number == _CORRELATION_ID_FIELD:
+                correlation_id = _decode_string(view, position, value_end)
+            elif field_number == _CONTENT_ENCODING_FIELD:
+                content_encoding = _decode_string(view, position, value_end)
+            position = value_end
+        elif wire_type == _FIXED64:
+            position += 8
+        elif wire_type == _FIXED32:
+            position += 4
+        else:
+            raise DecodeError('Unexpected wire type {}'.format(wire_type))
+
+    if position > end:
+        raise DecodeError('Truncated message')
+
+    return MessageEnvelope(
+        message_type, correlation_id, content, content_encoding)
+
+
+def _decode_varint(view, position):
+    result = 0
+    shift = 0
+    end = len(view)
+    while position < end:
+        byte = view[position]
+        position += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result & ((1 << 64) - 1), position
+        shift += 7
+        if shift >= 64:
+            break
+
+    raise DecodeError('Truncated or malformed varint')
+
+
+def _decode_string(view, start, end):
+    try:
+        return bytes(view[start:end]).decode('utf-8')
+    except UnicodeDecodeError:
+        raise DecodeError('Invalid string field')
@@ -18,15 +18,21 @@ from threading import Condition
 from threading import RLock
 import time
 
+from sawtooth_validator.networking.timer_wheel import TimerWheel
+from sawtooth_validator import metrics
+
 
 LOGGER = logging.getLogger(__name__)
+COLLECTOR = metrics.get_collector(__name__)
 
 
 class FutureResult:
-    def __init__(self, message_type, content, connection_id=None):
+    def __init__(self, message_type, content, connection_id=None,
+                 timed_out=False):
         self.message_type = message_type
         self.content = content
         self.connection_id = connection_id
+        self.timed_out = timed_out
 
 
 class FutureTimeoutError(Exception):
@@ -35,8 +41,9 @@ class FutureTimeoutError(Exception):
 
 class Future:
     def __init__(self, correlation_id, request=None, callback=None,
-                 timer_ctx=None):
+                 timer_ctx=None, connection_id=None):
         self.correlation_id = correlation_id
+        self.connection_id = connection_id
         self._request = request
         self._result = None
         self._condition = Condition()
@@ -44,6 +51,7 @@ class Future:
         self._callback_func = callback
         self._reconcile_time = None
         self._timer_ctx = timer_ctx
+        self.age_timer_ctx = None
 
     def done(self):
         return self._result is not None
@@ -57,6 +65,8 @@ class Future:
             if self._result is None:
                 if not self._condition.wait(timeout):
                     raise FutureTimeoutError('Future timed out')
+        if self._result.timed_out:
+            raise FutureTimeoutError('Future expired without a response')
         return self._result
 
     def set_result(self, result):
@@ -95,13 +105,51 @@ class FutureCollectionKeyError(Exception):
 
 
 class FutureCollection:
-    def __init__(self, resolving_threadpool=None):
+    """The futures awaiting a response, by correlation id.
+
+    A future may be given a deadline when it is put in the collection. The
+    deadlines are kept in a timer wheel, and each call to `expire` resolves
+    the futures whose deadlines have passed with a timed out FutureResult,
+    running their callbacks, and removes them.
+
+    The number of futures awaiting a response, their ages, and the number
+    which expire are reported over all connections.
+
+    Args:
+        resolving_threadpool (:obj:`Executor`): runs the callbacks of the
+            resolved futures; if None, callbacks are run by the resolving
+            thread
+        timer_wheel (:obj:`TimerWheel`): keeps the deadlines of the futures
+    """
+
+    def __init__(self, resolving_threadpool=None, timer_wheel=None):
         self._futures = {}
         self._lock = RLock()
         self._resolving_threadpool = resolving_threadpool
-
-    def put(self, future):
-        self._futures[future.correlation_id] = future
+        self._timer_wheel = \
+            TimerWheel() if timer_wheel is None else timer_wheel
+
+        self._outstanding_gauge = COLLECTOR.gauge(
+            'outstanding_futures', instance=self)
+        self._expired_counter = COLLECTOR.counter(
+            'expired_futures_count', instance=self)
+        self._age_timer = COLLECTOR.timer('future_age', instance=self)
+
+    def put(self, future, timeout=None):
+        """Adds a future to the collection.
+
+        Args:
+            future (:obj:`Future`): the future
+            timeout (float): the number of seconds after which the future
+                expires, if no response has arrived; if None, it waits for
+                a response indefinitely
+        """
+        with self._lock:
+            self._futures[future.correlation_id] = future
+            future.age_timer_ctx = self._age_timer.time()
+            self._outstanding_gauge.set_value(len(self._futures))
+            if timeout is not None:
+                self._timer_wheel.add(future.correlation_id, timeout)
 
     def set_result(self, correlation_id, result):
         with self._lock:
@@ -120,8 +168,48 @@ class FutureCollection:
                 "no such correlation id: {}".format(correlation_id))
 
     def remove(self, correlation_id):
-        try:
-            del self._futures[correlation_id]
-        except KeyError:
-            raise FutureCollectionKeyError(
-                "no such correlation id: {}".format(correlation_id))
+        with self._lock:
+            try:
+                future = self._futures.pop(correlation_id)
+            except KeyError:
+                raise FutureCollectionKeyError(
+                    "no such correlation id: {}".format(correlation_id))
+
+            self._timer_wheel.cancel(correlation_id)
+            future.age_timer_ctx.stop()
+            self._outstanding_gauge.set_value(len(self._futures))
+
+    def expire(self):
+        """Resolves the futures whose deadlines have passed with a timed out
+        result, and removes them from the collection.
+
+        Returns:
+            list of :obj:`Future`: the expired futures
+        """
+        with self._lock:
+            expired = []
+            for correlation_id in self._timer_wheel.expire():
+                future = self._futures.pop(correlation_id, None)
+                if future is None:
+                    continue
+
+                future.age_timer_ctx.stop()
+                self._outstanding_gauge.set_value(len(self._futures))
+                self._expired_counter.inc()
+
+                future.set_result(FutureResult(
+                    message_type=None,
+                    content=b'',
+                    connection_id=future.connection_id,
+                    timed_out=True))
+                future.timer_stop()
+                if self._resolving_threadpool is not None:
+                    self._resolving_threadpool.submit(future.run_callback)
+                else:
+                    future.run_callback()
+                expired.append(future)
+
+        if expired:
+            LOGGER.debug("%s futures expired without a response",
+                         len(expired))
+        return expired
@@ -94,6 +94,9 @@ class ConnectHandler(Handler):
         procedure required to gain access to that role. If the validator is not
         accepting connections or does not support the listed authorization
         type, return an ConnectionResponse.ERROR and close the connection.
+        The ConnectionResponse also names the codec, of those listed in the
+        ConnectionRequest, with which the content of gossip messages may be
+        compressed on the connection, if any.
         """
         message = ConnectionRequest()
         message.ParseFromString(message_content)
@@ -177,6 +180,10 @@ class ConnectHandler(Handler):
             connection_id,
             ConnectionStatus.CONNECTION_REQUEST)
 
+        connection_response.compression_codec = \
+            self._network.negotiate_compression(
+                connection_id, message.compression_codecs)
+
         return HandlerResult(
             HandlerStatus.RETURN,
             message_out=connection_response,
@@ -14,6 +14,7 @@
 # ------------------------------------------------------------------------------
 
 import asyncio
+from collections import deque
 from concurrent.futures import CancelledError
 from functools import partial
 import hashlib
@@ -37,6 +38,11 @@ from sawtooth_validator.concurrent.thread import InstrumentedThread
 from sawtooth_validator.exceptions import LocalConfigurationError
 from sawtooth_validator.protobuf import validator_pb2
 from sawtooth_validator.networking import future
+from sawtooth_validator.networking.compression import CompressionError
+from sawtooth_validator.networking.compression import DEFAULT_THRESHOLD
+from sawtooth_validator.networking.compression import PayloadCompressor
+from sawtooth_validator.networking.envelope import decode_envelope
+from sawtooth_validator.networking.timer_wheel import DEFAULT_TICK
 from sawtooth_validator.protobuf.authorization_pb2 import ConnectionRequest
 from sawtooth_validator.protobuf.authorization_pb2 import ConnectionResponse
 from sawtooth_validator.protobuf.authorization_pb2 import \
@@ -55,6 +61,10 @@ COLLECTOR = metrics.get_collector(__name__)
 
 # pylint: disable=too-many-lines
 
+# The most messages sent from the send queue before the event loop is given
+# a chance to run its other tasks
+_MAX_SEND_BATCH = 1000
+
 
 class ConnectionType(Enum):
     OUTBOUND_CONNECTION = 1
@@ -74,7 +84,7 @@ class AuthorizationType(Enum):
 
 ConnectionInfo = namedtuple('ConnectionInfo',
                             ['connection_type', 'connection', 'uri',
-                             'status', 'public_key'])
+                             'status', 'public_key', 'compression'])
 
 
 def _generate_id():
@@ -93,7 +103,9 @@ class _SendReceive:
                  zmq_identity=None, dispatcher=None, secured=False,
                  server_public_key=None, server_private_key=None,
                  heartbeat=False, heartbeat_interval=10,
-                 connection_timeout=60, monitor=False):
+                 connection_timeout=60, monitor=False,
+                 send_coalesce_interval=0, connection_owners=None,
+                 connection_id_prefix=b'', compressor=None):
         """
         Constructor for _SendReceive.
 
@@ -122,6 +134,19 @@ class _SendReceive:
                 messages on an otherwise quiet connection.
             connection_timeout (int): Number of seconds after which a
                 connection is considered timed out.
+            send_coalesce_interval (float): Number of seconds to wait,
+                once a message is queued to be sent, for more messages to
+                send along with it. Zero sends messages as soon as the
+                event loop can.
+            connection_owners (dict): A dictionary, shared by the
+                _SendReceive instances bound by an Interconnect, of the
+                connection ids of inbound connections to the _SendReceive
+                each connected to.
+            connection_id_prefix (bytes): Hashed with the zmq identities of
+                inbound connections to give their connection ids, keeping
+                them distinct from those of other sockets' connections.
+            compressor (PayloadCompressor): Decompresses the content of
+                received messages; if None, compressed content is refused.
         """
         self._connection = connection
         self._dispatcher = dispatcher
@@ -153,6 +178,13 @@ class _SendReceive:
         self._identities_to_connection_ids = {}
         self._monitor = monitor
 
+        self._connection_owners = connection_owners
+        self._connection_id_prefix = connection_id_prefix
+
+        if compressor is None:
+            compressor = PayloadCompressor(codecs=[])
+        self._compressor = compressor
+
         self._check_connections = None
         self._monitor_fd = None
         self._monitor_sock = None
@@ -161,6 +193,23 @@ class _SendReceive:
         self._received_message_counters = {}
         self._dispatcher_queue = None
 
+        # Messages are queued to be sent by any thread, and sent by the
+        # event loop in batches
+        self._send_queue = deque()
+        self._send_wakeup_lock = Lock()
+        self._send_wakeup_pending = False
+        self._send_wakeup = None
+        self._send_coalesce_interval = send_coalesce_interval
+
+        self._send_queue_depth_gauge = COLLECTOR.gauge(
+            'send_queue_depth', instance=self)
+        self._send_queue_timer = COLLECTOR.timer(
+            'send_queue_time', instance=self)
+        self._send_batch_size_counter = COLLECTOR.counter(
+            'send_batch_messages_count', instance=self)
+        self._send_batch_counter = COLLECTOR.counter(
+            'send_batch_count', instance=self)
+
     @property
     def connection(self):
         return self._connection
@@ -171,7 +220,8 @@ class _SendReceive:
     def _identity_to_connection_id(self, zmq_identity):
         if zmq_identity not in self._identities_to_connection_ids:
             self._identities_to_connection_ids[zmq_identity] = \
-                hashlib.sha512(zmq_identity).hexdigest()
+                hashlib.sha512(
+                    self._connection_id_prefix + zmq_identity).hexdigest()
 
         return self._identities_to_connection_ids[zmq_identity]
 
@@ -247,8 +297,12 @@ class _SendReceive:
                 fut = future.Future(
                     message.correlation_id,
                     message.content,
+                    connection_id=self._identity_to_connection_id(
+                        zmq_identity),
                 )
-                self._futures.put(fut)
+                # A ping which is not answered before the connection times
+                # out will never be
+                self._futures.put(fut, timeout=self._connection_timeout)
                 message_frame = [
                     bytes(zmq_identity),
                     message.SerializeToString()
@@ -272,11 +326,12 @@ class _SendReceive:
     def remove_connected_identity(self, zmq_identity):
         if zmq_identity in self._last_message_times:
             del self._last_message_times[zmq_identity]
-        if zmq_identity in self._identities_to_connection_ids:
-            del self._identities_to_connection_ids[zmq_identity]
         connection_id = self._identity_to_connection_id(zmq_identity)
+        del self._identities_to_connection_ids[zmq_identity]
         if connection_id in self._connections:
             del self._connections[connection_id]
+        if self._connection_owners is not None:
+            self._connection_owners.pop(connection_id, None)
 
     def _received_from_identity(self, zmq_identity):
         self._last_message_times[zmq_identity] = time.time()
@@ -287,21 +342,37 @@ class _SendReceive:
                                zmq_identity,
                                None,
                                None,
-                               None)
+                               None,
+                               '')
+            if self._connection_owners is not None:
+                self._connection_owners[connection_id] = self
+
+    @asyncio.coroutine
+    def _expire_futures(self):
+        while True:
+            try:
+                self._futures.expire()
+                yield from asyncio.sleep(DEFAULT_TICK)
+            except CancelledError:  # pylint: disable=try-except-raise
+                # The concurrent.futures.CancelledError is caught by asyncio
+                # when the Task associated with the coroutine is cancelled.
+                # The raise is required to stop this component.
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                LOGGER.exception("Expiring futures on address %s "
+                                 "caused an error: %s", self._address, e)
 
     @asyncio.coroutine
     def _dispatch_message(self):
         while True:
             try:
-                zmq_identity, msg_bytes = \
+                zmq_identity, msg_buffer = \
                     yield from self._dispatcher_queue.get()
                 self._get_queue_size_gauge(self.connection).set_value(
                     self._dispatcher_queue.qsize())
-                message = validator_pb2.Message()
-                message.ParseFromString(msg_bytes)
-
-                tag = get_enum_name(message.message_type)
-                self._get_received_message_counter(tag).inc()
+                # The content of the message is left in the received frame,
+                # and handed on as a view of it
+                message = decode_envelope(msg_buffer)
 
                 if zmq_identity is not None:
                     connection_id = \
@@ -310,6 +381,21 @@ class _SendReceive:
                     connection_id = \
                         self._identity_to_connection_id(
                             self._connection.encode())
+
+                if message.content_encoding:
+                    try:
+                        message.content = self._decompress(
+                            message, connection_id)
+                    except CompressionError as e:
+                        LOGGER.warning(
+                            "Dropping %s from %s: %s",
+                            get_enum_name(message.message_type),
+                            connection_id, e)
+                        continue
+
+                tag = get_enum_name(message.message_type)
+                self._get_received_message_counter(tag).inc()
+
                 try:
                     self._futures.set_result(
                         message.correlation_id,
@@ -335,6 +421,23 @@ class _SendReceive:
                 LOGGER.exception("Received a message on address %s that "
                                  "caused an error: %s", self._address, e)
 
+    def _decompress(self, message, connection_id):
+        """Decompresses the content of a message, which is only accepted
+        from a connection which agreed on the codec it is compressed with.
+
+        Raises:
+            CompressionError: if the content is refused
+        """
+        connection_info = self._connections.get(connection_id)
+        connection_codec = \
+            connection_info.compression if connection_info is not None \
+            else ''
+        return self._compressor.decompress(
+            message.message_type,
+            message.content,
+            message.content_encoding,
+            connection_codec)
+
     @asyncio.coroutine
     def _receive_message(self):
         """
@@ -342,22 +445,25 @@ class _SendReceive:
         """
         while True:
             try:
+                # Frames are received without copying them out of zmq
                 if self._socket.getsockopt(zmq.TYPE) == zmq.ROUTER:
-                    zmq_identity, msg_bytes = \
-                        yield from self._socket.recv_multipart()
-                    if msg_bytes == b'':
+                    identity_frame, msg_frame = \
+                        yield from self._socket.recv_multipart(copy=False)
+                    zmq_identity = identity_frame.bytes
+                    if not msg_frame.buffer:
                         # send ACK for connection probes
                         LOGGER.debug("ROUTER PROBE FROM %s", zmq_identity)
                         self._socket.send_multipart(
-                            [bytes(zmq_identity), msg_bytes])
+                            [zmq_identity, b''])
                     else:
                         self._received_from_identity(zmq_identity)
                         self._dispatcher_queue.put_nowait(
-                            (zmq_identity, msg_bytes))
+                            (zmq_identity, msg_frame.buffer))
                 else:
-                    msg_bytes = yield from self._socket.recv()
+                    msg_frame = yield from self._socket.recv(copy=False)
                     self._last_message_time = time.time()
-                    self._dispatcher_queue.put_nowait((None, msg_bytes))
+                    self._dispatcher_queue.put_nowait(
+                        (None, msg_frame.buffer))
                 self._get_queue_size_gauge(self.connection).set_value(
                     self._dispatcher_queue.qsize())
 
@@ -374,9 +480,84 @@ class _SendReceive:
     def _send_message_frame(self, message_frame):
         yield from self._socket.send_multipart(message_frame)
 
-    def send_message(self, msg, connection_id=None):
+    def _enqueue_send(self, message_bundle, on_sent=None):
+        """Queues a message to be sent by the event loop, waking it if it is
+        not already due to drain the send queue. Safe to call from any
+        thread.
+        """
+        self._send_queue.append(
+            (message_bundle, self._send_queue_timer.time(), on_sent))
+
+        with self._send_wakeup_lock:
+            if self._send_wakeup_pending:
+                return
+            self._send_wakeup_pending = True
+
+        try:
+            self._event_loop.call_soon_threadsafe(self._send_wakeup.set)
+        except RuntimeError:
+            # call_soon_threadsafe will throw a RuntimeError if
+            # the eventloop is closed. This occurs on shutdown.
+            pass
+
+    @asyncio.coroutine
+    def _drain_send_queue(self):
+        while True:
+            try:
+                yield from self._send_wakeup.wait()
+                self._send_wakeup.clear()
+                if self._send_coalesce_interval:
+                    yield from asyncio.sleep(self._send_coalesce_interval)
+
+                # Messages queued from here on need a new wakeup
+                with self._send_wakeup_lock:
+                    self._send_wakeup_pending = False
+
+                yield from self._send_queued()
+
+            except CancelledError:  # pylint: disable=try-except-raise
+                # The concurrent.futures.CancelledError is caught by asyncio
+                # when the Task associated with the coroutine is cancelled.
+                # The raise is required to stop this component.
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                LOGGER.exception("Sending a message on address %s "
+                                 "caused an error: %s", self._address, e)
+
+    @asyncio.coroutine
+    def _send_queued(self):
+        self._send_queue_depth_gauge.set_value(len(self._send_queue))
+        batch_size = 0
+        while self._send_queue:
+            message_bundle, timer_ctx, on_sent = self._send_queue.popleft()
+            timer_ctx.stop()
+            try:
+                yield from self._socket.send_multipart(message_bundle)
+            except CancelledError:  # pylint: disable=try-except-raise
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                LOGGER.exception("Sending a message on address %s "
+                                 "caused an error: %s", self._address, e)
+
+            # Called whether or not the send succeeded, as the message is no
+            # longer waiting to be sent
+            if on_sent is not None:
+                on_sent()
+
+            batch_size += 1
+            if batch_size % _MAX_SEND_BATCH == 0:
+                # Sends which complete immediately never yield to the
+                # event loop, so let its other tasks run between batches
+                yield from asyncio.sleep(0)
+
+        self._send_batch_size_counter.inc(batch_size)
+        self._send_batch_counter.inc()
+
+    def send_message(self, msg, connection_id=None, on_sent=None):
         """
         :param msg: protobuf validator_pb2.Message
+        :param on_sent: called, with no arguments, on the event loop once
+            the message has been written to the socket, or has failed to be
         """
         zmq_identity = None
         if connection_id is not None and self._connections is not None:
@@ -397,29 +578,9 @@ class _SendReceive:
             message_bundle = [bytes(zmq_identity),
                               msg.SerializeToString()]
 
-        try:
-            asyncio.run_coroutine_threadsafe(
-                self._send_message_frame(message_bundle),
-                self._event_loop)
-        except RuntimeError:
-            # run_coroutine_threadsafe will throw a RuntimeError if
-            # the eventloop is closed. This occurs on shutdown.
-            pass
-
-    @asyncio.coroutine
-    def _send_last_message(self, identity, msg):
-        LOGGER.debug("%s sending last message %s to %s",
-                     self._connection,
-                     get_enum_name(msg.message_type),
-                     identity if identity else self._address)
-
-        if identity is None:
-            message_bundle = [msg.SerializeToString()]
-        else:
-            message_bundle = [bytes(identity),
-                              msg.SerializeToString()]
+        self._enqueue_send(message_bundle, on_sent)
 
-        yield from self._socket.send_multipart(message_bundle)
+    def _last_message_sent(self, identity):
         if identity is None:
             if self._connection != "ServerThread":
                 self.shutdown()
@@ -449,14 +610,21 @@ class _SendReceive:
 
         self._ready.wait()
 
-        try:
-            asyncio.run_coroutine_threadsafe(
-                self._send_last_message(zmq_identity, msg),
-                self._event_loop)
-        except RuntimeError:
-            # run_coroutine_threadsafe will throw a RuntimeError if
-            # the eventloop is closed. This occurs on shutdown.
-            pass
+        LOGGER.debug("%s sending last message %s to %s",
+                     self._connection,
+                     get_enum_name(msg.message_type),
+                     zmq_identity if zmq_identity else self._address)
+
+        if zmq_identity is None:
+            message_bundle = [msg.SerializeToString()]
+        else:
+            message_bundle = [bytes(zmq_identity),
+                              msg.SerializeToString()]
+
+        # Sent through the send queue, after any messages queued before it
+        self._enqueue_send(
+            message_bundle,
+            on_sent=partial(self._last_message_sent, zmq_identity))
 
     def setup(self, socket_type, complete_or_error_queue):
         """Setup the asyncio event loop.
@@ -534,8 +702,15 @@ class _SendReceive:
             asyncio.ensure_future(self._dispatch_message(),
                                   loop=self._event_loop)
 
+            asyncio.ensure_future(self._expire_futures(),
+                                  loop=self._event_loop)
+
             self._dispatcher_queue = asyncio.Queue()
 
+            self._send_wakeup = asyncio.Event()
+            asyncio.ensure_future(self._drain_send_queue(),
+                                  loop=self._event_loop)
+
             if self._monitor:
                 self._monitor_fd = "inproc://monitor.s-{}".format(
                     _generate_id()[0:5])
@@ -652,10 +827,20 @@ class Interconnect:
                  max_future_callback_workers=10,
                  roles=None,
                  authorize=False,
-                 signer=None):
+                 signer=None,
+                 send_coalesce_interval=0,
+                 shard_endpoints=None,
+                 compression_codecs=None,
+                 compression_threshold=DEFAULT_THRESHOLD):
         """
         Constructor for Interconnect.
 
+        Inbound connections may be spread over several sockets, each bound
+        to its own endpoint and run by its own thread and event loop, so
+        that no one event loop has to receive, parse and send the messages
+        of every connection. Connections to any of the endpoints are known
+        by their connection ids, as connections to a single endpoint are.
+
         Args:
             secured (bool): Whether or not to start the 'server' socket
                 and associated Connection sockets in secure mode --
@@ -669,6 +854,18 @@ class Interconnect:
             max_future_callback_workers (int): max number of workers for future
                 callbacks, defaults to 10
             signer (:obj:`Signer`): cryptographic signer for the validator
+            send_coalesce_interval (float): Number of seconds a queued
+                message may wait for more messages to be sent with it, on
+                this and each outbound connection; defaults to 0
+            shard_endpoints (list of str): Further endpoints to accept
+                inbound connections on, each with its own socket and event
+                loop
+            compression_codecs (list of str): The codecs to offer peers for
+                compressing the content of gossip messages, most preferred
+                first; defaults to all those supported, and an empty list
+                turns compression off
+            compression_threshold (int): The smallest gossip message
+                content, in bytes, to compress
         """
         self._endpoint = endpoint
         self._public_endpoint = public_endpoint
@@ -702,6 +899,13 @@ class Interconnect:
 
         self._authorize = authorize
         self._signer = signer
+        self._send_coalesce_interval = send_coalesce_interval
+        self._compressor = PayloadCompressor(
+            codecs=compression_codecs, threshold=compression_threshold)
+
+        # connection_id -> the _SendReceive of the socket an inbound
+        # connection is connected to
+        self._connection_owners = {}
 
         self._send_receive_thread = _SendReceive(
             "ServerThread",
@@ -714,9 +918,34 @@ class Interconnect:
             server_private_key=server_private_key,
             heartbeat=heartbeat,
             connection_timeout=connection_timeout,
-            monitor=monitor)
-
-        self._thread = None
+            monitor=monitor,
+            send_coalesce_interval=send_coalesce_interval,
+            connection_owners=self._connection_owners,
+            compressor=self._compressor)
+
+        self._shards = [self._send_receive_thread]
+        for shard_endpoint in shard_endpoints or []:
+            name = "ServerThread-{}".format(len(self._shards))
+            self._shards.append(_SendReceive(
+                name,
+                connections=self._connections,
+                address=shard_endpoint,
+                dispatcher=dispatcher,
+                futures=self._futures,
+                secured=secured,
+                server_public_key=server_public_key,
+                server_private_key=server_private_key,
+                heartbeat=heartbeat,
+                connection_timeout=connection_timeout,
+                monitor=monitor,
+                send_coalesce_interval=send_coalesce_interval,
+                connection_owners=self._connection_owners,
+                compressor=self._compressor,
+                # ROUTER sockets name anonymous peers by counting them, so
+                # identities are only unique to a socket
+                connection_id_prefix=name.encode()))
+
+        self._threads = []
 
         self._send_response_timers = {}
 
@@ -728,6 +957,10 @@ class Interconnect:
     def endpoint(self):
         return self._endpoint
 
+    def _get_owner(self, connection_id):
+        return self._connection_owners.get(
+            connection_id, self._send_receive_thread)
+
     def _get_send_response_timer(self, tag):
         if tag not in self._send_response_timers:
             self._send_response_timers[tag] = COLLECTOR.timer(
@@ -793,7 +1026,8 @@ class Interconnect:
             ConnectionStatus.CONNECTED
 
     def set_check_connections(self, function):
-        self._send_receive_thread.set_check_connections(function)
+        for shard in self._shards:
+            shard.set_check_connections(function)
 
     def allow_inbound_connection(self):
         """Determines if an additional incoming network connection
@@ -826,14 +1060,18 @@ class Interconnect:
             server_private_key=self._server_private_key,
             future_callback_threadpool=self._future_callback_threadpool,
             heartbeat=True,
-            connection_timeout=self._connection_timeout)
+            connection_timeout=self._connection_timeout,
+            send_coalesce_interval=self._send_coalesce_interval,
+            compressor=self._compressor)
 
         self.outbound_connections[uri] = conn
         conn.start()
 
         self._add_connection(conn, uri)
 
-        connect_message = ConnectionRequest(endpoint=self._public_endpoint)
+        connect_message = ConnectionRequest(
+            endpoint=self._public_endpoint,
+            compression_codecs=self._compressor.codecs)
         conn.send(
             validator_pb2.Message.NETWORK_CONNECT,
             connect_message.SerializeToString(),
@@ -849,7 +1087,9 @@ class Interconnect:
         Send ConnectionRequest to an inbound connection. This allows
         the validator to be authorized by the incoming connection.
         """
-        connect_message = ConnectionRequest(endpoint=self._public_endpoint)
+        connect_message = ConnectionRequest(
+            endpoint=self._public_endpoint,
+            compression_codecs=self._compressor.codecs)
         self._safe_send(
             validator_pb2.Message.NETWORK_CONNECT,
             connect_message.SerializeToString(),
@@ -871,6 +1111,9 @@ class Interconnect:
 
             LOGGER.debug("Connection to %s was acknowledged",
                          connection.connection_id)
+            self._accept_compression(
+                connection.connection_id,
+                connection_response.compression_codec)
             if self._authorize:
                 # Send correct Authorization Request for network role
                 auth_type = {"trust": [], "challenge": []}
@@ -910,6 +1153,9 @@ class Interconnect:
                          "we sent. Removing connection: %s",
                          connection_id)
             self.remove_connection(connection_id)
+        else:
+            self._accept_compression(
+                connection_id, connection_response.compression_codec)
 
         # Send correct Authorization Request for network role
         auth_type = {"trust": [], "challenge": []}
@@ -1013,22 +1259,32 @@ class Interconnect:
         return futures
 
     def send(self, message_type, data, connection_id, callback=None,
-             one_way=False):
+             one_way=False, timeout=None, on_sent=None):
         """
         Send a message of message_type
         :param connection_id: the identity for the connection to send to
         :param message_type: validator_pb2.Message.* enum value
         :param data: bytes serialized protobuf
+        :param timeout: seconds after which, if no response has arrived,
+            the future is resolved with a timed out result; None waits
+            indefinitely
+        :param on_sent: called, with no arguments, on the event loop once
+            the message has been written to the socket, or has failed to
+            be; senders use it to limit how many of their messages are
+            waiting to be sent
         :return: future.Future
         """
         if connection_id not in self._connections:
             raise ValueError("Unknown connection id: {}".format(connection_id))
         connection_info = self._connections.get(connection_id)
+        data, content_encoding = self._compressor.compress(
+            message_type, data, connection_info.compression)
         if connection_info.connection_type == \
                 ConnectionType.ZMQ_IDENTITY:
             message = validator_pb2.Message(
                 correlation_id=_generate_id(),
-                content=data,
+                content=bytes(data),
+                content_encoding=content_encoding,
                 message_type=message_type)
 
             timer_tag = get_enum_name(message.message_type)
@@ -1037,35 +1293,42 @@ class Interconnect:
                 message.correlation_id,
                 message.content,
                 callback,
-                timer_ctx=timer_ctx)
+                timer_ctx=timer_ctx,
+                connection_id=connection_id)
             if not one_way:
-                self._futures.put(fut)
+                self._futures.put(fut, timeout=timeout)
 
-            self._send_receive_thread.send_message(msg=message,
-                                                   connection_id=connection_id)
+            self._get_owner(connection_id).send_message(
+                msg=message, connection_id=connection_id, on_sent=on_sent)
             return fut
 
         return connection_info.connection.send(
             message_type,
             data,
             callback=callback,
-            one_way=one_way)
+            one_way=one_way,
+            timeout=timeout,
+            content_encoding=content_encoding,
+            on_sent=on_sent)
 
     def start(self):
-        complete_or_error_queue = queue.Queue()
-        self._thread = InstrumentedThread(
-            target=self._send_receive_thread.setup,
-            args=(zmq.ROUTER, complete_or_error_queue))
-        self._thread.name = self.__class__.__name__ + self._thread.name
-        self._thread.start()
-        # Blocking in startup until the background thread has made it to
-        # running the event loop or error.
-        err = complete_or_error_queue.get(block=True)
-        if err != _STARTUP_COMPLETE_SENTINEL:
-            raise err
+        for shard in self._shards:
+            complete_or_error_queue = queue.Queue()
+            thread = InstrumentedThread(
+                target=shard.setup,
+                args=(zmq.ROUTER, complete_or_error_queue))
+            thread.name = self.__class__.__name__ + thread.name
+            thread.start()
+            self._threads.append(thread)
+            # Blocking in startup until the background thread has made it to
+            # running the event loop or error.
+            err = complete_or_error_queue.get(block=True)
+            if err != _STARTUP_COMPLETE_SENTINEL:
+                raise err
 
     def stop(self):
-        self._send_receive_thread.shutdown()
+        for shard in self._shards:
+            shard.shutdown()
         for conn in self.outbound_connections.values():
             conn.stop()
         self._future_callback_threadpool.shutdown(wait=True)
@@ -1104,7 +1367,8 @@ class Interconnect:
                                connection_info.connection,
                                endpoint,
                                connection_info.status,
-                               connection_info.public_key)
+                               connection_info.public_key,
+                               connection_info.compression)
 
         else:
             LOGGER.debug("Could not update the endpoint %s for "
@@ -1129,7 +1393,8 @@ class Interconnect:
                                connection_info.connection,
                                connection_info.uri,
                                connection_info.status,
-                               public_key)
+                               public_key,
+                               connection_info.compression)
         else:
             LOGGER.debug("Could not update the public key %s for "
                          "connection_id %s. The connection does not "
@@ -1155,7 +1420,8 @@ class Interconnect:
                                connection_info.connection,
                                connection_info.uri,
                                status,
-                               connection_info.public_key)
+                               connection_info.public_key,
+                               connection_info.compression)
         else:
             LOGGER.debug("Could not update the status to %s for "
                          "connection_id %s. The connection does not "
@@ -1163,6 +1429,48 @@ class Interconnect:
                          status,
                          connection_id)
 
+    def update_connection_compression(self, connection_id, codec):
+        """Sets the codec the content of gossip messages sent to a
+        connection is compressed with.
+
+        Args:
+            connection_id (str): The identifier for the connection.
+            codec (str): The codec agreed with the connection, or the empty
+                string to send content uncompressed.
+        """
+        if connection_id in self._connections:
+            connection_info = self._connections[connection_id]
+            self._connections[connection_id] = \
+                connection_info._replace(compression=codec)
+        else:
+            LOGGER.debug("Could not update the compression to %s for "
+                         "connection_id %s. The connection does not "
+                         "exist.",
+                         codec,
+                         connection_id)
+
+    def negotiate_compression(self, connection_id, offered_codecs):
+        """Chooses the codec to compress the content of gossip messages
+        with, from those a connection offered in its ConnectionRequest, and
+        uses it for messages sent to the connection.
+
+        Args:
+            connection_id (str): The identifier for the connection.
+            offered_codecs (list of str): The codecs the connection offered.
+
+        Returns:
+            str: The codec chosen, or the empty string if none of those
+                offered is accepted.
+        """
+        codec = self._compressor.choose_codec(offered_codecs)
+        self.update_connection_compression(connection_id, codec)
+        return codec
+
+    def _accept_compression(self, connection_id, codec):
+        # The codec chosen by the other end must be one offered to it
+        self.update_connection_compression(
+            connection_id, self._compressor.choose_codec([codec]))
+
     def _add_connection(self, connection, uri=None):
         with self._connections_lock:
             connection_id = connection.connection_id
@@ -1172,7 +1480,8 @@ class Interconnect:
                                    connection,
                                    uri,
                                    None,
-                                   None)
+                                   None,
+                                   '')
 
     def remove_connection(self, connection_id):
         with self._connections_lock:
@@ -1187,7 +1496,7 @@ class Interconnect:
 
                 elif connection_info.connection_type == \
                         ConnectionType.ZMQ_IDENTITY:
-                    self._send_receive_thread.remove_connected_identity(
+                    self._get_owner(connection_id).remove_connected_identity(
                         connection_info.connection)
 
     def send_last_message(self, message_type, data,
@@ -1206,7 +1515,7 @@ class Interconnect:
                 ConnectionType.ZMQ_IDENTITY:
             message = validator_pb2.Message(
                 correlation_id=_generate_id(),
-                content=data,
+                content=bytes(data),
                 message_type=message_type)
 
             fut = future.Future(message.correlation_id, message.content,
@@ -1215,7 +1524,7 @@ class Interconnect:
             if not one_way:
                 self._futures.put(fut)
 
-            self._send_receive_thread.send_last_message(
+            self._get_owner(connection_id).send_last_message(
                 msg=message,
                 connection_id=connection_id)
             return fut
@@ -1261,7 +1570,9 @@ class OutboundConnection:
                  server_private_key,
                  future_callback_threadpool,
                  heartbeat=True,
-                 connection_timeout=60):
+                 connection_timeout=60,
+                 send_coalesce_interval=0,
+                 compressor=None):
         self._futures = future.FutureCollection(
             resolving_threadpool=future_callback_threadpool)
         self._zmq_identity = zmq_identity
@@ -1285,7 +1596,9 @@ class OutboundConnection:
             server_public_key=server_public_key,
             server_private_key=server_private_key,
             heartbeat=heartbeat,
-            connection_timeout=connection_timeout)
+            connection_timeout=connection_timeout,
+            send_coalesce_interval=send_coalesce_interval,
+            compressor=compressor)
 
         self._thread = None
 
@@ -1297,7 +1610,8 @@ class OutboundConnection:
 
         return self._connection_id
 
-    def send(self, message_type, data, callback=None, one_way=False):
+    def send(self, message_type, data, callback=None, one_way=False,
+             timeout=None, content_encoding='', on_sent=None):
         """Sends a message of message_type
 
         Args:
@@ -1305,21 +1619,29 @@ class OutboundConnection:
             data (bytes): serialized protobuf
             callback (function): a callback function to call when a
                 response to this message is received
+            timeout (float): seconds after which, if no response has
+                arrived, the future is resolved with a timed out result;
+                None waits indefinitely
+            content_encoding (str): the codec data is compressed with, or
+                the empty string if it is not compressed
+            on_sent (function): called, with no arguments, once the message
+                has been written to the socket, or has failed to be
 
         Returns:
             future.Future
         """
         message = validator_pb2.Message(
             correlation_id=_generate_id(),
-            content=data,
+            content=bytes(data),
+            content_encoding=content_encoding,
             message_type=message_type)
 
         fut = future.Future(message.correlation_id, message.content,
-                            callback)
+                            callback, connection_id=self.connection_id)
         if not one_way:
-            self._futures.put(fut)
+            self._futures.put(fut, timeout=timeout)
 
-        self._send_receive_thread.send_message(message)
+        self._send_receive_thread.send_message(message, on_sent=on_sent)
         return fut
 
     def send_last_message(self, message_type, data, callback=None,
@@ -1337,7 +1659,7 @@ class OutboundConnection:
         """
         message = validator_pb2.Message(
             correlation_id=_generate_id(),
-            content=data,
+            content=bytes(data),
             message_type=message_type)
 
         fut = future.Future(message.correlation_id, message.content,
@@ -0,0 +1,157 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import math
+import time
+
+
+DEFAULT_TICK = 0.1
+DEFAULT_SLOT_BITS = 6
+DEFAULT_LEVELS = 4
+
+
+class TimerWheel:
+    """Tracks deadlines for keys in a hierarchical timer wheel, so that
+    adding and cancelling a deadline, and expiring each deadline, take
+    constant time however many deadlines are pending.
+
+    Time is counted in ticks. Each level of the wheel is a ring of slots,
+    and a slot at level n spans the ticks of a full turn of level n - 1.
+    A deadline is kept in the slot of the lowest level whose turn reaches
+    it, and as the wheel turns, the deadlines in the slot of a higher level
+    which comes due are moved down into the level below, until they expire
+    from the lowest level. Deadlines are expired to within a tick; those
+    further off than the top level reaches are kept in its last slot, and
+    moved down again until they come due.
+
+    The wheel is not thread-safe.
+
+    Args:
+        tick (float): the length of a tick, in seconds
+        slot_bits (int): the log2 of the number of slots in each level
+        levels (int): the number of levels
+        clock (function): returns the current time, in seconds
+    """
+
+    def __init__(self, tick=DEFAULT_TICK, slot_bits=DEFAULT_SLOT_BITS,
+                 levels=DEFAULT_LEVELS, clock=time.monotonic):
+        self._tick = tick
+        self._slot_bits = slot_bits
+        self._slot_mask = (1 << slot_bits) - 1
+        self._clock = clock
+
+        # level -> slot -> {key: expiry tick}
+        self._wheels = [
+            [{} for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        # key -> (level, slot)
+        self._locations = {}
+
+        self._start = clock()
+        self._current_tick = 0
+
+    def __len__(self):
+        return len(self._locations)
+
+    def __contains__(self, key):
+        return key in self._locations
+
+    def add(self, key, timeout):
+        """Sets the deadline of a key to the given number of seconds from
+        now, replacing any deadline it already has.
+        """
+        self.cancel(key)
+        expiry_tick = max(
+            self._current_tick + 1,
+            math.ceil((self._clock() + timeout - self._start) / self._tick))
+        self._place(key, expiry_tick)
+
+    def cancel(self, key):
+        """Removes the deadline of a key, if it has one.
+
+        Returns:
+            bool: whether the key had a deadline
+        """
+        location = self._locations.pop(key, None)
+        if location is None:
+            return False
+
+        level, slot = location
+        del self._wheels[level][slot][key]
+        return True
+
+    def expire(self):
+        """Turns the wheel up to the current time.
+
+        Returns:
+            list: the keys whose deadlines have passed, which no longer have
+                deadlines
+        """
+        now_tick = math.floor((self._clock() - self._start) / self._tick)
+
+        expired = []
+        while self._current_tick < now_tick:
+            self._current_tick += 1
+            self._cascade()
+
+            slot = self._wheels[0][self._current_tick & self._slot_mask]
+            if slot:
+                for key in slot:
+                    del self._locations[key]
+                expired.extend(slot)
+                slot.clear()
+
+            if not self._locations:
+                # Nothing is left to expire, so skip the remaining ticks
+                self._current_tick = now_tick
+
+        return expired
+
+    def _cascade(self):
+        """Moves the deadlines of the higher level slots which come due at
+        the current tick down into the levels below.
+        """
+        for level in range(1, len(self._wheels)):
+            shift = self._slot_bits * level
+            if self._current_tick & ((1 << shift) - 1):
+                # Level turns only when every level below it has
+                return
+
+            slot = self._wheels[level][
+                (self._current_tick >> shift) & self._slot_mask]
+            if slot:
+                due = list(slot.items())
+                slot.clear()
+                for key, expiry_tick in due:
+                    self._place(key, expiry_tick)
+
+    def _place(self, key, expiry_tick):
+        delta = expiry_tick - self._current_tick
+        for level in range(len(self._wheels)):
+            if delta < (1 << (self._slot_bits * (level + 1))) or \
+                    level == len(self._wheels) - 1:
+                break
+
+        top_span = 1 << (self._slot_bits * (level + 1))
+        if delta >= top_span:
+            # Beyond the reach of the wheel: wait in the furthest slot of
+            # the top level, and be placed again from there
+            slot_tick = self._current_tick + top_span - 1
+        else:
+            slot_tick = expiry_tick
+        slot = (slot_tick >> (self._slot_bits * level)) & self._slot_mask
+
+        self._wheels[level][slot][key] = expiry_tick
+        self._locations[key] = (level, slot)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sawtooth_validator/protobuf/client_block.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from sawtooth_validator.protobuf import block_pb2 as sawtooth__validator_dot_protobuf_dot_block__pb2
+from sawtooth_validator.protobuf import client_list_control_pb2 as sawtooth__validator_dot_protobuf_dot_client__list__control__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.sawtooth_validator/protobuf/client_block.proto\x1a\'sawtooth_validator/protobuf/block.proto\x1a\x35sawtooth_validator/protobuf/client_list_control.proto\"\x89\x01\n\x16\x43lientBlockListRequest\x12\x0f\n\x07head_id\x18\x01 \x01(\t\x12\x11\n\tblock_ids\x18\x02 \x03(\t\x12%\n\x06paging\x18\x03 \x01(\x0b\x32\x15.ClientPagingControls\x12$\n\x07sorting\x18\x04 \x03(\x0b\x32\x13.ClientSortControls\"\xb6\x02\n\x17\x43lientBlockListResponse\x12/\n\x06status\x18\x01 \x01(\x0e\x32\x1f.ClientBlockListResponse.Status\x12\x16\n\x06\x62locks\x18\x02 \x03(\x0b\x32\x06.Block\x12\x0f\n\x07head_id\x18\x03 \x01(\t\x12%\n\x06paging\x18\x04 \x01(\x0b\x32\x15.ClientPagingResponse\"\x99\x01\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x12\n\x0eINTERNAL_ERROR\x10\x02\x12\r\n\tNOT_READY\x10\x03\x12\x0b\n\x07NO_ROOT\x10\x04\x12\x0f\n\x0bNO_RESOURCE\x10\x05\x12\x12\n\x0eINVALID_PAGING\x10\x06\x12\x10\n\x0cINVALID_SORT\x10\x07\x12\x0e\n\nINVALID_ID\x10\x08\"-\n\x19\x43lientBlockGetByIdRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\t\"/\n\x1a\x43lientBlockGetByNumRequest\x12\x11\n\tblock_num\x18\x01 \x01(\x04\">\n$ClientBlockGetByTransactionIdRequest\x12\x16\n\x0etransaction_id\x18\x01 \x01(\t\"2\n\x1e\x43lientBlockGetByBatchIdRequest\x12\x10\n\x08\x62\x61tch_id\x18\x01 \x01(\t\"\xb8\x01\n\x16\x43lientBlockGetResponse\x12.\n\x06status\x18\x01 \x01(\x0e\x32\x1e.ClientBlockGetResponse.Status\x12\x15\n\x05\x62lock\x18\x02 \x01(\x0b\x32\x06.Block\"W\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x12\n\x0eINTERNAL_ERROR\x10\x02\x12\x0f\n\x0bNO_RESOURCE\x10\x05\x12\x0e\n\nINVALID_ID\x10\x08\x42+\n\x15sawtooth.sdk.protobufP\x01Z\x10\x63lient_block_pb2b\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_validator.protobuf.client_block_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n\025sawtooth.sdk.protobufP\001Z\020client_block_pb2'
+  _CLIENTBLOCKLISTREQUEST._serialized_start=147
+  _CLIENTBLOCKLISTREQUEST._serialized_end=284
+  _CLIENTBLOCKLISTRESPONSE._serialized_start=287
+  _CLIENTBLOCKLISTRESPONSE._serialized_end=597
+  _CLIENTBLOCKLISTRESPONSE_STATUS._serialized_start=444
+  _CLIENTBLOCKLISTRESPONSE_STATUS._serialized_end=597
+  _CLIENTBLOCKGETBYIDREQUEST._serialized_start=599
+  _CLIENTBLOCKGETBYIDREQUEST._serialized_end=644
+  _CLIENTBLOCKGETBYNUMREQUEST._serialized_start=646
+  _CLIENTBLOCKGETBYNUMREQUEST._serialized_end=693
+  _CLIENTBLOCKGETBYTRANSACTIONIDREQUEST._serialized_start=695
+  _CLIENTBLOCKGETBYTRANSACTIONIDREQUEST._serialized_end=757
+  _CLIENTBLOCKGETBYBATCHIDREQUEST._serialized_start=759
+  _CLIENTBLOCKGETBYBATCHIDREQUEST._serialized_end=809
+  _CLIENTBLOCKGETRESPONSE._serialized_start=812
+  _CLIENTBLOCKGETRESPONSE._serialized_end=996
+  _CLIENTBLOCKGETRESPONSE_STATUS._serialized_start=909
+  _CLIENTBLOCKGETRESPONSE_STATUS._serialized_end=996
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sawtooth_validator/protobuf/client_event.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from sawtooth_validator.protobuf import events_pb2 as sawtooth__validator_dot_protobuf_dot_events__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.sawtooth_validator/protobuf/client_event.proto\x1a(sawtooth_validator/protobuf/events.proto\"g\n\x1c\x43lientEventsSubscribeRequest\x12)\n\rsubscriptions\x18\x01 \x03(\x0b\x32\x12.EventSubscription\x12\x1c\n\x14last_known_block_ids\x18\x02 \x03(\t\"\xbb\x01\n\x1d\x43lientEventsSubscribeResponse\x12\x35\n\x06status\x18\x01 \x01(\x0e\x32%.ClientEventsSubscribeResponse.Status\x12\x18\n\x10response_message\x18\x02 \x01(\t\"I\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x12\n\x0eINVALID_FILTER\x10\x02\x12\x11\n\rUNKNOWN_BLOCK\x10\x03\" \n\x1e\x43lientEventsUnsubscribeRequest\"\x92\x01\n\x1f\x43lientEventsUnsubscribeResponse\x12\x37\n\x06status\x18\x01 \x01(\x0e\x32\'.ClientEventsUnsubscribeResponse.Status\"6\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x12\n\x0eINTERNAL_ERROR\x10\x02\"V\n\x16\x43lientEventsGetRequest\x12)\n\rsubscriptions\x18\x01 \x03(\x0b\x32\x12.EventSubscription\x12\x11\n\tblock_ids\x18\x02 \x03(\t\"\xc1\x01\n\x17\x43lientEventsGetResponse\x12/\n\x06status\x18\x01 \x01(\x0e\x32\x1f.ClientEventsGetResponse.Status\x12\x16\n\x06\x65vents\x18\x02 \x03(\x0b\x32\x06.Event\"]\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x12\n\x0eINTERNAL_ERROR\x10\x02\x12\x12\n\x0eINVALID_FILTER\x10\x03\x12\x11\n\rUNKNOWN_BLOCK\x10\x04\x42+\n\x15sawtooth.sdk.protobufP\x01Z\x10\x63lient_event_pb2b\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_validator.protobuf.client_event_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n\025sawtooth.sdk.protobufP\001Z\020client_event_pb2'
+  _CLIENTEVENTSSUBSCRIBEREQUEST._serialized_start=92
+  _CLIENTEVENTSSUBSCRIBEREQUEST._serialized_end=195
+  _CLIENTEVENTSSUBSCRIBERESPONSE._serialized_start=198
+  _CLIENTEVENTSSUBSCRIBERESPONSE._serialized_end=385
+  _CLIENTEVENTSSUBSCRIBERESPONSE_STATUS._serialized_start=312
+  _CLIENTEVENTSSUBSCRIBERESPONSE_STATUS._serialized_end=385
+  _CLIENTEVENTSUNSUBSCRIBEREQUEST._serialized_start=387
+  _CLIENTEVENTSUNSUBSCRIBEREQUEST._serialized_end=419
+  _CLIENTEVENTSUNSUBSCRIBERESPONSE._serialized_start=422
+  _CLIENTEVENTSUNSUBSCRIBERESPONSE._serialized_end=568
+  _CLIENTEVENTSUNSUBSCRIBERESPONSE_STATUS._serialized_start=514
+  _CLIENTEVENTSUNSUBSCRIBERESPONSE_STATUS._serialized_end=568
+  _CLIENTEVENTSGETREQUEST._serialized_start=570
+  _CLIENTEVENTSGETREQUEST._serialized_end=656
+  _CLIENTEVENTSGETRESPONSE._serialized_start=659
+  _CLIENTEVENTSGETRESPONSE._serialized_end=852
+  _CLIENTEVENTSGETRESPONSE_STATUS._serialized_start=759
+  _CLIENTEVENTSGETRESPONSE_STATUS._serialized_end=852
+# @@protoc_insertion_point(module_scope)
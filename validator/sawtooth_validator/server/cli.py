@@ -205,6 +205,12 @@ def main(args):
     if bind_consensus and "tcp://" not in bind_consensus:
         bind_consensus = "tcp://" + bind_consensus
 
+    component_shard_endpoints = [
+        shard_endpoint if "tcp://" in shard_endpoint
+        else "tcp://" + shard_endpoint
+        for shard_endpoint in validator_config.component_shard_endpoints or []
+    ]
+
     if validator_config.network_public_key is None or \
             validator_config.network_private_key is None:
         LOGGER.warning("Network key pair is not configured, Network "
@@ -275,7 +281,15 @@ def main(args):
         validator_config.fork_cache_keep_time,
         validator_config.network_public_key,
         validator_config.network_private_key,
-        roles=validator_config.roles)
+        roles=validator_config.roles,
+        receipt_compression=validator_config.receipt_compression,
+        event_log=validator_config.event_log,
+        event_log_attributes=validator_config.event_log_attributes,
+        component_shard_endpoints=component_shard_endpoints,
+        receipt_commit_window=validator_config.receipt_commit_window,
+        event_send_queue_size=validator_config.event_send_queue_size,
+        event_slow_consumer_policy=validator_config.event_slow_consumer_policy,
+        dispatcher_role_weights=validator_config.dispatcher_role_weights)
 
     # pylint: disable=broad-except
     try:
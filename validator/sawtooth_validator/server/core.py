@@ -53,14 +53,20 @@ from sawtooth_validator.state.settings_cache import SettingsCache
 from sawtooth_validator.state.identity_view import IdentityViewFactory
 from sawtooth_validator.state.state_view import StateViewFactory
 from sawtooth_validator.state.state_view import NativeStateViewFactory
+from sawtooth_validator.state.state_read_cache import StateReadCache
 from sawtooth_validator.gossip.permission_verifier import PermissionVerifier
 from sawtooth_validator.gossip.permission_verifier import IdentityCache
 from sawtooth_validator.gossip.identity_observer import IdentityObserver
 from sawtooth_validator.networking.interconnect import Interconnect
 from sawtooth_validator.gossip.gossip import Gossip
 
+from sawtooth_validator.config.validator import DEFAULT_SEND_QUEUE_SIZE
+from sawtooth_validator.config.validator import SLOW_CONSUMER_DROP
 from sawtooth_validator.server.events.broadcaster import EventBroadcaster
+from sawtooth_validator.server.events.event_log import EventLog
 
+from sawtooth_validator.journal.receipt_codec import create_receipt_codec
+from sawtooth_validator.journal.receipt_codec import DICTIONARY_KEY
 from sawtooth_validator.journal.receipt_store import TransactionReceiptStore
 
 from sawtooth_validator.server import network_handlers
@@ -90,7 +96,15 @@ class Validator:
                  fork_cache_keep_time,
                  network_public_key=None,
                  network_private_key=None,
-                 roles=None):
+                 roles=None,
+                 receipt_compression=None,
+                 event_log=False,
+                 event_log_attributes=None,
+                 component_shard_endpoints=None,
+                 receipt_commit_window=None,
+                 event_send_queue_size=DEFAULT_SEND_QUEUE_SIZE,
+                 event_slow_consumer_policy=SLOW_CONSUMER_DROP,
+                 dispatcher_role_weights=None):
         """Constructs a validator instance.
 
         Args:
@@ -115,6 +129,23 @@ class Validator:
             config_dir (str): path to the config directory
             identity_signer (str): cryptographic signer the validator uses for
                 signing
+            receipt_compression (str): the compression applied to newly
+                stored transaction receipts, if any
+            event_log (bool): whether to keep a log of the events of each
+                block, to answer event requests from
+            event_log_attributes (list of str): the event attribute keys
+                the event log is indexed by
+            component_shard_endpoints (list of str): further component
+                endpoints, each served by its own socket and event loop
+            receipt_commit_window (float): if set, the longest time, in
+                seconds, a receipt write may go unsynced; see GroupCommit
+            event_send_queue_size (int): the number of event lists which
+                may wait to be sent to a single event subscriber
+            event_slow_consumer_policy (str): what to do with an event
+                subscriber whose send queue is full; see EventBroadcaster
+            dispatcher_role_weights (dict of str: int): the number of
+                messages the dispatchers take from a connection in its
+                turn, by the connection's role; see Dispatcher
         """
         # -- Setup Global State Database and Factory -- #
         global_state_db_filename = os.path.join(
@@ -124,15 +155,30 @@ class Validator:
         global_state_db = NativeLmdbDatabase(
             global_state_db_filename,
             indexes=MerkleDatabase.create_index_configuration())
-        state_view_factory = StateViewFactory(global_state_db)
+        state_read_cache = StateReadCache()
+        state_view_factory = StateViewFactory(
+            global_state_db, state_read_cache=state_read_cache)
         native_state_view_factory = NativeStateViewFactory(global_state_db)
 
         # -- Setup Receipt Store -- #
         receipt_db_filename = os.path.join(
             data_dir, 'txn_receipts-{}.lmdb'.format(bind_network[-2:]))
         LOGGER.debug('txn receipt store file is %s', receipt_db_filename)
-        receipt_db = LMDBNoLockDatabase(receipt_db_filename, 'c')
-        receipt_store = TransactionReceiptStore(receipt_db)
+        receipt_db = LMDBNoLockDatabase(
+            receipt_db_filename, 'c', commit_window=receipt_commit_window)
+        receipt_codec = create_receipt_codec(
+            receipt_compression, receipt_db.get(DICTIONARY_KEY))
+        receipt_store = TransactionReceiptStore(
+            receipt_db, codec=receipt_codec)
+
+        # -- Setup Event Log -- #
+        event_log_store = None
+        if event_log:
+            event_log_filename = os.path.join(
+                data_dir, 'events-{}.lmdb'.format(bind_network[-2:]))
+            LOGGER.debug('event log file is %s', event_log_filename)
+            event_log_store = EventLog(
+                event_log_filename, indexed_attributes=event_log_attributes)
 
         # -- Setup Block Store -- #
         block_db_filename = os.path.join(
@@ -166,8 +212,9 @@ class Validator:
             name='Signature')
 
         # -- Setup Dispatchers -- #
-        component_dispatcher = Dispatcher()
-        network_dispatcher = Dispatcher()
+        component_dispatcher = Dispatcher(
+            role_weights=dispatcher_role_weights)
+        network_dispatcher = Dispatcher(role_weights=dispatcher_role_weights)
 
         # -- Setup Services -- #
         component_service = Interconnect(
@@ -177,7 +224,10 @@ class Validator:
             heartbeat=False,
             max_incoming_connections=20,
             monitor=True,
-            max_future_callback_workers=10)
+            max_future_callback_workers=10,
+            shard_endpoints=component_shard_endpoints,
+            # Only peers negotiate compression
+            compression_codecs=[])
 
         zmq_identity = hashlib.sha512(
             time.time().hex().encode()).hexdigest()[:23]
@@ -203,7 +253,8 @@ class Validator:
             roles=roles)
 
         # -- Setup Transaction Execution Platform -- #
-        context_manager = ContextManager(global_state_db)
+        context_manager = ContextManager(
+            global_state_db, state_read_cache=state_read_cache)
 
         batch_tracker = BatchTracker(block_store.has_batch)
 
@@ -222,20 +273,25 @@ class Validator:
             transaction_executor.check_connections)
 
         event_broadcaster = EventBroadcaster(
-            component_service, block_store, receipt_store)
+            component_service, block_store, receipt_store,
+            send_queue_size=event_send_queue_size,
+            slow_consumer_policy=event_slow_consumer_policy,
+            event_log=event_log_store)
 
         # -- Consensus Engine -- #
         consensus_thread_pool = InstrumentedThreadPoolExecutor(
             max_workers=3,
             name='Consensus')
-        consensus_dispatcher = Dispatcher()
+        consensus_dispatcher = Dispatcher(
+            role_weights=dispatcher_role_weights)
         consensus_service = Interconnect(
             bind_consensus,
             consensus_dispatcher,
             secured=False,
             heartbeat=False,
             max_incoming_connections=20,
-            max_future_callback_workers=10)
+            max_future_callback_workers=10,
+            compression_codecs=[])
 
         consensus_registry = ConsensusRegistry()
 
@@ -280,8 +336,7 @@ class Validator:
         batch_sender = BroadcastBatchSender(completer, gossip)
         chain_id_manager = ChainIdManager(data_dir)
 
-        identity_view_factory = IdentityViewFactory(
-            StateViewFactory(global_state_db))
+        identity_view_factory = IdentityViewFactory(state_view_factory)
 
         id_cache = IdentityCache(identity_view_factory)
 
@@ -327,6 +382,16 @@ class Validator:
             block_status_store=block_status_store,
             permission_verifier=permission_verifier)
 
+        chain_observers = [
+            event_broadcaster,
+            receipt_store,
+            batch_tracker,
+            identity_observer,
+            settings_observer
+        ]
+        if event_log_store is not None:
+            chain_observers.append(event_log_store)
+
         chain_controller = ChainController(
             block_store=block_store,
             block_manager=block_manager,
@@ -339,13 +404,7 @@ class Validator:
             state_pruning_block_depth=state_pruning_block_depth,
             fork_cache_keep_time=fork_cache_keep_time,
             data_dir=data_dir,
-            observers=[
-                event_broadcaster,
-                receipt_store,
-                batch_tracker,
-                identity_observer,
-                settings_observer
-            ])
+            observers=chain_observers)
 
         genesis_controller = GenesisController(
             context_manager=context_manager,
@@ -410,6 +469,8 @@ class Validator:
             consensus_notifier)
 
         self._block_status_store = block_status_store
+        self._receipt_db = receipt_db
+        self._event_log_store = event_log_store
 
         self._consensus_notifier = consensus_notifier
         self._consensus_dispatcher = consensus_dispatcher
@@ -420,6 +481,8 @@ class Validator:
         self._client_thread_pool = client_thread_pool
         self._sig_pool = sig_pool
 
+        self._event_broadcaster = event_broadcaster
+
         self._context_manager = context_manager
         self._transaction_executor = transaction_executor
         self._genesis_controller = genesis_controller
@@ -431,6 +494,7 @@ class Validator:
         self._block_validator = block_validator
 
     def start(self):
+        self._event_broadcaster.start()
         self._component_dispatcher.start()
         self._component_service.start()
         if self._genesis_controller.requires_genesis():
@@ -466,6 +530,7 @@ class Validator:
         self._network_service.stop()
 
         self._component_service.stop()
+        self._event_broadcaster.stop()
 
         self._consensus_service.stop()
         self._consensus_dispatcher.stop()
@@ -482,6 +547,11 @@ class Validator:
         self._chain_controller.stop()
         self._block_validator.stop()
 
+        # Syncs any receipts waiting on the commit window
+        self._receipt_db.close()
+        if self._event_log_store is not None:
+            self._event_log_store.close()
+
         threads = threading.enumerate()
 
         # This will remove the MainThread, which will exit when we exit with
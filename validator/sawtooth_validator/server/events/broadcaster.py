@@ -13,9 +13,17 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+from collections import deque
+from collections import OrderedDict
+from functools import partial
+from itertools import islice
 import logging
 from threading import Condition
 
+from sawtooth_validator.config.validator import DEFAULT_SEND_QUEUE_SIZE
+from sawtooth_validator.config.validator import SLOW_CONSUMER_DROP
+from sawtooth_validator.config.validator import SLOW_CONSUMER_POLICIES
+from sawtooth_validator.exceptions import PossibleForkDetectedError
 from sawtooth_validator.protobuf.events_pb2 import EventList
 from sawtooth_validator.protobuf import validator_pb2
 
@@ -25,8 +33,16 @@ from sawtooth_validator.journal.event_extractors \
 from sawtooth_validator.journal.event_extractors \
     import ReceiptEventExtractor
 from sawtooth_validator.journal.block_wrapper import NULL_BLOCK_IDENTIFIER
+from sawtooth_validator.server.events.event_log import UNLOGGED_EVENT_TYPES
+from sawtooth_validator.server.events.subscription import SubscriptionIndex
+from sawtooth_validator.concurrent.thread import InstrumentedThread
+from sawtooth_validator import metrics
 
 LOGGER = logging.getLogger(__name__)
+COLLECTOR = metrics.get_collector(__name__)
+
+# The most blocks read at a time when catching up a subscriber
+CATCHUP_CHUNK_SIZE = 16
 
 
 class NoKnownBlockError(Exception):
@@ -34,12 +50,78 @@ class NoKnownBlockError(Exception):
 
 
 class EventBroadcaster(ChainObserver):
-    def __init__(self, service, block_store, receipt_store):
+    """Sends the events of each committed block to the subscribers whose
+    subscriptions they match.
+
+    Event lists are queued per subscriber and sent by a separate thread, so
+    a slow subscriber does not hold up block commit, and subscribers are
+    caught up with the events of past blocks by another; see start().
+
+    Args:
+        service (:obj:`Interconnect`): the service subscribers are connected
+            through
+        block_store (:obj:`BlockStore`): the block store
+        receipt_store (:obj:`TransactionReceiptStore`): the receipt store
+        send_queue_size (int): the number of event lists which may be
+            waiting to be sent to a single subscriber, counting those handed
+            to the service which it has not yet written to the subscriber's
+            connection
+        slow_consumer_policy (str): what to do when a subscriber's send queue
+            is full; SLOW_CONSUMER_DROP drops the new event list, and
+            SLOW_CONSUMER_DISCONNECT removes the subscriber and closes its
+            connection
+        event_log (:obj:`EventLog`): an optional log of the events of past
+            blocks; the events of blocks it holds are read from it, rather
+            than extracted from the blocks and their receipts
+    """
+
+    def __init__(self, service, block_store, receipt_store,
+                 send_queue_size=DEFAULT_SEND_QUEUE_SIZE,
+                 slow_consumer_policy=SLOW_CONSUMER_DROP,
+                 event_log=None):
         self._subscribers = {}
+        self._subscription_index = SubscriptionIndex()
         self._subscribers_cv = Condition()
         self._service = service
         self._block_store = block_store
         self._receipt_store = receipt_store
+        self._event_log = event_log
+
+        if slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(
+                'Unknown slow consumer policy: {}'.format(
+                    slow_consumer_policy))
+        self._slow_consumer_policy = slow_consumer_policy
+        self._sender = _EventSender(self._send, send_queue_size)
+        self._catchup = _SubscriberCatchup(
+            self._sender, self._catchup_blocks, self._on_caught_up)
+
+        self._dropped_count = COLLECTOR.counter(
+            'dropped_event_lists_count', instance=self)
+        self._disconnected_count = COLLECTOR.counter(
+            'slow_subscribers_disconnected_count', instance=self)
+        self._catchup_blocks_count = COLLECTOR.counter(
+            'catchup_blocks_count', instance=self)
+        self._catchup_blocks_behind = COLLECTOR.gauge(
+            'catchup_blocks_behind', instance=self)
+
+    def start(self):
+        """Starts sending queued event lists to subscribers, and catching up
+        subscribers.
+        """
+        self._sender.start()
+        self._catchup.start()
+
+    def stop(self):
+        self._catchup.stop()
+        self._sender.stop()
+
+    def block_until_complete(self):
+        """Blocks until every subscriber being caught up has been, and every
+        queued event list has been sent, useful for unit tests.
+        """
+        self._catchup.block_until_complete()
+        self._sender.block_until_complete()
 
     def add_subscriber(self, connection_id, subscriptions,
                        last_known_block_id):
@@ -53,38 +135,107 @@ class EventBroadcaster(ChainObserver):
             self._subscribers[connection_id] = \
                 EventSubscriber(
                     connection_id, subscriptions, last_known_block_id)
+            self._subscription_index.add(connection_id, subscriptions)
 
         LOGGER.debug(
             'Added Subscriber %s for %s', connection_id, subscriptions)
 
     def catchup_subscriber(self, connection_id):
-        """Send an event list with all events that are in the given
-        subscriptions from all blocks since that latest block in the current
-        chain that is in the given last known block ids.
+        """Catch the subscriber up with an event list with all events that
+        are in its subscriptions for each block in the current chain after
+        its last known block, and then start sending it events.
+
+        The subscriber is caught up in the background, so this returns
+        without waiting for it. Blocks are read forward from the last known
+        block, at most CATCHUP_CHUNK_SIZE at a time, and only once the
+        subscriber's send queue has room for their event lists. As an event
+        list stays in the send queue until the service has written it to the
+        subscriber's connection, a subscriber far behind the chain head is
+        caught up at the pace its connection takes messages, rather than in a
+        single burst. Subscribers being caught up take turns, a chunk of
+        blocks at a time.
+
+        If the chain changes while the subscriber is being caught up, or a
+        block cannot be read, the rest of the catch up is abandoned, and the
+        subscriber is sent events from then on.
 
         Raises:
-            PossibleForkDetectedError
-                A possible fork was detected while building the event list
-            NoKnownBlockError
-                None of the last known blocks were in the current chain
             KeyError
-                Unknown connection_id
+                Unknown connection_id, or the last known block is not in the
+                block store
         """
         with self._subscribers_cv:
             subscriber = self._subscribers[connection_id]
             last_known_block_id = subscriber.get_last_known_block_id()
             subscriptions = subscriber.subscriptions
 
-        if last_known_block_id is not None:
-            LOGGER.debug(
-                'Catching up Subscriber %s from %s',
-                connection_id, last_known_block_id)
+        if last_known_block_id is None \
+                or self._block_store.chain_head is None:
+            self.enable_subscriber(connection_id)
+            return
 
-            # Send catchup events one block at a time
-            for block_id in self.get_catchup_block_ids(last_known_block_id):
-                events = self.get_events_for_block_id(block_id, subscriptions)
-                event_list = EventList(events=events)
-                self._send(connection_id, event_list.SerializeToString())
+        LOGGER.debug(
+            'Catching up Subscriber %s from %s',
+            connection_id, last_known_block_id)
+
+        if last_known_block_id == NULL_BLOCK_IDENTIFIER:
+            block_num = 0
+        else:
+            block_num = self._block_store[last_known_block_id].block_num + 1
+
+        self._catchup.add(
+            _CatchupCursor(
+                connection_id, subscriptions, block_num, last_known_block_id))
+
+    def _catchup_blocks(self, cursor, max_blocks):
+        """Queues the event lists of up to max_blocks blocks, from the block
+        the subscriber is to be caught up from next, advancing its cursor
+        past them.
+
+        Returns:
+            bool: True if the subscriber has been caught up with the current
+                chain
+
+        Raises:
+            PossibleForkDetectedError
+                The chain changed while the subscriber was being caught up
+            KeyError
+                A block or its receipts could not be read
+        """
+        chain_head = self._block_store.chain_head
+        block_iter = self._block_store.get_block_iter(
+            start_block_num=hex(cursor.block_num), reverse=False)
+
+        blocks_read = 0
+        for block in islice(block_iter, max_blocks):
+            if block.previous_block_id != cursor.previous_block_id:
+                raise PossibleForkDetectedError(
+                    'Chain changed while catching up subscriber {} at block '
+                    '{}'.format(cursor.connection_id, block.block_num))
+
+            events = self.get_events_for_block(block, cursor.subscriptions)
+            if not self._sender.enqueue(
+                    cursor.connection_id,
+                    EventList(events=events).SerializeToString()):
+                # Room made for this chunk was taken; try again next turn
+                return False
+
+            blocks_read += 1
+            cursor.block_num = block.block_num + 1
+            cursor.previous_block_id = block.identifier
+            self._catchup_blocks_count.inc()
+            if chain_head is not None:
+                self._catchup_blocks_behind.set_value(
+                    max(chain_head.block_num - block.block_num, 0))
+
+        return blocks_read < max_blocks
+
+    def _on_caught_up(self, connection_id):
+        try:
+            self.enable_subscriber(connection_id)
+        except KeyError:
+            # The subscriber was removed while it was being caught up
+            pass
 
     def enable_subscriber(self, connection_id):
         """Start sending events to the subscriber.
@@ -105,26 +256,10 @@ class EventBroadcaster(ChainObserver):
         with self._subscribers_cv:
             if connection_id in self._subscribers:
                 del self._subscribers[connection_id]
+            self._subscription_index.remove(connection_id)
 
-    def get_catchup_block_ids(self, last_known_block_id):
-        '''
-        Raises:
-            PossibleForkDetectedError
-        '''
-        # If latest known block is not the current chain head, catch up
-        catchup_up_blocks = []
-        chain_head = self._block_store.chain_head
-        if chain_head and last_known_block_id != chain_head.identifier:
-            # Start from the chain head and get blocks until we reach the
-            # known block
-            for block in self._block_store.get_predecessor_iter():
-                # All the blocks if NULL_BLOCK_IDENTIFIER
-                if last_known_block_id != NULL_BLOCK_IDENTIFIER:
-                    if block.identifier == last_known_block_id:
-                        break
-                catchup_up_blocks.append(block.identifier)
-
-        return list(reversed(catchup_up_blocks))
+        self._catchup.discard(connection_id)
+        self._sender.discard(connection_id)
 
     def get_latest_known_block_id(self, last_known_block_ids):
         '''
@@ -172,6 +307,13 @@ class EventBroadcaster(ChainObserver):
                 is missing from the receipt store.
         """
 
+        if self._event_log is not None:
+            try:
+                return self._get_logged_events(block_ids, subscriptions)
+            except KeyError:
+                # Not all of the blocks are in the log
+                pass
+
         blocks = [self._block_store[block_id] for block_id in block_ids]
         return self.get_events_for_blocks(blocks, subscriptions)
 
@@ -200,6 +342,66 @@ class EventBroadcaster(ChainObserver):
         return events
 
     def get_events_for_block(self, blkw, subscriptions):
+        if self._event_log is not None:
+            try:
+                return self._get_logged_events(
+                    [blkw.identifier], subscriptions, blocks=[blkw])
+            except KeyError:
+                # The block is not in the log
+                pass
+
+        receipts = self._get_block_receipts(blkw)
+
+        block_event_extractor = BlockEventExtractor(blkw)
+        receipt_event_extractor = ReceiptEventExtractor(receipts=receipts)
+
+        events = []
+        events.extend(block_event_extractor.extract(subscriptions))
+        events.extend(receipt_event_extractor.extract(subscriptions))
+
+        return events
+
+    def _get_logged_events(self, block_ids, subscriptions, blocks=None):
+        """Reads the events of blocks from the event log, adding the
+        state-delta events, which are not logged, from the receipt store.
+
+        Raises:
+            KeyError: if a block is not in the event log, or is not in the
+                block store when its receipts are needed
+        """
+        state_delta_subscriptions = [
+            subscription for subscription in subscriptions
+            if subscription.event_type in UNLOGGED_EVENT_TYPES
+        ]
+
+        events = []
+        logged_blocks = self._event_log.get_events(block_ids, subscriptions)
+        for i, (block_id, logged_events) in enumerate(logged_blocks):
+            events.extend(logged_events)
+            if state_delta_subscriptions:
+                blkw = blocks[i] if blocks else self._block_store[block_id]
+                events.extend(
+                    ReceiptEventExtractor(
+                        self._get_block_receipts(blkw)
+                    ).extract(state_delta_subscriptions))
+
+        return events
+
+    def _get_block_receipts(self, blkw):
+        try:
+            return self._receipt_store.get_block_receipts(blkw.identifier)
+        except KeyError:
+            return self._get_receipts_by_transaction(blkw)
+        except ValueError as err:
+            LOGGER.error(
+                "Unable to decode the receipts of block id %s: %s",
+                blkw.identifier[:10], err)
+            return []
+
+    def _get_receipts_by_transaction(self, blkw):
+        """Looks up the receipts of a block whose receipts were not stored
+        together as a bundle, one transaction at a time.
+        """
         receipts = []
         for batch in blkw.block.batches:
             for txn in batch.transactions:
@@ -213,15 +415,15 @@ class EventBroadcaster(ChainObserver):
                         " up events for block id %s",
                         txn.header_signature[:10],
                         blkw.identifier[:10])
+                except ValueError as err:
+                    LOGGER.error(
+                        "Unable to decode the receipt of transaction id %s "
+                        "in block id %s: %s",
+                        txn.header_signature[:10],
+                        blkw.identifier[:10],
+                        err)
 
-        block_event_extractor = BlockEventExtractor(blkw)
-        receipt_event_extractor = ReceiptEventExtractor(receipts=receipts)
-
-        events = []
-        events.extend(block_event_extractor.extract(subscriptions))
-        events.extend(receipt_event_extractor.extract(subscriptions))
-
-        return events
+        return receipts
 
     def chain_update(self, block, receipts):
         extractors = [
@@ -229,11 +431,8 @@ class EventBroadcaster(ChainObserver):
             ReceiptEventExtractor(receipts),
         ]
 
-        subscriptions = []
-        for subscriber in self._subscribers.values():
-            for subscription in subscriber.subscriptions:
-                if subscription not in subscriptions:
-                    subscriptions.append(subscription)
+        with self._subscribers_cv:
+            subscriptions = self._subscription_index.subscriptions
 
         events = []
         for extractor in extractors:
@@ -247,28 +446,59 @@ class EventBroadcaster(ChainObserver):
     def broadcast_events(self, events):
         LOGGER.debug("Broadcasting events: %s", events)
         with self._subscribers_cv:
-            # Copy the subscribers
-            subscribers = {
-                conn: sub.copy()
-                for conn, sub in self._subscribers.items()
+            # Every listening subscriber is sent an event list, even if none
+            # of the events are ones it subscribed to
+            events_by_subscriber = {
+                connection_id: []
+                for connection_id, subscriber in self._subscribers.items()
+                if subscriber.is_listening()
             }
-
-        if subscribers:
-            for connection_id, subscriber in subscribers.items():
-                if subscriber.is_listening():
-                    subscriber_events = [
-                        event for event in events
-                        if subscriber.is_subscribed(event)
-                    ]
-                    event_list = EventList(events=subscriber_events)
-                    self._send(connection_id, event_list.SerializeToString())
-
-    def _send(self, connection_id, message_bytes):
+            if not events_by_subscriber:
+                return
+
+            for event in events:
+                for connection_id in \
+                        self._subscription_index.get_subscribers(event):
+                    if connection_id in events_by_subscriber:
+                        events_by_subscriber[connection_id].append(event)
+
+        # Subscribers which receive the same events share a single
+        # serialized event list
+        payloads = {}
+        for connection_id, subscriber_events in events_by_subscriber.items():
+            payload_key = tuple(id(event) for event in subscriber_events)
+            try:
+                message_bytes = payloads[payload_key]
+            except KeyError:
+                message_bytes = EventList(
+                    events=subscriber_events).SerializeToString()
+                payloads[payload_key] = message_bytes
+
+            if not self._sender.enqueue(connection_id, message_bytes):
+                self._handle_slow_consumer(connection_id)
+
+    def _handle_slow_consumer(self, connection_id):
+        if self._slow_consumer_policy == SLOW_CONSUMER_DROP:
+            LOGGER.debug(
+                'Send queue of subscriber %s is full; dropping events',
+                connection_id)
+            self._dropped_count.inc()
+            return
+
+        LOGGER.warning(
+            'Send queue of subscriber %s is full; disconnecting it',
+            connection_id)
+        self._disconnected_count.inc()
+        self.remove_subscriber(connection_id)
+        self._service.remove_connection(connection_id)
+
+    def _send(self, connection_id, message_bytes, on_sent):
         self._service.send(
             validator_pb2.Message.CLIENT_EVENTS,
             message_bytes,
             connection_id=connection_id,
-            one_way=True)
+            one_way=True,
+            on_sent=on_sent)
 
 
 class EventSubscriber:
@@ -311,3 +541,261 @@ class EventSubscriber:
             self._subscriptions,
             self._last_known_block,
             self._listening)
+
+
+class _SendQueue:
+    """The messages waiting to be sent to a subscriber, and the number of
+    its messages handed to the service which have not yet been written to
+    its connection.
+    """
+
+    __slots__ = ['messages', 'in_flight']
+
+    def __init__(self):
+        self.messages = deque()
+        self.in_flight = 0
+
+    def __len__(self):
+        return len(self.messages) + self.in_flight
+
+
+class _EventSender(InstrumentedThread):
+    """Sends queued messages to subscribers, taking one message from each
+    subscriber with messages waiting in turn.
+
+    A message counts against its subscriber's queue until the service
+    reports that it has been written to the subscriber's connection, so a
+    subscriber whose connection does not keep up fills its queue, however
+    quickly messages are handed to the service.
+
+    Args:
+        send (function): sends a message
+            Expected args:
+                connection_id (str): the subscriber to send to
+                message_bytes (bytes): the message to send
+                on_sent (function): to be called, with no arguments, once
+                    the message has been written to the connection
+        queue_size (int): the number of messages which may wait to be sent to
+            a single subscriber
+    """
+
+    def __init__(self, send, queue_size):
+        super().__init__(name='_EventSender')
+        self.daemon = True
+        self._send = send
+        self._queue_size = queue_size
+
+        # Notified whenever a subscriber's queue gains room
+        self.condition = Condition()
+        self._queues = {}
+        # Subscribers with messages waiting, in the order they are served
+        self._ready = deque()
+        self._sending = False
+        self._stopped = False
+
+    def enqueue(self, connection_id, message_bytes):
+        """Queues a message for a subscriber.
+
+        Returns:
+            bool: False if the subscriber's queue is full, and the message
+                was not queued
+        """
+        with self.condition:
+            queue = self._queues.setdefault(connection_id, _SendQueue())
+            if len(queue) >= self._queue_size:
+                return False
+
+            if not queue.messages:
+                self._ready.append(connection_id)
+            queue.messages.append(message_bytes)
+            self.condition.notify_all()
+
+        return True
+
+    def room(self, connection_id):
+        """Returns the number of messages which may be queued for a
+        subscriber. Should be called with the condition held.
+        """
+        queue = self._queues.get(connection_id)
+        if queue is None:
+            return self._queue_size
+        return max(self._queue_size - len(queue), 0)
+
+    def discard(self, connection_id):
+        """Drops any messages waiting to be sent to a subscriber."""
+        with self.condition:
+            self._queues.pop(connection_id, None)
+            self.condition.notify_all()
+
+    def stop(self):
+        with self.condition:
+            self._stopped = True
+            self.condition.notify_all()
+
+    def block_until_complete(self):
+        with self.condition:
+            while (self._ready or self._sending) and not self._stopped:
+                self.condition.wait()
+
+    def _on_sent(self, queue):
+        with self.condition:
+            queue.in_flight -= 1
+            self.condition.notify_all()
+
+    def run(self):
+        while True:
+            with self.condition:
+                self._sending = False
+                self.condition.notify_all()
+                while not self._ready and not self._stopped:
+                    self.condition.wait()
+                if self._stopped:
+                    return
+
+                connection_id = self._ready.popleft()
+                queue = self._queues.get(connection_id)
+                if not queue or not queue.messages:
+                    continue
+                message_bytes = queue.messages.popleft()
+                if queue.messages:
+                    self._ready.append(connection_id)
+                queue.in_flight += 1
+                self._sending = True
+
+            try:
+                self._send(
+                    connection_id,
+                    message_bytes,
+                    partial(self._on_sent, queue))
+            except ValueError:
+                # The connection has been closed
+                LOGGER.debug(
+                    'Unable to send events to %s; connection is closed',
+                    connection_id)
+                self._on_sent(queue)
+            # pylint: disable=broad-except
+            except Exception:
+                LOGGER.exception(
+                    'Unhandled exception while sending events to %s',
+                    connection_id)
+                self._on_sent(queue)
+
+
+class _CatchupCursor:
+    """Where a subscriber being caught up is up to: the number of the block
+    it is to be sent the events of next, and the id of the block which
+    should precede it.
+    """
+
+    __slots__ = [
+        'connection_id', 'subscriptions', 'block_num', 'previous_block_id'
+    ]
+
+    def __init__(self, connection_id, subscriptions, block_num,
+                 previous_block_id):
+        self.connection_id = connection_id
+        self.subscriptions = subscriptions
+        self.block_num = block_num
+        self.previous_block_id = previous_block_id
+
+
+class _SubscriberCatchup(InstrumentedThread):
+    """Catches subscribers up with the events of past blocks, a chunk of
+    blocks at a time, taking turns between subscribers whose send queues
+    have room.
+
+    Args:
+        sender (:obj:`_EventSender`): the sender the event lists are queued
+            with
+        catchup_blocks (function): queues the event lists of a subscriber's
+            next blocks
+            Expected args:
+                cursor (:obj:`_CatchupCursor`): where the subscriber is up to
+                max_blocks (int): the most blocks to queue event lists for
+            Returns:
+                bool: True once the subscriber has been caught up
+        on_caught_up (function): called with the connection id of each
+            subscriber once it has been caught up, or catching it up failed
+    """
+
+    def __init__(self, sender, catchup_blocks, on_caught_up):
+        super().__init__(name='_SubscriberCatchup')
+        self.daemon = True
+        self._sender = sender
+        self._catchup_blocks = catchup_blocks
+        self._on_caught_up = on_caught_up
+
+        # Shares the sender's condition, so it wakes when room is made
+        self._condition = sender.condition
+        # Subscribers being caught up, in the order they take turns
+        self._cursors = OrderedDict()
+        self._stopped = False
+
+    def add(self, cursor):
+        with self._condition:
+            self._cursors[cursor.connection_id] = cursor
+            self._condition.notify_all()
+
+    def discard(self, connection_id):
+        with self._condition:
+            self._cursors.pop(connection_id, None)
+            self._condition.notify_all()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def block_until_complete(self):
+        with self._condition:
+            while self._cursors and not self._stopped:
+                self._condition.wait()
+
+    def _next_cursor(self):
+        for connection_id, cursor in self._cursors.items():
+            room = self._sender.room(connection_id)
+            if room > 0:
+                return cursor, room
+        return None, 0
+
+    def run(self):
+        while True:
+            with self._condition:
+                cursor, room = self._next_cursor()
+                while cursor is None and not self._stopped:
+                    self._condition.wait()
+                    cursor, room = self._next_cursor()
+                if self._stopped:
+                    return
+
+            connection_id = cursor.connection_id
+            try:
+                caught_up = self._catchup_blocks(
+                    cursor, min(room, CATCHUP_CHUNK_SIZE))
+            except (PossibleForkDetectedError, KeyError) as err:
+                LOGGER.warning(
+                    'Failed to catchup subscriber %s: %s', connection_id, err)
+                caught_up = True
+            # pylint: disable=broad-except
+            except Exception:
+                LOGGER.exception(
+                    'Unhandled exception while catching up subscriber %s',
+                    connection_id)
+                caught_up = True
+
+            if caught_up:
+                self._on_caught_up(connection_id)
+
+            with self._condition:
+                if self._cursors.get(connection_id) is not cursor:
+                    # The subscriber was removed, or is being caught up
+                    # afresh
+                    if connection_id not in self._cursors:
+                        self._sender.discard(connection_id)
+                    continue
+
+                if caught_up:
+                    del self._cursors[connection_id]
+                    self._condition.notify_all()
+                else:
+                    self._cursors.move_to_end(connection_id)
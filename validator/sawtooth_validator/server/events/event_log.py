@@ -0,0 +1,308 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import logging
+import os
+import struct
+
+import lmdb
+
+from sawtooth_validator.journal.chain import ChainObserver
+from sawtooth_validator.journal.event_extractors import BlockEventExtractor
+from sawtooth_validator.protobuf.events_pb2 import EventList
+from sawtooth_validator.server.events.subscription import EventSubscription
+from sawtooth_validator.server.events.subscription import SimpleAnyFilter
+from sawtooth_validator import metrics
+
+
+LOGGER = logging.getLogger(__name__)
+COLLECTOR = metrics.get_collector(__name__)
+
+DEFAULT_SIZE = 1024**4
+
+# State-delta events repeat the state changes held by the receipt store, so
+# they are not logged; see EventLog.
+LOGGED_BLOCK_SUBSCRIPTIONS = [
+    EventSubscription(event_type="sawtooth/block-commit")
+]
+UNLOGGED_EVENT_TYPES = frozenset(["sawtooth/state-delta"])
+
+# Index keys start with the kind of index they belong to
+_EVENT_TYPE_INDEX = b'T'
+_ATTRIBUTE_INDEX = b'A'
+
+# Requests for block numbers spread over more than this many times as many
+# blocks are answered with a lookup per block, rather than a scan of the
+# index over the whole range.
+_MAX_SCAN_RATIO = 4
+
+
+class EventLog(ChainObserver):
+    """An append-only log of the events of each block in the current chain,
+    stored in LMDB and indexed so that the blocks with events matching a
+    subscription can be found without reading the events of every block.
+
+    The events of a block, its sawtooth/block-commit event followed by the
+    events of its transactions, are stored under its block number. Every
+    block is indexed by the types of its events, and, for the attribute keys
+    given, by the type, key and value of each such attribute; a subscription
+    with a SimpleAnyFilter on one of those keys is looked up by that filter.
+
+    Blocks are added as they are committed. A block replaces any logged
+    blocks at or above its number, so the blocks of a fork which is no
+    longer part of the chain are pruned as the chain moves on; a block which
+    does not follow on from the logged block below it clears the log.
+
+    State-delta events are not logged, since they would duplicate the state
+    changes in the receipt store.
+
+    Args:
+        filename (str): the filename of the LMDB file
+        indexed_attributes (list of str): the attribute keys to index
+        flag (str): the mode to open the file with; 'c' creates it if
+            needed and 'n' always creates a new, empty log
+    """
+
+    def __init__(self, filename, indexed_attributes=None, flag='c',
+                 _size=DEFAULT_SIZE):
+        create = bool(flag == 'c')
+        if flag == 'n':
+            if os.path.isfile(filename):
+                os.remove(filename)
+            create = True
+
+        self._indexed_attributes = frozenset(indexed_attributes or [])
+
+        self._lmdb = lmdb.Environment(
+            path=filename,
+            map_size=_size,
+            map_async=True,
+            writemap=True,
+            readahead=False,
+            subdir=False,
+            create=create,
+            max_dbs=4,
+            lock=True)
+
+        # block num -> serialized EventList
+        self._events_db = self._lmdb.open_db(b'events')
+        # block num -> block id
+        self._block_ids_db = self._lmdb.open_db(b'block_ids')
+        # block id -> block num
+        self._block_nums_db = self._lmdb.open_db(b'block_nums')
+        # index key + block num -> empty
+        self._index_db = self._lmdb.open_db(b'index')
+
+        self._blocks_read_count = COLLECTOR.counter(
+            'blocks_read_count', instance=self)
+        self._blocks_skipped_count = COLLECTOR.counter(
+            'blocks_skipped_count', instance=self)
+
+    def chain_update(self, block, receipts):
+        events = BlockEventExtractor(block).extract(
+            LOGGED_BLOCK_SUBSCRIPTIONS)
+        events.extend(
+            event
+            for receipt in receipts
+            for event in receipt.events
+            if event.event_type not in UNLOGGED_EVENT_TYPES)
+
+        self.append(
+            block.identifier, block.block_num, block.previous_block_id,
+            events)
+
+    def append(self, block_id, block_num, previous_block_id, events):
+        """Logs the events of a block, replacing any logged blocks at or
+        above its number.
+
+        Args:
+            block_id (str): the block's id
+            block_num (int): the block's number
+            previous_block_id (str): the id of the block before it
+            events (list of Event): the block's events
+        """
+        with self._lmdb.begin(write=True) as txn:
+            remove_from = block_num
+            if block_num > 0:
+                logged_previous_id = txn.get(
+                    _block_key(block_num - 1), db=self._block_ids_db)
+                if logged_previous_id is not None and \
+                        logged_previous_id.decode() != previous_block_id:
+                    LOGGER.debug(
+                        'Block %s does not follow on from the event log; '
+                        'clearing it', block_id[:8])
+                    remove_from = 0
+
+            self._remove_from(txn, _block_key(remove_from))
+
+            block_key = _block_key(block_num)
+            txn.put(
+                block_key, EventList(events=events).SerializeToString(),
+                db=self._events_db)
+            txn.put(block_key, block_id.encode(), db=self._block_ids_db)
+            txn.put(block_id.encode(), block_key, db=self._block_nums_db)
+            for index_key in self._index_keys(events):
+                txn.put(index_key + block_key, b'', db=self._index_db)
+
+        self._lmdb.sync()
+
+    def get_events(self, block_ids, subscriptions):
+        """Returns the logged events of the given blocks which match any of
+        the subscriptions, each event once.
+
+        Args:
+            block_ids (list of str): the blocks to return events for
+            subscriptions (list of EventSubscription): the subscriptions
+
+        Returns:
+            list of (str, list of Event): the block id and the matching
+                events of each block, in the order of the given block ids
+
+        Raises:
+            KeyError: if one of the blocks is not in the log
+        """
+        subscriptions = [
+            subscription for subscription in subscriptions
+            if subscription.event_type not in UNLOGGED_EVENT_TYPES
+        ]
+
+        with self._lmdb.begin() as txn:
+            block_keys = []
+            for block_id in block_ids:
+                block_key = txn.get(block_id.encode(), db=self._block_nums_db)
+                if block_key is None:
+                    raise KeyError(
+                        'Block {} is not in the event log'.format(block_id))
+                block_keys.append(block_key)
+
+            candidates = self._find_candidates(txn, block_keys, subscriptions)
+
+            blocks = []
+            for block_id, block_key in zip(block_ids, block_keys):
+                if block_key not in candidates:
+                    self._blocks_skipped_count.inc()
+                    blocks.append((block_id, []))
+                    continue
+
+                self._blocks_read_count.inc()
+                event_list = EventList()
+                event_list.ParseFromString(
+                    txn.get(block_key, db=self._events_db))
+                blocks.append((block_id, [
+                    event for event in event_list.events
+                    if any(event in subscription
+                           for subscription in subscriptions)
+                ]))
+
+        return blocks
+
+    def close(self):
+        self._lmdb.close()
+
+    def _find_candidates(self, txn, block_keys, subscriptions):
+        """Returns the keys of the given blocks which have an event that may
+        match one of the subscriptions, according to the indexes.
+        """
+        if not subscriptions or not block_keys:
+            return set()
+
+        requested = set(block_keys)
+        first = min(requested)
+        last = max(requested)
+        scan = (
+            _block_num(last) - _block_num(first) + 1
+            <= _MAX_SCAN_RATIO * len(requested)
+        )
+
+        candidates = set()
+        with txn.cursor(db=self._index_db) as cursor:
+            for subscription in subscriptions:
+                prefix = self._subscription_index_key(subscription)
+                if scan:
+                    if not cursor.set_range(prefix + first):
+                        continue
+                    for key in cursor.iternext(values=False):
+                        if not key.startswith(prefix) or \
+                                key[len(prefix):] > last:
+                            break
+                        if key[len(prefix):] in requested:
+                            candidates.add(key[len(prefix):])
+                else:
+                    candidates.update(
+                        block_key for block_key in requested
+                        if cursor.set_key(prefix + block_key))
+
+                if len(candidates) == len(requested):
+                    break
+
+        return candidates
+
+    def _subscription_index_key(self, subscription):
+        for sub_filter in subscription.filters:
+            if isinstance(sub_filter, SimpleAnyFilter) and \
+                    sub_filter.key in self._indexed_attributes:
+                return _index_key(
+                    _ATTRIBUTE_INDEX, subscription.event_type,
+                    sub_filter.key, sub_filter.match_string)
+
+        return _index_key(_EVENT_TYPE_INDEX, subscription.event_type)
+
+    def _index_keys(self, events):
+        index_keys = set()
+        for event in events:
+            index_keys.add(_index_key(_EVENT_TYPE_INDEX, event.event_type))
+            for attribute in event.attributes:
+                if attribute.key in self._indexed_attributes:
+                    index_keys.add(_index_key(
+                        _ATTRIBUTE_INDEX, event.event_type, attribute.key,
+                        attribute.value))
+        return index_keys
+
+    def _remove_from(self, txn, block_key):
+        """Removes the logged blocks at or above the given block key."""
+        removed = []
+        with txn.cursor(db=self._block_ids_db) as cursor:
+            if cursor.set_range(block_key):
+                removed = list(cursor.iternext())
+
+        for removed_key, removed_id in removed:
+            event_list = EventList()
+            event_list.ParseFromString(
+                txn.get(removed_key, db=self._events_db))
+            for index_key in self._index_keys(event_list.events):
+                txn.delete(index_key + removed_key, db=self._index_db)
+
+            txn.delete(removed_key, db=self._events_db)
+            txn.delete(removed_key, db=self._block_ids_db)
+            txn.delete(removed_id, db=self._block_nums_db)
+
+
+def _block_key(block_num):
+    # Big-endian, so that blocks sort in block number order
+    return struct.pack('>Q', block_num)
+
+
+def _block_num(block_key):
+    return struct.unpack('>Q', block_key)[0]
+
+
+def _index_key(index, *parts):
+    # Each part is prefixed with its length, so that no key is a prefix of
+    # another key with different parts
+    key = index
+    for part in parts:
+        encoded = part.encode()
+        key += struct.pack('>I', len(encoded)) + encoded
+    return key
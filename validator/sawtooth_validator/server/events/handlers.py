@@ -15,7 +15,6 @@
 
 import logging
 
-from sawtooth_validator.exceptions import PossibleForkDetectedError
 from sawtooth_validator.protobuf import validator_pb2
 from sawtooth_validator.networking.dispatch import Handler
 from sawtooth_validator.networking.dispatch import HandlerResult
@@ -111,6 +110,10 @@ class ClientEventsSubscribeHandler(Handler):
     """Tells the EventBroadcaster to actually start sending the subscriber
     events. This is separate from validation and acknowledgement in order to
     ensure the correct message ordering.
+
+    The EventBroadcaster catches the subscriber up in the background, and
+    starts sending it events once it has, so a subscriber far behind the
+    chain head does not hold up a handler thread.
     """
 
     def __init__(self, event_broadcaster):
@@ -120,10 +123,10 @@ class ClientEventsSubscribeHandler(Handler):
         # Attempt to catch the subscriber up with events
         try:
             self._event_broadcaster.catchup_subscriber(connection_id)
-        except (PossibleForkDetectedError, NoKnownBlockError, KeyError) as err:
+        except (NoKnownBlockError, KeyError) as err:
             LOGGER.warning("Failed to catchup subscriber: %s", err)
+            self._event_broadcaster.enable_subscriber(connection_id)
 
-        self._event_broadcaster.enable_subscriber(connection_id)
         return HandlerResult(HandlerStatus.PASS)
 
 
@@ -54,6 +54,294 @@ class EventSubscription:
         return False
 
 
+class SubscriptionIndex:
+    """Indexes the event subscriptions of a set of subscribers so that an
+    event is only tested against the subscriptions it could belong to.
+
+    Subscriptions are indexed by event type and by one of their filters:
+
+        - a SimpleAnyFilter, by the exact attribute key and value it requires
+        - otherwise a RegexAnyFilter, by the attribute key it applies to; the
+          patterns of all such filters on the same event type and key are
+          matched together, once per attribute, by a PatternSet
+        - otherwise by event type alone
+
+    The index is updated as subscribers are added and removed; it is not
+    thread safe.
+    """
+
+    def __init__(self):
+        # connection_id -> list of EventSubscription
+        self._subscriptions_by_subscriber = {}
+        # subscription key -> (EventSubscription, count of subscribers)
+        self._unique_subscriptions = {}
+        # event_type -> bucket
+        self._unfiltered = {}
+        # (event_type, key, value) -> bucket
+        self._by_attribute = {}
+        # (event_type, key) -> PatternSet
+        self._pattern_sets = {}
+        # (event_type, key, pattern) -> bucket
+        self._by_pattern = {}
+
+        # Buckets map connection_id -> list of (EventSubscription, the filter
+        # the subscription is indexed by, or None)
+
+    def __len__(self):
+        return len(self._subscriptions_by_subscriber)
+
+    @property
+    def subscriptions(self):
+        """The distinct subscriptions of all subscribers."""
+        return [
+            subscription
+            for subscription, _ in self._unique_subscriptions.values()
+        ]
+
+    def add(self, connection_id, subscriptions):
+        """Indexes the subscriptions of a subscriber, replacing any it had
+        before.
+        """
+        self.remove(connection_id)
+        self._subscriptions_by_subscriber[connection_id] = subscriptions
+
+        for subscription in subscriptions:
+            key = _subscription_key(subscription)
+            _, count = self._unique_subscriptions.get(key, (None, 0))
+            self._unique_subscriptions[key] = (subscription, count + 1)
+
+            index, index_key, indexed_filter = \
+                self._index_location(subscription)
+            bucket = index.setdefault(index_key, {})
+            bucket.setdefault(connection_id, []).append(
+                (subscription, indexed_filter))
+
+            if isinstance(indexed_filter, RegexAnyFilter):
+                self._pattern_sets.setdefault(
+                    (subscription.event_type, indexed_filter.key),
+                    PatternSet()).add(indexed_filter.match_string)
+
+    def remove(self, connection_id):
+        """Removes the subscriptions of a subscriber from the index, if it
+        has any.
+        """
+        subscriptions = self._subscriptions_by_subscriber.pop(
+            connection_id, None)
+        if subscriptions is None:
+            return
+
+        for subscription in subscriptions:
+            key = _subscription_key(subscription)
+            unique_subscription, count = self._unique_subscriptions[key]
+            if count > 1:
+                self._unique_subscriptions[key] = \
+                    (unique_subscription, count - 1)
+            else:
+                del self._unique_subscriptions[key]
+
+            index, index_key, indexed_filter = \
+                self._index_location(subscription)
+            bucket = index.get(index_key)
+            if bucket is not None:
+                bucket.pop(connection_id, None)
+                if not bucket:
+                    del index[index_key]
+
+            if isinstance(indexed_filter, RegexAnyFilter):
+                set_key = (subscription.event_type, indexed_filter.key)
+                pattern_set = self._pattern_sets[set_key]
+                pattern_set.remove(indexed_filter.match_string)
+                if not pattern_set:
+                    del self._pattern_sets[set_key]
+
+    def get_subscribers(self, event):
+        """Returns the ids of the subscribers which have a subscription that
+        the event belongs to.
+
+        Returns:
+            set of str: the connection ids
+        """
+        event_type = event.event_type
+        buckets = [self._unfiltered.get(event_type)]
+        for attribute in event.attributes:
+            buckets.append(self._by_attribute.get(
+                (event_type, attribute.key, attribute.value)))
+
+            pattern_set = self._pattern_sets.get((event_type, attribute.key))
+            if pattern_set is not None:
+                for pattern in pattern_set.search(attribute.value):
+                    buckets.append(self._by_pattern.get(
+                        (event_type, attribute.key, pattern)))
+
+        subscribers = set()
+        for bucket in buckets:
+            if not bucket:
+                continue
+            for connection_id, entries in bucket.items():
+                if connection_id in subscribers:
+                    continue
+                for subscription, indexed_filter in entries:
+                    # The event is known to pass the filter the subscription
+                    # is indexed by
+                    if all(event in sub_filter
+                           for sub_filter in subscription.filters
+                           if sub_filter is not indexed_filter):
+                        subscribers.add(connection_id)
+                        break
+
+        return subscribers
+
+    def _index_location(self, subscription):
+        event_type = subscription.event_type
+        for sub_filter in subscription.filters:
+            if isinstance(sub_filter, SimpleAnyFilter):
+                # An event can only pass this filter if it has an attribute
+                # with exactly this key and value
+                return self._by_attribute, (
+                    event_type, sub_filter.key, sub_filter.match_string
+                ), sub_filter
+
+        for sub_filter in subscription.filters:
+            if isinstance(sub_filter, RegexAnyFilter):
+                # An event can only pass this filter if the value of an
+                # attribute with this key matches the pattern
+                return self._by_pattern, (
+                    event_type, sub_filter.key, sub_filter.match_string
+                ), sub_filter
+
+        return self._unfiltered, event_type, None
+
+
+class PatternSet:
+    """A set of regular expressions which are searched for in a value
+    together, returning the ones which match, as re.search would.
+
+    Patterns of the form "^literal" are stored in a prefix trie, so all of
+    them are matched in a single pass over the value. The remaining patterns
+    are combined into one alternation, which rules out most values with a
+    single search before the patterns are tried one at a time; patterns
+    with groups or inline flags, which would change what the alternation
+    matches, are always tried one at a time.
+    """
+
+    def __init__(self):
+        # pattern -> count of times added
+        self._patterns = {}
+        self._compiled = None
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def add(self, pattern):
+        self._patterns[pattern] = self._patterns.get(pattern, 0) + 1
+        self._compiled = None
+
+    def remove(self, pattern):
+        count = self._patterns.get(pattern, 0)
+        if count > 1:
+            self._patterns[pattern] = count - 1
+        else:
+            self._patterns.pop(pattern, None)
+        self._compiled = None
+
+    def search(self, value):
+        """Returns the patterns which match somewhere in the value.
+
+        Returns:
+            list of str: the matching patterns
+        """
+        if self._compiled is None:
+            self._compiled = _CompiledPatternSet(self._patterns)
+
+        return self._compiled.search(value)
+
+
+class _CompiledPatternSet:
+    def __init__(self, patterns):
+        # Each trie node is a dict of child nodes by character; the patterns
+        # which end at a node are listed under the key None
+        self._prefix_trie = {}
+        self._combinable = []
+        self._individual = []
+
+        for pattern in patterns:
+            prefix = literal_prefix(pattern)
+            if prefix is not None:
+                node = self._prefix_trie
+                for char in prefix:
+                    node = node.setdefault(char, {})
+                node.setdefault(None, []).append(pattern)
+                continue
+
+            regex = re.compile(pattern)
+            if regex.groups or '(?' in pattern:
+                # Groups would be renumbered in the alternation, and inline
+                # flags would apply to all of it, changing what the other
+                # patterns match
+                self._individual.append((pattern, regex))
+            else:
+                self._combinable.append((pattern, regex))
+
+        self._combined = None
+        if len(self._combinable) > 1:
+            try:
+                self._combined = re.compile('|'.join(
+                    '(?:{})'.format(pattern)
+                    for pattern, _ in self._combinable))
+            except re.error:
+                pass
+
+    def search(self, value):
+        matches = []
+
+        node = self._prefix_trie
+        matches.extend(node.get(None, ()))
+        for char in value:
+            node = node.get(char)
+            if node is None:
+                break
+            matches.extend(node.get(None, ()))
+
+        if self._combinable and (
+                self._combined is None or self._combined.search(value)):
+            matches.extend(
+                pattern for pattern, regex in self._combinable
+                if regex.search(value))
+
+        matches.extend(
+            pattern for pattern, regex in self._individual
+            if regex.search(value))
+
+        return matches
+
+
+_REGEX_META_CHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+
+def literal_prefix(pattern):
+    """Returns the literal string a regular expression matches the values
+    starting with, if it is of the form "^literal" or "^literal.*", or None
+    otherwise.
+    """
+    if not pattern.startswith('^'):
+        return None
+    prefix = pattern[1:]
+    if prefix.endswith('.*'):
+        prefix = prefix[:-2]
+    if _REGEX_META_CHARACTERS.intersection(prefix):
+        return None
+    return prefix
+
+
+def _subscription_key(subscription):
+    return (
+        subscription.event_type,
+        frozenset(
+            (sub_filter.__class__, sub_filter.key, sub_filter.match_string)
+            for sub_filter in subscription.filters),
+    )
+
+
 class InvalidFilterError(Exception):
     pass
 
@@ -17,12 +17,14 @@
 # Until this module can be sensibly broken up
 
 import abc
+from collections import OrderedDict
 import logging
 from time import time
 import itertools
 from functools import cmp_to_key
 import re
 from threading import Condition
+from threading import Lock
 # pylint: disable=import-error,no-name-in-module
 # needed for google.protobuf import
 from google.protobuf.message import DecodeError
@@ -52,6 +54,7 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 300
 MAX_PAGE_SIZE = 1000
 DEFAULT_PAGE_SIZE = 100
+STATE_TREE_POOL_SIZE = 16
 
 
 class _ResponseFailed(BaseException):
@@ -81,7 +84,7 @@ class _ClientRequestHandler(Handler, metaclass=abc.ABCMeta):
         request_proto (class): Protobuf class of the request to be handled
         response_proto (class): Protobuf class of the response to be sent
         response_type (enum): Message status of the response
-        tree (MerkleDatabase, optional): State tree to be queried
+        database (Database, optional): State database to be queried
         block_store (BlockStoreAdapter, optional): Block chain to be queried
 
     Attributes:
@@ -89,7 +92,7 @@ class _ClientRequestHandler(Handler, metaclass=abc.ABCMeta):
     """
 
     def __init__(self, request_proto, response_proto, response_type,
-                 tree=None, block_store=None):
+                 database=None, block_store=None):
         self._request_proto = request_proto
         self._response_proto = response_proto
         self._response_type = response_type
@@ -99,7 +102,10 @@ class _ClientRequestHandler(Handler, metaclass=abc.ABCMeta):
         self._state_root_regex = re.compile('[0-9a-f]{64}')
         self._namespace_regex = re.compile('^([0-9a-f]{2}){0,35}$')
 
-        self._tree = tree
+        if database is not None:
+            self._state_trees = _StateTreePool(database)
+        else:
+            self._state_trees = None
         self._block_store = block_store
 
     def handle(self, connection_id, message_content):
@@ -201,20 +207,25 @@ class _ClientRequestHandler(Handler, metaclass=abc.ABCMeta):
         LOGGER.debug('Unable to get chain head from block store')
         raise _ResponseFailed(self._status.NOT_READY)
 
-    def _set_root(self, request):
-        """Sets the root of the merkle tree, returning any head id used.
+    def _get_state_tree(self, request):
+        """Fetches a merkle tree bound to the requested state root, or to the
+        state root of the chain head.
+
+        The tree is never re-rooted, so it may be read by several requests
+        at once.
 
         Note:
-            This method will fail if `_tree` has not been set
+            This method will fail if `_state_trees` has not been set
 
         Args:
             request (object): The parsed protobuf request object
 
         Returns:
-            str: the state root of the head block used to specify the root
+            str: the state root of the tree
+            MerkleDatabase: the tree bound to that state root
 
         Raises:
-            ResponseFailed: Failed to set the root if the merkle tree
+            ResponseFailed: Failed to find the root in the database
         """
         if request.state_root:
             root = request.state_root
@@ -223,12 +234,12 @@ class _ClientRequestHandler(Handler, metaclass=abc.ABCMeta):
             root = head.state_root_hash
 
         try:
-            self._tree.set_merkle_root(root)
+            tree = self._state_trees.get(root)
         except KeyError as e:
             LOGGER.debug('Unable to find root "%s" in database', e)
             raise _ResponseFailed(self._status.NO_ROOT)
 
-        return root
+        return root, tree
 
     def _list_store_resources(self, request, head_id, filter_ids,
                               resource_fetcher, block_xform):
@@ -337,6 +348,46 @@ class _ClientRequestHandler(Handler, metaclass=abc.ABCMeta):
             raise _ResponseFailed(self._status.INVALID_ADDRESS)
 
 
+class _StateTreePool:
+    """A pool of merkle trees, each bound to a single state root.
+
+    Since a pooled tree is never re-rooted, it may be shared by concurrent
+    requests for the same root. The least recently used trees are dropped
+    once the pool is full.
+
+    Args:
+        database (Database): The state database the trees are read from
+        size (int): The maximum number of trees to hold
+    """
+
+    def __init__(self, database, size=STATE_TREE_POOL_SIZE):
+        self._database = database
+        self._size = size
+        self._trees = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, state_root):
+        """Returns a tree bound to the given state root.
+
+        Raises:
+            KeyError: The state root is not in the database
+        """
+        with self._lock:
+            tree = self._trees.get(state_root)
+            if tree is not None:
+                self._trees.move_to_end(state_root)
+                return tree
+
+        tree = MerkleDatabase(self._database, state_root)
+
+        with self._lock:
+            self._trees[state_root] = tree
+            while len(self._trees) > self._size:
+                self._trees.popitem(last=False)
+
+        return tree
+
+
 class _Pager:
     """A static class containing methods to paginate lists of resources.
 
@@ -694,30 +745,29 @@ class StateListRequest(_ClientRequestHandler):
             client_state_pb2.ClientStateListRequest,
             client_state_pb2.ClientStateListResponse,
             validator_pb2.Message.CLIENT_STATE_LIST_RESPONSE,
-            tree=MerkleDatabase(database),
+            database=database,
             block_store=block_store)
 
     def _respond(self, request):
         if request.state_root != '':
             self._validate_state_root(request.state_root)
-        state_root = self._set_root(request)
+        state_root, tree = self._get_state_tree(request)
 
         # Fetch entries and encode as protobuf
         self._validate_namespace(request.address)
-        entries = [
-            client_state_pb2.ClientStateListResponse.Entry(address=a, data=v)
-            for a, v in self._tree.leaves(request.address or '')]
-
-        # Order entries, remove if tree.entries refactored to be ordered
-        entries.sort(key=lambda l: l.address)
-
         if self.is_reverse(request.sorting, self._status.INVALID_SORT):
+            entries = [
+                client_state_pb2.ClientStateListResponse.Entry(
+                    address=a, data=v)
+                for a, v in tree.leaves(request.address or '')]
             entries.reverse()
 
-        entries, paging = _Pager.paginate_resources(
-            request,
-            entries,
-            self._status.INVALID_PAGING)
+            entries, paging = _Pager.paginate_resources(
+                request,
+                entries,
+                self._status.INVALID_PAGING)
+        else:
+            entries, paging = self._paginate_leaves(request, tree)
 
         if not entries:
             return self._wrap_response(
@@ -730,6 +780,54 @@ class StateListRequest(_ClientRequestHandler):
             paging=paging,
             entries=entries)
 
+    def _paginate_leaves(self, request, tree):
+        """Fetches a single page of entries from the tree, in address order.
+
+        The leaves are read starting at the requested paging start address,
+        and reading stops one entry past the page, so the cost of a request
+        is proportional to its limit rather than the size of the namespace.
+
+        Args:
+            request (object): The parsed protobuf request object
+            tree (MerkleDatabase): The state tree to read the entries from
+
+        Returns:
+            list: The paginated list of entries
+            object: The ClientPagingResponse to be sent back to the client
+        """
+        paging = request.paging
+        limit = min(paging.limit, MAX_PAGE_SIZE) or DEFAULT_PAGE_SIZE
+        prefix = request.address or ''
+
+        entries = [
+            client_state_pb2.ClientStateListResponse.Entry(address=a, data=v)
+            for a, v in itertools.islice(
+                tree.leaves(prefix, start=paging.start or None),
+                limit + 1)]
+
+        if paging.start and (not entries
+                             or entries[0].address != paging.start):
+            # A start address which is not in the namespace is only valid
+            # if the namespace is empty
+            if next(tree.leaves(prefix), None) is None:
+                return [], client_list_control_pb2.ClientPagingResponse()
+            raise _ResponseFailed(self._status.INVALID_PAGING)
+
+        if not entries:
+            return entries, client_list_control_pb2.ClientPagingResponse()
+
+        if len(entries) > limit:
+            paging_response = client_list_control_pb2.ClientPagingResponse(
+                next=entries[limit].address,
+                start=entries[0].address,
+                limit=limit)
+        else:
+            paging_response = client_list_control_pb2.ClientPagingResponse(
+                start=entries[0].address,
+                limit=limit)
+
+        return entries[:limit], paging_response
+
     @staticmethod
     def is_reverse(sorting, fail_status):
         if not sorting:
@@ -747,18 +845,18 @@ class StateGetRequest(_ClientRequestHandler):
             client_state_pb2.ClientStateGetRequest,
             client_state_pb2.ClientStateGetResponse,
             validator_pb2.Message.CLIENT_STATE_GET_RESPONSE,
-            tree=MerkleDatabase(database),
+            database=database,
             block_store=block_store)
 
     def _respond(self, request):
         if request.state_root != '':
             self._validate_state_root(request.state_root)
-        state_root = self._set_root(request)
+        state_root, tree = self._get_state_tree(request)
 
         # Fetch leaf value
         self._validate_namespace(request.address)
         try:
-            value = self._tree.get(request.address)
+            value = tree.get(request.address)
         except KeyError:
             LOGGER.debug('Unable to find entry at address %s', request.address)
             return self._status.NO_RESOURCE
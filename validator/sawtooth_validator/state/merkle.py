@@ -13,6 +13,7 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+from collections import deque
 import ctypes
 from enum import IntEnum
 
@@ -24,6 +25,9 @@ from sawtooth_validator import ffi
 # This is included for legacy reasons.
 INIT_ROOT_KEY = ''
 
+# The number of leaves returned by each call to the native leaf iterator.
+LEAF_CHUNK_SIZE = 256
+
 
 def _decode(encoded):
     return cbor.loads(encoded)
@@ -113,6 +117,41 @@ class MerkleDatabase(ffi.OwnedPointer):
         return _decode(ffi.from_rust_vec(
             vec_ptr, vec_len, vec_cap))
 
+    def get_many(self, addresses):
+        """Returns the values at several addresses, read with a single call
+        to the native library.
+
+        Args:
+            addresses (list of str): the addresses to read
+
+        Returns:
+            (list): (address, value) tuples, in the order of the given
+                addresses, where value is None if the address is not in the
+                tree
+        """
+        if not addresses:
+            return []
+
+        c_addresses = (ctypes.c_char_p * len(addresses))()
+        for (i, address) in enumerate(addresses):
+            c_addresses[i] = ctypes.c_char_p(address.encode())
+
+        (vec_ptr, vec_len, vec_cap) = ffi.prepare_vec_result()
+        _libexec(
+            'merkle_db_get_many',
+            self.pointer,
+            c_addresses,
+            ctypes.c_size_t(len(addresses)),
+            ctypes.byref(vec_ptr),
+            ctypes.byref(vec_len),
+            ctypes.byref(vec_cap))
+
+        return [
+            (address, _decode(data) if data is not None else None)
+            for address, data in cbor.loads(
+                ffi.from_rust_vec(vec_ptr, vec_len, vec_cap))
+        ]
+
     def __setitem__(self, address, value):
         return self.set(address, value)
 
@@ -196,11 +235,18 @@ class MerkleDatabase(ffi.OwnedPointer):
 
         return addresses
 
-    def leaves(self, prefix=None):
-        """Returns an iterator which returns tuples of (address, data) values
+    def leaves(self, prefix=None, start=None):
+        """Returns an iterator which returns tuples of (address, data) values,
+        ordered by address.
+
+        Args:
+            prefix (str): only leaves whose addresses begin with this prefix
+                are returned
+            start (str, optional): leaves whose addresses sort before this
+                address are skipped, without reading them from the database
         """
         try:
-            return _LeafIterator(self.pointer, prefix)
+            return _LeafIterator(self.pointer, prefix, start)
         except KeyError:
             # The prefix doesn't exist
             return iter([])
@@ -236,16 +282,19 @@ def _libexec(name, *args):
 
 
 class _LeafIterator:
-    def __init__(self, merkle_db_ptr, prefix=None):
+    def __init__(self, merkle_db_ptr, prefix=None, start=None):
         if prefix is None:
             prefix = ''
 
         c_prefix = ctypes.c_char_p(prefix.encode())
+        c_start = ctypes.c_char_p(start.encode() if start else None)
 
         self._c_iter_ptr = ctypes.c_void_p()
+        self._chunk = deque()
 
         _libexec('merkle_db_leaf_iterator_new',
-                 merkle_db_ptr, c_prefix, ctypes.byref(self._c_iter_ptr))
+                 merkle_db_ptr, c_prefix, c_start,
+                 ctypes.byref(self._c_iter_ptr))
 
     def __del__(self):
         if self._c_iter_ptr:
@@ -256,27 +305,30 @@ class _LeafIterator:
         return self
 
     def __next__(self):
+        if not self._chunk:
+            self._chunk = self._next_chunk()
+
+        address, data = self._chunk.popleft()
+        return (address, _decode(data))
+
+    def _next_chunk(self):
+        """Fetches the next LEAF_CHUNK_SIZE entries from the native iterator
+        in a single call.
+        """
         if not self._c_iter_ptr:
             raise StopIteration()
 
-        (string_ptr, string_len, string_cap) = ffi.prepare_string_result()
         (vec_ptr, vec_len, vec_cap) = ffi.prepare_vec_result()
 
         _libexec(
-            'merkle_db_leaf_iterator_next',
+            'merkle_db_leaf_iterator_next_chunk',
             self._c_iter_ptr,
-            ctypes.byref(string_ptr),
-            ctypes.byref(string_len),
-            ctypes.byref(string_cap),
+            ctypes.c_size_t(LEAF_CHUNK_SIZE),
             ctypes.byref(vec_ptr),
             ctypes.byref(vec_len),
             ctypes.byref(vec_cap))
 
-        address = ffi.from_rust_string(
-            string_ptr, string_len, string_cap).decode()
-        value = _decode(ffi.from_rust_vec(vec_ptr, vec_len, vec_cap))
-
-        return (address, value)
+        return deque(cbor.loads(ffi.from_rust_vec(vec_ptr, vec_len, vec_cap)))
 
 
 class _Entry(ctypes.Structure):
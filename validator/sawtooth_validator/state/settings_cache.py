@@ -19,6 +19,8 @@ from sawtooth_validator.journal.event_extractors import \
 from sawtooth_validator.journal.event_extractors import \
     ReceiptEventExtractor
 from sawtooth_validator.server.events.subscription import EventSubscription
+from sawtooth_validator.state.state_root_cache import DEFAULT_MAX_ROOTS
+from sawtooth_validator.state.state_root_cache import StateRootCache
 
 
 class SettingsObserver(ChainObserver):
@@ -76,10 +78,26 @@ class SettingsObserver(ChainObserver):
 
 
 class SettingsCache():
-    def __init__(self, settings_view_factory):
+    """Caches settings for the chain head, and, for any state root, the
+    settings read at that state root.
+
+    Settings looked up for the chain head are kept until the SettingsObserver
+    reports they have changed, or that the chain has forked. Settings read
+    from state are also kept by state root for the most recently used state
+    roots, so that after a fork, looking up settings at a state root which
+    has been seen recently does not read state again.
+
+    Args:
+        settings_view_factory (SettingsViewFactory): creates the views of
+            state that settings are read from
+        max_roots (int): the most state roots to keep settings for
+    """
+
+    def __init__(self, settings_view_factory, max_roots=DEFAULT_MAX_ROOTS):
         self._settings_view_factory = settings_view_factory
-        self._settings_view = None
         self._cache = {}
+        self._state_roots = StateRootCache(
+            settings_view_factory.create_settings_view, max_roots=max_roots)
 
     def __len__(self):
         return len(self._cache)
@@ -96,14 +114,11 @@ class SettingsCache():
     def get_setting(self, key, state_root, from_state=False,
                     default_value=None):
         if from_state:
-            self.update_view(state_root)
-            value = self._settings_view.get_setting(key)
-            return value
+            return self._read_setting(key, state_root)
 
         value = self._cache.get(key)
         if value is None:
-            self.update_view(state_root)
-            value = self._settings_view.get_setting(key)
+            value = self._read_setting(key, state_root)
             self._cache[key] = value
         if value is None:
             return default_value
@@ -116,6 +131,6 @@ class SettingsCache():
         if item in self._cache:
             del self._cache[item]
 
-    def update_view(self, state_root):
-        self._settings_view = \
-            self._settings_view_factory.create_settings_view(state_root)
+    def _read_setting(self, key, state_root):
+        return self._state_roots.get(
+            key, state_root, lambda view: view.get_setting(key))
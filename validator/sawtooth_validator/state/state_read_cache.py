@@ -0,0 +1,99 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+from collections import OrderedDict
+from threading import Lock
+
+from sawtooth_validator import metrics
+
+
+COLLECTOR = metrics.get_collector(__name__)
+
+DEFAULT_CACHE_SIZE = 16384
+
+
+class StateReadCache:
+    """A least-recently-used cache of state values, keyed by state root and
+    address.
+
+    A state root identifies an immutable snapshot of state, so entries are
+    never invalidated; they are only evicted to bound the size of the cache.
+    Addresses which are not present in state are cached as well, with a value
+    of None.
+
+    Accesses are thread safe.
+
+    Args:
+        size (int): the maximum number of entries to hold
+    """
+
+    def __init__(self, size=DEFAULT_CACHE_SIZE):
+        self._lock = Lock()
+        self._cache = OrderedDict()
+        self._size = size
+
+        self._hit_count = COLLECTOR.counter('hit_count', instance=self)
+        self._miss_count = COLLECTOR.counter('miss_count', instance=self)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._cache)
+
+    def get_many(self, state_root, addresses, read_many):
+        """Returns the values at the given addresses under a state root,
+        reading any addresses that are not cached with `read_many`.
+
+        Args:
+            state_root (str): the state root to read under
+            addresses (list of str): the addresses to read
+            read_many (function): reads the values of the addresses that were
+                not in the cache
+                Expected args:
+                    addresses (list of str): the addresses to read
+                Expected return:
+                    list: (address, value) tuples, where value is None for
+                        addresses which are not in state
+
+        Returns:
+            list: (address, value) tuples, in the order of the given
+                addresses, where value is None for addresses which are not in
+                state
+        """
+        values = {}
+        misses = []
+        with self._lock:
+            for address in addresses:
+                key = (state_root, address)
+                try:
+                    values[address] = self._cache[key]
+                except KeyError:
+                    misses.append(address)
+                else:
+                    self._cache.move_to_end(key)
+
+        self._hit_count.inc(len(addresses) - len(misses))
+
+        if misses:
+            self._miss_count.inc(len(misses))
+
+            read_values = read_many(misses)
+            values.update(read_values)
+            with self._lock:
+                for address, value in read_values:
+                    self._cache[(state_root, address)] = value
+                while len(self._cache) > self._size:
+                    self._cache.popitem(last=False)
+
+        return [(address, values[address]) for address in addresses]
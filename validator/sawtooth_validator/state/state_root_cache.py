@@ -0,0 +1,98 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+from collections import OrderedDict
+from threading import Lock
+
+
+DEFAULT_MAX_ROOTS = 64
+
+_MISSING = object()
+
+
+class _Root:
+    __slots__ = ['view', 'values']
+
+    def __init__(self):
+        self.view = None
+        self.values = {}
+
+
+class StateRootCache:
+    """Values read from state, kept by key and state root for the most
+    recently used state roots.
+
+    The state under a state root never changes, so a value read at a state
+    root never goes stale, and the values of the heads of several forks can
+    be kept side by side; moving between forks whose state roots are still
+    kept does not read the Merkle trie again. The least recently used state
+    root is dropped once more than max_roots are kept.
+
+    Args:
+        create_view (function): returns a view of the state under a state
+            root, to read values from
+        max_roots (int): the most state roots to keep values for
+    """
+
+    def __init__(self, create_view, max_roots=DEFAULT_MAX_ROOTS):
+        self._create_view = create_view
+        self._max_roots = max_roots
+
+        # state root -> _Root, least recently used first
+        self._roots = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._roots)
+
+    def __contains__(self, state_root):
+        return state_root in self._roots
+
+    def get(self, key, state_root, read):
+        """Returns the value of a key at a state root, reading it from a view
+        of the state with read(view) if it is not kept.
+
+        Args:
+            key (hashable): the key of the value
+            state_root (str): the state root to read the value at
+            read (function): reads the value from a view of the state
+
+        Returns:
+            object: the value
+        """
+        with self._lock:
+            root = self._roots.get(state_root)
+            if root is None:
+                root = _Root()
+                self._roots[state_root] = root
+                if len(self._roots) > self._max_roots:
+                    self._roots.popitem(last=False)
+            else:
+                self._roots.move_to_end(state_root)
+
+            value = root.values.get(key, _MISSING)
+            view = root.view
+
+        if value is not _MISSING:
+            return value
+
+        if view is None:
+            view = self._create_view(state_root)
+            root.view = view
+
+        value = read(view)
+        with self._lock:
+            root.values[key] = value
+        return value
@@ -27,14 +27,18 @@ class StateViewFactory:
     database, these views are considered immutable.
     """
 
-    def __init__(self, database):
+    def __init__(self, database, state_read_cache=None):
         """Initializes the factory with a given database.
 
         Args:
             database (:obj:`Database`): the database containing the merkle
                 tree.
+            state_read_cache (:obj:`StateReadCache`, optional): a cache of
+                state values, shared by the views, consulted before reading
+                from the merkle tree.
         """
         self._database = database
+        self._state_read_cache = state_read_cache
 
     def create_view(self, state_root_hash=None):
         """Creates a StateView for the given state root hash.
@@ -53,7 +57,12 @@ class StateViewFactory:
         merkle_db = MerkleDatabase(self._database,
                                    merkle_root=state_root_hash)
 
-        return StateView(merkle_db)
+        if state_root_hash == INIT_ROOT_KEY:
+            return StateView(merkle_db)
+
+        return StateView(merkle_db,
+                         state_root_hash=state_root_hash,
+                         state_read_cache=self._state_read_cache)
 
 
 class NativeStateViewFactory(ffi.OwnedPointer):
@@ -76,20 +85,37 @@ class StateView:
     immutable snapshot.
     """
 
-    def __init__(self, tree):
+    def __init__(self, tree, state_root_hash=None, state_read_cache=None):
         """Creates a StateView with a given merkle tree.
 
         Args:
             tree (:obj:`MerkleDatabase`): the merkle tree for this view
+            state_root_hash (str, optional): the state root of the tree,
+                required if a state_read_cache is given
+            state_read_cache (:obj:`StateReadCache`, optional): a cache of
+                state values consulted before reading from the tree
         """
         self._tree = tree
+        self._state_root_hash = state_root_hash
+        self._state_read_cache = state_read_cache
 
     def get(self, address):
         """
         Returns:
             bytes the state entry at the given address
+
+        Raises:
+            KeyError: if there is no state entry at the given address
         """
-        return self._tree.get(address)
+        if self._state_read_cache is None:
+            return self._tree.get(address)
+
+        [(_, value)] = self._state_read_cache.get_many(
+            self._state_root_hash, [address], self._tree.get_many)
+        if value is None:
+            raise KeyError('Value was not found')
+
+        return value
 
     def addresses(self):
         """
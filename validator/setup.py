@@ -66,4 +66,9 @@ setup(
         "pyformance"
     ],
     data_files=data_files,
-    entry_points={})
+    entry_points={
+        'console_scripts': [
+            'sawtooth-receipt-migrate = '
+            'sawtooth_validator.journal.receipt_migration:main'
+        ]
+    })
@@ -769,7 +769,7 @@ impl<TEP: ExecutionPlatform + Clone + 'static, PV: PermissionVerifier + Clone +
                                 .map(TransactionReceipt::from)
                                 .collect();
                             for observer in &mut state.observers {
-                                observer.chain_update(&block, receipts.as_slice());
+                                observer.chain_update(blk, receipts.as_slice());
                             }
                         }
                         None => {
@@ -15,6 +15,7 @@
  * ------------------------------------------------------------------------------
  */
 
+use std::cmp;
 use std::collections::BTreeMap;
 use std::collections::HashMap;
 use std::collections::HashSet;
@@ -381,6 +382,63 @@ impl MerkleDatabase {
         Ok(())
     }
 
+    /// Returns the data for each of the given addresses, in the order given.
+    ///
+    /// Nodes on paths shared by several of the addresses are only read from
+    /// the database once.  Addresses which are not in the tree, or which have
+    /// no data, are returned with a value of None.
+    pub fn get_many(
+        &self,
+        addresses: &[&str],
+    ) -> Result<Vec<(String, Option<Vec<u8>>)>, StateDatabaseError> {
+        let mut path_cache = HashMap::new();
+        addresses
+            .iter()
+            .map(|address| {
+                let value = self.get_value_with_cache(address, &mut path_cache)?;
+                Ok((address.to_string(), value))
+            })
+            .collect()
+    }
+
+    fn get_value_with_cache(
+        &self,
+        address: &str,
+        path_cache: &mut HashMap<String, Node>,
+    ) -> Result<Option<Vec<u8>>, StateDatabaseError> {
+        let tokens = tokenize_address(address);
+
+        let mut path = String::with_capacity(address.len());
+        for token in tokens.iter() {
+            let mut child_path = path.clone();
+            child_path.push_str(token);
+
+            if !path_cache.contains_key(&child_path) {
+                let child_hash = {
+                    let node = if path.is_empty() {
+                        &self.root_node
+                    } else {
+                        &path_cache[&path]
+                    };
+                    match node.children.get(*token) {
+                        Some(child_hash) => child_hash.clone(),
+                        None => return Ok(None),
+                    }
+                };
+                let child = get_node_by_hash(&self.db, &child_hash)?;
+                path_cache.insert(child_path.clone(), child);
+            }
+
+            path = child_path;
+        }
+
+        Ok(if path.is_empty() {
+            self.root_node.value.clone()
+        } else {
+            path_cache[&path].value.clone()
+        })
+    }
+
     fn get_by_address(&self, address: &str) -> Result<Node, StateDatabaseError> {
         let tokens = tokenize_address(address);
 
@@ -460,26 +518,80 @@ impl StateReader for MerkleDatabase {
     }
 
     fn leaves(&self, prefix: Option<&str>) -> Result<Box<StateIter>, StateDatabaseError> {
-        Ok(Box::new(MerkleLeafIterator::new(self.clone(), prefix)?))
+        Ok(Box::new(MerkleLeafIterator::new(
+            self.clone(),
+            prefix,
+            None,
+        )?))
     }
 }
 
+impl MerkleDatabase {
+    /// Returns an iterator over the leaves under the given prefix, in address
+    /// order, beginning with the first leaf whose address is not less than
+    /// `start`.
+    ///
+    /// Subtrees that sort entirely before `start` are never read, so the cost
+    /// of seeking is proportional to the depth of the trie, rather than the
+    /// number of leaves skipped.
+    pub fn leaves_from(
+        &self,
+        prefix: Option<&str>,
+        start: Option<&str>,
+    ) -> Result<MerkleLeafIterator, StateDatabaseError> {
+        MerkleLeafIterator::new(self.clone(), prefix, start)
+    }
+}
+
+/// A node waiting to be visited by a MerkleLeafIterator.  Child nodes are only
+/// read from the database once they are reached, so that an iterator which is
+/// dropped early does not pay for the siblings it never visits.
+enum PendingNode {
+    Loaded(Node),
+    Unloaded(String),
+}
+
 /// A MerkleLeafIterator is fixed to iterate over the state address/value pairs
 /// the merkle root hash at the time of its creation.
+///
+/// Leaves are returned in address order.
 pub struct MerkleLeafIterator {
     merkle_db: MerkleDatabase,
-    visited: VecDeque<(String, Node)>,
+    visited: VecDeque<(String, PendingNode)>,
+    start: Option<String>,
 }
 
 impl MerkleLeafIterator {
-    fn new(merkle_db: MerkleDatabase, prefix: Option<&str>) -> Result<Self, StateDatabaseError> {
+    fn new(
+        merkle_db: MerkleDatabase,
+        prefix: Option<&str>,
+        start: Option<&str>,
+    ) -> Result<Self, StateDatabaseError> {
         let path = prefix.unwrap_or("");
 
         let mut visited = VecDeque::new();
         let initial_node = merkle_db.get_by_address(path)?;
-        visited.push_front((path.to_string(), initial_node));
+        visited.push_front((path.to_string(), PendingNode::Loaded(initial_node)));
 
-        Ok(MerkleLeafIterator { merkle_db, visited })
+        Ok(MerkleLeafIterator {
+            merkle_db,
+            visited,
+            start: start.map(String::from),
+        })
+    }
+
+    /// Returns true if every address under the given path sorts before the
+    /// start address of this iterator.
+    fn precedes_start(&self, path: &str) -> bool {
+        match self.start {
+            Some(ref start) => {
+                // Compare as bytes, as the start address is caller-provided,
+                // and may not be valid to slice as a str.
+                let len = cmp::min(path.len(), start.len());
+                path.as_bytes()[..len] < start.as_bytes()[..len]
+            }
+            None => false,
+        }
     }
 }
 
@@ -487,31 +599,42 @@ impl Iterator for MerkleLeafIterator {
     type Item = Result<(String, Vec<u8>), StateDatabaseError>;
 
     fn next(&mut self) -> Option<Self::Item> {
-        if self.visited.is_empty() {
-            return None;
-        }
+        while let Some((path, pending_node)) = self.visited.pop_front() {
+            let node = match pending_node {
+                PendingNode::Loaded(node) => node,
+                PendingNode::Unloaded(hash_key) => {
+                    match get_node_by_hash(&self.merkle_db.db, &hash_key) {
+                        Ok(node) => node,
+                        Err(err) => return Some(Err(err)),
+                    }
+                }
+            };
 
-        loop {
-            if let Some((path, node)) = self.visited.pop_front() {
-                if node.value.is_some() {
-                    return Some(Ok((path, node.value.unwrap())));
+            if let Some(value) = node.value {
+                if self.precedes_start(&path) {
+                    continue;
                 }
+                return Some(Ok((path, value)));
+            }
 
-                // Reverse the list, such that we have an in-order traversal of the
-                // children, based on the natural path order.
-                for (child_path, hash_key) in node.children.iter().rev() {
-                    let child = match get_node_by_hash(&self.merkle_db.db, hash_key) {
-                        Ok(node) => node,
-                        Err(err) => return Some(Err(err)),
-                    };
-                    let mut child_address = path.clone();
-                    child_address.push_str(child_path);
-                    self.visited.push_front((child_address, child));
+            // Reverse the list, such that we have an in-order traversal of the
+            // children, based on the natural path order.
+            for (child_path, hash_key) in node.children.iter().rev() {
+                let mut child_address = path.clone();
+                child_address.push_str(child_path);
+
+                // The remaining children all sort before this one, so none of
+                // them can contain the start address either.
+                if self.precedes_start(&child_address) {
+                    break;
                 }
-            } else {
-                return None;
+
+                self.visited
+                    .push_front((child_address, PendingNode::Unloaded(hash_key.clone())));
             }
         }
+
+        None
     }
 }
 
@@ -1422,6 +1545,77 @@ mod tests {
         })
     }
 
+    #[test]
+    fn leaf_iteration_from_start() {
+        run_test(|merkle_path| {
+            let mut merkle_db = make_db(merkle_path);
+
+            let addresses = vec!["ab0000", "aba001", "abff02", "cd0003"];
+            for (i, key) in addresses.iter().enumerate() {
+                let new_root = merkle_db
+                    .set(key, format!("{:04x}", i * 10).as_bytes())
+                    .unwrap();
+                merkle_db.set_merkle_root(new_root).unwrap();
+            }
+
+            // start at an existing address
+            let mut leaf_iter = merkle_db.leaves_from(None, Some("aba001")).unwrap();
+            assert_eq!(
+                ("aba001".into(), "000a".as_bytes().to_vec()),
+                leaf_iter.next().unwrap().unwrap()
+            );
+            assert_eq!(
+                ("abff02".into(), "0014".as_bytes().to_vec()),
+                leaf_iter.next().unwrap().unwrap()
+            );
+            assert_eq!(
+                ("cd0003".into(), "001e".as_bytes().to_vec()),
+                leaf_iter.next().unwrap().unwrap()
+            );
+            assert!(leaf_iter.next().is_none(), "Iterator should be Exhausted");
+
+            // start between addresses, within a prefix
+            let mut leaf_iter = merkle_db.leaves_from(Some("ab"), Some("aba002")).unwrap();
+            assert_eq!(
+                ("abff02".into(), "0014".as_bytes().to_vec()),
+                leaf_iter.next().unwrap().unwrap()
+            );
+            assert!(leaf_iter.next().is_none(), "Iterator should be Exhausted");
+
+            // start after all addresses
+            let mut leaf_iter = merkle_db.leaves_from(None, Some("ff")).unwrap();
+            assert!(leaf_iter.next().is_none(), "Iterator should be Exhausted");
+        })
+    }
+
+    #[test]
+    fn get_many() {
+        run_test(|merkle_path| {
+            let mut merkle_db = make_db(merkle_path);
+
+            let addresses = vec!["ab0000", "aba001", "abff02"];
+            for (i, key) in addresses.iter().enumerate() {
+                let new_root = merkle_db
+                    .set(key, format!("{:04x}", i * 10).as_bytes())
+                    .unwrap();
+                merkle_db.set_merkle_root(new_root).unwrap();
+            }
+
+            let values = merkle_db
+                .get_many(&["abff02", "ab0001", "ab0000", "ff"])
+                .unwrap();
+            assert_eq!(
+                vec![
+                    ("abff02".into(), Some("0014".as_bytes().to_vec())),
+                    ("ab0001".into(), None),
+                    ("ab0000".into(), Some("0000".as_bytes().to_vec())),
+                    ("ff".into(), None),
+                ],
+                values
+            );
+        })
+    }
+
     fn run_test<T>(test: T) -> ()
     where
         T: FnOnce(&str) -> () + panic::UnwindSafe,
@@ -14,6 +14,8 @@
  * limitations under the License.
  * ------------------------------------------------------------------------------
  */
+use cbor::encoder::GenericEncoder;
+use cbor::value::{Bytes, Text, Value};
 use database::lmdb::LmdbDatabase;
 use state::error::StateDatabaseError;
 use state::merkle::*;
@@ -21,6 +23,7 @@ use state::merkle::*;
 use state::StateReader;
 use std::collections::HashMap;
 use std::ffi::CStr;
+use std::io::Cursor;
 use std::mem;
 use std::os::raw::{c_char, c_void};
 use std::slice;
@@ -245,6 +248,69 @@ pub unsafe extern "C" fn merkle_db_get(
     }
 }
 
+#[no_mangle]
+/// Reads the values at several addresses in one call.  The result is a CBOR
+/// encoded array of `[address, data]` pairs, in the order of the given
+/// addresses, where data is null for any address that is not in the tree.
+pub unsafe extern "C" fn merkle_db_get_many(
+    merkle_db: *mut c_void,
+    addresses: *const *const c_char,
+    addresses_len: usize,
+    bytes: *mut *const u8,
+    bytes_len: *mut usize,
+    bytes_cap: *mut usize,
+) -> ErrorCode {
+    if merkle_db.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    if addresses_len > 0 && addresses.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    let addresses: Result<Vec<&str>, ErrorCode> = if addresses_len > 0 {
+        slice::from_raw_parts(addresses, addresses_len)
+            .iter()
+            .map(|c_str| {
+                CStr::from_ptr(*c_str)
+                    .to_str()
+                    .map_err(|_| ErrorCode::InvalidAddress)
+            })
+            .collect()
+    } else {
+        Ok(Vec::with_capacity(0))
+    };
+
+    let addresses = match addresses {
+        Ok(addresses) => addresses,
+        Err(err) => return err,
+    };
+
+    match (*(merkle_db as *mut MerkleDatabase))
+        .get_many(&addresses)
+        .and_then(encode_entries)
+    {
+        Ok(data_vec) => {
+            *bytes_cap = data_vec.capacity();
+            *bytes_len = data_vec.len();
+            *bytes = data_vec.as_slice().as_ptr();
+
+            // It will be up to the callee to cleanup this memory
+            mem::forget(data_vec);
+
+            ErrorCode::Success
+        }
+        Err(StateDatabaseError::DatabaseError(err)) => {
+            error!("A Database Error occurred: {}", err);
+            ErrorCode::DatabaseError
+        }
+        Err(err) => {
+            error!("Unknown Error!: {:?}", err);
+            ErrorCode::Unknown
+        }
+    }
+}
+
 #[no_mangle]
 pub unsafe extern "C" fn merkle_db_set(
     merkle_db: *mut c_void,
@@ -487,9 +553,12 @@ pub unsafe extern "C" fn merkle_db_prune(
 }
 
 #[no_mangle]
+/// Creates an address-ordered leaf iterator.  The start address may be null,
+/// in which case iteration begins at the first leaf under the prefix.
 pub unsafe extern "C" fn merkle_db_leaf_iterator_new(
     merkle_db: *mut c_void,
     prefix: *const c_char,
+    start: *const c_char,
     iterator: *mut *const c_void,
 ) -> ErrorCode {
     if merkle_db.is_null() {
@@ -505,9 +574,18 @@ pub unsafe extern "C" fn merkle_db_leaf_iterator_new(
         Err(_) => return ErrorCode::InvalidAddress,
     };
 
-    match (*(merkle_db as *mut MerkleDatabase)).leaves(Some(prefix)) {
+    let start = if start.is_null() {
+        None
+    } else {
+        match CStr::from_ptr(start).to_str() {
+            Ok(s) => Some(s),
+            Err(_) => return ErrorCode::InvalidAddress,
+        }
+    };
+
+    match (*(merkle_db as *mut MerkleDatabase)).leaves_from(Some(prefix), start) {
         Ok(leaf_iterator) => {
-            *iterator = Box::into_raw(leaf_iterator) as *const c_void;
+            *iterator = Box::into_raw(Box::new(leaf_iterator)) as *const c_void;
 
             ErrorCode::Success
         }
@@ -573,3 +651,74 @@ pub unsafe extern "C" fn merkle_db_leaf_iterator_next(
         }
     }
 }
+
+#[no_mangle]
+/// Returns up to `max_entries` leaves from the iterator in a single CBOR
+/// encoded array of `[address, data]` pairs.  Returns StopIteration once the
+/// iterator has been exhausted.
+pub unsafe extern "C" fn merkle_db_leaf_iterator_next_chunk(
+    iterator: *mut c_void,
+    max_entries: usize,
+    bytes: *mut *const u8,
+    bytes_len: *mut usize,
+    bytes_cap: *mut usize,
+) -> ErrorCode {
+    if iterator.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    let leaf_iterator = &mut *(iterator as *mut MerkleLeafIterator);
+    let entries: Result<Vec<(String, Option<Vec<u8>>)>, StateDatabaseError> = leaf_iterator
+        .take(max_entries)
+        .map(|entry| entry.map(|(address, data)| (address, Some(data))))
+        .collect();
+
+    match entries.and_then(|entries| {
+        if entries.is_empty() {
+            Ok(None)
+        } else {
+            encode_entries(entries).map(Some)
+        }
+    }) {
+        Ok(Some(data_vec)) => {
+            *bytes_cap = data_vec.capacity();
+            *bytes_len = data_vec.len();
+            *bytes = data_vec.as_slice().as_ptr();
+
+            mem::forget(data_vec);
+
+            ErrorCode::Success
+        }
+        Ok(None) => ErrorCode::StopIteration,
+        Err(StateDatabaseError::DatabaseError(err)) => {
+            error!("A Database Error occurred: {}", err);
+            ErrorCode::DatabaseError
+        }
+        Err(err) => {
+            error!("Unknown Error!: {:?}", err);
+            ErrorCode::Unknown
+        }
+    }
+}
+
+/// Encodes address/data pairs as a CBOR array of `[address, data]` arrays, so
+/// that many entries may be returned in one contiguous buffer.
+fn encode_entries(entries: Vec<(String, Option<Vec<u8>>)>) -> Result<Vec<u8>, StateDatabaseError> {
+    let values = entries
+        .into_iter()
+        .map(|(address, data)| {
+            Value::Array(vec![
+                Value::Text(Text::Text(address)),
+                match data {
+                    Some(bytes) => Value::Bytes(Bytes::Bytes(bytes)),
+                    None => Value::Null,
+                },
+            ])
+        })
+        .collect();
+
+    let mut e = GenericEncoder::new(Cursor::new(Vec::new()));
+    e.value(&Value::Array(values))?;
+
+    Ok(e.into_inner().into_writer().into_inner())
+}
@@ -43,6 +43,9 @@ class MockNetwork():
     def update_connection_public_key(self, connection_id, public_key):
         pass
 
+    def negotiate_compression(self, connection_id, offered_codecs):
+        return ''
+
     def send_connect_request(self, connection_id):
         pass
 
@@ -0,0 +1,162 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+from threading import Barrier
+from threading import Lock
+from threading import Thread
+import unittest
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import sawtooth_validator.state.client_handlers as handlers
+from sawtooth_validator.protobuf import client_state_pb2
+
+
+ROOTS = [format(i, 'x').zfill(64) for i in range(40)]
+
+
+class MockMerkleDatabase:
+    """Stands in for a MerkleDatabase, recording each tree created and
+    refusing roots which are not in ROOTS.
+    """
+
+    created = []
+    _lock = Lock()
+
+    def __init__(self, database, merkle_root=None):
+        if merkle_root not in ROOTS:
+            raise KeyError(merkle_root)
+        self.database = database
+        self.merkle_root = merkle_root
+        with MockMerkleDatabase._lock:
+            MockMerkleDatabase.created.append(merkle_root)
+
+
+@patch.object(handlers, 'MerkleDatabase', MockMerkleDatabase)
+class TestStateTreePool(unittest.TestCase):
+    def setUp(self):
+        MockMerkleDatabase.created = []
+        self._database = object()
+
+    def test_hit_and_miss(self):
+        """Tests that a tree is created for a root on the first request for
+        it, and the same tree is returned for later requests.
+        """
+        pool = handlers._StateTreePool(self._database)
+
+        tree = pool.get(ROOTS[0])
+        self.assertEqual(ROOTS[0], tree.merkle_root)
+        self.assertIs(self._database, tree.database)
+        self.assertIs(tree, pool.get(ROOTS[0]))
+
+        other_tree = pool.get(ROOTS[1])
+        self.assertEqual(ROOTS[1], other_tree.merkle_root)
+        self.assertIsNot(tree, other_tree)
+
+        self.assertEqual([ROOTS[0], ROOTS[1]], MockMerkleDatabase.created)
+
+    def test_missing_root(self):
+        """Tests that a root which is not in the database raises a KeyError,
+        and is not kept in the pool.
+        """
+        pool = handlers._StateTreePool(self._database)
+
+        with self.assertRaises(KeyError):
+            pool.get('f' * 64)
+        with self.assertRaises(KeyError):
+            pool.get('f' * 64)
+
+        self.assertEqual([], MockMerkleDatabase.created)
+
+    def test_eviction(self):
+        """Tests that the pool holds at most STATE_TREE_POOL_SIZE trees, and
+        drops the least recently used one first.
+        """
+        size = handlers.STATE_TREE_POOL_SIZE
+        pool = handlers._StateTreePool(self._database)
+
+        first_tree = pool.get(ROOTS[0])
+        for root in ROOTS[1:size]:
+            pool.get(root)
+
+        # Using the first tree makes the second root the least recently used
+        self.assertIs(first_tree, pool.get(ROOTS[0]))
+        pool.get(ROOTS[size])
+        self.assertEqual(size + 1, len(MockMerkleDatabase.created))
+
+        self.assertIs(first_tree, pool.get(ROOTS[0]))
+        for root in ROOTS[2:size + 1]:
+            pool.get(root)
+        self.assertEqual(size + 1, len(MockMerkleDatabase.created))
+
+        pool.get(ROOTS[1])
+        self.assertEqual(size + 2, len(MockMerkleDatabase.created))
+        self.assertEqual(ROOTS[1], MockMerkleDatabase.created[-1])
+
+    def test_concurrent_roots(self):
+        """Tests that concurrent requests for different roots are each given
+        a tree bound to their own root, and that requests for the same root
+        share its tree.
+        """
+        pool = handlers._StateTreePool(self._database)
+        roots = ROOTS[:8]
+        requests_per_root = 4
+        start = Barrier(len(roots) * requests_per_root)
+        results = {root: [] for root in roots}
+
+        def request(root):
+            start.wait()
+            for _ in range(100):
+                results[root].append(pool.get(root))
+
+        threads = [
+            Thread(target=request, args=(root,))
+            for root in roots
+            for _ in range(requests_per_root)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for root in roots:
+            trees = results[root]
+            self.assertEqual(100 * requests_per_root, len(trees))
+            self.assertTrue(all(t.merkle_root == root for t in trees))
+
+        final_trees = {root: pool.get(root) for root in roots}
+        for root in roots:
+            self.assertIs(final_trees[root], results[root][-1])
+
+    def test_handler_pool(self):
+        """Tests that a state handler created with a database reads through
+        its own pool of trees, and one created without has no pool.
+        """
+        store = Mock(chain_head=Mock(state_root_hash=ROOTS[3]))
+
+        handler = handlers.StateGetRequest(self._database, store)
+        request = client_state_pb2.ClientStateGetRequest()
+
+        root, tree = handler._get_state_tree(request)
+        self.assertEqual(ROOTS[3], root)
+        self.assertIs(self._database, tree.database)
+        self.assertIs(tree, handler._get_state_tree(request)[1])
+
+        request.state_root = 'f' * 64
+        with self.assertRaises(handlers._ResponseFailed):
+            handler._get_state_tree(request)
+
+        self.assertIsNone(
+            handlers.StateGetRequest(None, store)._state_trees)
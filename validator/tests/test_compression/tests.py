@@ -0,0 +1,139 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import os
+import unittest
+import zlib
+
+from sawtooth_validator.networking.compression import CompressionError
+from sawtooth_validator.networking.compression import MAX_DECOMPRESSED_SIZE
+from sawtooth_validator.networking.compression import PayloadCompressor
+from sawtooth_validator.networking.compression import ZLIB
+from sawtooth_validator.protobuf import validator_pb2
+
+
+GOSSIP_MESSAGE = validator_pb2.Message.GOSSIP_MESSAGE
+
+
+class TestPayloadCompressor(unittest.TestCase):
+    def test_choose_codec(self):
+        """Tests that the first offered codec which is accepted is chosen,
+        and none if no offered codec is accepted.
+        """
+        compressor = PayloadCompressor()
+        self.assertEqual(ZLIB, compressor.choose_codec(['lz4', ZLIB]))
+        self.assertEqual('', compressor.choose_codec(['lz4']))
+        self.assertEqual('', compressor.choose_codec([]))
+
+        off = PayloadCompressor(codecs=[])
+        self.assertEqual('', off.choose_codec([ZLIB]))
+
+    def test_unsupported_codec(self):
+        """Tests that configuring a codec which is not supported fails."""
+        with self.assertRaises(ValueError):
+            PayloadCompressor(codecs=['lz4'])
+
+    def test_round_trip(self):
+        """Tests that compressible gossip content is compressed with the
+        agreed codec, and decompresses to the original content.
+        """
+        compressor = PayloadCompressor(threshold=100)
+        content = b'{"Verb": "inc", "Name": "abc", "Value": 1}' * 100
+
+        compressed, codec = compressor.compress(
+            GOSSIP_MESSAGE, content, ZLIB)
+        self.assertEqual(ZLIB, codec)
+        self.assertLess(len(compressed), len(content))
+
+        self.assertEqual(
+            content,
+            compressor.decompress(
+                GOSSIP_MESSAGE, memoryview(compressed), codec, ZLIB))
+
+    def test_not_compressed(self):
+        """Tests that content is sent as it is with no agreed codec, for
+        message types other than gossip, below the threshold, and when
+        compressing would not make it smaller.
+        """
+        compressor = PayloadCompressor(threshold=100)
+        content = b'a' * 1000
+
+        self.assertEqual(
+            (content, ''), compressor.compress(GOSSIP_MESSAGE, content, ''))
+        self.assertEqual(
+            (content, ''),
+            compressor.compress(
+                validator_pb2.Message.GOSSIP_BLOCK_REQUEST, content, ZLIB))
+        self.assertEqual(
+            (b'a' * 99, ''),
+            compressor.compress(GOSSIP_MESSAGE, b'a' * 99, ZLIB))
+
+        random_content = os.urandom(1000)
+        self.assertEqual(
+            (random_content, ''),
+            compressor.compress(GOSSIP_MESSAGE, random_content, ZLIB))
+
+    def test_broadcast_compressed_once(self):
+        """Tests that the same content sent to several connections is
+        compressed once.
+        """
+        compressor = PayloadCompressor(threshold=100)
+        content = b'b' * 1000
+
+        first, _ = compressor.compress(GOSSIP_MESSAGE, content, ZLIB)
+        second, _ = compressor.compress(GOSSIP_MESSAGE, content, ZLIB)
+        self.assertIs(first, second)
+
+        other, _ = compressor.compress(GOSSIP_MESSAGE, b'c' * 1000, ZLIB)
+        self.assertIsNot(first, other)
+
+    def test_decompress_refused(self):
+        """Tests that content compressed with a codec which is not
+        accepted, or not agreed with the connection, content of a message
+        type which is never compressed, and content which is corrupt,
+        truncated or decompresses to too much, is refused.
+        """
+        content = zlib.compress(b'd' * 1000)
+
+        with self.assertRaises(CompressionError):
+            PayloadCompressor(codecs=[]).decompress(
+                GOSSIP_MESSAGE, content, ZLIB, ZLIB)
+
+        compressor = PayloadCompressor()
+        with self.assertRaises(CompressionError):
+            compressor.decompress(GOSSIP_MESSAGE, content, ZLIB, '')
+        with self.assertRaises(CompressionError):
+            compressor.decompress(
+                validator_pb2.Message.CLIENT_BATCH_SUBMIT_REQUEST,
+                content, ZLIB, ZLIB)
+        with self.assertRaises(CompressionError):
+            compressor.decompress(GOSSIP_MESSAGE, b'not zlib', ZLIB, ZLIB)
+        with self.assertRaises(CompressionError):
+            compressor.decompress(GOSSIP_MESSAGE, content[:-4], ZLIB, ZLIB)
+        with self.assertRaises(CompressionError):
+            compressor.decompress(
+                GOSSIP_MESSAGE,
+                zlib.compress(b'\0' * (MAX_DECOMPRESSED_SIZE + 1)),
+                ZLIB, ZLIB)
+
+    def test_oversized_not_compressed(self):
+        """Tests that content larger than a peer will decompress is sent
+        uncompressed.
+        """
+        compressor = PayloadCompressor()
+        content = b'\0' * (MAX_DECOMPRESSED_SIZE + 1)
+
+        self.assertEqual(
+            (content, ''), compressor.compress(GOSSIP_MESSAGE, content, ZLIB))
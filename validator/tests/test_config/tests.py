@@ -158,6 +158,10 @@ class TestValidatorConfig(unittest.TestCase):
         self.assertEqual(config.scheduler, "parallel")
         self.assertEqual(config.minimum_peer_connectivity, 3)
         self.assertEqual(config.maximum_peer_connectivity, 10)
+        self.assertEqual(config.receipt_compression, "none")
+        self.assertEqual(config.event_log, False)
+        self.assertEqual(config.event_send_queue_size, 64)
+        self.assertEqual(config.event_slow_consumer_policy, "drop")
 
     def test_validator_config_load_from_file(self):
         """Tests loading config settings from a TOML configuration file.
@@ -204,6 +208,24 @@ class TestValidatorConfig(unittest.TestCase):
                 fd.write(os.linesep)
                 fd.write('maximum_peer_connectivity = 100')
                 fd.write(os.linesep)
+                fd.write('receipt_compression = "zlib"')
+                fd.write(os.linesep)
+                fd.write('event_log = true')
+                fd.write(os.linesep)
+                fd.write('event_log_attributes = ["address"]')
+                fd.write(os.linesep)
+                fd.write('component_shard_endpoints = ["tcp://test:4005"]')
+                fd.write(os.linesep)
+                fd.write('receipt_commit_window = 0.5')
+                fd.write(os.linesep)
+                fd.write('event_send_queue_size = 16')
+                fd.write(os.linesep)
+                fd.write('event_slow_consumer_policy = "disconnect"')
+                fd.write(os.linesep)
+                fd.write('[dispatcher_role_weights]')
+                fd.write(os.linesep)
+                fd.write('client = 2')
+                fd.write(os.linesep)
                 fd.write('[roles]')
                 fd.write(os.linesep)
                 fd.write('network = "trust"')
@@ -224,6 +246,15 @@ class TestValidatorConfig(unittest.TestCase):
             self.assertEqual(config.opentsdb_password, "secret")
             self.assertEqual(config.minimum_peer_connectivity, 1)
             self.assertEqual(config.maximum_peer_connectivity, 100)
+            self.assertEqual(config.receipt_compression, "zlib")
+            self.assertEqual(config.event_log, True)
+            self.assertEqual(config.event_log_attributes, ["address"])
+            self.assertEqual(
+                config.component_shard_endpoints, ["tcp://test:4005"])
+            self.assertEqual(config.receipt_commit_window, 0.5)
+            self.assertEqual(config.event_send_queue_size, 16)
+            self.assertEqual(config.event_slow_consumer_policy, "disconnect")
+            self.assertEqual(config.dispatcher_role_weights, {"client": 2})
 
         finally:
             os.environ.clear()
@@ -257,6 +288,15 @@ class TestValidatorConfig(unittest.TestCase):
                 fd.write(os.linesep)
             with self.assertRaises(LocalConfigurationError):
                 load_toml_validator_config(filename)
+
+            for role_weights in ['clients = 2', 'client = 0']:
+                with open(filename, 'w') as fd:
+                    fd.write('[dispatcher_role_weights]')
+                    fd.write(os.linesep)
+                    fd.write(role_weights)
+                    fd.write(os.linesep)
+                with self.assertRaises(LocalConfigurationError):
+                    load_toml_validator_config(filename)
         finally:
             os.environ.clear()
             os.environ.update(orig_environ)
@@ -22,7 +22,9 @@ import hashlib
 import os
 import shutil
 import tempfile
+import threading
 import time
+from unittest import mock
 
 from sawtooth_validator.database.native_lmdb import NativeLmdbDatabase
 from sawtooth_validator.execution import context_manager
@@ -522,6 +524,100 @@ class TestContextManager(unittest.TestCase):
               ('tttt', b'12'),
               ('zzoo', b'27')]])
 
+    def test_prefetch_shared_inputs(self):
+        """Tests that contexts created against the same state root, with
+        overlapping inputs, each receive the prefetched values of all of
+        their inputs.
+
+        Notes:
+            Set up the context:
+                Squash a context to produce a state root with values at
+                3 addresses.
+            Test:
+                Create several contexts against that root, with
+                overlapping inputs, and make get calls on each of them.
+        """
+        addresses = [self._create_address(a) for a in ['aaaa', 'bbbb', 'cccc']]
+        values = [b'1', b'2', b'3']
+
+        context_id = self.context_manager.create_context(
+            state_hash=self.first_state_hash,
+            base_contexts=[],
+            inputs=[],
+            outputs=addresses)
+        self.context_manager.set(
+            context_id,
+            [{address: value} for address, value in zip(addresses, values)])
+        squash = self.context_manager.get_squash_handler()
+        state_hash = squash(
+            self.first_state_hash, [context_id], persist=True, clean_up=True)
+
+        inputs = [addresses[:2], addresses[1:], addresses, addresses[2:]]
+        context_ids = [
+            self.context_manager.create_context(
+                state_hash=state_hash,
+                base_contexts=[],
+                inputs=context_inputs,
+                outputs=[])
+            for context_inputs in inputs
+        ]
+
+        expected = dict(zip(addresses, values))
+        for c_id, context_inputs in zip(context_ids, inputs):
+            self.assertEqual(
+                self.context_manager.get(c_id, context_inputs),
+                [(address, expected[address]) for address in context_inputs])
+
+    def test_prefetch_split_across_readers(self):
+        """Tests that the inputs of a context are prefetched by more than
+        one reader, and that the context receives the values of all of them.
+
+        Notes:
+            Set up the context:
+                Squash a context to produce a state root with values at
+                30 addresses.
+            Test:
+                Create a context against that root with all 30 addresses as
+                inputs, make a get call on it, and record which threads
+                read state.
+        """
+        addresses = [self._create_address(str(i)) for i in range(30)]
+        values = [str(i).encode() for i in range(30)]
+
+        context_id = self.context_manager.create_context(
+            state_hash=self.first_state_hash,
+            base_contexts=[],
+            inputs=[],
+            outputs=addresses)
+        self.context_manager.set(
+            context_id,
+            [{address: value} for address, value in zip(addresses, values)])
+        squash = self.context_manager.get_squash_handler()
+        state_hash = squash(
+            self.first_state_hash, [context_id], persist=True, clean_up=True)
+
+        readers = set()
+        read_state = context_manager._read_state
+
+        def recording_read_state(*args):
+            readers.add(threading.current_thread().name)
+            return read_state(*args)
+
+        with mock.patch.object(
+                context_manager, '_read_state', recording_read_state):
+            c_id = self.context_manager.create_context(
+                state_hash=state_hash,
+                base_contexts=[],
+                inputs=addresses,
+                outputs=[])
+            self.assertEqual(
+                self.context_manager.get(c_id, addresses),
+                list(zip(addresses, values)))
+
+        self.assertGreater(len(readers), 1)
+        self.assertTrue(
+            all(name.startswith('_ContextReader') for name in readers))
+
     def test_squash(self):
         """Tests that squashing a context based on state from other
         contexts will result in the same merkle hash as updating the
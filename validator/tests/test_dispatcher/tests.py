@@ -14,6 +14,7 @@
 # ------------------------------------------------------------------------------
 
 from concurrent.futures import ThreadPoolExecutor
+import threading
 import unittest
 
 from sawtooth_validator.networking import dispatch
@@ -76,3 +77,181 @@ class TestDispatcherIdentityMessageMatch(unittest.TestCase):
 
     def tearDown(self):
         self._dispatcher.stop()
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__()
+        self.submit_count = 0
+        self._count_lock = threading.Lock()
+
+    def submit(self, *args, **kwargs):
+        with self._count_lock:
+            self.submit_count += 1
+        return super().submit(*args, **kwargs)
+
+
+class _RecordingHandler(dispatch.Handler):
+    def __init__(self, name, calls, status=dispatch.HandlerStatus.PASS):
+        self._name = name
+        self._calls = calls
+        self._status = status
+
+    def handle(self, connection_id, message_content):
+        self._calls.append((self._name, threading.current_thread().name))
+        if self._status == dispatch.HandlerStatus.RETURN_AND_PASS:
+            return dispatch.HandlerResult(
+                self._status,
+                message_out=validator_pb2.Message(correlation_id=self._name),
+                message_type=validator_pb2.Message.PING_RESPONSE)
+        return dispatch.HandlerResult(self._status)
+
+
+class TestDispatcherHandlerStages(unittest.TestCase):
+    def test_consecutive_handlers_share_a_task(self):
+        """Tests that consecutive handlers in a message type's chain which
+        share an executor are run in a single task on it, in order, while a
+        change of executor starts a new task, and that a handler which drops
+        the message ends the chain.
+        """
+        first_pool = _CountingExecutor()
+        second_pool = _CountingExecutor()
+        calls = []
+        sent = []
+
+        dispatcher = dispatch.Dispatcher()
+        dispatcher.add_send_message(
+            "connection", lambda msg, connection_id: sent.append(msg))
+        for name, pool, status in [
+                ("a", first_pool, dispatch.HandlerStatus.PASS),
+                ("b", first_pool, dispatch.HandlerStatus.RETURN_AND_PASS),
+                ("c", second_pool, dispatch.HandlerStatus.PASS),
+                ("d", first_pool, dispatch.HandlerStatus.PASS),
+                ("e", first_pool, dispatch.HandlerStatus.DROP),
+                ("f", first_pool, dispatch.HandlerStatus.PASS)]:
+            dispatcher.add_handler(
+                validator_pb2.Message.DEFAULT,
+                _RecordingHandler(name, calls, status),
+                pool)
+
+        dispatcher.start()
+        try:
+            dispatcher.dispatch(
+                "connection",
+                validator_pb2.Message(
+                    message_type=validator_pb2.Message.DEFAULT),
+                "connection_id")
+            dispatcher.block_until_complete()
+        finally:
+            dispatcher.stop()
+            first_pool.shutdown()
+            second_pool.shutdown()
+
+        self.assertEqual(
+            ["a", "b", "c", "d", "e"], [name for name, _ in calls])
+        self.assertEqual(calls[0][1], calls[1][1])
+        self.assertEqual(calls[3][1], calls[4][1])
+        self.assertEqual(2, first_pool.submit_count)
+        self.assertEqual(1, second_pool.submit_count)
+        self.assertEqual(1, len(sent))
+
+
+class _ConnectionRecordingHandler(dispatch.Handler):
+    def __init__(self, connection_ids):
+        self._connection_ids = connection_ids
+
+    def handle(self, connection_id, message_content):
+        self._connection_ids.append(connection_id)
+        return dispatch.HandlerResult(dispatch.HandlerStatus.PASS)
+
+
+class TestDispatcherFairQueuing(unittest.TestCase):
+    def test_flooding_connection_does_not_starve_others(self):
+        """Tests that messages of the same priority are taken from each
+        connection in turn, as many at a time as the weight of the
+        connection's role, so that a connection which sends many messages
+        does not hold up the messages of another.
+        """
+        pool = ThreadPoolExecutor(max_workers=1)
+        connection_ids = []
+
+        dispatcher = dispatch.Dispatcher(
+            role_weights={dispatch.ROLE_PEER: 2, dispatch.ROLE_CLIENT: 1})
+        for message_type in [validator_pb2.Message.GOSSIP_MESSAGE,
+                             validator_pb2.Message.CLIENT_BATCH_LIST_REQUEST]:
+            dispatcher.add_handler(
+                message_type, _ConnectionRecordingHandler(connection_ids),
+                pool)
+
+        for _ in range(8):
+            dispatcher.dispatch(
+                "connection",
+                validator_pb2.Message(
+                    message_type=validator_pb2.Message.GOSSIP_MESSAGE),
+                "peer")
+        for _ in range(2):
+            dispatcher.dispatch(
+                "connection",
+                validator_pb2.Message(
+                    message_type=validator_pb2.Message
+                    .CLIENT_BATCH_LIST_REQUEST),
+                "client")
+
+        dispatcher.start()
+        try:
+            dispatcher.block_until_complete()
+        finally:
+            dispatcher.stop()
+            pool.shutdown()
+
+        self.assertEqual(
+            ["peer", "peer", "client", "peer", "peer", "client",
+             "peer", "peer", "peer", "peer"],
+            connection_ids)
+
+    def test_role_queue_depths(self):
+        """Tests that the queue depth gauges count the messages waiting from
+        the connections of each role, over every priority, with one gauge
+        per role rather than per connection.
+        """
+        pool = ThreadPoolExecutor(max_workers=1)
+        connection_ids = []
+
+        dispatcher = dispatch.Dispatcher()
+        for message_type in [validator_pb2.Message.GOSSIP_MESSAGE,
+                             validator_pb2.Message.PING_REQUEST]:
+            dispatcher.add_handler(
+                message_type, _ConnectionRecordingHandler(connection_ids),
+                pool)
+        dispatcher.set_message_priority(
+            validator_pb2.Message.PING_REQUEST, dispatch.Priority.HIGH)
+
+        for connection_id in ["a", "b"]:
+            for message_type in [validator_pb2.Message.GOSSIP_MESSAGE,
+                                 validator_pb2.Message.PING_REQUEST]:
+                dispatcher.dispatch(
+                    "connection",
+                    validator_pb2.Message(message_type=message_type),
+                    connection_id)
+
+        self.assertEqual(
+            {dispatch.ROLE_PEER: 2, None: 2},
+            dispatcher._in_queue._role_depths)
+        self.assertEqual(
+            {dispatch.ROLE_PEER, "unknown"},
+            set(dispatcher._role_queue_gauges))
+
+        dispatcher.start()
+        try:
+            dispatcher.block_until_complete()
+        finally:
+            dispatcher.stop()
+            pool.shutdown()
+
+        self.assertEqual(4, len(connection_ids))
+        self.assertEqual(
+            {dispatch.ROLE_PEER: 0, None: 0},
+            dispatcher._in_queue._role_depths)
+        self.assertEqual(
+            {dispatch.ROLE_PEER, "unknown"},
+            set(dispatcher._role_queue_gauges))
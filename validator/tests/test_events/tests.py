@@ -16,8 +16,12 @@
 # pylint: disable=protected-access
 
 import os
+import queue
+import re
+import shutil
 import tempfile
 import unittest
+from unittest.mock import ANY
 from unittest.mock import Mock
 from unittest.mock import MagicMock
 from uuid import uuid4
@@ -26,12 +30,15 @@ from sawtooth_validator.database.dict_database import DictDatabase
 from sawtooth_validator.database.native_lmdb import NativeLmdbDatabase
 from sawtooth_validator.journal.block_store import BlockStore
 from sawtooth_validator.journal.block_wrapper import BlockWrapper
+from sawtooth_validator.journal.block_wrapper import NULL_BLOCK_IDENTIFIER
 from sawtooth_validator.journal.event_extractors \
     import BlockEventExtractor
 from sawtooth_validator.journal.receipt_store import TransactionReceiptStore
 from sawtooth_validator.networking.dispatch import HandlerStatus
+from sawtooth_validator.config.validator import SLOW_CONSUMER_DISCONNECT
 
 from sawtooth_validator.server.events.broadcaster import EventBroadcaster
+from sawtooth_validator.server.events.event_log import EventLog
 from sawtooth_validator.server.events.handlers \
     import ClientEventsGetRequestHandler
 from sawtooth_validator.server.events.handlers \
@@ -43,6 +50,7 @@ from sawtooth_validator.server.events.handlers \
 
 from sawtooth_validator.server.events.subscription import EventSubscription
 from sawtooth_validator.server.events.subscription import EventFilterFactory
+from sawtooth_validator.server.events.subscription import SubscriptionIndex
 
 from sawtooth_validator.execution.tp_state_handlers import TpEventAddHandler
 
@@ -167,6 +175,156 @@ class EventSubscriptionTest(unittest.TestCase):
                         key="test", match_string="test")]))
 
 
+class SubscriptionIndexTest(unittest.TestCase):
+    def test_get_subscribers(self):
+        """Test that an event is matched to exactly the subscribers with a
+        subscription it belongs to, whether the subscription is indexed by
+        an exact attribute filter or only by event type, and that removed
+        subscribers are no longer matched.
+        """
+        index = SubscriptionIndex()
+        index.add("exact", [
+            EventSubscription(
+                event_type="test", filters=[
+                    FILTER_FACTORY.create(key="address", match_string="abc")
+                ])
+        ])
+        index.add("regex", [
+            EventSubscription(
+                event_type="test", filters=[
+                    FILTER_FACTORY.create(
+                        key="address", match_string="^a",
+                        filter_type=events_pb2.EventFilter.REGEX_ANY)
+                ])
+        ])
+        index.add("other", [EventSubscription(event_type="other")])
+        index.add("both", [
+            EventSubscription(event_type="test"),
+            EventSubscription(event_type="other"),
+        ])
+
+        def event(event_type, address):
+            return events_pb2.Event(
+                event_type=event_type,
+                attributes=[
+                    events_pb2.Event.Attribute(key="address", value=address)
+                ])
+
+        self.assertEqual(
+            {"exact", "regex", "both"},
+            index.get_subscribers(event("test", "abc")))
+        self.assertEqual(
+            {"regex", "both"},
+            index.get_subscribers(event("test", "ab")))
+        self.assertEqual(
+            {"other", "both"},
+            index.get_subscribers(event("other", "abc")))
+
+        # "both" and "other" share the "other" subscription
+        self.assertEqual(4, len(index.subscriptions))
+
+        index.remove("both")
+        index.remove("exact")
+        self.assertEqual(
+            {"regex"},
+            index.get_subscribers(event("test", "abc")))
+        self.assertEqual(2, len(index.subscriptions))
+
+    def test_get_subscribers_by_pattern(self):
+        """Test that subscriptions indexed by their regex filters are matched
+        as the filters would match them, including when several subscribers
+        share a pattern, and that their remaining filters are still applied.
+        """
+        index = SubscriptionIndex()
+
+        def regex_filter(key, pattern):
+            return FILTER_FACTORY.create(
+                key=key, match_string=pattern,
+                filter_type=events_pb2.EventFilter.REGEX_ANY)
+
+        patterns = {
+            "prefix": "^abc",
+            "prefix_any": "^ab.*",
+            "shared_prefix": "^abc",
+            "anywhere": "cd",
+            "alternation": "x|d$",
+            "group": "(b)c",
+        }
+        for connection_id, pattern in patterns.items():
+            index.add(connection_id, [
+                EventSubscription(
+                    event_type="test",
+                    filters=[regex_filter("address", pattern)])
+            ])
+        index.add("filtered", [
+            EventSubscription(
+                event_type="test", filters=[
+                    regex_filter("address", "^a"),
+                    regex_filter("name", "^z"),
+                ])
+        ])
+
+        def event(*attributes):
+            return events_pb2.Event(
+                event_type="test",
+                attributes=[
+                    events_pb2.Event.Attribute(key=key, value=value)
+                    for key, value in attributes
+                ])
+
+        for value in ["abcd", "ab", "bc", "xyz", "", "zabc"]:
+            self.assertEqual(
+                {connection_id
+                 for connection_id, pattern in patterns.items()
+                 if re.search(pattern, value)},
+                index.get_subscribers(event(("address", value))))
+
+        self.assertEqual(
+            {"prefix_any", "filtered"},
+            index.get_subscribers(event(("address", "ab"), ("name", "z"))))
+        self.assertEqual(
+            {"prefix_any"},
+            index.get_subscribers(event(("address", "ab"), ("name", "y"))))
+
+        index.remove("prefix")
+        self.assertEqual(
+            {"prefix_any", "shared_prefix", "anywhere", "alternation",
+             "group"},
+            index.get_subscribers(event(("address", "abcd"))))
+
+    def test_get_subscribers_by_pattern_with_flags(self):
+        """Test that patterns setting inline flags only change what they
+        match themselves, and not what the other patterns match.
+        """
+        index = SubscriptionIndex()
+
+        patterns = {
+            "spaced": "a b",
+            "verbose": "(?x) c d",
+            "ignore_case": "(?i)EF",
+            "anywhere": "gh",
+        }
+        for connection_id, pattern in patterns.items():
+            index.add(connection_id, [
+                EventSubscription(
+                    event_type="test",
+                    filters=[FILTER_FACTORY.create(
+                        key="address", match_string=pattern,
+                        filter_type=events_pb2.EventFilter.REGEX_ANY)])
+            ])
+
+        for value in ["a b", "ab", "cd", "c d", "ef", "EF", "gh", "GH"]:
+            self.assertEqual(
+                {connection_id
+                 for connection_id, pattern in patterns.items()
+                 if re.search(pattern, value)},
+                index.get_subscribers(events_pb2.Event(
+                    event_type="test",
+                    attributes=[events_pb2.Event.Attribute(
+                        key="address", value=value)])),
+                value)
+
+
 class ClientEventsSubscribeValidationHandlerTest(unittest.TestCase):
     def test_subscribe(self):
         """Test that a subscriber is successfully validated and added to the
@@ -237,13 +395,24 @@ class ClientEventsSubscribeValidationHandlerTest(unittest.TestCase):
 
 class ClientEventsSubscribeHandlersTest(unittest.TestCase):
     def test_subscribe(self):
-        """Tests that the handler turns on the subscriber."""
+        """Tests that the handler has the subscriber caught up, which turns
+        it on once it has been, and turns the subscriber on itself if it
+        cannot be caught up.
+        """
         mock_event_broadcaster = Mock()
         handler = ClientEventsSubscribeHandler(mock_event_broadcaster)
         request = client_event_pb2.ClientEventsSubscribeRequest()
 
         response = handler.handle("test_conn_id", request)
 
+        mock_event_broadcaster.catchup_subscriber.assert_called_with(
+            "test_conn_id")
+        mock_event_broadcaster.enable_subscriber.assert_not_called()
+        self.assertEqual(HandlerStatus.PASS, response.status)
+
+        mock_event_broadcaster.catchup_subscriber.side_effect = KeyError
+        response = handler.handle("test_conn_id", request)
+
         mock_event_broadcaster.enable_subscriber.assert_called_with(
             "test_conn_id")
         self.assertEqual(HandlerStatus.PASS, response.status)
@@ -392,14 +561,92 @@ class EventBroadcasterTest(unittest.TestCase):
         mock_service.send.assert_not_called()
 
         event_broadcaster.enable_subscriber("test_conn_id")
-        event_broadcaster.chain_update(block, [])
+        event_broadcaster.start()
+        try:
+            event_broadcaster.chain_update(block, [])
+            event_broadcaster.block_until_complete()
+        finally:
+            event_broadcaster.stop()
 
         event_list = events_pb2.EventList(
             events=BlockEventExtractor(block).extract(
                 [create_block_commit_subscription()])).SerializeToString()
         mock_service.send.assert_called_with(
             validator_pb2.Message.CLIENT_EVENTS,
-            event_list, connection_id="test_conn_id", one_way=True)
+            event_list, connection_id="test_conn_id", one_way=True,
+            on_sent=ANY)
+
+    def test_broadcast_events_serialized_once(self):
+        """Test that subscribers which receive the same events are sent the
+        same serialized event list, and that a subscriber receives only the
+        events it subscribed to.
+        """
+        mock_service = Mock()
+        event_broadcaster = EventBroadcaster(mock_service, Mock(), Mock())
+        block = create_block()
+
+        for connection_id in ("conn_a", "conn_b"):
+            event_broadcaster.add_subscriber(
+                connection_id, [create_block_commit_subscription()], [])
+            event_broadcaster.enable_subscriber(connection_id)
+        event_broadcaster.add_subscriber(
+            "conn_c", [EventSubscription(event_type="other")], [])
+        event_broadcaster.enable_subscriber("conn_c")
+
+        event_broadcaster.start()
+        try:
+            event_broadcaster.chain_update(block, [])
+            event_broadcaster.block_until_complete()
+        finally:
+            event_broadcaster.stop()
+
+        sent = {
+            call[1]["connection_id"]: call[0][1]
+            for call in mock_service.send.call_args_list
+        }
+        self.assertIs(sent["conn_a"], sent["conn_b"])
+        self.assertEqual(
+            events_pb2.EventList().SerializeToString(), sent["conn_c"])
+
+    def test_slow_consumer_policy(self):
+        """Test that once a subscriber's send queue is full, further event
+        lists are dropped, or the subscriber is disconnected, according to
+        the slow consumer policy.
+        """
+        block = create_block()
+
+        mock_service = Mock()
+        event_broadcaster = EventBroadcaster(
+            mock_service, Mock(), Mock(), send_queue_size=2)
+        event_broadcaster.add_subscriber(
+            "test_conn_id", [create_block_commit_subscription()], [])
+        event_broadcaster.enable_subscriber("test_conn_id")
+
+        # Nothing is sent until the broadcaster is started
+        for _ in range(3):
+            event_broadcaster.chain_update(block, [])
+
+        event_broadcaster.start()
+        try:
+            event_broadcaster.block_until_complete()
+        finally:
+            event_broadcaster.stop()
+        self.assertEqual(2, mock_service.send.call_count)
+        self.assertIn("test_conn_id", event_broadcaster._subscribers)
+
+        mock_service = Mock()
+        event_broadcaster = EventBroadcaster(
+            mock_service, Mock(), Mock(), send_queue_size=2,
+            slow_consumer_policy=SLOW_CONSUMER_DISCONNECT)
+        event_broadcaster.add_subscriber(
+            "test_conn_id", [create_block_commit_subscription()], [])
+        event_broadcaster.enable_subscriber("test_conn_id")
+
+        for _ in range(3):
+            event_broadcaster.chain_update(block, [])
+
+        self.assertNotIn("test_conn_id", event_broadcaster._subscribers)
+        mock_service.remove_connection.assert_called_with("test_conn_id")
 
     def test_catchup_subscriber(self):
         """Test that catch subscriber handles the case of:
@@ -409,32 +656,417 @@ class EventBroadcasterTest(unittest.TestCase):
         mock_service = Mock()
         mock_block_store = MagicMock()
         mock_block_store.chain_head = None
-        mock_block_store.get_predecessor_iter.return_value = []
+        mock_block_store.get_block_iter.return_value = []
         mock_receipt_store = Mock()
+        mock_receipt_store.get_block_receipts.return_value = []
 
         event_broadcaster = EventBroadcaster(mock_service,
                                              mock_block_store,
                                              mock_receipt_store)
+        event_broadcaster.start()
 
         event_broadcaster.add_subscriber(
-            "test_conn_id", [create_block_commit_subscription()], [])
+            "test_conn_id", [create_block_commit_subscription()],
+            NULL_BLOCK_IDENTIFIER)
 
         event_broadcaster.catchup_subscriber("test_conn_id")
+        event_broadcaster.block_until_complete()
 
         mock_service.send.assert_not_called()
 
         block = create_block()
         mock_block_store.chain_head = block
-        mock_block_store.get_predecessor_iter.return_value = [block]
-        mock_block_store.__getitem__.return_value = block
+        mock_block_store.get_block_iter.return_value = [block]
 
         event_broadcaster.catchup_subscriber("test_conn_id")
+        event_broadcaster.block_until_complete()
         event_list = events_pb2.EventList(
             events=BlockEventExtractor(block).extract(
                 [create_block_commit_subscription()])).SerializeToString()
         mock_service.send.assert_called_with(
             validator_pb2.Message.CLIENT_EVENTS,
-            event_list, connection_id="test_conn_id", one_way=True)
+            event_list, connection_id="test_conn_id", one_way=True,
+            on_sent=ANY)
+        mock_block_store.get_block_iter.assert_called_with(
+            start_block_num="0x0", reverse=False)
+
+        event_broadcaster.stop()
+
+    def test_catchup_subscriber_flow_control(self):
+        """Test that a subscriber is caught up in the background from the
+        block after its last known block, one event list per block and in
+        order, with no more event lists handed to the service at a time than
+        its send queue holds until the service reports them sent, and that
+        it is sent events once it has been caught up.
+        """
+        blocks = [block for _, block, _ in create_chain(num=6)]
+        mock_block_store = self._create_block_store(blocks)
+        mock_receipt_store = Mock()
+        mock_receipt_store.get_block_receipts.return_value = []
+
+        sent = []
+        pending = queue.Queue()
+
+        def send(message_type, message_bytes, connection_id, one_way,
+                 on_sent):
+            sent.append(message_bytes)
+            pending.put(on_sent)
+
+        mock_service = Mock()
+        mock_service.send.side_effect = send
+
+        event_broadcaster = EventBroadcaster(
+            mock_service, mock_block_store, mock_receipt_store,
+            send_queue_size=2)
+        event_broadcaster.start()
+        try:
+            event_broadcaster.add_subscriber(
+                "test_conn_id", [create_block_commit_subscription()],
+                blocks[1].identifier)
+            event_broadcaster.catchup_subscriber("test_conn_id")
+
+            # Two event lists are handed to the service, and no more until
+            # it has sent one of them
+            on_sent = [pending.get(timeout=5), pending.get(timeout=5)]
+            with self.assertRaises(queue.Empty):
+                pending.get(timeout=0.2)
+            self.assertFalse(
+                event_broadcaster._subscribers["test_conn_id"].is_listening())
+
+            on_sent.pop(0)()
+            on_sent.append(pending.get(timeout=5))
+            while on_sent:
+                on_sent.pop(0)()
+                try:
+                    on_sent.append(pending.get(timeout=0.2))
+                except queue.Empty:
+                    pass
+
+            event_broadcaster.block_until_complete()
+        finally:
+            event_broadcaster.stop()
+
+        self.assertEqual(
+            [
+                events_pb2.EventList(
+                    events=BlockEventExtractor(block).extract(
+                        [create_block_commit_subscription()])
+                ).SerializeToString()
+                for block in blocks[2:]
+            ],
+            sent)
+        self.assertEqual(
+            hex(blocks[2].block_num),
+            mock_block_store.get_block_iter.call_args_list[0][1][
+                'start_block_num'])
+        self.assertTrue(
+            event_broadcaster._subscribers["test_conn_id"].is_listening())
+
+    def test_catchup_subscriber_fork(self):
+        """Test that a change to the chain while a subscriber is being caught
+        up ends its catch up, and that it is then sent events.
+        """
+        blocks = [block for _, block, _ in create_chain(num=6)]
+        # The chain no longer follows on from the last known block
+        mock_block_store = self._create_block_store(blocks[:2] + blocks[3:])
+        mock_receipt_store = Mock()
+        mock_receipt_store.get_block_receipts.return_value = []
+        mock_service = Mock()
+
+        event_broadcaster = EventBroadcaster(
+            mock_service, mock_block_store, mock_receipt_store)
+        event_broadcaster.start()
+        try:
+            event_broadcaster.add_subscriber(
+                "test_conn_id", [create_block_commit_subscription()],
+                blocks[1].identifier)
+            event_broadcaster.catchup_subscriber("test_conn_id")
+            event_broadcaster.block_until_complete()
+        finally:
+            event_broadcaster.stop()
+
+        mock_service.send.assert_not_called()
+        self.assertTrue(
+            event_broadcaster._subscribers["test_conn_id"].is_listening())
+
+    def test_catchup_removed_subscriber(self):
+        """Test that a subscriber removed while it is being caught up is sent
+        nothing more.
+        """
+        blocks = [block for _, block, _ in create_chain(num=6)]
+        mock_block_store = self._create_block_store(blocks)
+        mock_receipt_store = Mock()
+        mock_receipt_store.get_block_receipts.return_value = []
+        pending = queue.Queue()
+        mock_service = Mock()
+        mock_service.send.side_effect = \
+            lambda *args, on_sent, **kwargs: pending.put(on_sent)
+
+        event_broadcaster = EventBroadcaster(
+            mock_service, mock_block_store, mock_receipt_store,
+            send_queue_size=1)
+        event_broadcaster.start()
+        try:
+            event_broadcaster.add_subscriber(
+                "test_conn_id", [create_block_commit_subscription()],
+                NULL_BLOCK_IDENTIFIER)
+            event_broadcaster.catchup_subscriber("test_conn_id")
+            on_sent = pending.get(timeout=5)
+
+            event_broadcaster.remove_subscriber("test_conn_id")
+            on_sent()
+            event_broadcaster.block_until_complete()
+        finally:
+            event_broadcaster.stop()
+
+        self.assertEqual(1, mock_service.send.call_count)
+        self.assertEqual({}, event_broadcaster._sender._queues)
+
+    @staticmethod
+    def _create_block_store(blocks):
+        """Creates a mock block store holding the given blocks, the last of
+        which is the chain head.
+        """
+        def get_block_iter(start_block_num, reverse):
+            return iter([
+                block for block in blocks
+                if block.block_num >= int(start_block_num, 16)
+            ])
+
+        mock_block_store = MagicMock()
+        mock_block_store.chain_head = blocks[-1]
+        mock_block_store.__getitem__.side_effect = \
+            lambda block_id: next(
+                block for block in blocks if block.identifier == block_id)
+        mock_block_store.get_block_iter.side_effect = get_block_iter
+        return mock_block_store
+
+
+class EventLogTest(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._event_log = EventLog(
+            os.path.join(self._temp_dir, 'events.lmdb'),
+            indexed_attributes=["account"], flag='n')
+
+    def tearDown(self):
+        self._event_log.close()
+        shutil.rmtree(self._temp_dir)
+
+    def _log_chain(self, num):
+        """Logs a chain of blocks, where block n has a "transfer" event for
+        account n % 3, and every block after the first has a "payment"
+        event.
+        """
+        blocks = []
+        for _, block, txn_ids in create_chain(num=num):
+            events = [
+                events_pb2.Event(
+                    event_type="transfer",
+                    attributes=[
+                        events_pb2.Event.Attribute(
+                            key="account", value=str(block.block_num % 3)),
+                    ]),
+            ]
+            if block.block_num > 1:
+                events.append(events_pb2.Event(event_type="payment"))
+            receipts = [
+                transaction_receipt_pb2.TransactionReceipt(
+                    transaction_id=txn_ids[0], events=events)
+            ]
+            self._event_log.chain_update(block, receipts)
+            blocks.append((block, receipts))
+        return blocks
+
+    def test_get_events(self):
+        """Test that events read from the event log match the subscriptions
+        they are requested for, whether the blocks are found by event type or
+        by an indexed attribute, and whether the requested blocks are read in
+        a range or looked up one at a time.
+        """
+        blocks = self._log_chain(20)
+
+        subscriptions = [
+            EventSubscription(
+                event_type="transfer",
+                filters=[FILTER_FACTORY.create("account", "1")]),
+            EventSubscription(event_type="payment"),
+        ]
+
+        for requested in [blocks, blocks[3:7], blocks[::9], [blocks[0]]]:
+            block_ids = [block.identifier for block, _ in requested]
+            self.assertEqual(
+                [
+                    (block.identifier, [
+                        event
+                        for receipt in receipts
+                        for event in receipt.events
+                        if any(event in subscription
+                               for subscription in subscriptions)
+                    ])
+                    for block, receipts in requested
+                ],
+                self._event_log.get_events(block_ids, subscriptions))
+
+        block_commits = self._event_log.get_events(
+            [blocks[4][0].identifier], [create_block_commit_subscription()])
+        self.assertEqual(
+            [(blocks[4][0].identifier,
+              BlockEventExtractor(blocks[4][0]).extract(
+                  [create_block_commit_subscription()]))],
+            block_commits)
+
+        with self.assertRaises(KeyError):
+            self._event_log.get_events(["unknown"], subscriptions)
+
+    def test_fork(self):
+        """Test that logging a block replaces the logged blocks at or above
+        its number, and that a block which does not follow on from the log
+        clears it.
+        """
+        blocks = self._log_chain(5)
+        subscriptions = [EventSubscription(event_type="transfer")]
+
+        fork_block = create_block(
+            block_num=3, previous_block_id=blocks[1][0].identifier,
+            block_id="fork")
+        self._event_log.chain_update(fork_block, [])
+
+        self.assertEqual(
+            [(blocks[1][0].identifier, [blocks[1][1][0].events[0]]),
+             ("fork", [])],
+            self._event_log.get_events(
+                [blocks[1][0].identifier, "fork"], subscriptions))
+        for block, _ in blocks[2:]:
+            with self.assertRaises(KeyError):
+                self._event_log.get_events([block.identifier], subscriptions)
+
+        self._event_log.chain_update(
+            create_block(
+                block_num=4, previous_block_id="unknown", block_id="other"),
+            [])
+        with self.assertRaises(KeyError):
+            self._event_log.get_events(
+                [blocks[0][0].identifier], subscriptions)
+        self.assertEqual(
+            [("other", [])],
+            self._event_log.get_events(["other"], subscriptions))
+
+    def test_chain_update_two_blocks(self):
+        """Test that when a chain of two blocks is committed at once, each
+        block's events are logged under its own id, and that the broadcaster
+        returns the same events for them with and without the log, each
+        event once, even where it matches more than one subscription.
+        """
+        chain = create_chain(num=2)
+        blocks = []
+        for _, block, txn_ids in chain:
+            receipts = [
+                transaction_receipt_pb2.TransactionReceipt(
+                    transaction_id=txn_ids[0],
+                    events=[
+                        events_pb2.Event(
+                            event_type="transfer",
+                            attributes=[
+                                events_pb2.Event.Attribute(
+                                    key="block", value=block.identifier),
+                            ]),
+                    ])
+            ]
+            blocks.append((block, receipts))
+
+        # The chain controller notifies observers of each block in turn
+        for block, receipts in blocks:
+            self._event_log.chain_update(block, receipts)
+
+        subscriptions = [
+            create_block_commit_subscription(),
+            EventSubscription(event_type="transfer"),
+            EventSubscription(
+                event_type="transfer",
+                filters=[FILTER_FACTORY.create(
+                    "block", ".*", events_pb2.EventFilter.REGEX_ANY)]),
+        ]
+        for block, receipts in blocks:
+            self.assertEqual(
+                [(block.identifier, receipts[0].events[:])],
+                self._event_log.get_events(
+                    [block.identifier], subscriptions[1:]))
+
+        mock_block_store = MagicMock()
+        mock_block_store.__getitem__.side_effect = \
+            lambda block_id: next(
+                block for block, _ in blocks if block.identifier == block_id)
+        mock_receipt_store = Mock()
+        mock_receipt_store.get_block_receipts.side_effect = \
+            lambda block_id: next(
+                receipts for block, receipts in blocks
+                if block.identifier == block_id)
+
+        block_ids = [block.identifier for block, _ in blocks]
+        extracted = EventBroadcaster(
+            Mock(), mock_block_store, mock_receipt_store
+        ).get_events_for_block_ids(block_ids, subscriptions)
+        logged = EventBroadcaster(
+            Mock(), mock_block_store, mock_receipt_store,
+            event_log=self._event_log
+        ).get_events_for_block_ids(block_ids, subscriptions)
+
+        self.assertEqual(
+            [
+                event
+                for block, receipts in blocks
+                for event in (
+                    BlockEventExtractor(block).extract(subscriptions)
+                    + receipts[0].events[:])
+            ],
+            extracted)
+        self.assertEqual(extracted, logged)
+
+    def test_broadcaster_reads_event_log(self):
+        """Test that the event broadcaster answers requests for the events of
+        logged blocks from the event log, without reading the blocks, and
+        extracts the events of blocks which are not logged.
+        """
+        blocks = self._log_chain(3)
+        unlogged_block = create_block(
+            block_num=4, previous_block_id=blocks[-1][0].identifier,
+            block_id="unlogged")
+
+        mock_block_store = MagicMock()
+        mock_block_store.__getitem__.return_value = unlogged_block
+        mock_receipt_store = Mock()
+        mock_receipt_store.get_block_receipts.return_value = []
+
+        event_broadcaster = EventBroadcaster(
+            Mock(), mock_block_store, mock_receipt_store,
+            event_log=self._event_log)
+
+        subscriptions = [
+            create_block_commit_subscription(),
+            EventSubscription(event_type="payment"),
+        ]
+        events = event_broadcaster.get_events_for_block_ids(
+            [block.identifier for block, _ in blocks], subscriptions)
+
+        mock_block_store.__getitem__.assert_not_called()
+        mock_receipt_store.get_block_receipts.assert_not_called()
+        self.assertEqual(
+            [
+                event
+                for block, receipts in blocks
+                for event in (
+                    BlockEventExtractor(block).extract(subscriptions)
+                    + [event
+                       for event in receipts[0].events
+                       if event.event_type == "payment"])
+            ],
+            events)
+
+        self.assertEqual(
+            BlockEventExtractor(unlogged_block).extract(subscriptions),
+            event_broadcaster.get_events_for_block_ids(
+                ["unlogged"], subscriptions))
 
 
 class TpEventAddHandlerTest(unittest.TestCase):
@@ -0,0 +1,125 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import unittest
+
+from sawtooth_validator.networking.future import Future
+from sawtooth_validator.networking.future import FutureCollection
+from sawtooth_validator.networking.future import \
+    FutureCollectionKeyError
+from sawtooth_validator.networking.future import FutureResult
+from sawtooth_validator.networking.future import FutureTimeoutError
+from sawtooth_validator.networking.timer_wheel import TimerWheel
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TimerWheelTest(unittest.TestCase):
+    def test_expire_in_deadline_order(self):
+        """Tests that keys expire once their deadlines have passed, to
+        within a tick, whichever level of the wheel their deadlines place
+        them in, and that deadlines beyond the reach of the wheel expire
+        too.
+        """
+        clock = _Clock()
+        wheel = TimerWheel(tick=1, slot_bits=2, levels=2, clock=clock)
+
+        # The wheel reaches 16 ticks ahead
+        timeouts = {'a': 1, 'b': 3, 'c': 4, 'd': 9, 'e': 15, 'f': 40}
+        for key, timeout in timeouts.items():
+            wheel.add(key, timeout)
+        self.assertEqual(6, len(wheel))
+
+        expired_at = {}
+        for now in range(1, 50):
+            clock.now = now
+            for key in wheel.expire():
+                expired_at[key] = now
+
+        self.assertEqual(timeouts, expired_at)
+        self.assertEqual(0, len(wheel))
+
+    def test_cancel_and_replace(self):
+        """Tests that a cancelled deadline never expires, and that adding a
+        key again replaces its deadline.
+        """
+        clock = _Clock()
+        wheel = TimerWheel(tick=1, slot_bits=2, levels=2, clock=clock)
+
+        wheel.add('a', 2)
+        wheel.add('b', 2)
+        wheel.add('b', 10)
+        self.assertTrue(wheel.cancel('a'))
+        self.assertFalse(wheel.cancel('a'))
+
+        clock.now = 5
+        self.assertEqual([], wheel.expire())
+        self.assertIn('b', wheel)
+
+        clock.now = 10
+        self.assertEqual(['b'], wheel.expire())
+
+
+class FutureCollectionTest(unittest.TestCase):
+    def test_expire_futures(self):
+        """Tests that a future with a deadline which passes before a
+        response arrives is resolved with a timed out result, runs its
+        callback and is removed, while futures which are answered, or have
+        no deadline, are not expired.
+        """
+        clock = _Clock()
+        futures = FutureCollection(
+            timer_wheel=TimerWheel(tick=0.1, clock=clock))
+        results = []
+
+        def callback(request, result):
+            results.append((request, result))
+
+        expiring = Future('1', b'ping', callback, connection_id='peer')
+        answered = Future('2', b'ping', callback, connection_id='peer')
+        waiting = Future('3', b'ping', callback, connection_id='peer')
+        futures.put(expiring, timeout=5)
+        futures.put(answered, timeout=5)
+        futures.put(waiting)
+
+        futures.set_result('2', FutureResult(message_type=1, content=b''))
+        futures.remove('2')
+        self.assertEqual(1, len(results))
+
+        clock.now = 4
+        self.assertEqual([], futures.expire())
+
+        clock.now = 5
+        self.assertEqual([expiring], futures.expire())
+        self.assertEqual(2, len(results))
+        request, result = results[1]
+        self.assertEqual(b'ping', request)
+        self.assertTrue(result.timed_out)
+        self.assertEqual('peer', result.connection_id)
+
+        with self.assertRaises(FutureTimeoutError):
+            expiring.result()
+        with self.assertRaises(FutureCollectionKeyError):
+            futures.get('1')
+
+        clock.now = 1000
+        self.assertEqual([], futures.expire())
+        self.assertIs(waiting, futures.get('3'))
@@ -15,9 +15,13 @@
 import os
 import shutil
 import tempfile
+import threading
+import time
 import unittest
+from unittest.mock import MagicMock
 import struct
 
+from sawtooth_validator.database.group_commit import GroupCommit
 from sawtooth_validator.database.indexed_database import IndexedDatabase
 
 
@@ -565,6 +569,151 @@ class IndexedDatabaseTest(unittest.TestCase):
             (4, 'foo', "foo's data"),
             db.get('foo', index='name'))
 
+    def test_group_commit(self):
+        """Test that with a commit window, the updates of concurrent writers
+        are all applied, along with their index entries, and that the
+        updates are visible as soon as each writer returns.
+        """
+        db = IndexedDatabase(
+            os.path.join(self._temp_dir, 'test_db'),
+            _serialize_tuple,
+            _deserialize_tuple,
+            indexes={'name': lambda tup: [tup[1].encode()]},
+            flag='c',
+            commit_window=0.01,
+            _size=1024**2)
+
+        not_visible = []
+
+        def write(writer):
+            for i in range(10):
+                rec_id = writer * 10 + i
+                db.put(str(rec_id), (rec_id, 'name{}'.format(rec_id), 'data'))
+                if not db.contains_key(str(rec_id)):
+                    not_visible.append(rec_id)
+
+        writers = [
+            threading.Thread(target=write, args=(writer,))
+            for writer in range(8)
+        ]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+
+        self.assertEqual([], not_visible)
+        self.assertEqual(80, db.count())
+        self.assertEqual(80, db.count(index='name'))
+        self.assertEqual(
+            (42, 'name42', 'data'), db.get('name42', index='name'))
+
+        db.update([('80', (80, 'name80', 'data'))], ['42'])
+        self.assertEqual(80, db.count(index='name'))
+        self.assertFalse(db.contains_key('name42', index='name'))
+
+        db.close()
+
+
+class GroupCommitTest(unittest.TestCase):
+    def setUp(self):
+        self._lmdb_env = MagicMock()
+        self._applied = []
+        self._apply_started = threading.Event()
+        self._release_apply = threading.Event()
+        self._release_apply.set()
+
+    def _apply_update(self, _, updates):
+        self._apply_started.set()
+        self._release_apply.wait()
+        for puts, _ in updates:
+            if ('bad', 'value') in puts:
+                raise ValueError('bad value')
+        self._applied.extend(updates)
+
+    def test_failed_update_is_isolated(self):
+        """Tests that when one of the updates committed together fails,
+        the others are still applied, and only its writer sees the error.
+        """
+        group_commit = GroupCommit(self._lmdb_env, self._apply_update, 0)
+        errors = {}
+
+        def write(name, puts):
+            try:
+                group_commit.update(puts, [])
+            except ValueError as err:
+                errors[name] = err
+
+        # Hold up the first commit, so that the others queue behind it and
+        # are committed together
+        self._release_apply.clear()
+        first = threading.Thread(
+            target=write, args=('first', [('a', 'value')]))
+        first.start()
+        self._apply_started.wait()
+
+        writers = [
+            threading.Thread(target=write, args=(name, puts))
+            for name, puts in [
+                ('good', [('b', 'value')]),
+                ('bad', [('bad', 'value')]),
+                ('also_good', [('c', 'value')]),
+            ]
+        ]
+        for writer in writers:
+            writer.start()
+        while len(group_commit._pending) < len(writers):
+            time.sleep(0.001)
+        self._release_apply.set()
+
+        for writer in [first] + writers:
+            writer.join()
+
+        self.assertEqual(['bad'], list(errors))
+        self.assertEqual(
+            [('a', 'value'), ('b', 'value'), ('c', 'value')],
+            sorted(put for puts, _ in self._applied for put in puts))
+
+    def test_close_stops_syncing(self):
+        """Tests that closing syncs any writes waiting on the commit window,
+        and that the environment is not synced once close has returned.
+        """
+        group_commit = GroupCommit(self._lmdb_env, self._apply_update, 0.05)
+
+        group_commit.update([('a', 'value')], [])
+        self.assertEqual(0, self._lmdb_env.sync.call_count)
+
+        group_commit.close()
+        self.assertEqual(1, self._lmdb_env.sync.call_count)
+
+        time.sleep(0.1)
+        self.assertEqual(1, self._lmdb_env.sync.call_count)
+
+    def test_close_waits_for_sync(self):
+        """Tests that closing while the commit window's sync is running waits
+        for it to finish.
+        """
+        syncing = threading.Event()
+        release_sync = threading.Event()
+
+        def sync():
+            if not syncing.is_set():
+                syncing.set()
+                release_sync.wait()
+
+        self._lmdb_env.sync.side_effect = sync
+        group_commit = GroupCommit(self._lmdb_env, self._apply_update, 0.01)
+        group_commit.update([('a', 'value')], [])
+        syncing.wait()
+
+        closer = threading.Thread(target=group_commit.close)
+        closer.start()
+        closer.join(0.05)
+        self.assertTrue(closer.is_alive())
+
+        release_sync.set()
+        closer.join()
+        self.assertEqual(2, self._lmdb_env.sync.call_count)
+
 
 def _serialize_tuple(tup):
     return "{}-{}-{}".format(*tup).encode()
@@ -0,0 +1,290 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+import zlib
+
+import zmq
+
+from sawtooth_validator.networking import dispatch
+from sawtooth_validator.networking.compression import ZLIB
+from sawtooth_validator.networking.interconnect import Interconnect
+from sawtooth_validator.protobuf import validator_pb2
+from sawtooth_validator.protobuf.network_pb2 import PingRequest
+from sawtooth_validator.protobuf.network_pb2 import PingResponse
+
+
+class _PingHandler(dispatch.Handler):
+    def handle(self, connection_id, message_content):
+        return dispatch.HandlerResult(
+            dispatch.HandlerStatus.RETURN,
+            message_out=PingResponse(),
+            message_type=validator_pb2.Message.PING_RESPONSE)
+
+
+class _RecordingHandler(dispatch.Handler):
+    def __init__(self):
+        self.received = []
+
+    def handle(self, connection_id, message_content):
+        self.received.append(bytes(message_content))
+        return dispatch.HandlerResult(dispatch.HandlerStatus.PASS)
+
+
+class TestShardedInterconnect(unittest.TestCase):
+    """Tests an interconnect accepting connections on two endpoints, each
+    with its own socket and event loop.
+    """
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._endpoints = [
+            'ipc://{}'.format(os.path.join(self._temp_dir, name))
+            for name in ('main', 'shard')
+        ]
+
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._dispatcher = dispatch.Dispatcher()
+        self._dispatcher.add_handler(
+            validator_pb2.Message.PING_REQUEST, _PingHandler(), self._pool)
+        self._gossip_handler = _RecordingHandler()
+        self._dispatcher.add_handler(
+            validator_pb2.Message.GOSSIP_MESSAGE,
+            self._gossip_handler,
+            self._pool)
+        self._interconnect = Interconnect(
+            self._endpoints[0],
+            self._dispatcher,
+            shard_endpoints=self._endpoints[1:])
+
+        self._dispatcher.start()
+        self._interconnect.start()
+
+        self._context = zmq.Context()
+        self._clients = []
+        for endpoint in self._endpoints:
+            client = self._context.socket(zmq.DEALER)
+            client.setsockopt(zmq.LINGER, 0)
+            client.connect(endpoint)
+            self._clients.append(client)
+
+    def tearDown(self):
+        for client in self._clients:
+            client.close()
+        self._context.term()
+        self._interconnect.stop()
+        self._dispatcher.stop()
+        self._pool.shutdown()
+        shutil.rmtree(self._temp_dir)
+
+    def _receive(self, client):
+        self.assertTrue(client.poll(5000), 'No message received')
+        message = validator_pb2.Message()
+        message.ParseFromString(client.recv())
+        return message
+
+    def _assert_nothing_received(self, client):
+        self.assertFalse(client.poll(100), 'Unexpected message received')
+
+    def _wait_for(self, predicate):
+        deadline = time.time() + 5
+        while not predicate():
+            self.assertLess(time.time(), deadline, 'Timed out')
+            time.sleep(0.01)
+
+    def _ping(self):
+        """Pings from each client, and returns the connection id each is
+        known by.
+        """
+        for i, client in enumerate(self._clients):
+            client.send(validator_pb2.Message(
+                correlation_id=str(i),
+                content=PingRequest().SerializeToString(),
+                message_type=validator_pb2.Message.PING_REQUEST
+            ).SerializeToString())
+
+        for i, client in enumerate(self._clients):
+            reply = self._receive(client)
+            self.assertEqual(str(i), reply.correlation_id)
+            self.assertEqual(
+                validator_pb2.Message.PING_RESPONSE, reply.message_type)
+            self._assert_nothing_received(client)
+
+        owners = self._interconnect._connection_owners
+        self._wait_for(lambda: len(owners) == len(self._clients))
+        connection_ids = [None] * len(self._clients)
+        for connection_id, owner in owners.items():
+            connection_ids[self._endpoints.index(owner._address)] = \
+                connection_id
+        return connection_ids
+
+    def test_connection_ids_distinct(self):
+        """Tests that connections to different endpoints have their own
+        connection ids, each owned by the socket it connected to, and that
+        replies are sent back through that socket.
+        """
+        connection_ids = self._ping()
+
+        self.assertEqual(
+            len(self._clients), len(set(filter(None, connection_ids))))
+        self.assertEqual(
+            set(connection_ids), set(self._interconnect._connections))
+        self.assertIsNot(
+            self._interconnect._connection_owners[connection_ids[0]],
+            self._interconnect._connection_owners[connection_ids[1]])
+
+    def test_send(self):
+        """Tests that messages sent to a connection are sent through the
+        socket which owns it, and reach only that connection.
+        """
+        connection_ids = self._ping()
+
+        for i, connection_id in enumerate(connection_ids):
+            self._interconnect.send(
+                validator_pb2.Message.CLIENT_EVENTS,
+                str(i).encode(),
+                connection_id=connection_id,
+                one_way=True)
+
+        for i, client in enumerate(self._clients):
+            message = self._receive(client)
+            self.assertEqual(str(i).encode(), message.content)
+            self._assert_nothing_received(client)
+
+    def test_send_last_message(self):
+        """Tests that a last message is sent through the socket which owns
+        the connection, after which the connection is removed, and that the
+        other connection is unaffected.
+        """
+        connection_ids = self._ping()
+
+        self._interconnect.send_last_message(
+            validator_pb2.Message.CLIENT_EVENTS,
+            b'last',
+            connection_id=connection_ids[1],
+            one_way=True)
+
+        self.assertEqual(b'last', self._receive(self._clients[1]).content)
+        self._assert_nothing_received(self._clients[0])
+        self._wait_for(
+            lambda: connection_ids[1] not in
+            self._interconnect._connection_owners)
+        self.assertNotIn(connection_ids[1], self._interconnect._connections)
+        self.assertIn(connection_ids[0], self._interconnect._connections)
+
+    def test_remove_connection(self):
+        """Tests that removing a connection removes it from the socket which
+        owns it, and leaves the other connection in place.
+        """
+        connection_ids = self._ping()
+
+        self._interconnect.remove_connection(connection_ids[1])
+
+        self.assertNotIn(connection_ids[1], self._interconnect._connections)
+        self.assertNotIn(
+            connection_ids[1], self._interconnect._connection_owners)
+        self.assertIn(connection_ids[0], self._interconnect._connections)
+
+        self._interconnect.send(
+            validator_pb2.Message.CLIENT_EVENTS,
+            b'still here',
+            connection_id=connection_ids[0],
+            one_way=True)
+        self.assertEqual(
+            b'still here', self._receive(self._clients[0]).content)
+
+    def _fail_sends(self, connection_id):
+        """Makes sends through the socket which owns the connection raise
+        an error.
+        """
+        owner = self._interconnect._connection_owners[connection_id]
+        return mock.patch.object(
+            owner._socket, 'send_multipart',
+            side_effect=zmq.ZMQError(msg='send failed'))
+
+    def test_send_error_calls_on_sent(self):
+        """Tests that on_sent is called for a message whose send fails, so
+        that a sender limiting its queued messages does not lose a slot.
+        """
+        connection_ids = self._ping()
+        sent = threading.Event()
+
+        with self._fail_sends(connection_ids[0]):
+            self._interconnect.send(
+                validator_pb2.Message.CLIENT_EVENTS,
+                b'lost',
+                connection_id=connection_ids[0],
+                one_way=True,
+                on_sent=sent.set)
+            self.assertTrue(sent.wait(5), 'on_sent not called')
+
+        self._assert_nothing_received(self._clients[0])
+
+    def test_send_last_message_error(self):
+        """Tests that a connection is removed after its last message, even
+        if sending the message fails.
+        """
+        connection_ids = self._ping()
+
+        with self._fail_sends(connection_ids[1]):
+            self._interconnect.send_last_message(
+                validator_pb2.Message.CLIENT_EVENTS,
+                b'last',
+                connection_id=connection_ids[1],
+                one_way=True)
+            self._wait_for(
+                lambda: connection_ids[1] not in
+                self._interconnect._connection_owners)
+
+        self.assertNotIn(connection_ids[1], self._interconnect._connections)
+        self.assertIn(connection_ids[0], self._interconnect._connections)
+
+    def test_compressed_content_refused(self):
+        """Tests that compressed content is only accepted from a connection
+        which agreed on its codec, and only in a message type which is
+        compressed.
+        """
+        connection_ids = self._ping()
+        content = b'gossip' * 100
+
+        def send_compressed(message_type):
+            self._clients[0].send(validator_pb2.Message(
+                correlation_id='compressed',
+                content=zlib.compress(content),
+                content_encoding=ZLIB,
+                message_type=message_type
+            ).SerializeToString())
+
+        send_compressed(validator_pb2.Message.GOSSIP_MESSAGE)
+        # A ping sent after it is answered once it has been handled
+        self._ping()
+        self._dispatcher.block_until_complete()
+        self.assertEqual([], self._gossip_handler.received)
+
+        self._interconnect.update_connection_compression(
+            connection_ids[0], ZLIB)
+        send_compressed(validator_pb2.Message.PING_REQUEST)
+        self._assert_nothing_received(self._clients[0])
+
+        send_compressed(validator_pb2.Message.GOSSIP_MESSAGE)
+        self._wait_for(lambda: self._gossip_handler.received)
+        self.assertEqual([content], self._gossip_handler.received)
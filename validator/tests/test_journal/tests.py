@@ -712,3 +712,53 @@ class TestReceiptEventExtractor(unittest.TestCase):
                 change_sets[1][0], change_sets[0][1],
             ]).SerializeToString(),
         )])
+
+    def test_state_delta_events_by_address_prefix(self):
+        """Test that a sawtooth/state-delta event is only generated when it
+        would pass the address filters of a subscription, whether a filter
+        is looked up as an anchored prefix or tested against each address.
+        """
+        receipts = [
+            TransactionReceipt(state_changes=[
+                StateChange(address=address, value=b"v", type=StateChange.SET)
+                for address in ["abc1", "abc2", "bcd1"]
+            ]),
+        ]
+        extractor = ReceiptEventExtractor(receipts)
+        factory = EventFilterFactory()
+
+        def subscription(*filters):
+            return EventSubscription(
+                event_type="sawtooth/state-delta", filters=list(filters))
+
+        def regex(match_string, filter_type=EventFilter.REGEX_ANY):
+            return factory.create("address", match_string, filter_type)
+
+        matched = [
+            [regex("^abc")],
+            [regex("^bcd.*")],
+            [regex("^ab"), factory.create("address", "bcd1")],
+            [regex("c2$")],
+            [regex("^[ab]", EventFilter.REGEX_ALL)],
+        ]
+        unmatched = [
+            [regex("^abd")],
+            [regex("^bcd1.")],
+            [regex("^abc"), factory.create("address", "abc3")],
+            [regex("^a", EventFilter.REGEX_ALL)],
+            [factory.create("other", "abc1")],
+        ]
+
+        for filters in matched:
+            events = extractor.extract([subscription(*filters)])
+            self.assertEqual(1, len(events), filters)
+            self.assertEqual(
+                ["bcd1", "abc2", "abc1"],
+                [attribute.value for attribute in events[0].attributes])
+            self.assertEqual(
+                3, len(StateChangeList.FromString(events[0].data)
+                       .state_changes))
+
+        for filters in unmatched:
+            self.assertEqual(
+                [], extractor.extract([subscription(*filters)]), filters)
@@ -21,6 +21,7 @@ import shutil
 import tempfile
 from string import ascii_lowercase
 
+from sawtooth_validator.state.merkle import LEAF_CHUNK_SIZE
 from sawtooth_validator.state.merkle import MerkleDatabase
 from sawtooth_validator.database.native_lmdb import NativeLmdbDatabase
 
@@ -169,6 +170,45 @@ class TestSawtoothMerkleTrie(unittest.TestCase):
         self.assertEqual([("010202", {"my_data": 2})],
                          [entry for entry in self.trie.leaves('0102')])
 
+        # Test iteration from a start address
+        self.assertEqual(
+            [("010202", {"my_data": 2}),
+             ("010303", {"my_data": 3})],
+            [entry for entry in self.trie.leaves('01', start='010202')])
+
+        # Test iteration from a start address which is not in the trie
+        self.assertEqual(
+            [("010303", {"my_data": 3})],
+            [entry for entry in self.trie.leaves('01', start='010203')])
+
+    def test_merkle_trie_chunked_leaf_iteration(self):
+        """Tests that iteration spanning several native chunks returns every
+        leaf, in address order.
+        """
+        set_items = {
+            '{:06x}'.format(i): {'my_data': i}
+            for i in range(LEAF_CHUNK_SIZE * 2 + 1)
+        }
+        new_root = self.update(set_items, [], virtual=False)
+        self.set_merkle_root(new_root)
+
+        self.assertEqual(sorted(set_items.items()), list(self.trie))
+
+    def test_merkle_trie_get_many(self):
+        new_root = self.update({
+            "010101": {"my_data": 1},
+            "010202": {"my_data": 2},
+        }, [], virtual=False)
+        self.set_merkle_root(new_root)
+
+        self.assertEqual(
+            [("010202", {"my_data": 2}),
+             ("010303", None),
+             ("010101", {"my_data": 1})],
+            self.trie.get_many(["010202", "010303", "010101"]))
+
+        self.assertEqual([], self.trie.get_many([]))
+
     # assertions
     def assert_value_at_address(self, address, value, ishash=False):
         self.assertEqual(
@@ -0,0 +1,103 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import unittest
+
+from google.protobuf.message import DecodeError
+
+from sawtooth_validator.networking.envelope import decode_envelope
+from sawtooth_validator.protobuf import validator_pb2
+
+
+class TestDecodeEnvelope(unittest.TestCase):
+    def test_matches_protobuf(self):
+        """Tests that a decoded envelope has the fields protobuf parses
+        from the same serialized message, including an empty one.
+        """
+        messages = [
+            validator_pb2.Message(),
+            validator_pb2.Message(
+                message_type=validator_pb2.Message.GOSSIP_MESSAGE,
+                correlation_id='abc123',
+                content=b'\x00\x01' * 1000),
+            validator_pb2.Message(
+                message_type=validator_pb2.Message.PING_REQUEST,
+                correlation_id='été'),
+            validator_pb2.Message(
+                message_type=validator_pb2.Message.GOSSIP_BLOCK_RESPONSE,
+                correlation_id='def456',
+                content=b'compressed',
+                content_encoding='zlib'),
+        ]
+
+        for message in messages:
+            envelope = decode_envelope(message.SerializeToString())
+            self.assertEqual(message.message_type, envelope.message_type)
+            self.assertEqual(message.correlation_id, envelope.correlation_id)
+            self.assertEqual(message.content, bytes(envelope.content))
+            self.assertEqual(
+                message.content_encoding, envelope.content_encoding)
+
+    def test_content_is_view(self):
+        """Tests that the content of a decoded envelope is a view of the
+        buffer it was decoded from, rather than a copy.
+        """
+        buffer = bytearray(validator_pb2.Message(
+            message_type=validator_pb2.Message.GOSSIP_MESSAGE,
+            correlation_id='abc123',
+            content=b'before').SerializeToString())
+
+        envelope = decode_envelope(buffer)
+        self.assertIsInstance(envelope.content, memoryview)
+
+        start = bytes(buffer).index(b'before')
+        buffer[start:start + 6] = b'after!'
+        self.assertEqual(b'after!', bytes(envelope.content))
+
+    def test_unknown_fields_skipped(self):
+        """Tests that fields the envelope does not know of are skipped."""
+        serialized = validator_pb2.Message(
+            message_type=validator_pb2.Message.PING_REQUEST,
+            content=b'content').SerializeToString()
+        # field 9 varint, field 10 length delimited, field 11 fixed32 and
+        # field 12 fixed64
+        unknown = (
+            b'\x48\x96\x01' + b'\x52\x03abc' + b'\x5d' + b'\x00' * 4 +
+            b'\x61' + b'\x00' * 8)
+
+        envelope = decode_envelope(unknown + serialized)
+        self.assertEqual(
+            validator_pb2.Message.PING_REQUEST, envelope.message_type)
+        self.assertEqual(b'content', bytes(envelope.content))
+
+    def test_malformed(self):
+        """Tests that truncated or malformed buffers raise DecodeError."""
+        serialized = validator_pb2.Message(
+            message_type=validator_pb2.Message.GOSSIP_MESSAGE,
+            correlation_id='abc123',
+            content=b'content').SerializeToString()
+
+        for end in range(1, len(serialized)):
+            # Cutting the message between fields leaves a valid message
+            try:
+                validator_pb2.Message().ParseFromString(serialized[:end])
+            except DecodeError:
+                with self.assertRaises(DecodeError):
+                    decode_envelope(serialized[:end])
+
+        with self.assertRaises(DecodeError):
+            decode_envelope(b'\x0f')
+        with self.assertRaises(DecodeError):
+            decode_envelope(b'\x08' + b'\xff' * 11)
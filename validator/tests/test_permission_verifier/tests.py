@@ -32,6 +32,7 @@ from sawtooth_validator.protobuf.events_pb2 import Event
 from sawtooth_validator.protobuf.transaction_receipt_pb2 import \
     TransactionReceipt
 from sawtooth_validator.journal.block_wrapper import BlockWrapper
+from sawtooth_validator.gossip.permission_verifier import CompiledPolicy
 from sawtooth_validator.gossip.permission_verifier import PermissionVerifier
 from sawtooth_validator.gossip.permission_verifier import IdentityCache
 from sawtooth_validator.gossip.identity_observer import IdentityObserver
@@ -47,6 +48,7 @@ class TestPermissionVerifier(unittest.TestCase):
         self.signer = crypto_factory.new_signer(private_key)
         self._identity_view_factory = MockIdentityViewFactory()
         self.permissions = {}
+        self._state_root = "0000000000000000000000"
         self._identity_cache = IdentityCache(
             self._identity_view_factory)
         self.permission_verifier = \
@@ -60,7 +62,14 @@ class TestPermissionVerifier(unittest.TestCase):
         return self.signer.get_public_key().as_hex()
 
     def _current_root_func(self):
-        return "0000000000000000000000"
+        return self._state_root
+
+    def _fork(self):
+        """Moves the chain head to a fork whose identities differ, and so
+        whose state root differs.
+        """
+        self._state_root = "{:022d}".format(int(self._state_root) + 1)
+        self._identity_cache.forked()
 
     def _create_transactions(self, count):
         txn_list = []
@@ -149,12 +158,24 @@ class TestPermissionVerifier(unittest.TestCase):
         allowed = self.permission_verifier.is_batch_signer_authorized(batch)
         self.assertTrue(allowed)
 
-        self._identity_cache.forked()
+        self._fork()
         self._identity_view_factory.add_policy("default", ["DENY_KEY *"])
         batch = self._create_batches(1, 1)[0]
         allowed = self.permission_verifier.is_batch_signer_authorized(batch)
         self.assertFalse(allowed)
 
+    def test_default_policy_from_state(self):
+        """
+        Test that policies read directly from state are enforced.
+            1. Set default policy to deny all. Batch should be rejected
+                when checked against state.
+        """
+        self._identity_view_factory.add_policy("default", ["DENY_KEY *"])
+        batch = self._create_batches(1, 1)[0]
+        allowed = self.permission_verifier.is_batch_signer_authorized(
+            batch, state_root="state_root", from_state=True)
+        self.assertFalse(allowed)
+
     def test_transactor_role(self):
         """
         Test that role:"transactor" is checked properly.
@@ -168,7 +189,7 @@ class TestPermissionVerifier(unittest.TestCase):
         allowed = self.permission_verifier.is_batch_signer_authorized(batch)
         self.assertTrue(allowed)
 
-        self._identity_cache.forked()
+        self._fork()
         self._identity_view_factory.add_policy("policy1", ["PERMIT_KEY other"])
         self._identity_view_factory.add_role("transactor", "policy1")
         batch = self._create_batches(1, 1)[0]
@@ -189,7 +210,7 @@ class TestPermissionVerifier(unittest.TestCase):
         allowed = self.permission_verifier.is_batch_signer_authorized(batch)
         self.assertTrue(allowed)
 
-        self._identity_cache.forked()
+        self._fork()
         self._identity_view_factory.add_policy("policy1", ["PERMIT_KEY other"])
         self._identity_view_factory.add_role("transactor.batch_signer",
                                              "policy1")
@@ -211,7 +232,7 @@ class TestPermissionVerifier(unittest.TestCase):
         allowed = self.permission_verifier.is_batch_signer_authorized(batch)
         self.assertTrue(allowed)
 
-        self._identity_cache.forked()
+        self._fork()
         self._identity_view_factory.add_policy("policy1", ["PERMIT_KEY other"])
         self._identity_view_factory.add_role("transactor.transaction_signer",
                                              "policy1")
@@ -235,7 +256,7 @@ class TestPermissionVerifier(unittest.TestCase):
         allowed = self.permission_verifier.is_batch_signer_authorized(batch)
         self.assertTrue(allowed)
 
-        self._identity_cache.forked()
+        self._fork()
         self._identity_view_factory.add_policy("policy1", ["PERMIT_KEY other"])
         self._identity_view_factory.add_role(
             "transactor.transaction_signer.intkey",
@@ -346,7 +367,7 @@ class TestPermissionVerifier(unittest.TestCase):
         allowed = self.permission_verifier.check_network_role(self.public_key)
         self.assertTrue(allowed)
 
-        self._identity_cache.forked()
+        self._fork()
         self._identity_view_factory.add_policy("default", ["DENY_KEY *"])
         allowed = self.permission_verifier.check_network_role(self.public_key)
         self.assertFalse(allowed)
@@ -368,7 +389,7 @@ class TestPermissionVerifier(unittest.TestCase):
         allowed = self.permission_verifier.check_network_role(self.public_key)
         self.assertTrue(allowed)
 
-        self._identity_cache.forked()
+        self._fork()
         self._identity_view_factory.add_policy("policy2", ["PERMIT_KEY other"])
         self._identity_view_factory.add_role(
             "network",
@@ -376,6 +397,42 @@ class TestPermissionVerifier(unittest.TestCase):
         allowed = self.permission_verifier.check_network_role(self.public_key)
         self.assertFalse(allowed)
 
+    def test_network_decision_cached(self):
+        """
+        Test that the decision for a public key is kept until the identity
+        cache sees a role or policy change.
+            1. Set default policy to permit all. Public key should be allowed.
+            2. Set default policy to deny all without telling the cache. The
+                kept decision should still allow the public key, without
+                reading the identity view again.
+            3. Move to a new state root and invalidate the default policy.
+                Public key should be rejected.
+        """
+        self._identity_view_factory.add_policy("default", ["PERMIT_KEY *"])
+        allowed = self.permission_verifier.check_network_role(self.public_key)
+        self.assertTrue(allowed)
+
+        self._identity_view_factory.add_policy("default", ["DENY_KEY *"])
+        views_created = []
+        create_identity_view = \
+            self._identity_view_factory.create_identity_view
+
+        def counting_create_identity_view(root):
+            views_created.append(root)
+            return create_identity_view(root)
+
+        self._identity_view_factory.create_identity_view = \
+            counting_create_identity_view
+
+        allowed = self.permission_verifier.check_network_role(self.public_key)
+        self.assertTrue(allowed)
+        self.assertEqual(views_created, [])
+
+        self._state_root = "0000000000000000000001"
+        self._identity_cache.invalidate("default")
+        allowed = self.permission_verifier.check_network_role(self.public_key)
+        self.assertFalse(allowed)
+
     def test_network_consensus(self):
         """
         Test that if no roles are set and no default policy is set,
@@ -396,7 +453,7 @@ class TestPermissionVerifier(unittest.TestCase):
             self.public_key)
         self.assertTrue(allowed)
 
-        self._identity_cache.forked()
+        self._fork()
         self._identity_view_factory.add_policy("default", ["DENY_KEY *"])
         allowed = self.permission_verifier.check_network_consensus_role(
             self.public_key)
@@ -420,7 +477,7 @@ class TestPermissionVerifier(unittest.TestCase):
             self.public_key)
         self.assertTrue(allowed)
 
-        self._identity_cache.forked()
+        self._fork()
         self._identity_view_factory.add_policy("policy2", ["PERMIT_KEY other"])
         self._identity_view_factory.add_role(
             "network.consensus",
@@ -430,6 +487,58 @@ class TestPermissionVerifier(unittest.TestCase):
         self.assertFalse(allowed)
 
 
+class TestCompiledPolicy(unittest.TestCase):
+    def test_first_entry_decides(self):
+        """
+        Test that the first entry matching a key decides it.
+            1. A key listed twice is decided by its first entry.
+            2. A "*" entry decides the keys not listed before it, and the
+                entries after it are ignored.
+            3. Keys matching no entry are denied.
+        """
+        policy = CompiledPolicy(make_policy("policy1", [
+            "PERMIT_KEY a",
+            "DENY_KEY b",
+            "DENY_KEY a",
+            "PERMIT_KEY b",
+            "DENY_KEY *",
+            "PERMIT_KEY c",
+        ]))
+        self.assertTrue(policy.allows("a"))
+        self.assertFalse(policy.allows("b"))
+        self.assertFalse(policy.allows("c"))
+
+        policy = CompiledPolicy(make_policy("policy2", [
+            "DENY_KEY a",
+            "PERMIT_KEY *",
+        ]))
+        self.assertFalse(policy.allows("a"))
+        self.assertTrue(policy.allows("c"))
+
+        policy = CompiledPolicy(make_policy("policy3", ["PERMIT_KEY a"]))
+        self.assertTrue(policy.allows("a"))
+        self.assertFalse(policy.allows("c"))
+
+    def test_large_policy(self):
+        """
+        Test that a policy of many entries permits and denies the same keys
+        as applying its entries in order.
+        """
+        rules = []
+        for i in range(10000):
+            if i % 3 == 0:
+                rules.append("DENY_KEY key{}".format(i))
+            else:
+                rules.append("PERMIT_KEY key{}".format(i))
+        # Later entries for listed keys are ignored
+        rules.extend("DENY_KEY key{}".format(i) for i in range(1, 100, 3))
+        policy = CompiledPolicy(make_policy("policy1", rules))
+
+        for i in range(10000):
+            self.assertEqual(policy.allows("key{}".format(i)), i % 3 != 0)
+        self.assertFalse(policy.allows("other"))
+
+
 class TestIdentityObserver(unittest.TestCase):
     def setUp(self):
         self._identity_view_factory = MockIdentityViewFactory()
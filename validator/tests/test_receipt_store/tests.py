@@ -19,12 +19,18 @@ from unittest.mock import Mock
 from sawtooth_validator.database.dict_database import DictDatabase
 from sawtooth_validator.execution.tp_state_handlers import \
     TpReceiptAddDataHandler
+from sawtooth_validator.journal.receipt_codec import DICTIONARY_KEY
+from sawtooth_validator.journal.receipt_codec import RawReceiptCodec
+from sawtooth_validator.journal.receipt_codec import train_dictionary
+from sawtooth_validator.journal.receipt_codec import ZlibReceiptCodec
+from sawtooth_validator.journal.receipt_migration import migrate_receipts
 from sawtooth_validator.journal.receipt_store import TransactionReceiptStore
 from sawtooth_validator.journal.receipt_store import \
     ClientReceiptGetRequestHandler
 
 from sawtooth_validator.networking.dispatch import HandlerStatus
 
+from sawtooth_validator.protobuf.block_pb2 import Block
 from sawtooth_validator.protobuf.transaction_receipt_pb2 import \
     TransactionReceipt
 from sawtooth_validator.protobuf.transaction_receipt_pb2 import StateChange
@@ -85,6 +91,206 @@ class ReceiptStoreTest(unittest.TestCase):
             self.assertEqual(stored_receipt.events, receipt.events)
             self.assertEqual(stored_receipt.data, receipt.data)
 
+    def test_chain_update_writes_all_receipts_at_once(self):
+        """Tests that a chain update stores all of the block's receipts with
+        a single write to the backing database.
+        """
+        receipt_db = DictDatabase()
+        receipt_db.update = Mock(wraps=receipt_db.update)
+        receipt_store = TransactionReceiptStore(receipt_db)
+
+        receipts = [
+            TransactionReceipt(
+                transaction_id=str(i), data=[str(i).encode()])
+            for i in range(10)
+        ]
+
+        receipt_store.chain_update(Block(header_signature='b0'), receipts)
+
+        self.assertEqual(1, receipt_db.update.call_count)
+        for receipt in receipts:
+            self.assertEqual(
+                receipt, receipt_store.get(receipt.transaction_id))
+
+    def test_get_receipts_by_block(self):
+        """Tests that the receipts of a block can be read back together, in
+        block order, by block id, and individually or in groups by
+        transaction id.
+        """
+        receipt_store = TransactionReceiptStore(DictDatabase())
+
+        blocks = {}
+        for block_num in range(3):
+            block_id = 'b{}'.format(block_num)
+            blocks[block_id] = [
+                TransactionReceipt(
+                    transaction_id='{}-t{}'.format(block_id, i),
+                    data=[block_id.encode()])
+                for i in range(5)
+            ]
+            receipt_store.chain_update(
+                Block(header_signature=block_id), blocks[block_id])
+
+        legacy_receipt = TransactionReceipt(transaction_id='legacy')
+        receipt_store.put('legacy', legacy_receipt)
+
+        for block_id, receipts in blocks.items():
+            self.assertEqual(
+                receipts, receipt_store.get_block_receipts(block_id))
+
+        self.assertEqual(
+            [blocks['b2'][3], legacy_receipt, blocks['b0'][1]],
+            receipt_store.get_multi(['b2-t3', 'legacy', 'b0-t1']))
+
+        with self.assertRaises(KeyError):
+            receipt_store.get_block_receipts('unknown')
+
+        with self.assertRaises(KeyError):
+            receipt_store.get_multi(['b1-t0', 'unknown'])
+
+    def test_compressed_receipts(self):
+        """Tests that receipts stored through a compressing codec, with a
+        dictionary trained on existing receipts, read back unchanged, and
+        that receipts stored before compression was enabled remain readable.
+        """
+        receipt_db = DictDatabase()
+        receipts = [
+            TransactionReceipt(
+                transaction_id=str(i),
+                state_changes=[
+                    StateChange(
+                        address='a1000000' + str(i % 3) * 62,
+                        value=str(i).encode(),
+                        type=StateChange.SET)
+                ])
+            for i in range(10)
+        ]
+
+        TransactionReceiptStore(receipt_db).put('legacy', receipts[0])
+
+        dictionary = train_dictionary(
+            [receipt.SerializeToString() for receipt in receipts])
+        self.assertTrue(dictionary)
+
+        receipt_store = TransactionReceiptStore(
+            receipt_db, codec=ZlibReceiptCodec(dictionary=dictionary))
+        receipt_store.chain_update(Block(header_signature='b0'), receipts)
+
+        self.assertEqual(receipts, receipt_store.get_block_receipts('b0'))
+        self.assertEqual(receipts[0], receipt_store.get('legacy'))
+
+        # The codec only chooses how receipts are encoded; they are decoded
+        # with the codec named in each, given the dictionary
+        self.assertEqual(
+            receipts,
+            TransactionReceiptStore(
+                receipt_db, codec=RawReceiptCodec(dictionary=dictionary)
+            ).get_block_receipts('b0'))
+
+        # Without the dictionary, the receipts cannot be decoded
+        with self.assertRaises(ValueError):
+            TransactionReceiptStore(
+                receipt_db, codec=ZlibReceiptCodec()).get('1')
+
+    def test_migrate_receipts(self):
+        """Tests that migrating a receipt database to a new codec re-encodes
+        every receipt, and leaves the transaction index intact.
+        """
+        source_db = DictDatabase()
+        receipts = [
+            TransactionReceipt(transaction_id=str(i), data=[b'data'] * 10)
+            for i in range(5)
+        ]
+        TransactionReceiptStore(source_db).chain_update(
+            Block(header_signature='b0'), receipts)
+        TransactionReceiptStore(source_db).put('legacy', receipts[0])
+
+        target_db = DictDatabase()
+        receipt_count = migrate_receipts(
+            source_db, target_db, RawReceiptCodec(), ZlibReceiptCodec(),
+            batch_size=2)
+
+        self.assertEqual(6, receipt_count)
+        self.assertEqual(len(source_db), len(target_db))
+
+        receipt_store = TransactionReceiptStore(
+            target_db, codec=ZlibReceiptCodec())
+        self.assertEqual(receipts, receipt_store.get_block_receipts('b0'))
+        self.assertEqual(
+            [receipts[3], receipts[0]],
+            receipt_store.get_multi(['3', 'legacy']))
+
+        # The migrated receipts are compressed, but are still read by a
+        # store which does not compress
+        self.assertNotEqual(source_db.get('legacy'), target_db.get('legacy'))
+        self.assertEqual(
+            receipts[0], TransactionReceiptStore(target_db).get('legacy'))
+
+    def test_chain_update_per_block(self):
+        """Tests that when a chain of several blocks is committed at once,
+        and each block is passed to chain_update in turn, each block's
+        receipts are read back from its own bundle.
+        """
+        receipt_store = TransactionReceiptStore(DictDatabase())
+
+        blocks = [
+            (Block(header_signature='b{}'.format(block_num)), [
+                TransactionReceipt(
+                    transaction_id='b{}-t{}'.format(block_num, i),
+                    data=[str(block_num).encode()])
+                for i in range(block_num + 2)
+            ])
+            for block_num in range(2)
+        ]
+        for block, receipts in blocks:
+            receipt_store.chain_update(block, receipts)
+
+        for block, receipts in blocks:
+            self.assertEqual(
+                receipts,
+                receipt_store.get_block_receipts(block.header_signature))
+            self.assertEqual(
+                receipts,
+                receipt_store.get_multi(
+                    [receipt.transaction_id for receipt in receipts]))
+
+    def test_stale_receipt_position(self):
+        """Tests that a transaction whose index entry points past the end of
+        its block's bundle is reported as missing.
+        """
+        receipt_store = TransactionReceiptStore(DictDatabase())
+
+        receipts = [
+            TransactionReceipt(transaction_id=str(i)) for i in range(3)
+        ]
+        receipt_store.chain_update(Block(header_signature='b0'), receipts)
+        # Rewriting the bundle with fewer receipts leaves the entries of the
+        # others pointing past its end
+        receipt_store.chain_update(Block(header_signature='b0'), receipts[:1])
+
+        self.assertEqual(receipts[0], receipt_store.get('0'))
+        with self.assertRaises(KeyError):
+            receipt_store.get('2')
+        with self.assertRaises(KeyError):
+            receipt_store.get_multi(['0', '2'])
+
+    def test_reserved_keys(self):
+        """Tests that the keys of receipt bundles and of codec data, which
+        share the database with transaction ids, are not read as receipts.
+        """
+        receipt_db = DictDatabase()
+        receipt_store = TransactionReceiptStore(receipt_db)
+        receipt_store.chain_update(
+            Block(header_signature='b0'),
+            [TransactionReceipt(transaction_id='t0')])
+        receipt_db.put(DICTIONARY_KEY, b'dictionary')
+
+        for key in [DICTIONARY_KEY, 'block:b0']:
+            with self.assertRaises(KeyError):
+                receipt_store.get(key)
+            with self.assertRaises(KeyError):
+                receipt_store.get_multi(['t0', key])
+
     def test_raise_key_error_on_missing_receipt(self):
         """Tests that we correctly raise key error on a missing receipt
         """
@@ -126,6 +332,23 @@ class TransactionReceiptGetRequestHandlerTest(unittest.TestCase):
         self.assertEqual(ClientReceiptGetResponse.NO_RESOURCE,
                          response.message_out.status)
 
+    def test_get_undecodable_receipt(self):
+        """Tests that the TransactionReceiptGetRequestHandler responds with
+        an INTERNAL_ERROR when a receipt cannot be decoded.
+        """
+        receipt_db = DictDatabase()
+        receipt_store = TransactionReceiptStore(receipt_db)
+        receipt_db.put('deadbeef', b'\x00\x01not zlib')
+
+        handler = ClientReceiptGetRequestHandler(receipt_store)
+        request = ClientReceiptGetRequest(
+            transaction_ids=['deadbeef']).SerializeToString()
+
+        response = handler.handle('test_conn_id', request)
+        self.assertEqual(HandlerStatus.RETURN, response.status)
+        self.assertEqual(ClientReceiptGetResponse.INTERNAL_ERROR,
+                         response.message_out.status)
+
 
 class TpReceiptAddDataHandlerTest(unittest.TestCase):
     def test_add_event(self):
@@ -161,3 +161,47 @@ class TestSettingsCache(unittest.TestCase):
         self.assertEqual(
             self._settings_cache.get_setting("setting2", "state_root"),
             settings_view.get_setting("setting2"))
+
+    def test_known_fork(self):
+        """
+        Test that settings read at a state root are kept after a fork, and
+        read again once the state root has been dropped.
+            1. Read a setting at two state roots, then fork. Reading it at
+                either state root should not read state again.
+            2. Read it at more state roots than are kept. Reading it at the
+                least recently used state root should read state again.
+        """
+        self._settings_view_factory.add_setting("setting1", "test1")
+
+        views_created = []
+        create_settings_view = \
+            self._settings_view_factory.create_settings_view
+
+        def counting_create_settings_view(root):
+            views_created.append(root)
+            return create_settings_view(root)
+
+        self._settings_view_factory.create_settings_view = \
+            counting_create_settings_view
+        self._settings_cache = SettingsCache(
+            self._settings_view_factory, max_roots=2)
+
+        self._settings_cache.get_setting("setting1", "root1")
+        self._settings_cache.get_setting(
+            "setting1", "root2", from_state=True)
+        self.assertEqual(views_created, ["root1", "root2"])
+
+        self._settings_cache.forked()
+        self.assertEqual(
+            self._settings_cache.get_setting("setting1", "root2"), "test1")
+        self.assertEqual(
+            self._settings_cache.get_setting(
+                "setting1", "root1", from_state=True),
+            "test1")
+        self.assertEqual(views_created, ["root1", "root2"])
+
+        self._settings_cache.get_setting(
+            "setting1", "root3", from_state=True)
+        self._settings_cache.get_setting(
+            "setting1", "root2", from_state=True)
+        self.assertEqual(views_created, ["root1", "root2", "root3", "root2"])
@@ -0,0 +1,93 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import unittest
+
+from sawtooth_validator.state.state_read_cache import StateReadCache
+
+
+class TestStateReadCache(unittest.TestCase):
+    def setUp(self):
+        self._state = {
+            'root1': {'aa': b'1', 'bb': b'2'},
+            'root2': {'aa': b'3'},
+        }
+        self._reads = []
+
+    def _reader(self, state_root):
+        def read_many(addresses):
+            self._reads.append((state_root, list(addresses)))
+            return [(address, self._state[state_root].get(address))
+                    for address in addresses]
+        return read_many
+
+    def test_get_many(self):
+        """Tests that values are read through to state only on a miss, and
+        returned in the order requested.
+        """
+        cache = StateReadCache()
+
+        self.assertEqual(
+            [('bb', b'2'), ('aa', b'1')],
+            cache.get_many('root1', ['bb', 'aa'], self._reader('root1')))
+        self.assertEqual([('root1', ['bb', 'aa'])], self._reads)
+
+        self.assertEqual(
+            [('aa', b'1'), ('cc', None), ('bb', b'2')],
+            cache.get_many('root1', ['aa', 'cc', 'bb'],
+                           self._reader('root1')))
+        self.assertEqual(
+            [('root1', ['bb', 'aa']), ('root1', ['cc'])], self._reads)
+
+        # missing addresses are cached as well
+        self.assertEqual(
+            [('cc', None)],
+            cache.get_many('root1', ['cc'], self._reader('root1')))
+        self.assertEqual(2, len(self._reads))
+
+    def test_state_roots_are_distinct(self):
+        """Tests that the same address under different state roots are
+        cached separately.
+        """
+        cache = StateReadCache()
+
+        cache.get_many('root1', ['aa'], self._reader('root1'))
+        self.assertEqual(
+            [('aa', b'3')],
+            cache.get_many('root2', ['aa'], self._reader('root2')))
+        self.assertEqual(
+            [('aa', b'1')],
+            cache.get_many('root1', ['aa'], self._reader('root1')))
+        self.assertEqual(2, len(self._reads))
+
+    def test_eviction(self):
+        """Tests that the least recently used entries are evicted once the
+        cache is full.
+        """
+        cache = StateReadCache(size=2)
+
+        cache.get_many('root1', ['aa', 'bb'], self._reader('root1'))
+        # touch 'aa', so that 'bb' is the least recently used
+        cache.get_many('root1', ['aa'], self._reader('root1'))
+        cache.get_many('root2', ['aa'], self._reader('root2'))
+        self.assertEqual(2, len(cache))
+        self.assertEqual(2, len(self._reads))
+
+        cache.get_many('root1', ['aa'], self._reader('root1'))
+        self.assertEqual(2, len(self._reads))
+
+        cache.get_many('root1', ['bb'], self._reader('root1'))
+        self.assertEqual(
+            ('root1', ['bb']), self._reads[-1])